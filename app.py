@@ -1,5 +1,6 @@
 import os
 import logging
+import multiprocessing
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
@@ -65,4 +66,21 @@ with app.app_context():
     # Create all tables (this is safe for new databases and won't affect existing ones)
     db.create_all()
 
+
+def serves_requests() -> bool:
+    """Whether this process serves requests: not an article parsing process, nor the debug reloader's watcher"""
+    if multiprocessing.parent_process() is not None:
+        return False
+    # main.py runs the reloader, which serves from a child process it marks with WERKZEUG_RUN_MAIN
+    return os.environ.get("NEWSFLASH_RELOADER") != "true" or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+
+
+# Keep popular topics warm in the caches (the scheduler's lock keeps it to one process per deployment)
+if Config.PRECOMPUTE_ENABLED and serves_requests():
+    routes.precompute_scheduler.start()
+
+# Start the article parsing processes now, so the first articles opened do not wait for them
+if serves_requests():
+    routes.article_extractor.extraction_pool.warm_up()
+
 logger.info("Flask application initialized successfully")
\ No newline at end of file
@@ -0,0 +1,284 @@
+"""
+Article Deduplication Module for NewsFlash Application
+
+This module provides ingestion-time near-duplicate suppression including:
+- Canonical URL normalization (tracking parameters, AMP and mobile variants)
+- 64-bit SimHash fingerprints of title and body with banded lookup
+- A global seen set linking duplicates to the summary of the first copy
+- Per-session seen sets so "load more" does not return articles the user already has
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from cachetools import TTLCache
+from config import Config
+from sentiment_lexicon import TOKEN_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that identify a campaign or referrer rather than the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid', 'ocid', 'cmpid', 'ref', 'ref_src',
+    'referrer', 'src', 'source', 'via', 'share', 'amp', 'outputtype', '_ga', 'guccounter', 'ito', 'smid',
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'pk_')
+HOST_PREFIXES = ('www.', 'amp.', 'm.', 'mobile.')
+AMP_PATH = re.compile(r"(?:/amp|\.amp|/amp\.html)/?$|/amp(?=/)", re.IGNORECASE)
+
+FINGERPRINT_BITS = 64
+# Eight 8-bit bands: fingerprints within 7 bits of each other share at least one band,
+# so the banded lookup is exact for DEDUP_SIMHASH_DISTANCE <= 7
+BAND_BITS = 8
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so copies of one article map to the same string.
+
+    Args:
+        url: Article URL as returned by the search
+
+    Returns:
+        Canonical URL (https, bare host, no tracking parameters, AMP suffixes or fragment)
+    """
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or '').lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    path = AMP_PATH.sub('', parts.path).rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash of text from its word unigrams and bigrams.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Fingerprint as an integer; similar texts differ in few bits, text without words gives 0
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if not tokens:
+        return 0
+    features = Counter(tokens)
+    features.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
+
+    vector = [0] * FINGERPRINT_BITS
+    for feature, weight in features.items():
+        value = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(FINGERPRINT_BITS):
+            vector[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(FINGERPRINT_BITS) if vector[bit] > 0)
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Count the bits in which two fingerprints differ"""
+    return bin(first ^ second).count('1')
+
+
+class ArticleDeduplicator:
+    """Tracks articles already summarized or shown so duplicates skip the AI."""
+
+    def __init__(self, max_distance: Optional[int] = None, max_entries: Optional[int] = None,
+                 ttl: Optional[float] = None):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            max_distance: Largest SimHash distance treated as a duplicate (defaults to Config.DEDUP_SIMHASH_DISTANCE)
+            max_entries: Articles remembered globally (defaults to Config.DEDUP_MAX_ENTRIES)
+            ttl: Seconds an article is remembered (defaults to Config.DEDUP_TTL)
+        """
+        self.max_distance = Config.DEDUP_SIMHASH_DISTANCE if max_distance is None else max_distance
+        ttl = ttl or Config.DEDUP_TTL
+        max_entries = max_entries or Config.DEDUP_MAX_ENTRIES
+        # entry id -> {'url', 'fingerprint', 'results': {language: summary fields}}
+        self._entries = TTLCache(maxsize=max_entries, ttl=ttl)
+        self._urls = TTLCache(maxsize=max_entries, ttl=ttl)
+        self._bands = {}
+        # session id -> {'urls': set, 'fingerprints': list}
+        self._sessions = TTLCache(maxsize=Config.DEDUP_MAX_SESSIONS, ttl=ttl)
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._stats = {'batch_duplicates': 0, 'session_duplicates': 0, 'global_duplicates': 0, 'novel': 0}
+
+    @staticmethod
+    def fingerprint(article: Dict[str, Any]) -> Tuple[str, int]:
+        """
+        Get the canonical URL and SimHash of an article.
+
+        Args:
+            article: Article with 'url', 'title' and 'body'
+
+        Returns:
+            Tuple of (canonical URL, fingerprint)
+        """
+        text = f"{article.get('title', '')} {article.get('body', '')}"
+        return canonicalize_url(article.get('url', '')), simhash(text)
+
+    def _bands_of(self, fingerprint: int) -> List[Tuple[int, int]]:
+        """Split a fingerprint into (band index, band value) keys"""
+        mask = (1 << BAND_BITS) - 1
+        return [(band, fingerprint >> (band * BAND_BITS) & mask) for band in range(FINGERPRINT_BITS // BAND_BITS)]
+
+    def _find_entry(self, url: str, fingerprint: int) -> Optional[Dict[str, Any]]:
+        """Find a remembered article by canonical URL or a nearby fingerprint (lock held)"""
+        entry = self._entries.get(self._urls.get(url)) if url else None
+        if entry or not fingerprint:
+            return entry
+        for key in self._bands_of(fingerprint):
+            candidates = self._bands.get(key)
+            if not candidates:
+                continue
+            for entry_id in list(candidates):
+                entry = self._entries.get(entry_id)
+                if entry is None:
+                    candidates.discard(entry_id)  # expired or evicted
+                    if not candidates:
+                        del self._bands[key]
+                elif hamming_distance(entry['fingerprint'], fingerprint) <= self.max_distance:
+                    return entry
+        return None
+
+    def _is_near(self, url: str, fingerprint: int, urls: set, fingerprints: List[int]) -> bool:
+        """Check an article against a small seen set"""
+        return bool(url and url in urls) or bool(fingerprint) and any(
+            hamming_distance(fingerprint, seen) <= self.max_distance for seen in fingerprints
+        )
+
+    def partition(self, articles: List[Dict[str, Any]], language: str, session_id: Optional[str] = None,
+                  limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Drop duplicate articles and fill in summaries already generated for earlier copies.
+
+        Duplicates within the batch and articles the session has already seen are dropped.
+        Articles matching a remembered article get its summary, sentiment and a
+        'duplicate_of' URL instead of a new AI call.
+
+        Args:
+            articles: Search results without summaries
+            language: Summary language
+            session_id: Session whose seen set to check, if any
+            limit: Most articles to keep; the rest are ignored
+
+        Returns:
+            Tuple of (articles to return, the subset that still needs summarizing)
+        """
+        kept, novel = [], []
+        batch_urls, batch_fingerprints = set(), []
+        with self._lock:
+            seen = self._sessions.get(session_id) if session_id else None
+            for article in articles:
+                if limit is not None and len(kept) >= limit:
+                    break
+                url, fingerprint = self.fingerprint(article)
+                if self._is_near(url, fingerprint, batch_urls, batch_fingerprints):
+                    self._stats['batch_duplicates'] += 1
+                    continue
+                batch_urls.add(url)
+                batch_fingerprints.append(fingerprint)
+                if seen and self._is_near(url, fingerprint, seen['urls'], seen['fingerprints']):
+                    self._stats['session_duplicates'] += 1
+                    continue
+
+                kept.append(article)
+                entry = self._find_entry(url, fingerprint)
+                result = entry['results'].get(language) if entry else None
+                if result:
+                    article.update(result, duplicate_of=entry['url'])
+                    self._stats['global_duplicates'] += 1
+                else:
+                    novel.append(article)
+                    self._stats['novel'] += 1
+
+        if len(novel) < len(kept) or len(kept) < min(len(articles), limit or len(articles)):
+            logger.info(f"Deduplicated {len(articles)} articles: kept {len(kept)}, "
+                        f"{len(kept) - len(novel)} reuse earlier summaries")
+        return kept, novel
+
+    def remember(self, articles: List[Dict[str, Any]], language: str) -> None:
+        """
+        Record summarized articles so later copies can reuse their summaries.
+
+        Only summaries the AI produced are recorded; local fallbacks would otherwise be
+        reused instead of asking the AI again once it is available.
+
+        Args:
+            articles: Articles with 'summary', 'sentiment', 'summary_language' and 'ai_summary'
+            language: Summary language
+        """
+        with self._lock:
+            for article in articles:
+                if not article.get('summary') or not article.get('ai_summary') or article.get('duplicate_of'):
+                    continue
+                url, fingerprint = self.fingerprint(article)
+                entry = self._find_entry(url, fingerprint)
+                if entry is None:
+                    entry_id = self._next_id
+                    self._next_id += 1
+                    entry = {'url': article.get('url', ''), 'fingerprint': fingerprint, 'results': {}}
+                    self._entries[entry_id] = entry
+                    if url:
+                        self._urls[url] = entry_id
+                    if fingerprint:
+                        for key in self._bands_of(fingerprint):
+                            self._bands.setdefault(key, set()).add(entry_id)
+                entry['results'][language] = {
+                    'summary': article['summary'],
+                    'sentiment': article.get('sentiment', Config.SENTIMENT_DEFAULT),
+                    'summary_language': article.get('summary_language', language),
+                    'ai_summary': True,
+                }
+
+    def mark_seen(self, session_id: str, articles: List[Dict[str, Any]]) -> None:
+        """
+        Add articles to a session's seen set.
+
+        Args:
+            session_id: Session the articles were shown to
+            articles: Articles with 'url', 'title' and 'body'
+        """
+        if not session_id:
+            return
+        with self._lock:
+            seen = self._sessions.get(session_id) or {'urls': set(), 'fingerprints': []}
+            for article in articles:
+                url, fingerprint = self.fingerprint(article)
+                seen['urls'].add(url)
+                seen['fingerprints'].append(fingerprint)
+            # Re-assign so the session's TTL restarts
+            self._sessions[session_id] = seen
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get duplicate counters.
+
+        Returns:
+            Dictionary of duplicate counts by kind, novel articles and remembered articles
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['remembered'] = len(self._entries)
+        total = stats['novel'] + stats['global_duplicates'] + stats['batch_duplicates'] + stats['session_duplicates']
+        stats['duplicate_rate'] = round((total - stats['novel']) / total, 4) if total else 0.0
+        return stats
@@ -1,183 +1,177 @@
 import logging
-import requests
-from typing import Optional, Dict
-import trafilatura
-from bs4 import BeautifulSoup
-from newspaper import Article
-import re
+import threading
+from collections import Counter
+from typing import Any, Optional, Dict, Tuple
+from urllib.parse import urlparse
+from config import Config
+from article_parser import STRATEGIES, extract_page, format_article_text, is_likely_noise, parse_metadata, run_strategy
+from extraction_cache import ExtractionCache
+from extraction_pool import ExtractionPool
+from single_flight import SingleFlight
+from error_handler import get_circuit_breaker
+from deadline import current_deadline
+from page_fetcher import PageFetcher
 
 logger = logging.getLogger(__name__)
 
+
 class ArticleExtractor:
-    def __init__(self):
+    # Less time than this left is not worth starting another download
+    MIN_DOWNLOAD_TIME = 0.5
+
+    def __init__(self, fetcher: Optional[PageFetcher] = None):
+        # Readers opening the same article at once share one download
+        self.extraction_flights = SingleFlight("extraction")
+        # Every strategy parses the same download, made over pooled connections
+        self.fetcher = fetcher or PageFetcher()
+        # Extracted articles are kept on disk and revalidated with conditional requests
+        self.extraction_cache = ExtractionCache() if Config.ARTICLE_CACHE_ENABLED else None
+        # Parsing runs in worker processes so it does not hold this process's GIL; a race
+        # needs a worker per strategy
+        self.extraction_pool = ExtractionPool(
+            max(Config.EXTRACTION_POOL_WORKERS, len(STRATEGIES)) if Config.EXTRACTION_RACE_ENABLED else None,
+            preload=('article_parser',)
+        )
+        self._race_lock = threading.Lock()
+        self._race_stats = {'races': 0, 'early': 0, 'no_content': 0, 'skipped': 0, 'wins': Counter()}
         logger.info("ArticleExtractor initialized successfully with newspaper3k")
 
     def extract_full_article(self, url: str) -> Optional[str]:
-        """Extract the full article content from a URL using newspaper3k"""
+        """Extract the full article content from a URL using newspaper3k
+        
+        Articles extracted less than Config.ARTICLE_CACHE_TTL seconds ago come from the article cache.
+        """
+        cached = self._cached_value(url, 'content')
+        if cached is not None:
+            return cached
+        return self.extraction_flights.do(url, lambda: self._extract_through_circuit(url))
+
+    def _cached_value(self, url: str, field: str) -> Optional[Any]:
+        """Get a field of a fresh article cache entry"""
+        if self.extraction_cache is None:
+            return None
+        entry = self.extraction_cache.get(url)
+        return entry.get(field) if entry and entry['fresh'] else None
+
+    def _extract_through_circuit(self, url: str) -> Optional[str]:
+        """Extract an article unless its host's circuit is open
+        
+        Each host has its own breaker, so one failing site does not stop reads from others.
+        Extractions that come back empty count as failures of that host.
+        """
+        if self._out_of_time(url):
+            return None
+        circuit = get_circuit_breaker(f"article_fetch:{urlparse(url).netloc.lower()}")
+        if not circuit.allow_request():
+            logger.warning(f"Skipping extraction from {url}: circuit for its host is open")
+            return None
+        
+        text = self._extract_full_article(url)
+        if text:
+            circuit.record_success()
+        else:
+            circuit.record_failure(Exception(f"No content extracted from {url}"))
+        return text
+
+    def _extract_full_article(self, url: str) -> Optional[str]:
+        """Download an article once and extract it (see extract_full_article)
+        
+        A stale cached extraction is revalidated with a conditional request and served
+        again if the site answers 304 Not Modified.
+        """
         try:
             logger.info(f"Extracting full article from: {url}")
-            
-            # First try with newspaper3k - excellent for article extraction
-            try:
-                article = Article(url)
-                article.download()
-                article.parse()
-                
-                logger.info(f"Newspaper3k raw text length: {len(article.text) if article.text else 0}")
-                
-                if article.text and len(article.text.strip()) > 100:
-                    formatted_text = self._format_newspaper_content(article.text)
-                    logger.info(f"Successfully extracted article using newspaper3k: {len(formatted_text)} characters (original: {len(article.text)})")
-                    return formatted_text
-                else:
-                    logger.warning(f"Newspaper3k extracted text too short or empty: {len(article.text) if article.text else 0} characters")
-                    
-            except Exception as e:
-                logger.warning(f"Newspaper3k extraction failed: {e}, trying trafilatura fallback")
-            
-            # Fallback to trafilatura
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded:
-                text = trafilatura.extract(downloaded, include_comments=False, include_tables=True)
-                logger.info(f"Trafilatura raw text length: {len(text) if text else 0}")
-                
-                if text and len(text.strip()) > 100:
-                    formatted_text = self._format_newspaper_content(text)
-                    logger.info(f"Successfully extracted article using trafilatura: {len(formatted_text)} characters (original: {len(text)})")
-                    return formatted_text
-                else:
-                    logger.warning(f"Trafilatura extracted text too short or empty: {len(text) if text else 0} characters")
-            else:
-                logger.warning("Trafilatura failed to download content")
-            
-            # Final fallback to BeautifulSoup
-            logger.warning("Both newspaper3k and trafilatura failed, trying BeautifulSoup fallback")
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-                element.decompose()
-            
-            # Try to find the main content area
-            content_selectors = [
-                'article', '[role="main"]', '.article-content', 
-                '.post-content', '.entry-content', '.content', 'main'
-            ]
-            
-            article_content = None
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    article_content = elements[0]
-                    break
-            
-            if not article_content:
-                article_content = soup.find('body')
-            
-            if article_content:
-                text = article_content.get_text(separator='\n', strip=True)
-                formatted_text = self._format_newspaper_content(text)
-                
-                if len(formatted_text.strip()) > 100:
-                    logger.info(f"Successfully extracted article using BeautifulSoup: {len(formatted_text)} characters")
-                    return formatted_text
-            
-            logger.warning(f"Could not extract meaningful content from {url}")
-            return None
+            cached = self.extraction_cache.get(url, record=False) if self.extraction_cache else None
+            if cached is not None and not cached.get('content'):
+                cached = None
+            
+            page = self.fetcher.fetch_page(url, etag=cached['etag'] if cached else None,
+                                           last_modified=cached['last_modified'] if cached else None)
+            if page is None:
+                return None
+            if page['not_modified']:
+                logger.info(f"Article not modified since it was cached: {url}")
+                self.extraction_cache.revalidate(url)
+                return cached['content']
+            
+            text, metadata = self._extract_page(url, page['html'])
+            if text and self.extraction_cache is not None:
+                self.extraction_cache.set(url, {'content': text, 'metadata': metadata},
+                                          etag=page['etag'], last_modified=page['last_modified'])
+            return text
             
         except Exception as e:
             logger.error(f"Error extracting article from {url}: {e}")
             return None
 
-    def _format_newspaper_content(self, text: str) -> str:
-        """Format article content using newspaper3k-style formatting (NO API calls)"""
-        try:
-            # Clean up the text
-            text = text.strip()
-            original_length = len(text)
-            
-            # Remove excessive whitespace and normalize line breaks
-            text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple line breaks to double
-            text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single space
-            
-            # Split into paragraphs
-            paragraphs = text.split('\n\n')
-            formatted_paragraphs = []
-            filtered_count = 0
-            
-            for paragraph in paragraphs:
-                paragraph = paragraph.strip()
-                
-                # Skip very short lines (likely navigation/ads)
-                if len(paragraph) < 20:
-                    filtered_count += 1
-                    continue
-                    
-                # Skip lines that look like navigation or ads
-                if self._is_likely_noise(paragraph):
-                    filtered_count += 1
-                    logger.debug(f"Filtered noise paragraph: {paragraph[:50]}...")
-                    continue
-                
-                # Clean up the paragraph
-                paragraph = re.sub(r'\s+', ' ', paragraph)  # Normalize whitespace
-                paragraph = paragraph.strip()
-                
-                # Only keep substantial paragraphs
-                if len(paragraph) > 30:
-                    formatted_paragraphs.append(paragraph)
-                else:
-                    filtered_count += 1
-            
-            # Join paragraphs with proper spacing
-            formatted_text = '\n\n'.join(formatted_paragraphs)
-            
-            logger.info(f"Formatting stats - Original: {original_length} chars, Filtered {filtered_count} paragraphs, Final: {len(formatted_text)} chars")
-            
-            # Limit to reasonable length for display
-            if len(formatted_text) > 25000:
-                formatted_text = formatted_text[:25000] + "\n\n[Article truncated for display]"
-                logger.info("Article truncated due to length limit (25000 chars)")
-            
-            return formatted_text
-            
-        except Exception as e:
-            logger.error(f"Error formatting article text: {e}")
-            return text
+    def _extract_page(self, url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Extract readable text and metadata from a downloaded page in the extraction pool"""
+        if not Config.EXTRACTION_RACE_ENABLED:
+            return self.extraction_pool.run(extract_page, url, html)
+        return self._race_strategies(url, html)
 
-    def _is_likely_noise(self, line: str) -> bool:
-        """Check if a line is likely to be noise (ads, navigation, etc.)"""
-        noise_patterns = [
-            'subscribe', 'newsletter', 'advertisement', 'click here', 'read more',
-            'sign up', 'follow us', 'share this', 'cookie', 'privacy policy',
-            'terms of service', 'related articles', 'trending now', 'most popular',
-            'you may also like', 'recommended for you', 'advertisement', 'sponsored',
-            'continue reading', 'view comments', 'leave a comment', 'social media',
-            'facebook', 'twitter', 'instagram', 'linkedin', 'download app',
-            'get notifications', 'breaking news alert', 'newsletter signup'
-        ]
+    def _race_strategies(self, url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Run every strategy at once on a page and keep the best scoring text
         
-        line_lower = line.lower()
+        Waiting stops at the first text scoring at least Config.EXTRACTION_RACE_CONFIDENCE.
+        When the pool has no free worker for every strategy, they are tried one after another.
+        """
+        results = self.extraction_pool.race(
+            [(run_strategy, (name, url, html)) for name in STRATEGIES],
+            accept=lambda result: result['score'] >= Config.EXTRACTION_RACE_CONFIDENCE
+        )
+        if results is None:
+            with self._race_lock:
+                self._race_stats['skipped'] += 1
+            logger.info(f"Too few free extraction workers to race, extracting {url} sequentially")
+            return self.extraction_pool.run(extract_page, url, html)
+        metadata = next((result['metadata'] for result in results if result['metadata']), None)
+        best = max(results, key=lambda result: result['score'], default=None)
         
-        # Check for noise patterns
-        if any(pattern in line_lower for pattern in noise_patterns):
-            return True
-            
-        # Check for very short lines (likely navigation)
-        if len(line.strip()) < 20:
-            return True
-            
-        # Check for lines that are mostly punctuation or numbers
-        if len(re.sub(r'[^a-zA-Z]', '', line)) < len(line) * 0.5:
+        with self._race_lock:
+            self._race_stats['races'] += 1
+            if best is None or not best['text']:
+                self._race_stats['no_content'] += 1
+            else:
+                self._race_stats['wins'][best['strategy']] += 1
+                if best['score'] >= Config.EXTRACTION_RACE_CONFIDENCE and len(results) < len(STRATEGIES):
+                    self._race_stats['early'] += 1
+        
+        if best is None or not best['text']:
+            logger.warning(f"Could not extract meaningful content from {url}")
+            return None, metadata
+        logger.info(f"Extracted article using {best['strategy']} (score {best['score']} "
+                    f"of {len(results)} finished strategies): {len(best['text'])} characters")
+        return best['text'], metadata
+
+    def get_race_stats(self) -> Dict[str, Any]:
+        """Get counters of raced extractions and the strategies that won them"""
+        with self._race_lock:
+            return dict(self._race_stats, wins=dict(self._race_stats['wins']),
+                        enabled=Config.EXTRACTION_RACE_ENABLED)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get article cache hit/miss counters"""
+        if self.extraction_cache is None:
+            return {'enabled': False}
+        return dict(self.extraction_cache.get_stats(), enabled=True)
+
+    def _out_of_time(self, url: str) -> bool:
+        """Check whether the request's deadline leaves no time for another download"""
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining() < self.MIN_DOWNLOAD_TIME:
+            logger.warning(f"Request deadline reached, giving up on extracting {url}")
             return True
-            
         return False
 
+    def _format_newspaper_content(self, text: str) -> str:
+        """Format article content using newspaper3k-style formatting (NO API calls)"""
+        return format_article_text(text)
+
+    def _is_likely_noise(self, line: str) -> bool:
+        """Check if a line is likely to be noise (ads, navigation, etc.)"""
+        return is_likely_noise(line)
+
     def get_readable_article(self, url: str, title: str = "") -> Dict[str, str]:
         """Get a readable version of the article with newspaper3k formatting (NO API calls)"""
         try:
@@ -205,19 +199,21 @@ class ArticleExtractor:
     def get_article_metadata(self, url: str) -> Dict[str, str]:
         """Extract article metadata using newspaper3k (NO API calls)"""
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            
-            return {
-                "title": article.title or "No title available",
-                "authors": ", ".join(article.authors) if article.authors else "Unknown author",
-                "publish_date": str(article.publish_date) if article.publish_date else "Unknown date",
-                "summary": article.summary[:500] if article.summary else "No summary available",
-                "keywords": ", ".join(article.keywords[:10]) if article.keywords else "No keywords",
-                "top_image": article.top_image or "",
-                "text_length": len(article.text) if article.text else 0
-            }
+            metadata = self._cached_value(url, 'metadata')
+            if metadata is None and self.extraction_cache is not None:
+                # Extraction caches the metadata of the page it downloads; if it cached none,
+                # the page could not be downloaded or parsed and fetching it again would not help
+                self.extract_full_article(url)
+                metadata = self._cached_value(url, 'metadata')
+                if metadata is None:
+                    raise ValueError("article could not be extracted")
+            if metadata is not None:
+                return metadata
+            
+            html = self.fetcher.fetch(url)
+            if not html:
+                raise ValueError("page could not be downloaded")
+            return self.extraction_pool.run(parse_metadata, url, html)
             
         except Exception as e:
             logger.error(f"Error extracting metadata from {url}: {e}")
@@ -230,5 +226,3 @@ class ArticleExtractor:
                 "top_image": "",
                 "text_length": 0
             }
-
-
@@ -0,0 +1,246 @@
+"""
+Article Parser Module for NewsFlash Application
+
+This module provides parsing of downloaded article pages including:
+- newspaper3k, trafilatura and BeautifulSoup extraction strategies
+- Noise filtering and paragraph formatting of extracted text
+- Quality scores used to pick between strategies
+- Picklable entry points for the extraction pool's worker processes
+
+It imports only parsing libraries and configuration, so worker processes that
+import it do not load the web application.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Optional, Tuple
+import trafilatura
+from bs4 import BeautifulSoup
+from newspaper import Article
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+NOISE_PATTERNS = [
+    'subscribe', 'newsletter', 'advertisement', 'click here', 'read more',
+    'sign up', 'follow us', 'share this', 'cookie', 'privacy policy',
+    'terms of service', 'related articles', 'trending now', 'most popular',
+    'you may also like', 'recommended for you', 'advertisement', 'sponsored',
+    'continue reading', 'view comments', 'leave a comment', 'social media',
+    'facebook', 'twitter', 'instagram', 'linkedin', 'download app',
+    'get notifications', 'breaking news alert', 'newsletter signup'
+]
+
+
+def is_likely_noise(line: str) -> bool:
+    """Check if a line is likely to be noise (ads, navigation, etc.)"""
+    line_lower = line.lower()
+    
+    # Check for noise patterns
+    if any(pattern in line_lower for pattern in NOISE_PATTERNS):
+        return True
+        
+    # Check for very short lines (likely navigation)
+    if len(line.strip()) < 20:
+        return True
+        
+    # Check for lines that are mostly punctuation or numbers (Latin or Devanagari letters count as text)
+    if len(re.sub(r'[^a-zA-Z\u0900-\u0963\u0971-\u097F]', '', line)) < len(line) * 0.5:
+        return True
+        
+    return False
+
+
+def format_article_text(text: str) -> str:
+    """Format article content using newspaper3k-style formatting (NO API calls)"""
+    try:
+        # Clean up the text
+        text = text.strip()
+        original_length = len(text)
+    
+        # Remove excessive whitespace and normalize line breaks
+        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple line breaks to double
+        text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single space
+    
+        # Split into paragraphs
+        paragraphs = text.split('\n\n')
+        formatted_paragraphs = []
+        filtered_count = 0
+    
+        for paragraph in paragraphs:
+            paragraph = paragraph.strip()
+    
+            # Skip very short lines (likely navigation/ads)
+            if len(paragraph) < 20:
+                filtered_count += 1
+                continue
+    
+            # Skip lines that look like navigation or ads
+            if is_likely_noise(paragraph):
+                filtered_count += 1
+                logger.debug(f"Filtered noise paragraph: {paragraph[:50]}...")
+                continue
+    
+            # Clean up the paragraph
+            paragraph = re.sub(r'\s+', ' ', paragraph)  # Normalize whitespace
+            paragraph = paragraph.strip()
+    
+            # Only keep substantial paragraphs
+            if len(paragraph) > 30:
+                formatted_paragraphs.append(paragraph)
+            else:
+                filtered_count += 1
+    
+        # Join paragraphs with proper spacing
+        formatted_text = '\n\n'.join(formatted_paragraphs)
+    
+        logger.info(f"Formatting stats - Original: {original_length} chars, Filtered {filtered_count} paragraphs, Final: {len(formatted_text)} chars")
+    
+        # Limit to reasonable length for display
+        if len(formatted_text) > 25000:
+            formatted_text = formatted_text[:25000] + "\n\n[Article truncated for display]"
+            logger.info("Article truncated due to length limit (25000 chars)")
+    
+        return formatted_text
+    
+    except Exception as e:
+        logger.error(f"Error formatting article text: {e}")
+        return text
+
+
+def article_metadata(article: Article) -> Dict[str, Any]:
+    """Build the metadata of a parsed newspaper3k article"""
+    return {
+        "title": article.title or "No title available",
+        "authors": ", ".join(article.authors) if article.authors else "Unknown author",
+        "publish_date": str(article.publish_date) if article.publish_date else "Unknown date",
+        "summary": article.summary[:500] if article.summary else "No summary available",
+        "keywords": ", ".join(article.keywords[:10]) if article.keywords else "No keywords",
+        "top_image": article.top_image or "",
+        "text_length": len(article.text) if article.text else 0
+    }
+
+
+def parse_metadata(url: str, html: str) -> Dict[str, Any]:
+    """Parse a downloaded page with newspaper3k and build its metadata"""
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    return article_metadata(article)
+
+
+def newspaper_text(url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Extract text and metadata with newspaper3k - excellent for article extraction"""
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    return article.text, article_metadata(article)
+
+
+def trafilatura_text(url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Extract text with trafilatura"""
+    return trafilatura.extract(html, url=url, include_comments=False, include_tables=True), None
+
+
+def soup_text(url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Extract the text of the page's main content area with BeautifulSoup"""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Remove unwanted elements
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
+        element.decompose()
+    
+    # Try to find the main content area
+    content_selectors = [
+        'article', '[role="main"]', '.article-content', 
+        '.post-content', '.entry-content', '.content', 'main'
+    ]
+    
+    article_content = None
+    for selector in content_selectors:
+        elements = soup.select(selector)
+        if elements:
+            article_content = elements[0]
+            break
+    
+    if not article_content:
+        article_content = soup.find('body')
+    
+    return (article_content.get_text(separator='\n', strip=True) if article_content else None), None
+
+
+# Extraction strategies, in the order they are tried one after another
+STRATEGIES = {
+    'newspaper3k': newspaper_text,
+    'trafilatura': trafilatura_text,
+    'beautifulsoup': soup_text,
+}
+
+
+def score_extraction(raw_text: Optional[str], text: Optional[str]) -> float:
+    """
+    Score how likely an extraction is the complete article.
+
+    Args:
+        raw_text: Text as the strategy returned it
+        text: The same text after formatting
+
+    Returns:
+        Score from 0 to 1, from the formatted length and paragraph count and the share of
+        raw lines that were noise; 0 for extractions of 100 characters or less
+    """
+    if not text or len(text.strip()) <= 100:
+        return 0.0
+    lines = [line for line in raw_text.splitlines() if line.strip()]
+    noise_ratio = sum(1 for line in lines if is_likely_noise(line)) / len(lines) if lines else 1.0
+    length_score = min(len(text) / Config.EXTRACTION_RACE_TARGET_LENGTH, 1.0)
+    paragraph_score = min(text.count('\n\n') + 1, 5) / 5
+    return round(0.5 * length_score + 0.3 * paragraph_score + 0.2 * (1 - noise_ratio), 3)
+
+
+def run_strategy(name: str, url: str, html: str) -> Dict[str, Any]:
+    """
+    Run one extraction strategy on a downloaded page, then format and score its text.
+
+    Runs in the extraction pool's worker processes, so it only takes and returns plain data.
+
+    Args:
+        name: Key of STRATEGIES
+        url: Page URL
+        html: Downloaded HTML
+
+    Returns:
+        Dictionary with the strategy name, formatted 'text' (None if it found too little),
+        'score' and newspaper3k 'metadata' (None for other strategies)
+    """
+    try:
+        raw_text, metadata = STRATEGIES[name](url, html)
+    except Exception as e:
+        logger.warning(f"{name} extraction failed: {e}")
+        return {'strategy': name, 'text': None, 'score': 0.0, 'metadata': None}
+    
+    logger.info(f"{name} raw text length: {len(raw_text) if raw_text else 0}")
+    text = format_article_text(raw_text) if raw_text else None
+    score = score_extraction(raw_text, text)
+    if not score:
+        logger.warning(f"{name} extracted text too short or empty: {len(text) if text else 0} characters")
+        text = None
+    return {'strategy': name, 'text': text, 'score': score, 'metadata': metadata}
+
+
+def extract_page(url: str, html: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Extract readable text and metadata from a downloaded page
+    
+    newspaper3k, trafilatura and BeautifulSoup are tried in turn on the same HTML, until one
+    finds more than 100 characters. Runs in the extraction pool's worker processes.
+    """
+    metadata = None
+    for name in STRATEGIES:
+        result = run_strategy(name, url, html)
+        metadata = metadata or result['metadata']
+        if result['text']:
+            logger.info(f"Successfully extracted article using {name}: {len(result['text'])} characters")
+            return result['text'], metadata
+    
+    logger.warning(f"Could not extract meaningful content from {url}")
+    return None, metadata
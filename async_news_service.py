@@ -0,0 +1,385 @@
+"""
+Async News Service Module for NewsFlash Application
+
+This module provides an asyncio-native variant of NewsService including:
+- Summaries and sentiment through LangChain ainvoke/abatch instead of blocking invoke
+- Async semaphores bounding AI requests and DuckDuckGo searches in flight
+- The shared rate limiter, summary cache and prompt templates of NewsService
+- A background event loop so synchronous Flask views can drive it
+- A command line entry point for ad-hoc searches
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+from langchain_core.runnables import RunnableLambda
+from config import Config
+from language_service import LanguageService
+from news_service import NewsService
+from deadline import remaining_budget
+from retry_budget import record_attempt
+from rate_limiter import is_rate_limit_error
+from sentiment_lexicon import LexiconSentimentAnalyzer
+from structured_output import parse_structured_response
+from error_handler import (
+    ErrorHandler, FallbackManager, with_retry, handle_language_operation_async, check_deadline,
+    AIServiceError, StructuredOutputError
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNewsService(NewsService):
+    """NewsService whose searches and AI calls run as coroutines on one event loop."""
+
+    def __init__(self):
+        super().__init__()
+        # Semaphores belong to the loop they are first used on; keep one pair per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        # Every AI call in a chain goes through the gate, so ainvoke and abatch share its limits
+        self._gated_llm = RunnableLambda(self._acall_llm, name="gated_llm")
+        self._gated_structured_llm = RunnableLambda(self._acall_structured_llm, name="gated_structured_llm")
+        self.prompts.build([
+            (('summary_sentiment', 'sentiment'), self._gated_llm),
+            (('structured', 'correction'), self._gated_structured_llm),
+        ])
+
+    def _get_semaphores(self) -> Dict[str, asyncio.Semaphore]:
+        """Get the AI and search semaphores for the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = {
+                'llm': asyncio.Semaphore(max(1, Config.ASYNC_LLM_CONCURRENCY)),
+                'search': asyncio.Semaphore(max(1, Config.ASYNC_SEARCH_CONCURRENCY)),
+            }
+            self._semaphores[loop] = semaphores
+        return semaphores
+
+    def run_sync(self, coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the service's background event loop from synchronous code
+
+        Args:
+            coroutine: Coroutine to run, e.g. self.asearch_news(...)
+            timeout: Maximum seconds to wait for the result (defaults to the time the request
+                has left of Config.REQUEST_DEADLINE)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine did not finish in time; it is cancelled
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="async-news-loop", daemon=True).start()
+        if timeout is None:
+            timeout = remaining_budget(Config.REQUEST_DEADLINE)
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # Stop the coroutine too, so it does not keep searching and summarizing for nobody
+            future.cancel()
+            logger.warning(f"Async news operation cancelled after {timeout:.1f}s")
+            raise
+
+    def _search_news(self, topic: str, max_results: int = 5, language: str = 'en',
+                     session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run asearch_news on the background loop for the synchronous search_news"""
+        return self.run_sync(self.asearch_news(topic, max_results, language, session_id))
+
+    def search_multiple_topics(self, topics: List[str], max_results_per_topic: int = 5, language: str = 'en') -> Dict[str, List[Dict[str, Any]]]:
+        """Synchronous entry point running asearch_multiple_topics on the background loop"""
+        return self.run_sync(self.asearch_multiple_topics(topics, max_results_per_topic, language))
+
+    async def _acquire_rate_limit(self) -> None:
+        """Wait for a shared rate limit token without blocking the event loop"""
+        deadline = time.monotonic() + remaining_budget(Config.RATE_LIMIT_MAX_WAIT)
+        while True:
+            try:
+                wait_time = self.rate_limiter.try_acquire()
+            except Exception as e:
+                logger.error(f"Rate limiter error, allowing request: {e}")
+                return
+            if wait_time <= 0:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AIServiceError("Timed out waiting for an AI request slot")
+            await asyncio.sleep(min(wait_time, remaining))
+
+    async def _acall_llm(self, prompt):
+        """Call the model once a semaphore slot and a rate limit token are available"""
+        return await self._acall_model(self.llm, prompt)
+
+    async def _acall_structured_llm(self, prompt):
+        """Call the JSON schema constrained model through the same gate"""
+        return await self._acall_model(self.structured_llm, prompt)
+
+    async def _acall_model(self, model, prompt):
+        """Wait for a semaphore slot and a rate limit token, then call the model
+
+        Calls are rejected with CircuitOpenError while the Gemini circuit is open, and
+        with DeadlineExceededError once the request's deadline has passed.
+        """
+        check_deadline("AI request")
+        self.gemini_circuit.check()
+        async with self._get_semaphores()['llm']:
+            try:
+                await self._acquire_rate_limit()
+            except BaseException:
+                # Timed out or cancelled before anything was sent
+                self.gemini_circuit.cancel()
+                raise
+            record_attempt('gemini')
+            try:
+                result = await model.ainvoke(prompt)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.rate_limiter.record_throttle()
+                self.gemini_circuit.record_failure(e)
+                raise
+        self.rate_limiter.record_success()
+        self.gemini_circuit.record_success()
+        return result
+
+    async def asearch_news(self, topic: str, max_results: int = 5, language: str = 'en',
+                           session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search for news on a topic and summarize the results concurrently
+
+        Summaries not ready within Config.TOPIC_TIME_BUDGET seconds fall back to the
+        article body with neutral sentiment. Duplicates are handled as in NewsService.search_news.
+        """
+        try:
+            logger.info(f"Searching for news on topic: {topic} (language: {language})")
+            target_language = LanguageService.get_fallback_language(language)
+
+            # duckduckgo_search has no async client, so searches run in a worker thread
+            async with self._get_semaphores()['search']:
+                fetch_count = max_results * 2 if session_id and self.deduplicator is not None else max_results
+                found = await asyncio.to_thread(self._find_articles, topic, fetch_count, target_language, session_id)
+            articles, novel = self._deduplicate(found, target_language, session_id, max_results)
+
+            try:
+                await asyncio.wait_for(self.asummarize_articles(novel, target_language),
+                                       remaining_budget(Config.TOPIC_TIME_BUDGET))
+            except asyncio.TimeoutError:
+                logger.warning(f"Summary time budget exceeded for topic {topic}, using fallback summaries")
+
+            for article in novel:
+                if 'sentiment' not in article:
+                    article.update({
+                        'summary': self._fallback_summary(article['body'], target_language),
+                        'sentiment': self._fallback_sentiment(article['body'], target_language),
+                        'summary_language': target_language,
+                        'ai_summary': False
+                    })
+            self._remember_articles(novel, target_language)
+            self.mark_articles_seen(session_id, articles)
+
+            logger.info(f"Found {len(articles)} articles for topic: {topic} (language: {target_language})")
+            return articles
+
+        except Exception as e:
+            logger.error(f"Error searching news for topic {topic}: {e}")
+            return []
+
+    async def asearch_multiple_topics(self, topics: List[str], max_results_per_topic: int = 5,
+                                      language: str = 'en') -> Dict[str, List[Dict[str, Any]]]:
+        """Search several topics concurrently, preserving the caller's topic order"""
+        target_language = LanguageService.get_fallback_language(language)
+        results = await asyncio.gather(
+            *(self.asearch_news(topic, max_results_per_topic, target_language) for topic in topics)
+        )
+        return dict(zip(topics, results))
+
+    async def asummarize_articles(self, articles: List[Dict[str, Any]], language: str) -> None:
+        """Fill in summaries and sentiments with one abatch call for the uncached articles
+
+        Args:
+            articles: Articles to summarize (updated in place)
+            language: Language for the summaries
+        """
+        pending = []
+        for article in articles:
+            body = article['body']
+            if len(body) < Config.AI_SUMMARY_MIN_LENGTH or not self._ai_summary_enabled() or self.gemini_circuit.is_open():
+                article.update({
+                    'summary': self._fallback_summary(body, language) if body else 'No summary available',
+                    'sentiment': self._fallback_sentiment(body, language),
+                    'summary_language': language,
+                    'ai_summary': False
+                })
+                continue
+            cached = self._get_cached_result('summary_sentiment', body, article['title'], language)
+            if cached:
+                article.update(summary=cached['summary'][:2000], sentiment=cached['sentiment'], summary_language=language,
+                               ai_summary=True)
+            else:
+                pending.append(article)
+
+        if not pending:
+            return
+
+        if Config.STRUCTURED_OUTPUT_ENABLED:
+            chain = self.prompts.chain('structured', language, self._gated_structured_llm)
+        else:
+            chain = self.prompts.compose(self.get_sentiment_prompt_template(language), self._gated_llm)
+        inputs = [self.token_budget.prepare_inputs(article['title'], article['body'], language) for article in pending]
+        results = await chain.abatch(
+            inputs, config={'max_concurrency': max(1, Config.ASYNC_LLM_CONCURRENCY)}, return_exceptions=True
+        )
+        # abatch returns a cancellation (e.g. the search time budget running out) as a
+        # result; stop here instead of retrying past the budget
+        if any(isinstance(result, asyncio.CancelledError) for result in results):
+            raise asyncio.CancelledError()
+
+        retry = []
+        for article, result in zip(pending, results):
+            summary, sentiment = (None, None)
+            if not isinstance(result, Exception) and getattr(result, 'content', None):
+                summary, sentiment = self._parse_batched_answer(result.content, language)
+            if summary:
+                response = {'summary': summary, 'sentiment': sentiment or FallbackManager.get_sentiment_fallback(),
+                            'language': language, 'ai_summary': True}
+                self._cache_result('summary_sentiment', article['body'], article['title'], language, response)
+                article.update(summary=summary[:2000], sentiment=response['sentiment'], summary_language=language,
+                               ai_summary=True)
+            else:
+                retry.append(article)
+
+        # Failed batch items get the single-article path with its retries and language fallback
+        if retry:
+            logger.info(f"{len(retry)} of {len(pending)} batched summaries failed, retrying individually")
+            summaries = await asyncio.gather(
+                *(self.agenerate_summary_with_sentiment(a['body'], a['title'], language) for a in retry)
+            )
+            for article, data in zip(retry, summaries):
+                article.update(summary=str(data['summary'])[:2000], sentiment=data['sentiment'],
+                               summary_language=data['language'], ai_summary=bool(data.get('ai_summary')))
+
+    def _parse_batched_answer(self, content: str, language: str) -> tuple:
+        """Parse one abatch answer, leaving malformed structured output to the per-article retry"""
+        if not Config.STRUCTURED_OUTPUT_ENABLED:
+            return self._parse_summary_and_sentiment(content)
+        try:
+            data = parse_structured_response(content, language)
+        except StructuredOutputError as e:
+            logger.debug(f"Malformed structured output in batch: {e}")
+            return None, None
+        return data['summary'], data['sentiment']
+
+    async def _ainvoke_structured(self, inputs: Dict[str, str], language: str) -> Dict[str, str]:
+        """Async counterpart of NewsService._invoke_structured, with one correction retry"""
+        language = LanguageService.get_fallback_language(language)
+        chain = self.prompts.chain('structured', language, self._gated_structured_llm)
+        content = getattr(await chain.ainvoke(inputs), 'content', None) or ''
+        try:
+            return parse_structured_response(content, language)
+        except StructuredOutputError as e:
+            logger.warning(f"Malformed structured output in {language} ({e}), retrying once")
+            chain = self.prompts.chain('correction', language, self._gated_structured_llm)
+            content = getattr(await chain.ainvoke(dict(inputs, previous=content[:1000], error=str(e))), 'content', None) or ''
+            return parse_structured_response(content, language)
+
+    async def agenerate_summary_with_sentiment(self, article_text: str, title: str, language: str = 'en') -> dict:
+        """Generate summary and sentiment with one ainvoke call, falling back like the sync version"""
+        target_language = LanguageService.get_fallback_language(language)
+        try:
+            if (len(article_text) < Config.AI_SUMMARY_MIN_LENGTH or not self._ai_summary_enabled()
+                    or self.gemini_circuit.is_open()):
+                return self._fallback_result(article_text, target_language)
+
+            cached = self._get_cached_result('summary_sentiment', article_text, title, target_language)
+            if cached:
+                return dict(cached, ai_summary=True)
+
+            return await handle_language_operation_async(
+                "agenerate_summary_with_sentiment",
+                language,
+                self._agenerate_summary_with_sentiment_for_language,
+                article_text, title
+            )
+
+        except Exception as e:
+            ErrorHandler.log_language_error("agenerate_summary_with_sentiment", target_language, e)
+            return self._fallback_result(article_text, target_language)
+
+    @with_retry()
+    async def _agenerate_summary_with_sentiment_for_language(self, article_text: str, title: str, language: str) -> dict:
+        """Generate summary and sentiment for a specific language with retry logic"""
+        inputs = self.token_budget.prepare_inputs(title, article_text, language)
+        if Config.STRUCTURED_OUTPUT_ENABLED:
+            data = await self._ainvoke_structured(inputs, language)
+            summary, sentiment = data['summary'], data['sentiment']
+        else:
+            chain = self.prompts.compose(self.get_sentiment_prompt_template(language), self._gated_llm)
+            result = await chain.ainvoke(inputs)
+            if not getattr(result, 'content', None):
+                raise AIServiceError("No content in AI response")
+            summary, sentiment = self._parse_summary_and_sentiment(result.content)
+        response = {
+            'summary': summary or self._fallback_summary(article_text, language),
+            'sentiment': sentiment or FallbackManager.get_sentiment_fallback(),
+            'language': language,
+            'ai_summary': bool(summary)
+        }
+        if summary:
+            self._cache_result('summary_sentiment', article_text, title, language, response)
+        return response
+
+    async def aanalyze_sentiment(self, text: str, language: str = 'en') -> str:
+        """Analyze the sentiment of text with ainvoke, returning neutral on any failure"""
+        if len(text.strip()) < 20:
+            return 'neutral'
+
+        target_language = LanguageService.get_fallback_language(language)
+        try:
+            local = self.sentiment_lexicon.score(text, target_language) if Config.SENTIMENT_LEXICON_ENABLED else None
+            if local and LexiconSentimentAnalyzer.is_confident(local):
+                self.sentiment_lexicon.record_decision(local, target_language, escalated=False)
+                return local['sentiment']
+            if self.gemini_circuit.is_open():
+                return FallbackManager.get_sentiment_fallback()
+
+            inputs = self.token_budget.prepare_inputs("Sentiment Analysis", text, target_language)
+            if Config.STRUCTURED_OUTPUT_ENABLED:
+                result = None
+                sentiment = (await self._ainvoke_structured(inputs, target_language))['sentiment']
+            else:
+                chain = self.prompts.compose(self.get_sentiment_prompt_template(target_language), self._gated_llm)
+                result = await chain.ainvoke(inputs)
+                sentiment = self._parse_sentiment_from_response(result.content) if getattr(result, 'content', None) else None
+            if sentiment:
+                if local:
+                    self.sentiment_lexicon.record_decision(local, target_language, escalated=True, ai_sentiment=sentiment)
+                return sentiment
+            raise AIServiceError("No content in sentiment analysis response")
+        except Exception as e:
+            ErrorHandler.log_sentiment_error("aanalyze_sentiment", e)
+            return FallbackManager.get_sentiment_fallback()
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, List[Dict[str, Any]]]:
+    """Run a multi-topic search for the command line"""
+    service = AsyncNewsService()
+    return await service.asearch_multiple_topics(args.topics, args.max_results, args.language)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Search and summarize news with the async NewsService")
+    parser.add_argument('topics', nargs='+', help="Topics to search")
+    parser.add_argument('--language', default='en', help="Summary language (en, hi, mr)")
+    parser.add_argument('--max-results', type=int, default=Config.NEWS_RESULTS_PER_TOPIC, help="Articles per topic")
+    results = asyncio.run(_main(parser.parse_args()))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
@@ -0,0 +1,220 @@
+"""
+Candidate Buffer Module for NewsFlash Application
+
+This module provides cursor pagination over buffered search results including:
+- One window of search candidates per session, topic and language
+- Opaque cursors holding a buffer and a position in it
+- The window of a session's first search, picked up by its first "load more"
+- Buffers that grow from a larger search only when their candidates run out
+- Expiry of idle buffers and counters of pages served from buffers and refills
+"""
+
+import base64
+import binascii
+import logging
+import secrets
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from cachetools import TTLCache
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateWindow:
+    """Search candidates for one session, topic and language, in search order."""
+
+    def __init__(self, buffer_id: str, session_id: Optional[str], topic: str, language: str,
+                 candidates: List[Dict[str, Any]], fetched: int):
+        """
+        Initialize a window.
+
+        Args:
+            buffer_id: Identifier used in cursors
+            session_id: Session the window belongs to
+            topic: Normalized topic searched
+            language: Language of the search
+            candidates: Unsummarized articles from the search
+            fetched: Number of results the search asked for
+        """
+        self.buffer_id = buffer_id
+        self.session_id = session_id
+        self.topic = topic
+        self.language = language
+        self.candidates = []
+        self.fetched = fetched
+        self.exhausted = False
+        self._urls = set()
+        self._lock = threading.Lock()
+        self.extend(candidates)
+
+    def extend(self, candidates: List[Dict[str, Any]]) -> int:
+        """
+        Append candidates not already in the window.
+
+        Args:
+            candidates: Articles from a larger search of the same topic
+
+        Returns:
+            Number of candidates added
+        """
+        added = 0
+        with self._lock:
+            for candidate in candidates:
+                url = candidate.get('url') or candidate.get('title')
+                if url in self._urls:
+                    continue
+                self._urls.add(url)
+                self.candidates.append(candidate)
+                added += 1
+        return added
+
+    def take(self, offset: int, count: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read candidates from a position.
+
+        Args:
+            offset: Position to read from
+            count: Maximum number of candidates
+
+        Returns:
+            Tuple of (copies of the candidates read, position after them)
+        """
+        with self._lock:
+            batch = [dict(candidate) for candidate in self.candidates[offset:offset + count]]
+        return batch, offset + len(batch)
+
+    def has_more(self, offset: int) -> bool:
+        """Whether candidates remain after offset, or a larger search may still find some"""
+        with self._lock:
+            return offset < len(self.candidates) or not self.exhausted
+
+
+class CandidateBuffer:
+    """Per-session candidate windows addressed by opaque cursors."""
+
+    def __init__(self, ttl: Optional[float] = None, max_buffers: Optional[int] = None):
+        """
+        Initialize the buffer store.
+
+        Args:
+            ttl: Seconds an idle window is kept (defaults to Config.PAGINATION_BUFFER_TTL)
+            max_buffers: Maximum windows kept (defaults to Config.PAGINATION_MAX_BUFFERS)
+        """
+        self._windows = TTLCache(
+            maxsize=max_buffers or Config.PAGINATION_MAX_BUFFERS,
+            ttl=ttl if ttl is not None else Config.PAGINATION_BUFFER_TTL
+        )
+        # Latest window per (session, topic, language), for pages requested without a cursor
+        self._latest = TTLCache(maxsize=self._windows.maxsize, ttl=self._windows.ttl)
+        self._lock = threading.Lock()
+        self._stats = {'opened': 0, 'resumed': 0, 'rejected': 0, 'refills': 0}
+
+    def open(self, session_id: Optional[str], topic: str, language: str,
+             candidates: List[Dict[str, Any]], fetched: int) -> CandidateWindow:
+        """
+        Buffer the candidates of a new search.
+
+        Args:
+            session_id: Session paging through the results
+            topic: Normalized topic searched
+            language: Language of the search
+            candidates: Unsummarized articles from the search
+            fetched: Number of results the search asked for
+
+        Returns:
+            The new window
+        """
+        window = CandidateWindow(secrets.token_urlsafe(12), session_id, topic, language, candidates, fetched)
+        with self._lock:
+            self._windows[window.buffer_id] = window
+            if session_id:
+                self._latest[(session_id, topic, language)] = window.buffer_id
+            self._stats['opened'] += 1
+        return window
+
+    def resume(self, cursor: Optional[str], session_id: Optional[str], topic: str,
+               language: str) -> Tuple[Optional[CandidateWindow], int]:
+        """
+        Find the window and position a cursor points to.
+
+        Without a cursor the session's latest window for the topic is read from the start.
+        Cursors of another session, topic or language, and cursors of expired windows, are
+        treated as missing.
+
+        Args:
+            cursor: Cursor from an earlier page, if any
+            session_id: Session asking for the page
+            topic: Normalized topic requested
+            language: Language requested
+
+        Returns:
+            Tuple of (window or None, position in it)
+        """
+        if not cursor:
+            with self._lock:
+                buffer_id = self._latest.get((session_id, topic, language)) if session_id else None
+            decoded = (buffer_id, 0) if buffer_id else None
+        else:
+            decoded = self.decode_cursor(cursor)
+        if decoded is None:
+            return None, 0
+
+        buffer_id, offset = decoded
+        with self._lock:
+            window = self._windows.get(buffer_id)
+            if window is None or (window.session_id, window.topic, window.language) != (session_id, topic, language):
+                self._stats['rejected'] += 1
+                return None, 0
+            # Reading a window keeps it alive
+            self._windows[buffer_id] = window
+            self._stats['resumed'] += 1
+        return window, offset
+
+    def record_refill(self) -> None:
+        """Count a window grown from a larger search"""
+        with self._lock:
+            self._stats['refills'] += 1
+
+    @staticmethod
+    def encode_cursor(window: CandidateWindow, offset: int) -> str:
+        """
+        Build an opaque cursor for a position in a window.
+
+        Args:
+            window: Window the next page is read from
+            offset: Position of the next page
+
+        Returns:
+            URL-safe cursor string
+        """
+        return base64.urlsafe_b64encode(f"{window.buffer_id}:{offset}".encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+        """
+        Read a cursor built by encode_cursor.
+
+        Args:
+            cursor: Cursor string from a client
+
+        Returns:
+            Tuple of (buffer id, position), or None if the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            buffer_id, offset = base64.urlsafe_b64decode(padded.encode()).decode().rsplit(":", 1)
+            return (buffer_id, int(offset)) if int(offset) >= 0 else None
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            logger.debug(f"Ignoring malformed pagination cursor: {cursor[:40]}")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pagination counters.
+
+        Returns:
+            Dictionary of windows opened, resumed and refilled, cursors rejected, and windows buffered
+        """
+        with self._lock:
+            return dict(self._stats, buffers=len(self._windows))
@@ -55,6 +55,19 @@ class Config:
     # Application Settings
     NEWS_RESULTS_PER_TOPIC = 5
     LOAD_MORE_COUNT = 5
+    PAGINATION_WINDOW = int(os.getenv("PAGINATION_WINDOW", "20"))  # Search results fetched and buffered per topic for "load more" pages
+    PAGINATION_MAX_CANDIDATES = int(os.getenv("PAGINATION_MAX_CANDIDATES", "60"))  # Largest search a buffer grows to once its candidates run out
+    PAGINATION_BUFFER_TTL = int(os.getenv("PAGINATION_BUFFER_TTL", "1800"))  # Seconds an idle buffer and its cursors stay valid
+    PAGINATION_MAX_BUFFERS = 1024  # Buffers kept per worker
+    
+    # Concurrency Settings
+    CONCURRENT_SEARCH_ENABLED = os.getenv("CONCURRENT_SEARCH_ENABLED", "true").lower() == "true"
+    SEARCH_MAX_WORKERS = int(os.getenv("SEARCH_MAX_WORKERS", "5"))  # Topics searched in parallel
+    SUMMARY_MAX_WORKERS = int(os.getenv("SUMMARY_MAX_WORKERS", "5"))  # Articles summarized in parallel
+    TOPIC_TIME_BUDGET = float(os.getenv("TOPIC_TIME_BUDGET", "30"))  # Seconds allowed per topic before partial results are returned
+    ASYNC_NEWS_SERVICE_ENABLED = os.getenv("ASYNC_NEWS_SERVICE_ENABLED", "false").lower() == "true"  # Serve searches from the asyncio service
+    ASYNC_LLM_CONCURRENCY = int(os.getenv("ASYNC_LLM_CONCURRENCY", "20"))  # AI requests in flight at once on the event loop
+    ASYNC_SEARCH_CONCURRENCY = int(os.getenv("ASYNC_SEARCH_CONCURRENCY", "5"))  # DuckDuckGo searches in flight at once
     
     # TTS Settings
     TTS_LANGUAGE = 'en'
@@ -73,15 +86,100 @@ class Config:
     SENTIMENT_ANALYSIS_ENABLED = os.getenv("SENTIMENT_ANALYSIS_ENABLED", "true").lower() == "true"
     SENTIMENT_DEFAULT = "neutral"  # Default sentiment when analysis fails
     SENTIMENT_DISPLAY_ENABLED = os.getenv("SENTIMENT_DISPLAY_ENABLED", "true").lower() == "true"
+    SENTIMENT_LEXICON_ENABLED = os.getenv("SENTIMENT_LEXICON_ENABLED", "true").lower() == "true"  # Try the local lexicon before the AI
+    SENTIMENT_LEXICON_THRESHOLD = float(os.getenv("SENTIMENT_LEXICON_THRESHOLD", "0.6"))  # Minimum lexicon confidence to skip the AI
     
     # AI Settings
     USE_AI_SUMMARY = os.getenv("USE_AI_SUMMARY", "true").lower() == "true"
     AI_SUMMARY_MIN_LENGTH = 150  # Only use AI for articles longer than this
-    RATE_LIMIT_DELAY = 2  # Seconds between AI requests
+    SUMMARY_MODE = os.getenv("SUMMARY_MODE", "auto").lower()  # llm: AI with lead-sentence fallback, local: extractive only, auto: AI with extractive fallback
+    EXTRACTIVE_SUMMARY_SENTENCES = int(os.getenv("EXTRACTIVE_SUMMARY_SENTENCES", "3"))  # Sentences kept by the extractive summarizer
+    EXTRACTIVE_SUMMARY_MAX_LENGTH = 400  # Maximum characters in an extractive summary
+    BATCH_SUMMARY_ENABLED = os.getenv("BATCH_SUMMARY_ENABLED", "false").lower() == "true"  # Summarize a topic's articles in one AI call
+    BATCH_SUMMARY_SIZE = int(os.getenv("BATCH_SUMMARY_SIZE", "5"))  # Maximum articles per batched AI call
+    STRUCTURED_OUTPUT_ENABLED = os.getenv("STRUCTURED_OUTPUT_ENABLED", "false").lower() == "true"  # Constrain summary+sentiment answers to a JSON schema
+    PROMPT_ARTICLE_TOKEN_BUDGET = int(os.getenv("PROMPT_ARTICLE_TOKEN_BUDGET", "200"))  # Estimated tokens of article text per prompt
+    PROMPT_TITLE_TOKEN_BUDGET = int(os.getenv("PROMPT_TITLE_TOKEN_BUDGET", "50"))  # Estimated tokens of title per prompt
+    PROMPT_WARMUP_ENABLED = os.getenv("PROMPT_WARMUP_ENABLED", "false").lower() == "true"  # Send one AI request at startup to open the model connection
+    RATE_LIMIT_DELAY = 2  # Average seconds between AI requests across all threads/workers (0 disables limiting)
+    RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "5"))  # Requests allowed back-to-back after idle time
+    RATE_LIMIT_MAX_WAIT = 30  # Seconds a request may wait for a rate limit token before giving up
+    RATE_LIMIT_DB_PATH = os.getenv("RATE_LIMIT_DB_PATH", os.path.join("instance", "rate_limiter.db"))
+    
+    # Summary Cache Settings
+    SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+    SUMMARY_CACHE_DB_PATH = os.getenv("SUMMARY_CACHE_DB_PATH", os.path.join("instance", "summary_cache.db"))
+    SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))  # Seconds a cached summary stays valid
+    SUMMARY_CACHE_MEMORY_SIZE = 1024  # Entries kept in the in-process LRU layer
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "20000"))  # Entries kept on disk
+    
+    # Search Result Cache Settings
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_FRESH_TTL = int(os.getenv("SEARCH_CACHE_FRESH_TTL", "300"))  # Seconds results are served as-is
+    SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", "1800"))  # Seconds stale results are served while refreshing
+    SEARCH_CACHE_MAX_ENTRIES = 256  # Cached queries per worker
+    
+    # Hedged Search Settings
+    SEARCH_HEDGING_ENABLED = os.getenv("SEARCH_HEDGING_ENABLED", "false").lower() == "true"  # Send a second identical DuckDuckGo search when the first is slow
+    SEARCH_HEDGE_PERCENTILE = float(os.getenv("SEARCH_HEDGE_PERCENTILE", "95"))  # Search latency percentile after which the hedge is sent
+    SEARCH_HEDGE_MAX_PERCENT = float(os.getenv("SEARCH_HEDGE_MAX_PERCENT", "10"))  # Hedged searches allowed as a percentage of all searches
+    SEARCH_HEDGE_INITIAL_DELAY = float(os.getenv("SEARCH_HEDGE_INITIAL_DELAY", "2"))  # Seconds before hedging until enough latencies are sampled
+    SEARCH_HEDGE_MIN_SAMPLES = 20  # Latencies needed before the percentile is used
+    SEARCH_HEDGE_SAMPLES = 200  # Recent search latencies kept
+    
+    # Article Page Fetch Settings
+    ARTICLE_FETCH_TIMEOUT = float(os.getenv("ARTICLE_FETCH_TIMEOUT", "10"))  # Seconds one article page download may take
+    ARTICLE_FETCH_MAX_PER_HOST = int(os.getenv("ARTICLE_FETCH_MAX_PER_HOST", "4"))  # Concurrent downloads and kept-alive connections per site
+    ARTICLE_FETCH_POOL_HOSTS = 32  # Sites whose connection pools are kept open
+    
+    # Article Parsing Pool Settings
+    EXTRACTION_POOL_ENABLED = os.getenv("EXTRACTION_POOL_ENABLED", "true").lower() == "true"  # Parse articles in worker processes instead of request threads
+    EXTRACTION_POOL_WORKERS = int(os.getenv("EXTRACTION_POOL_WORKERS", "2"))  # Parsing processes per web worker
+    EXTRACTION_TASK_TIMEOUT = float(os.getenv("EXTRACTION_TASK_TIMEOUT", "10"))  # Seconds one article may take to parse
+    EXTRACTION_POOL_MAX_TASKS = int(os.getenv("EXTRACTION_POOL_MAX_TASKS", "100"))  # Articles a parsing process handles before it is replaced
+    EXTRACTION_RACE_ENABLED = os.getenv("EXTRACTION_RACE_ENABLED", "false").lower() == "true"  # Run all extraction strategies at once and keep the best scoring text
+    EXTRACTION_RACE_CONFIDENCE = float(os.getenv("EXTRACTION_RACE_CONFIDENCE", "0.8"))  # Score (0-1) at which a raced extraction is used without waiting for the others
+    EXTRACTION_RACE_TARGET_LENGTH = 1500  # Characters of text that earn a full length score
+    
+    # Extracted Article Cache Settings
+    ARTICLE_CACHE_ENABLED = os.getenv("ARTICLE_CACHE_ENABLED", "true").lower() == "true"  # Serve repeat article opens without downloading or parsing
+    ARTICLE_CACHE_DB_PATH = os.getenv("ARTICLE_CACHE_DB_PATH", os.path.join("instance", "article_cache.db"))
+    ARTICLE_CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", "900"))  # Seconds an extraction is served before revalidating with a conditional request
+    ARTICLE_CACHE_MAX_MB = int(os.getenv("ARTICLE_CACHE_MAX_MB", "64"))  # Compressed megabytes kept before evicting least recently read articles
+    
+    # Popular Topic Precompute Settings
+    PRECOMPUTE_ENABLED = os.getenv("PRECOMPUTE_ENABLED", "false").lower() == "true"  # Refresh popular topics in the background
+    PRECOMPUTE_INTERVAL = float(os.getenv("PRECOMPUTE_INTERVAL", "240"))  # Seconds between refreshes; each refresh re-runs the search, so below SEARCH_CACHE_FRESH_TTL results never go stale
+    PRECOMPUTE_TOP_TOPICS = int(os.getenv("PRECOMPUTE_TOP_TOPICS", "5"))  # Most popular topics refreshed in every language
+    PRECOMPUTE_LOOKBACK_HOURS = float(os.getenv("PRECOMPUTE_LOOKBACK_HOURS", "24"))  # Hours of sessions and articles popularity is counted over
+    PRECOMPUTE_LOCK_PATH = os.getenv("PRECOMPUTE_LOCK_PATH", os.path.join("instance", "precompute.lock"))  # Held by the one process that refreshes
+    PRECOMPUTE_SEED_TOPICS = [t.strip() for t in os.getenv("PRECOMPUTE_SEED_TOPICS", "").split(",") if t.strip()]  # Refreshed while there is too little history
+    
+    # Request Coalescing Settings
+    SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"  # Share one in-flight search, summary, extraction or TTS call between identical requests
+    SINGLE_FLIGHT_TIMEOUT = int(os.getenv("SINGLE_FLIGHT_TIMEOUT", "30"))  # Seconds a request waits for an identical in-flight call before running its own
+    
+    # Duplicate Article Settings
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"  # Skip summarizing copies of articles already seen
+    DEDUP_SIMHASH_DISTANCE = int(os.getenv("DEDUP_SIMHASH_DISTANCE", "7"))  # Max differing fingerprint bits for a near-duplicate
+    DEDUP_TTL = int(os.getenv("DEDUP_TTL", "21600"))  # Seconds an article is remembered
+    DEDUP_MAX_ENTRIES = 5000  # Articles remembered for reusing summaries
+    DEDUP_MAX_SESSIONS = 1000  # Sessions whose seen articles are tracked
     
     # Error Handling Settings
     MAX_RETRY_ATTEMPTS = 3  # Maximum retry attempts for AI operations
-    RETRY_DELAY = 1  # Base delay between retries (exponential backoff)
+    RETRY_DELAY = 1  # Base delay between retries (exponential backoff with decorrelated jitter)
+    RETRY_MAX_DELAY = 10  # Longest single backoff; larger Retry-After hints are not waited for
+    RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", "2"))  # Retries per dependency for one top-level operation, shared by nested retry layers
+    REQUEST_DEADLINE = float(os.getenv("REQUEST_DEADLINE", "60"))  # Seconds each HTTP request may spend in services, including retries
     ENABLE_FALLBACK_LOGGING = True  # Enable detailed fallback logging
     SENTIMENT_FALLBACK_ENABLED = True  # Enable sentiment analysis fallbacks
     LANGUAGE_FALLBACK_ENABLED = True  # Enable language fallbacks
+    
+    # Circuit Breaker Settings (Gemini, DuckDuckGo, gTTS and each article host)
+    CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"  # Fail fast to fallbacks while a dependency is down
+    CIRCUIT_BREAKER_FAILURE_RATE = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))  # Failure share in the window that opens a circuit
+    CIRCUIT_BREAKER_MIN_CALLS = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "5"))  # Calls in the window before the failure rate is judged
+    CIRCUIT_BREAKER_WINDOW = 60  # Seconds of call outcomes considered
+    CIRCUIT_BREAKER_OPEN_SECONDS = int(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "30"))  # Seconds a circuit stays open before a probe call
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS = 1  # Probe calls allowed at once while half-open
@@ -0,0 +1,117 @@
+"""
+Deadline Module for NewsFlash Application
+
+This module provides request-scoped time budgets including:
+- A Deadline object set once per HTTP request and read by every service it calls
+- Nested scopes that can only tighten, never extend, the request's deadline
+- Helpers to cap timeouts and wait budgets at the time the request has left
+- Executor submission that carries the deadline into worker threads
+"""
+
+import contextvars
+import logging
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_deadline = contextvars.ContextVar("newsflash_deadline", default=None)
+
+
+class Deadline:
+    """Point in time (time.monotonic) by which a request should have answered."""
+
+    def __init__(self, seconds: float):
+        """
+        Initialize a deadline.
+
+        Args:
+            seconds: Seconds from now until the deadline
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether no time is left"""
+        return self.remaining() <= 0
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """
+        Limit a timeout to the time left.
+
+        Args:
+            timeout: Timeout in seconds, or None for no limit of its own
+
+        Returns:
+            The smaller of timeout and the remaining time
+        """
+        return self.remaining() if timeout is None else min(timeout, self.remaining())
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Get the deadline of the request being served.
+
+    Returns:
+        The current Deadline, or None outside a deadline scope
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """
+    Set the deadline for everything called within the block.
+
+    An enclosing deadline that expires sooner stays in force.
+
+    Args:
+        seconds: Time budget for the block
+
+    Yields:
+        The deadline in force inside the block
+    """
+    deadline = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_budget(seconds: Optional[float]) -> Optional[float]:
+    """
+    Cap a time budget at what the current request has left.
+
+    Args:
+        seconds: Budget of the operation, or None for no budget of its own
+
+    Returns:
+        seconds unchanged outside a deadline scope, otherwise the smaller of the two
+    """
+    deadline = _current_deadline.get()
+    return seconds if deadline is None else deadline.cap(seconds)
+
+
+def submit_with_deadline(executor: Executor, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    Submit work to an executor so it runs under the caller's deadline.
+
+    Args:
+        executor: Thread pool to run fn
+        fn: Callable to run
+        *args, **kwargs: Arguments to pass to fn
+
+    Returns:
+        Future of the call
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
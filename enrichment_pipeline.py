@@ -0,0 +1,216 @@
+"""
+Enrichment Pipeline Module for NewsFlash Application
+
+This module provides single-pass article enrichment for the news routes including:
+- Declared stages (search, summary+sentiment, language tagging) and the fields each one fills in
+- Running only the stages needed for the fields a route asks for
+- Skipping a stage for articles that already carry its fields, so no article is enriched twice
+- Per-article fallbacks when a stage fails
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from error_handler import FallbackManager
+
+logger = logging.getLogger(__name__)
+
+# Fields each route asks the pipeline for
+SEARCH_FIELDS = ('title', 'url', 'summary', 'sentiment', 'language', 'date', 'source', 'topic')
+TOPIC_FIELDS = ('summary', 'sentiment', 'language', 'summary_language', 'topic')
+
+
+class EnrichmentStage:
+    """A named pipeline step and the article fields it provides."""
+
+    def __init__(self, name: str, provides: Iterable[str],
+                 run: Callable[[Dict[str, Any], str, Optional[str]], Dict[str, Any]]):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Stage name used in logs
+            provides: Article fields the stage fills in
+            run: Callable(article, language, topic) returning the provided field values
+        """
+        self.name = name
+        self.provides = frozenset(provides)
+        self.run = run
+
+    def is_needed(self, article: Dict[str, Any], fields: frozenset) -> bool:
+        """
+        Check whether the stage must run for an article.
+
+        Args:
+            article: Article dictionary
+            fields: Fields requested by the caller
+
+        Returns:
+            True if a requested field provided by this stage is missing from the article
+        """
+        return any(not article.get(field) for field in self.provides & fields)
+
+
+class ArticleEnrichmentPipeline:
+    """Runs search results through the declared enrichment stages exactly once."""
+
+    # Declared stage order; 'search' produces the articles the other stages enrich
+    STAGES = ('search', 'summary_sentiment', 'language')
+
+    def __init__(self, news_service):
+        """
+        Initialize the pipeline.
+
+        Args:
+            news_service: NewsService used for searching and summarization
+        """
+        self.news_service = news_service
+        self.stages = [
+            EnrichmentStage('summary_sentiment', ('summary', 'sentiment'), self._summarize),
+            EnrichmentStage('language', ('language', 'summary_language', 'topic'), self._tag_language),
+        ]
+
+    def search(self, topic: str, max_results: int, language: str,
+               fields: Iterable[str] = SEARCH_FIELDS, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Search a topic and enrich the results with the requested fields.
+
+        Search errors are propagated so callers can report them.
+
+        Args:
+            topic: Topic or query to search
+            max_results: Maximum number of articles
+            language: Validated language code
+            fields: Article fields the caller needs
+            session_id: Session whose already seen articles are left out, if any
+
+        Returns:
+            List of enriched article dictionaries
+        """
+        if session_id:
+            articles = self.news_service.search_news(topic, max_results, language, session_id=session_id)
+        else:
+            articles = self.news_service.search_news(topic, max_results, language)
+        return self.enrich(articles, language, fields, topic)
+
+    def search_page(self, topic: str, max_results: int, language: str, fields: Iterable[str] = TOPIC_FIELDS,
+                    session_id: Optional[str] = None, cursor: Optional[str] = None,
+                    exclude_urls: Iterable[str] = ()) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get the next page of a topic's buffered search results, enriched with the requested fields.
+
+        Args:
+            topic: Topic to page through
+            max_results: Articles per page
+            language: Validated language code
+            fields: Article fields the caller needs
+            session_id: Session paging through the topic
+            cursor: Cursor returned with the previous page, if any
+            exclude_urls: URLs already shown to the session
+
+        Returns:
+            Tuple of (enriched articles, cursor of the next page or None)
+        """
+        articles, next_cursor = self.news_service.search_page(
+            topic, max_results, language, session_id=session_id, cursor=cursor, exclude_urls=exclude_urls
+        )
+        return self.enrich(articles, language, fields, topic), next_cursor
+
+    def search_topics(self, topics: List[str], language: str,
+                      fields: Iterable[str] = TOPIC_FIELDS) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several topics and enrich every result with the requested fields.
+
+        Args:
+            topics: Topics to search
+            language: Validated language code
+            fields: Article fields the caller needs
+
+        Returns:
+            Dictionary mapping each topic to its enriched articles
+        """
+        results = self.news_service.search_multiple_topics(topics, language=language)
+        return {topic: self.enrich(articles, language, fields, topic) for topic, articles in results.items()}
+
+    def stream_topics(self, topics: List[str], language: str,
+                      fields: Iterable[str] = TOPIC_FIELDS) -> Iterator[Dict[str, Any]]:
+        """
+        Search several topics, yielding each enriched article as soon as it is ready.
+
+        Args:
+            topics: Topics to search
+            language: Validated language code
+            fields: Article fields the caller needs
+
+        Yields:
+            Events from NewsService.stream_multiple_topics with their articles enriched
+        """
+        for event in self.news_service.stream_multiple_topics(topics, language=language):
+            if event['type'] == 'article':
+                self.enrich([event['article']], language, fields, event['topic'])
+            yield event
+
+    def enrich(self, articles: List[Dict[str, Any]], language: str, fields: Iterable[str],
+               topic: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Run articles through the stages that provide missing requested fields.
+
+        Args:
+            articles: Articles to enrich (updated in place)
+            language: Validated language code
+            fields: Article fields the caller needs
+            topic: Topic the articles were found for
+
+        Returns:
+            The enriched articles
+        """
+        fields = frozenset(fields)
+        for stage in self.stages:
+            pending = [article for article in articles if stage.is_needed(article, fields)]
+            if pending:
+                logger.debug(f"Running enrichment stage '{stage.name}' for {len(pending)} articles")
+            for article in pending:
+                article.update(stage.run(article, language, topic))
+        return articles
+
+    @staticmethod
+    def select(article: Dict[str, Any], fields: Iterable[str] = SEARCH_FIELDS) -> Dict[str, Any]:
+        """
+        Project an article onto the requested fields with display defaults.
+
+        Args:
+            article: Enriched article dictionary
+            fields: Fields to include
+
+        Returns:
+            Dictionary containing only the requested fields
+        """
+        defaults = {'title': 'No title', 'sentiment': FallbackManager.get_sentiment_fallback()}
+        return {field: article.get(field) or defaults.get(field, '') for field in fields}
+
+    def _summarize(self, article: Dict[str, Any], language: str, topic: Optional[str]) -> Dict[str, Any]:
+        """Summary+sentiment stage: one combined AI call, neutral sentiment on failure"""
+        body = article.get('body', '')
+        try:
+            summary_data = self.news_service.generate_summary_with_sentiment(body, article.get('title', ''), language)
+            if not isinstance(summary_data, dict):
+                raise TypeError(f"Unexpected summary result: {type(summary_data).__name__}")
+            return {
+                'summary': summary_data.get('summary', article.get('summary', '')),
+                'sentiment': summary_data.get('sentiment', FallbackManager.get_sentiment_fallback()),
+                'summary_language': summary_data.get('language', language)
+            }
+        except Exception as e:
+            logger.warning(f"Error enhancing article with sentiment: {e}")
+            return {
+                'summary': article.get('summary', body[:200]),
+                'sentiment': FallbackManager.get_sentiment_fallback(),
+                'summary_language': language
+            }
+
+    def _tag_language(self, article: Dict[str, Any], language: str, topic: Optional[str]) -> Dict[str, Any]:
+        """Language tagging stage: record the request language and topic"""
+        return {
+            'language': language,
+            'summary_language': article.get('summary_language') or language,
+            'topic': article.get('topic') or topic or ''
+        }
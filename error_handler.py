@@ -2,15 +2,27 @@
 Comprehensive Error Handling Module for NewsFlash Application
 
 This module provides centralized error handling, logging, and fallback mechanisms
-for language-specific operations and sentiment analysis.
+for language-specific operations and sentiment analysis, and circuit breakers for
+the external services they depend on.
 """
 
+import asyncio
 import logging
+import random
+import threading
 import time
 import functools
-from typing import Any, Callable, Dict, Optional, Union
+import inspect
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+import requests
+from cachetools import LRUCache
 from config import Config
+from deadline import current_deadline
+from retry_budget import current_retry_budget, retry_budget_scope
 from language_service import LanguageService
+from extractive_summarizer import ExtractiveSummarizer
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +42,22 @@ class AIServiceError(NewsFlashError):
     """Exception raised for AI service errors."""
     pass
 
+class StructuredOutputError(AIServiceError):
+    """Exception raised when an AI response does not match the expected JSON schema."""
+    pass
+
 class TTSError(NewsFlashError):
     """Exception raised for TTS service errors."""
     pass
 
+class CircuitOpenError(NewsFlashError):
+    """Exception raised when a dependency's circuit breaker rejects a call."""
+    pass
+
+class DeadlineExceededError(NewsFlashError):
+    """Exception raised when the request's deadline passes before an operation starts."""
+    pass
+
 class ErrorHandler:
     """Centralized error handling and logging for the NewsFlash application."""
     
@@ -81,6 +105,8 @@ def with_language_fallback(fallback_language: str = None):
     """
     Decorator to provide language fallback functionality.
     
+    The default language is not tried once the operation's retry budget is exhausted.
+    
     Args:
         fallback_language: Language to fallback to (defaults to system default)
     """
@@ -104,38 +130,41 @@ def with_language_fallback(fallback_language: str = None):
                 args[2] = target_language
                 args = tuple(args)
             
-            try:
-                # Log language fallback if it occurred
-                if target_language != original_language and Config.ENABLE_FALLBACK_LOGGING:
-                    logger.info(f"Language fallback: {original_language} -> {target_language} in {func.__name__}")
-                
-                return func(*args, **kwargs)
-                
-            except Exception as e:
-                # If target language fails and it's not the default, try default language
-                if target_language != LanguageService.get_default_language() and Config.LANGUAGE_FALLBACK_ENABLED:
-                    ErrorHandler.log_language_error(
-                        func.__name__, target_language, e, LanguageService.get_default_language()
-                    )
+            with retry_budget_scope(func.__name__) as budget:
+                try:
+                    # Log language fallback if it occurred
+                    if target_language != original_language and Config.ENABLE_FALLBACK_LOGGING:
+                        logger.info(f"Language fallback: {original_language} -> {target_language} in {func.__name__}")
                     
-                    # Update to default language
-                    if 'language' in kwargs:
-                        kwargs['language'] = LanguageService.get_default_language()
-                    elif len(args) > 2:
-                        args = list(args)
-                        args[2] = LanguageService.get_default_language()
-                        args = tuple(args)
+                    return func(*args, **kwargs)
                     
-                    try:
-                        return func(*args, **kwargs)
-                    except Exception as fallback_error:
+                except Exception as e:
+                    # If target language fails and it's not the default, try default language,
+                    # unless the operation has used up its retries
+                    if (target_language != LanguageService.get_default_language() and Config.LANGUAGE_FALLBACK_ENABLED
+                            and not budget.exhausted()):
                         ErrorHandler.log_language_error(
-                            func.__name__, LanguageService.get_default_language(), fallback_error
+                            func.__name__, target_language, e, LanguageService.get_default_language()
                         )
-                        raise LanguageError(f"All language fallbacks failed in {func.__name__}: {fallback_error}")
-                else:
-                    ErrorHandler.log_language_error(func.__name__, target_language, e)
-                    raise LanguageError(f"Language operation failed in {func.__name__}: {e}")
+                        
+                        # Update to default language
+                        if 'language' in kwargs:
+                            kwargs['language'] = LanguageService.get_default_language()
+                        elif len(args) > 2:
+                            args = list(args)
+                            args[2] = LanguageService.get_default_language()
+                            args = tuple(args)
+                        
+                        try:
+                            return func(*args, **kwargs)
+                        except Exception as fallback_error:
+                            ErrorHandler.log_language_error(
+                                func.__name__, LanguageService.get_default_language(), fallback_error
+                            )
+                            raise LanguageError(f"All language fallbacks failed in {func.__name__}: {fallback_error}")
+                    else:
+                        ErrorHandler.log_language_error(func.__name__, target_language, e)
+                        raise LanguageError(f"Language operation failed in {func.__name__}: {e}")
         
         return wrapper
     return decorator
@@ -163,57 +192,197 @@ def with_sentiment_fallback(fallback_sentiment: str = "neutral"):
         return wrapper
     return decorator
 
-def with_retry(max_attempts: int = None, base_delay: float = None, exponential_backoff: bool = True):
+def with_retry(max_attempts: int = None, base_delay: float = None, exponential_backoff: bool = True,
+               dependency: str = "gemini"):
     """
-    Decorator to provide retry functionality with exponential backoff.
+    Decorator to provide retry functionality with jittered exponential backoff.
+    
+    Delays use decorrelated jitter (each one drawn between base_delay and three times
+    the previous delay, capped at Config.RETRY_MAX_DELAY) so workers that failed
+    together do not retry together. A Retry-After hint on the error replaces the
+    computed delay. No retry is made if its delay would outlast the current request's
+    deadline.
+    
+    Retries are drawn from the retry budget of the top-level operation, which nested
+    retry layers share, so stacked decorators cannot multiply the number of calls.
+    
+    Works on both regular functions and coroutine functions; the latter back off
+    with asyncio.sleep so the event loop is never blocked.
     
     Args:
         max_attempts: Maximum retry attempts (defaults to config)
         base_delay: Base delay between retries (defaults to config)
-        exponential_backoff: Whether to use exponential backoff
+        exponential_backoff: Whether to grow the delay between attempts
+        dependency: Service the function calls, whose retry allowance is spent (AI by default)
     """
     max_attempts = max_attempts or Config.MAX_RETRY_ATTEMPTS
     base_delay = base_delay or Config.RETRY_DELAY
     
+    def retry_delay(func: Callable, error: Exception, attempt: int, previous: float) -> Optional[float]:
+        """Return the delay before the next attempt, None to stop retrying, or raise if the error should propagate."""
+        # Check if this is a retryable error
+        if not _is_retryable_error(error):
+            raise error
+        
+        ErrorHandler.log_ai_service_error(func.__name__, error, attempt + 1)
+        if attempt >= max_attempts - 1:  # Don't sleep on last attempt
+            return None
+        
+        hint = _retry_after(error)
+        if hint is not None:
+            if hint > Config.RETRY_MAX_DELAY:
+                logger.warning(f"Not retrying {func.__name__}: server asked to wait {hint:.1f}s")
+                return None
+            delay = hint + random.uniform(0, base_delay)
+        elif exponential_backoff:
+            delay = min(Config.RETRY_MAX_DELAY, random.uniform(base_delay, max(previous, base_delay) * 3))
+        else:
+            delay = base_delay
+        
+        deadline = current_deadline()
+        if deadline is not None and delay >= deadline.remaining():
+            logger.warning(f"Not retrying {func.__name__}: {delay:.2f}s backoff exceeds the {deadline.remaining():.2f}s left")
+            return None
+        
+        budget = current_retry_budget()
+        if budget is not None and not budget.try_spend(dependency):
+            logger.warning(f"Not retrying {func.__name__}: {budget.operation} has used its {dependency} retry budget")
+            return None
+        
+        logger.info(f"Retrying {func.__name__} in {delay:.2f} seconds (attempt {attempt + 1}/{max_attempts})")
+        return delay
+    
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                delay = 0.0
+                
+                with retry_budget_scope(func.__name__):
+                    for attempt in range(max_attempts):
+                        try:
+                            return await func(*args, **kwargs)
+                        except Exception as e:
+                            last_exception = e
+                            delay = retry_delay(func, e, attempt, delay)
+                            if delay is None:
+                                break
+                            await asyncio.sleep(delay)
+                
+                raise AIServiceError(f"All retry attempts failed in {func.__name__}: {last_exception}") from last_exception
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
+            delay = 0.0
             
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    
-                    # Check if this is a retryable error
-                    if not _is_retryable_error(e):
-                        raise e
-                    
-                    if attempt < max_attempts - 1:  # Don't sleep on last attempt
-                        delay = base_delay * (2 ** attempt) if exponential_backoff else base_delay
-                        ErrorHandler.log_ai_service_error(func.__name__, e, attempt + 1)
-                        logger.info(f"Retrying {func.__name__} in {delay} seconds (attempt {attempt + 1}/{max_attempts})")
+            with retry_budget_scope(func.__name__):
+                for attempt in range(max_attempts):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        last_exception = e
+                        delay = retry_delay(func, e, attempt, delay)
+                        if delay is None:
+                            break
                         time.sleep(delay)
-                    else:
-                        ErrorHandler.log_ai_service_error(func.__name__, e, attempt + 1)
             
-            raise AIServiceError(f"All retry attempts failed in {func.__name__}: {last_exception}")
+            raise AIServiceError(f"All retry attempts failed in {func.__name__}: {last_exception}") from last_exception
         
         return wrapper
     return decorator
 
+# HTTP statuses worth retrying; other 4xx responses will fail the same way again
+RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+def _error_chain(error: BaseException) -> Iterator[BaseException]:
+    """Yield an error and the errors it was raised from or while handling"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an error (requests, google-api-core and similar clients)"""
+    response = getattr(error, 'response', None)
+    for value in (getattr(error, 'status_code', None), getattr(error, 'code', None),
+                  getattr(response, 'status_code', None)):
+        if isinstance(value, int) and not isinstance(value, bool) and 100 <= value < 600:
+            return value
+    return None
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """
+    Find a server-provided retry hint on an error or the errors behind it.
+    
+    Args:
+        error: The exception to inspect
+        
+    Returns:
+        Seconds to wait before retrying, or None if the server gave no hint
+    """
+    for e in _error_chain(error):
+        value = getattr(e, 'retry_after', None)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return max(0.0, float(value))
+        
+        # HTTP Retry-After header: delta-seconds or an HTTP date
+        headers = getattr(getattr(e, 'response', None), 'headers', None)
+        header = headers.get('Retry-After') if hasattr(headers, 'get') else None
+        if isinstance(header, str) and header.strip():
+            try:
+                return max(0.0, float(header))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(header).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        
+        # google.rpc.RetryInfo attached to Gemini quota errors
+        details = getattr(e, 'details', None)
+        if isinstance(details, (list, tuple)):
+            for detail in details:
+                retry_delay = getattr(detail, 'retry_delay', None)
+                seconds = getattr(retry_delay, 'seconds', None)
+                if isinstance(seconds, int):
+                    return seconds + getattr(retry_delay, 'nanos', 0) / 1e9
+    return None
+
 def _is_retryable_error(error: Exception) -> bool:
     """
     Determine if an error is retryable.
     
+    Errors are classified by type and HTTP status, looking through the errors they
+    wrap; the message is only consulted for untyped errors.
+    
     Args:
         error: The exception to check
         
     Returns:
         True if the error should be retried, False otherwise
     """
-    error_str = str(error).lower()
+    for e in _error_chain(error):
+        # Malformed structured output has already had its correction retry; an open
+        # circuit or a passed deadline will not change on a retry
+        if isinstance(e, (StructuredOutputError, CircuitOpenError, DeadlineExceededError)):
+            return False
+        status = _error_status(e)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES or status >= 500
+        if isinstance(e, (TimeoutError, ConnectionError, requests.Timeout, requests.ConnectionError)):
+            return True
+        if isinstance(e, requests.RequestException):
+            return False
+    
+    return _is_retryable_message(str(error))
+
+def _is_retryable_message(error_str: str) -> bool:
+    """Classify an untyped error by its message"""
+    error_str = error_str.lower()
     
     # Retryable errors
     retryable_indicators = [
@@ -292,22 +461,263 @@ class FallbackManager:
         if len(article_text) <= max_length:
             return article_text
         
-        # Try to find sentence boundaries
-        sentences = article_text.split('. ')
+        # Try to find sentence boundaries, including the Devanagari danda
+        sentences = ExtractiveSummarizer.split_sentences(article_text)
         if len(sentences) >= 2:
             # Take first two sentences
-            summary = '. '.join(sentences[:2]) + '.'
+            summary = ' '.join(sentences[:2])
             if len(summary) <= max_length:
                 return summary
         
         # Fallback to character truncation
         return article_text[:max_length].strip() + "..."
 
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one external dependency.
+    
+    Closed: calls pass and outcomes are counted over a rolling window; once enough
+    calls fail the circuit opens. Open: calls are rejected until the cool-down ends.
+    Half-open: a few probe calls pass; a success closes the circuit, a failure
+    reopens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_rate: float = None, min_calls: int = None,
+                 window: float = None, open_seconds: float = None, half_open_calls: int = None):
+        """
+        Initialize a closed circuit.
+        
+        Args:
+            name: Dependency name used in logs and status
+            failure_rate: Failure share in the window that opens the circuit (defaults to config)
+            min_calls: Calls in the window before the failure rate is judged (defaults to config)
+            window: Seconds of outcomes considered (defaults to config)
+            open_seconds: Seconds the circuit stays open before probing (defaults to config)
+            half_open_calls: Concurrent probe calls allowed while half-open (defaults to config)
+        """
+        self.name = name
+        self.failure_rate = failure_rate if failure_rate is not None else Config.CIRCUIT_BREAKER_FAILURE_RATE
+        self.min_calls = min_calls or Config.CIRCUIT_BREAKER_MIN_CALLS
+        self.window = window or Config.CIRCUIT_BREAKER_WINDOW
+        self.open_seconds = open_seconds if open_seconds is not None else Config.CIRCUIT_BREAKER_OPEN_SECONDS
+        self.half_open_calls = half_open_calls or Config.CIRCUIT_BREAKER_HALF_OPEN_CALLS
+        self._state = self.CLOSED
+        self._outcomes = deque()  # (monotonic time, succeeded)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._last_error = None
+        self._lock = threading.Lock()
+        self._stats = {'rejected': 0, 'opened': 0}
+    
+    def _trim(self, now: float) -> None:
+        """Drop outcomes older than the window (lock held)"""
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+    
+    def _open(self, now: float) -> None:
+        """Move to the open state (lock held)"""
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._stats['opened'] += 1
+        logger.warning(f"Circuit '{self.name}' opened for {self.open_seconds}s: {self._last_error}")
+    
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the cool-down has passed"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self._state = self.HALF_OPEN
+                self._probes = 0
+            return self._state
+    
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected without probing"""
+        return Config.CIRCUIT_BREAKER_ENABLED and self.state == self.OPEN
+    
+    def allow_request(self) -> bool:
+        """
+        Decide whether a call may go to the dependency.
+        
+        Returns:
+            True if the call may proceed; callers must then report its outcome
+        """
+        if not Config.CIRCUIT_BREAKER_ENABLED:
+            return True
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+            self._stats['rejected'] += 1
+            return False
+    
+    def check(self) -> None:
+        """
+        Raise unless a call may go to the dependency.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open or its probe slots are taken
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit '{self.name}' is open; skipping call")
+    
+    def reset(self) -> None:
+        """Close the circuit and forget recorded outcomes"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._outcomes.clear()
+            self._probes = 0
+            self._last_error = None
+    
+    def cancel(self) -> None:
+        """Give back a half-open probe slot for a call that was allowed but never made"""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes:
+                self._probes -= 1
+    
+    def record_success(self) -> None:
+        """Report a successful call"""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                logger.info(f"Circuit '{self.name}' closed after a successful probe")
+            self._outcomes.append((now, True))
+            self._trim(now)
+    
+    def record_failure(self, error: Exception = None) -> None:
+        """
+        Report a failed call.
+        
+        Args:
+            error: The failure, kept for the status endpoint
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._last_error = str(error)[:200] if error else None
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._outcomes.append((now, False))
+            self._trim(now)
+            failures = sum(1 for _, succeeded in self._outcomes if not succeeded)
+            if (self._state == self.CLOSED and len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_rate):
+                self._open(now)
+    
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func through the breaker, recording its outcome.
+        
+        Args:
+            func: Function calling the dependency
+            *args, **kwargs: Arguments to pass to the function
+            
+        Returns:
+            Result of func
+            
+        Raises:
+            CircuitOpenError: If the circuit rejects the call
+        """
+        self.check()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the breaker's state and counters.
+        
+        Returns:
+            Dictionary with state, calls and failures in the window, open/reject counts,
+            seconds until the next probe and the last error
+        """
+        state = self.state
+        with self._lock:
+            self._trim(time.monotonic())
+            failures = sum(1 for _, succeeded in self._outcomes if not succeeded)
+            retry_in = max(0.0, self._opened_at + self.open_seconds - time.monotonic()) if state == self.OPEN else 0.0
+            return dict(
+                self._stats,
+                state=state,
+                calls=len(self._outcomes),
+                failures=failures,
+                retry_in=round(retry_in, 1),
+                last_error=self._last_error,
+            )
+
+# Breakers are per process; host-level article fetch breakers are bounded
+_circuit_breakers = LRUCache(maxsize=256)
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a dependency, creating it on first use.
+    
+    Args:
+        name: Dependency name ('gemini', 'duckduckgo', 'gtts', 'article_fetch:<host>')
+        
+    Returns:
+        The dependency's breaker
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            breaker = _circuit_breakers[name] = CircuitBreaker(name)
+        return breaker
+
+def get_circuit_breaker_status() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the status of every circuit breaker.
+    
+    Returns:
+        Dictionary mapping dependency name to its breaker status
+    """
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.name: breaker.get_status() for breaker in breakers}
+
+def reset_circuit_breakers() -> None:
+    """Close every circuit breaker, keeping the instances services already hold"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    for breaker in breakers:
+        breaker.reset()
+
+def check_deadline(operation: str = "operation") -> None:
+    """
+    Raise if the current request's deadline has passed.
+    
+    Args:
+        operation: Name used in the error message
+        
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    deadline = current_deadline()
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceededError(f"Request deadline of {deadline.seconds}s passed before {operation}")
+
 # Convenience functions for common error handling patterns
 def handle_language_operation(operation_name: str, language: str, operation_func: Callable, *args, **kwargs) -> Any:
     """
     Handle a language-specific operation with comprehensive error handling.
     
+    The operation's retry budget covers every language tried; once a dependency has
+    used up its retries, further fallback languages are not attempted.
+    
     Args:
         operation_name: Name of the operation for logging
         language: Target language
@@ -319,13 +729,40 @@ def handle_language_operation(operation_name: str, language: str, operation_func
     """
     fallback_chain = FallbackManager.get_language_fallback_chain(language)
     
-    for lang in fallback_chain:
-        try:
-            return operation_func(*args, language=lang, **kwargs)
-        except Exception as e:
-            ErrorHandler.log_language_error(operation_name, lang, e)
-            if lang == fallback_chain[-1]:  # Last language in chain
-                raise LanguageError(f"All language fallbacks failed for {operation_name}: {e}")
+    with retry_budget_scope(operation_name) as budget:
+        for lang in fallback_chain:
+            try:
+                return operation_func(*args, language=lang, **kwargs)
+            except Exception as e:
+                ErrorHandler.log_language_error(operation_name, lang, e)
+                if lang == fallback_chain[-1] or budget.exhausted():
+                    raise LanguageError(f"All language fallbacks failed for {operation_name}: {e}")
+    
+    raise LanguageError(f"No valid languages in fallback chain for {operation_name}")
+
+async def handle_language_operation_async(operation_name: str, language: str, operation_func: Callable, *args, **kwargs) -> Any:
+    """
+    Async counterpart of handle_language_operation for coroutine functions.
+    
+    Args:
+        operation_name: Name of the operation for logging
+        language: Target language
+        operation_func: Coroutine function to await
+        *args, **kwargs: Arguments to pass to the function
+        
+    Returns:
+        Result of the operation or fallback value
+    """
+    fallback_chain = FallbackManager.get_language_fallback_chain(language)
+    
+    with retry_budget_scope(operation_name) as budget:
+        for lang in fallback_chain:
+            try:
+                return await operation_func(*args, language=lang, **kwargs)
+            except Exception as e:
+                ErrorHandler.log_language_error(operation_name, lang, e)
+                if lang == fallback_chain[-1] or budget.exhausted():
+                    raise LanguageError(f"All language fallbacks failed for {operation_name}: {e}")
     
     raise LanguageError(f"No valid languages in fallback chain for {operation_name}")
 
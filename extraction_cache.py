@@ -0,0 +1,256 @@
+"""
+Extraction Cache Module for NewsFlash Application
+
+This module provides persistent caching of extracted articles including:
+- Entries keyed by the fetched URL without its fragment and click-tracking parameters
+- zlib-compressed readable text and metadata in a SQLite store shared by workers
+- ETag/Last-Modified validators for conditional revalidation once an entry is stale
+- A size cap enforced by evicting the least recently read entries
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track a click and never change the page served
+TRACKING_PARAMS = {'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid', '_ga'}
+TRACKING_PREFIXES = ('utm_',)
+
+
+def cache_key(url: str) -> str:
+    """
+    Build the cache key of a URL.
+
+    Unlike deduplication's canonical URL, the key keeps the scheme, host prefixes such as
+    m. or amp., the path and every other parameter, since those can select a different page.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        The URL with a lowercase scheme and host, and no fragment or click-tracking parameters
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+class ExtractionCache:
+    """Persistent, compressed cache of extracted articles with conditional revalidation."""
+
+    # Enforce the size cap once every this many writes
+    EVICTION_INTERVAL = 20
+
+    def __init__(self, db_path: Optional[str] = None, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the store (defaults to Config.ARTICLE_CACHE_DB_PATH)
+            ttl: Seconds an entry is served without revalidation (defaults to Config.ARTICLE_CACHE_TTL)
+            max_bytes: Compressed bytes kept before evicting (defaults to Config.ARTICLE_CACHE_MAX_MB)
+        """
+        self.db_path = db_path or Config.ARTICLE_CACHE_DB_PATH
+        self.ttl = ttl if ttl is not None else Config.ARTICLE_CACHE_TTL
+        self.max_bytes = max_bytes or Config.ARTICLE_CACHE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._stats = {'hits': 0, 'stale': 0, 'misses': 0, 'revalidated': 0, 'writes': 0, 'evictions': 0}
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the cache table, disabling the cache if SQLite is unavailable."""
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS article_cache ("
+                    "url TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, etag TEXT, "
+                    "last_modified TEXT, validated_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_article_cache_accessed ON article_cache (accessed_at)")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Article cache unavailable, extracting every article: {e}")
+            self.db_path = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection to the store."""
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def get(self, url: str, record: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Look up an extracted article, fresh or stale.
+
+        Args:
+            url: Article URL
+            record: Whether the lookup counts towards the hit/miss counters
+
+        Returns:
+            Dictionary of the stored values, 'etag', 'last_modified' and 'fresh' (whether it
+            may be served without revalidation), or None on a miss
+        """
+        entry = self._read(cache_key(url))
+        if not record:
+            return entry
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+            elif entry['fresh']:
+                self._stats['hits'] += 1
+            else:
+                self._stats['stale'] += 1
+        return entry
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read and decompress an entry, marking it recently used."""
+        if not self.db_path:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, etag, last_modified, validated_at FROM article_cache WHERE url = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                now = time.time()
+                conn.execute("UPDATE article_cache SET accessed_at = ? WHERE url = ?", (now, key))
+            finally:
+                conn.close()
+            entry = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+            entry.update(etag=row[1], last_modified=row[2], fresh=row[3] > now - self.ttl)
+            return entry
+        except Exception as e:
+            logger.error(f"Article cache read failed: {e}")
+            return None
+
+    def set(self, url: str, values: Dict[str, Any], etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Store an extracted article, replacing any earlier version.
+
+        Args:
+            url: Article URL
+            values: JSON-serializable extraction results (readable text, metadata)
+            etag: ETag the page was served with
+            last_modified: Last-Modified the page was served with
+        """
+        if not self.db_path:
+            return
+        with self._lock:
+            self._stats['writes'] += 1
+            self._writes_since_eviction += 1
+            evict = self._writes_since_eviction >= self.EVICTION_INTERVAL
+            if evict:
+                self._writes_since_eviction = 0
+        try:
+            value = zlib.compress(json.dumps(values, ensure_ascii=False).encode('utf-8'))
+            conn = self._connect()
+            try:
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO article_cache "
+                    "(url, value, size, etag, last_modified, validated_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (cache_key(url), value, len(value), etag, last_modified, now, now)
+                )
+                if evict:
+                    self._evict(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Article cache write failed: {e}")
+
+    def revalidate(self, url: str) -> None:
+        """
+        Mark an entry fresh again after the site answered 304 Not Modified.
+
+        Args:
+            url: Article URL
+        """
+        if not self.db_path:
+            return
+        with self._lock:
+            self._stats['revalidated'] += 1
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("UPDATE article_cache SET validated_at = ? WHERE url = ?", (time.time(), cache_key(url)))
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Article cache revalidation failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop the least recently read entries until the store fits in max_bytes."""
+        removed = conn.execute(
+            "DELETE FROM article_cache WHERE url IN ("
+            "SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY accessed_at DESC, url) AS kept "
+            "FROM article_cache) WHERE kept > ?)",
+            (self.max_bytes,)
+        ).rowcount
+        if removed:
+            with self._lock:
+                self._stats['evictions'] += removed
+            logger.info(f"Article cache evicted {removed} entries")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if not self.db_path:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM article_cache")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Article cache clear failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            Dictionary of counters, hit rate, entries and compressed bytes stored
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['stale'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['entries'] = stats['bytes'] = 0
+        if self.db_path:
+            try:
+                conn = self._connect()
+                try:
+                    stats['entries'], stats['bytes'] = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM article_cache"
+                    ).fetchone()
+                finally:
+                    conn.close()
+            except Exception as e:
+                logger.error(f"Article cache stats failed: {e}")
+        stats['persistent'] = self.db_path is not None
+        return stats
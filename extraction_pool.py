@@ -0,0 +1,429 @@
+"""
+Extraction Pool Module for NewsFlash Application
+
+This module provides a process pool for CPU-bound article parsing including:
+- A bounded set of worker processes, each parsing one article at a time
+- Per-task timeouts shortened to what the request's deadline has left, started once a
+  worker is ready, so process start-up and imports are not charged to the task
+- Workers started in the background at warm-up, with their parsing modules imported
+- Workers replaced after a number of tasks, releasing memory parsers leave behind
+- Only the stuck or crashed worker replaced, and parsing in-process when no worker can start
+- Races of several tasks on workers reserved together, ending as soon as one result is good enough
+"""
+
+import importlib
+import logging
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from config import Config
+from deadline import remaining_budget
+
+logger = logging.getLogger(__name__)
+
+
+def _serve(conn: Connection, preload: Sequence[str]) -> None:
+    """Worker process loop: import the preloaded modules, then run (function, arguments) tasks
+    and send back their outcome"""
+    for module in preload:
+        importlib.import_module(module)
+    conn.send('ready')
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args = task
+        try:
+            outcome = (True, fn(*args))
+        except Exception as e:
+            outcome = (False, e)
+        try:
+            conn.send(outcome)
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send((False, RuntimeError(f"Unpicklable result from {getattr(fn, '__name__', fn)}: {e}")))
+
+
+class WorkerCrashed(RuntimeError):
+    """A worker process exited while running a task."""
+
+
+class _Worker:
+    """One worker process and the pipe its tasks go through."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext, preload: Sequence[str]):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, tuple(preload)), daemon=True)
+        self.process.start()
+        child.close()
+        self.tasks = 0
+        self.ready = False
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait until the process has started and imported its modules"""
+        if not self.ready and self.conn.poll(timeout):
+            try:
+                self.conn.recv()
+            except (EOFError, OSError) as e:
+                raise WorkerCrashed(f"Extraction worker exited while starting: {e}") from e
+            self.ready = True
+        return self.ready
+
+    def send(self, fn: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Hand the worker a task"""
+        self.tasks += 1
+        try:
+            self.conn.send((fn, args))
+        except (EOFError, OSError) as e:
+            raise WorkerCrashed(f"Extraction worker is gone: {e}") from e
+
+    def receive(self) -> Any:
+        """Get the outcome of the worker's task, once its pipe is readable"""
+        try:
+            ok, value = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise WorkerCrashed(f"Extraction worker exited: {e}") from e
+        if not ok:
+            raise value
+        return value
+
+    def stop(self, terminate: bool = False) -> None:
+        """Let the process exit after its current task, or kill it"""
+        if terminate:
+            self.process.terminate()
+        else:
+            try:
+                self.conn.send(None)
+            except (EOFError, OSError):
+                pass
+        self.conn.close()
+
+
+class ExtractionPool:
+    """Runs picklable parsing functions in a bounded set of self-healing worker processes."""
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                 max_tasks_per_child: Optional[int] = None, preload: Sequence[str] = ()):
+        """
+        Initialize the pool. Worker processes are started by warm_up or as tasks need them.
+
+        Args:
+            max_workers: Worker processes (defaults to Config.EXTRACTION_POOL_WORKERS)
+            timeout: Seconds one task may take (defaults to Config.EXTRACTION_TASK_TIMEOUT)
+            max_tasks_per_child: Tasks after which a worker is replaced (defaults to Config.EXTRACTION_POOL_MAX_TASKS)
+            preload: Modules each worker imports before it reports ready
+        """
+        self.max_workers = max_workers or Config.EXTRACTION_POOL_WORKERS
+        self.timeout = timeout if timeout is not None else Config.EXTRACTION_TASK_TIMEOUT
+        self.max_tasks_per_child = max_tasks_per_child or Config.EXTRACTION_POOL_MAX_TASKS
+        self.preload = tuple(preload)
+        # Forking a threaded web worker is unsafe
+        self._context = multiprocessing.get_context('spawn')
+        self._workers = set()
+        self._idle = []
+        self._starting = 0
+        self._unavailable = False
+        self._lock = threading.Condition()
+        self._stats = {'tasks': 0, 'inline': 0, 'timeouts': 0, 'restarts': 0, 'retries': 0}
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a function in a worker process and wait for its result.
+
+        A task whose worker crashes is retried once in a new worker.
+
+        Args:
+            fn: Module-level function (it is pickled by reference)
+            *args: Picklable arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            TimeoutError: If the task did not finish within the timeout or the request's deadline
+            WorkerCrashed: If the worker exited while running the task, again after the retry
+        """
+        if not Config.EXTRACTION_POOL_ENABLED:
+            return self._run_inline(fn, *args)
+
+        for attempt in range(2):
+            workers = self._checkout(1, time.monotonic() + remaining_budget(self.timeout))
+            if workers is None:
+                return self._run_inline(fn, *args)
+            worker = workers[0]
+            # The task's time starts once a started worker has it
+            ends_at = time.monotonic() + remaining_budget(self.timeout)
+            with self._lock:
+                self._stats['tasks'] += 1
+            try:
+                worker.send(fn, args)
+                finished = worker.conn.poll(max(ends_at - time.monotonic(), 0))
+                result = worker.receive() if finished else None
+            except WorkerCrashed as e:
+                self._discard(worker)
+                if attempt:
+                    raise
+                logger.warning(f"{e}, retrying the task in a new worker")
+                with self._lock:
+                    self._stats['retries'] += 1
+                continue
+            except Exception:
+                self._checkin(worker)
+                raise
+            if not finished:
+                self._timed_out([worker])
+                raise TimeoutError("Article parsing timed out")
+            self._checkin(worker)
+            return result
+
+    def race(self, tasks: Sequence[Tuple[Callable[..., Any], Tuple[Any, ...]]],
+             accept: Callable[[Any], bool]) -> Optional[List[Any]]:
+        """
+        Run tasks in worker processes at once and collect results until one is accepted.
+
+        Every task gets its own worker, so a race only starts when that many are free,
+        counting workers still finishing the losing tasks of earlier races. Without a pool
+        the tasks run in-process one after another, stopping at the first accepted result.
+        Losing tasks still running when a result is accepted finish in the background.
+
+        Args:
+            tasks: (module-level function, arguments) pairs
+            accept: Whether a result is good enough to stop waiting for the others
+
+        Returns:
+            Results in the order they finished; only those that finished in time if the
+            timeout passed; None if too few workers were free to race
+
+        Raises:
+            TimeoutError: If no task finished within the timeout or the request's deadline
+        """
+        workers = self._checkout(len(tasks), None) if Config.EXTRACTION_POOL_ENABLED else None
+        if workers is None:
+            if Config.EXTRACTION_POOL_ENABLED and not self._unavailable:
+                return None
+            results = []
+            for fn, args in tasks:
+                results.append(self._run_inline(fn, *args))
+                if accept(results[-1]):
+                    break
+            return results
+
+        ends_at = time.monotonic() + remaining_budget(self.timeout)
+        with self._lock:
+            self._stats['tasks'] += len(tasks)
+        pending = {}
+        for worker, (fn, args) in zip(workers, tasks):
+            try:
+                worker.send(fn, args)
+                pending[worker.conn] = worker
+            except WorkerCrashed as e:
+                logger.warning(f"{e}, racing without it")
+                self._discard(worker)
+
+        results = []
+        while pending:
+            ready = wait(list(pending), timeout=max(ends_at - time.monotonic(), 0))
+            if not ready:
+                break
+            for conn in ready:
+                worker = pending.pop(conn)
+                try:
+                    results.append(worker.receive())
+                except WorkerCrashed as e:
+                    logger.warning(f"{e} during a race")
+                    self._discard(worker)
+                    continue
+                except Exception:
+                    self._checkin(worker)
+                    self._finish_in_background(list(pending.values()), ends_at)
+                    raise
+                self._checkin(worker)
+                if accept(results[-1]):
+                    self._finish_in_background(list(pending.values()), ends_at)
+                    return results
+
+        if pending:
+            self._timed_out(list(pending.values()))
+            if not results:
+                raise TimeoutError("Article parsing timed out")
+        return results
+
+    def _run_inline(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a function in this process"""
+        with self._lock:
+            self._stats['inline'] += 1
+        return fn(*args)
+
+    def _checkout(self, count: int, ends_at: Optional[float]) -> Optional[List[_Worker]]:
+        """
+        Reserve workers for tasks, starting new ones up to the pool's size.
+
+        Args:
+            count: Workers needed at once
+            ends_at: Monotonic time to wait for free and started workers until; None not
+                to wait for free workers (new ones may still take the timeout to start)
+
+        Returns:
+            The reserved workers, ready for tasks, or None if they cannot be had without
+            waiting (ends_at None) or no worker process can be started
+
+        Raises:
+            TimeoutError: If no worker was free, or a new one had not started, before ends_at
+            WorkerCrashed: If a new worker exited while starting
+        """
+        with self._lock:
+            while True:
+                if self._unavailable or count > self.max_workers:
+                    return None
+                self._idle = [worker for worker in self._idle if self._alive(worker)]
+                free = len(self._idle) + self.max_workers - len(self._workers) - self._starting
+                if free >= count:
+                    break
+                if ends_at is None:
+                    return None
+                if not self._lock.wait(max(ends_at - time.monotonic(), 0)) and time.monotonic() >= ends_at:
+                    self._stats['timeouts'] += 1
+                    raise TimeoutError("No extraction worker was free in time")
+            reserved = [self._idle.pop() for _ in range(min(count, len(self._idle)))]
+            to_start = count - len(reserved)
+            self._starting += to_start
+
+        try:
+            for _ in range(to_start):
+                reserved.append(_Worker(self._context, self.preload))
+        except Exception as e:
+            logger.error(f"Could not start an extraction worker, parsing in-process: {e}")
+            with self._lock:
+                self._unavailable = True
+                self._starting -= to_start
+                self._workers.update(reserved)
+                self._idle.extend(reserved)
+                self._lock.notify_all()
+            return None
+
+        with self._lock:
+            self._starting -= to_start
+            self._workers.update(reserved)
+
+        ready_by = ends_at if ends_at is not None else time.monotonic() + remaining_budget(self.timeout)
+        try:
+            started = all([worker.wait_ready(max(ready_by - time.monotonic(), 0)) for worker in reserved])
+        except WorkerCrashed:
+            started = None
+        if started:
+            return reserved
+        for worker in reserved:
+            if worker.ready:
+                self._checkin(worker)
+            else:
+                self._discard(worker)
+        if started is None:
+            raise WorkerCrashed("Extraction worker exited while starting")
+        with self._lock:
+            self._stats['timeouts'] += 1
+        raise TimeoutError("Extraction worker did not start in time")
+
+    def _alive(self, worker: _Worker) -> bool:
+        """Check an idle worker, dropping it if its process has exited (lock held)"""
+        if worker.process.is_alive():
+            return True
+        self._workers.discard(worker)
+        worker.conn.close()
+        return False
+
+    def _checkin(self, worker: _Worker) -> None:
+        """Return a worker after its task, retiring it after max_tasks_per_child tasks"""
+        with self._lock:
+            if worker not in self._workers:
+                return
+            if worker.tasks < self.max_tasks_per_child:
+                self._idle.append(worker)
+                self._lock.notify_all()
+                return
+            self._workers.discard(worker)
+            self._lock.notify_all()
+        worker.stop()
+
+    def _discard(self, worker: _Worker) -> None:
+        """Kill a stuck or crashed worker; a new one is started when a task needs it"""
+        with self._lock:
+            if worker not in self._workers:
+                return
+            self._workers.discard(worker)
+            self._stats['restarts'] += 1
+            self._lock.notify_all()
+        worker.stop(terminate=True)
+
+    def _timed_out(self, workers: List[_Worker]) -> None:
+        """Count a timeout and kill the workers still running its tasks, and only them"""
+        logger.warning(f"Extraction task timed out, replacing {len(workers)} extraction worker(s)")
+        with self._lock:
+            self._stats['timeouts'] += 1
+        for worker in workers:
+            self._discard(worker)
+
+    def _finish_in_background(self, workers: List[_Worker], ends_at: float) -> None:
+        """Let the losers of a race finish, returning their workers or killing them at the timeout"""
+        if not workers:
+            return
+
+        def finish():
+            for worker in workers:
+                try:
+                    if worker.conn.poll(max(ends_at - time.monotonic(), 0)):
+                        worker.receive()
+                    else:
+                        self._discard(worker)
+                        continue
+                except WorkerCrashed:
+                    self._discard(worker)
+                    continue
+                except Exception:
+                    pass
+                self._checkin(worker)
+
+        threading.Thread(target=finish, name="extraction-race-losers", daemon=True).start()
+
+    def warm_up(self) -> None:
+        """Start every worker process in the background, so the first tasks do not wait for them"""
+        if not Config.EXTRACTION_POOL_ENABLED:
+            return
+
+        def start():
+            try:
+                workers = self._checkout(self.max_workers, None)
+            except Exception as e:
+                logger.warning(f"Extraction pool warm-up failed: {e}")
+                return
+            for worker in workers or []:
+                self._checkin(worker)
+            logger.info(f"Extraction pool warmed up with {self.max_workers} workers")
+
+        threading.Thread(target=start, name="extraction-pool-warmup", daemon=True).start()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            workers, self._workers, self._idle = list(self._workers), set(), []
+            self._lock.notify_all()
+        for worker in workers:
+            worker.stop(terminate=True)
+            worker.process.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary of tasks sent to workers, tasks parsed in-process, timeouts, workers
+            replaced after a timeout or crash and tasks retried after a crash, with the pool's
+            size, its busy workers and whether any worker is running
+        """
+        with self._lock:
+            return dict(self._stats, enabled=Config.EXTRACTION_POOL_ENABLED, workers=self.max_workers,
+                        busy=len(self._workers) - len(self._idle), running=bool(self._workers))
@@ -0,0 +1,171 @@
+"""
+Extractive Summarizer Module for NewsFlash Application
+
+This module provides a local, no-network summarizer including:
+- Sentence segmentation for Latin punctuation and the Devanagari danda (।, ॥)
+- TF-IDF sentence vectors with small English, Hindi and Marathi stopword lists
+- TextRank scoring over the sentence similarity graph
+- Selection of the top sentences in their original order within a length limit
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+from config import Config
+from sentiment_lexicon import TOKEN_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: Latin terminators (optionally closing a quote) before whitespace, or a danda with or without it
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"'”’)])\s+|(?<=[।॥])\s*|\n+")
+# Tokens before a period that do not end a sentence
+ABBREVIATIONS = {'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'jr', 'sr', 'vs', 'inc', 'ltd', 'co', 'corp', 'no', 'etc', 'gov', 'gen', 'rs'}
+
+STOPWORDS = {
+    'en': {
+        'the', 'a', 'an', 'and', 'or', 'but', 'of', 'to', 'in', 'on', 'at', 'for', 'with', 'by', 'from', 'as',
+        'is', 'are', 'was', 'were', 'be', 'been', 'has', 'have', 'had', 'it', 'its', 'this', 'that', 'these',
+        'those', 'he', 'she', 'they', 'we', 'you', 'his', 'her', 'their', 'our', 'will', 'would', 'can',
+        'could', 'said', 'says', 'also', 'which', 'who', 'not', 'than', 'into', 'about', 'after', 'over',
+    },
+    'hi': {
+        'का', 'की', 'के', 'को', 'में', 'से', 'पर', 'ने', 'और', 'या', 'है', 'हैं', 'था', 'थी', 'थे', 'यह', 'वह',
+        'ये', 'वे', 'इस', 'उस', 'इसके', 'उसके', 'एक', 'भी', 'तो', 'ही', 'लिए', 'कि', 'जो', 'गया', 'गई', 'कहा',
+        'रहा', 'रही', 'रहे', 'हो', 'होने', 'करने', 'किया', 'कर',
+    },
+    'mr': {
+        'आणि', 'या', 'व', 'हे', 'ही', 'हा', 'ते', 'तो', 'ती', 'आहे', 'आहेत', 'होते', 'होता', 'होती', 'की', 'एक',
+        'मध्ये', 'साठी', 'त्या', 'त्यांनी', 'त्याच्या', 'असे', 'केले', 'करण्यात', 'आले', 'आली', 'म्हणाले', 'पण',
+        'तर', 'ने', 'चा', 'ची', 'चे', 'ला', 'वर',
+    },
+}
+
+
+class ExtractiveSummarizer:
+    """Summarizes text by picking its most central sentences."""
+
+    DAMPING = 0.85
+    ITERATIONS = 30
+    # Sentences beyond this are ignored so long articles stay cheap to rank
+    MAX_SENTENCES = 60
+
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        """
+        Split text into sentences, keeping the terminating punctuation.
+
+        Args:
+            text: Text in English, Hindi or Marathi
+
+        Returns:
+            List of non-empty sentences
+        """
+        sentences = []
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(text):
+            candidate = text[start:match.start()].strip()
+            words = candidate.rsplit(None, 1)
+            last_word = words[-1].rstrip('.').lower() if words else ''
+            # "Dr. Rao" and "U.S. officials" are not sentence ends
+            if candidate.endswith('.') and (last_word in ABBREVIATIONS or re.fullmatch(r"(?:[a-z]\.)*[a-z]", last_word)):
+                continue
+            if candidate:
+                sentences.append(candidate)
+            start = match.end()
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+
+    @staticmethod
+    def _tokenize(sentence: str, language: str) -> List[str]:
+        """Get the content words of a sentence"""
+        stopwords = STOPWORDS.get(language, STOPWORDS['en'])
+        return [token for token in TOKEN_PATTERN.findall(sentence.lower())
+                if token not in stopwords and not token.isdigit()]
+
+    @staticmethod
+    def _tfidf_vectors(tokenized: List[List[str]]) -> List[Dict[str, float]]:
+        """Build unit-length TF-IDF vectors, treating each sentence as a document"""
+        document_frequency = Counter(token for tokens in tokenized for token in set(tokens))
+        count = len(tokenized)
+        vectors = []
+        for tokens in tokenized:
+            weights = {token: tf * (math.log((1 + count) / (1 + document_frequency[token])) + 1)
+                       for token, tf in Counter(tokens).items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            vectors.append({token: weight / norm for token, weight in weights.items()} if norm else {})
+        return vectors
+
+    def rank_sentences(self, sentences: List[str], language: str = 'en') -> List[float]:
+        """
+        Score sentences with TextRank over their TF-IDF cosine similarities.
+
+        Args:
+            sentences: Sentences of one text
+            language: Language code used for stopwords
+
+        Returns:
+            One score per sentence; higher is more central
+        """
+        vectors = self._tfidf_vectors([self._tokenize(sentence, language) for sentence in sentences])
+        count = len(vectors)
+        similarity = [[0.0] * count for _ in range(count)]
+        for i in range(count):
+            for j in range(i + 1, count):
+                shared = vectors[i].keys() & vectors[j].keys()
+                similarity[i][j] = similarity[j][i] = sum(vectors[i][t] * vectors[j][t] for t in shared)
+        out_weight = [sum(row) for row in similarity]
+
+        scores = [1.0 / count] * count
+        for _ in range(self.ITERATIONS):
+            scores = [
+                (1 - self.DAMPING) / count + self.DAMPING * sum(
+                    similarity[j][i] / out_weight[j] * scores[j] for j in range(count) if out_weight[j]
+                )
+                for i in range(count)
+            ]
+        return scores
+
+    def summarize(self, text: str, language: str = 'en', max_sentences: int = None, max_length: int = None) -> str:
+        """
+        Create an extractive summary of the text.
+
+        Args:
+            text: Article text to summarize
+            language: Language code (en, hi, mr)
+            max_sentences: Most sentences to keep (defaults to Config.EXTRACTIVE_SUMMARY_SENTENCES)
+            max_length: Most characters to return (defaults to Config.EXTRACTIVE_SUMMARY_MAX_LENGTH)
+
+        Returns:
+            The selected sentences in their original order
+        """
+        max_sentences = max_sentences or Config.EXTRACTIVE_SUMMARY_SENTENCES
+        max_length = max_length or Config.EXTRACTIVE_SUMMARY_MAX_LENGTH
+
+        if not text or not text.strip():
+            return "No content available for summary."
+        text = text.strip()
+
+        sentences = self.split_sentences(text)[:self.MAX_SENTENCES]
+        if len(text) <= max_length and len(sentences) <= max_sentences:
+            return text
+
+        scores = self.rank_sentences(sentences, language)
+        # Ties go to the earlier sentence, which in news is usually the lead
+        ranked = sorted(range(len(sentences)), key=lambda index: (-scores[index], index))
+
+        chosen = []
+        length = 0
+        for index in ranked:
+            if len(chosen) == max_sentences:
+                break
+            if length + len(sentences[index]) + len(chosen) <= max_length:
+                chosen.append(index)
+                length += len(sentences[index])
+
+        if not chosen:
+            return text[:max_length].strip() + "..."
+        return ' '.join(sentences[index] for index in sorted(chosen))
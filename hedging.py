@@ -0,0 +1,147 @@
+"""
+Hedging Module for NewsFlash Application
+
+This module provides hedged requests for calls with a long latency tail including:
+- A second identical request sent once the first is slower than a latency percentile
+- Whichever request answers first wins; the other is left to finish in the background
+- A cap on hedges as a percentage of requests, so hedging cannot double the load
+- Request, hedge and hedge-win counters per hedged operation
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+from config import Config
+from deadline import remaining_budget, submit_with_deadline
+from error_handler import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class Hedger:
+    """Runs a call and, if it is slow, a second identical one, returning the first answer."""
+
+    def __init__(self, name: str, percentile: Optional[float] = None, max_extra_percent: Optional[float] = None,
+                 initial_delay: Optional[float] = None, max_workers: Optional[int] = None):
+        """
+        Initialize a hedger.
+
+        Args:
+            name: Operation name used in logs and stats
+            percentile: Latency percentile after which the hedge is sent (defaults to Config.SEARCH_HEDGE_PERCENTILE)
+            max_extra_percent: Hedges allowed as a percentage of requests (defaults to Config.SEARCH_HEDGE_MAX_PERCENT)
+            initial_delay: Hedge delay used until enough latencies are sampled (defaults to Config.SEARCH_HEDGE_INITIAL_DELAY)
+            max_workers: Threads running requests and hedges (defaults to twice Config.SEARCH_MAX_WORKERS)
+        """
+        self.name = name
+        self.percentile = percentile if percentile is not None else Config.SEARCH_HEDGE_PERCENTILE
+        self.max_extra_percent = max_extra_percent if max_extra_percent is not None else Config.SEARCH_HEDGE_MAX_PERCENT
+        self.initial_delay = initial_delay if initial_delay is not None else Config.SEARCH_HEDGE_INITIAL_DELAY
+        self._latencies = deque(maxlen=Config.SEARCH_HEDGE_SAMPLES)
+        # Hedge allowance in percent of a hedge: each request earns max_extra_percent, a hedge costs 100
+        self._credit = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or 2 * Config.SEARCH_MAX_WORKERS, thread_name_prefix=f"{name}-hedge"
+        )
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'over_budget': 0}
+
+    def hedge_delay(self) -> float:
+        """
+        Get how long to wait for the first request before hedging.
+
+        Returns:
+            The configured percentile of recent latencies, or the initial delay while too few are sampled
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < Config.SEARCH_HEDGE_MIN_SAMPLES:
+            return self.initial_delay
+        index = max(0, math.ceil(self.percentile / 100 * len(latencies)) - 1)
+        return latencies[index]
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, hedging it with a second call if the first has not answered in time.
+
+        Args:
+            fn: Request to run; must be safe to run twice
+
+        Returns:
+            The result of whichever call succeeded first
+
+        Raises:
+            DeadlineExceededError: If no call answered before the request's deadline
+            Exception: What the calls raised, if every call failed
+        """
+        if not Config.SEARCH_HEDGING_ENABLED:
+            return fn()
+
+        delay = self.hedge_delay()
+        with self._lock:
+            self._stats['requests'] += 1
+            self._credit = min(100.0, self._credit + self.max_extra_percent)
+
+        primary = self._submit(fn)
+        pending = {primary}
+        done, _ = wait(pending, timeout=remaining_budget(delay))
+        if not done and self._take_hedge():
+            logger.debug(f"{self.name}: no answer after {delay:.2f}s, sending a hedged request")
+            pending.add(self._submit(fn))
+
+        error = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining_budget(None), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceededError(f"{self.name} did not answer before the request deadline")
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                if future is not primary:
+                    with self._lock:
+                        self._stats['hedge_wins'] += 1
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+        raise error
+
+    def _submit(self, fn: Callable[[], Any]) -> Future:
+        """Start one request, recording its latency when it succeeds"""
+        started = time.monotonic()
+        future = submit_with_deadline(self._executor, fn)
+        future.add_done_callback(lambda f: self._record_latency(f, time.monotonic() - started))
+        return future
+
+    def _record_latency(self, future: Future, latency: float) -> None:
+        """Add a successful request's latency to the samples"""
+        if not future.cancelled() and future.exception() is None:
+            with self._lock:
+                self._latencies.append(latency)
+
+    def _take_hedge(self) -> bool:
+        """Spend one hedge from the allowance, if any is left"""
+        with self._lock:
+            if self._credit < 100.0:
+                self._stats['over_budget'] += 1
+                return False
+            self._credit -= 100.0
+            self._stats['hedged'] += 1
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters.
+
+        Returns:
+            Dictionary of requests, hedges sent, hedges that answered first, hedges skipped
+            for being over the allowance, and the current hedge delay in seconds
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            return dict(self._stats, enabled=Config.SEARCH_HEDGING_ENABLED, delay=round(delay, 3),
+                        samples=len(self._latencies))
@@ -1,4 +1,9 @@
-from app import app
+import os
 
 if __name__ == '__main__':
+    # Tells app.py that only the reloader's child process serves requests
+    os.environ['NEWSFLASH_RELOADER'] = 'true'
+    # Imported here so the spawned article parsing processes, which re-import this
+    # module, do not load the application
+    from app import app
     app.run(host='0.0.0.0', port=5000, debug=True)
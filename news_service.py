@@ -1,14 +1,35 @@
+import json
 import logging
-from typing import List, Dict, Any
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from duckduckgo_search import DDGS
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from config import Config
 from language_service import LanguageService
+from rate_limiter import RateLimiter, is_rate_limit_error
+from summary_cache import SummaryCache
+from search_cache import SearchResultCache
+from sentiment_lexicon import LexiconSentimentAnalyzer
+from extractive_summarizer import ExtractiveSummarizer
+from article_dedup import ArticleDeduplicator
+from token_budget import TokenBudgetManager
+from prompt_registry import PromptRegistry
+from single_flight import SingleFlight
+from hedging import Hedger
+from candidate_buffer import CandidateBuffer, CandidateWindow
+from deadline import remaining_budget, submit_with_deadline
+from retry_budget import record_attempt
+from structured_output import (
+    SUMMARY_SENTIMENT_SCHEMA, build_correction_templates, build_structured_templates, parse_structured_response
+)
 from error_handler import (
     ErrorHandler, FallbackManager, with_language_fallback, with_sentiment_fallback, 
-    with_retry, handle_language_operation, handle_sentiment_operation,
-    LanguageError, SentimentAnalysisError, AIServiceError
+    with_retry, handle_language_operation, handle_sentiment_operation, get_circuit_breaker, check_deadline,
+    LanguageError, SentimentAnalysisError, AIServiceError, StructuredOutputError, CircuitOpenError
 )
 import os
 
@@ -21,6 +42,14 @@ os.environ["LANGCHAIN_PROJECT"] = Config.LANGSMITH_PROJECT
 logger = logging.getLogger(__name__)
 
 class NewsService:
+    # Extra seconds granted to a topic over its budget to hand back partial results
+    TOPIC_GRACE_PERIOD = 2
+    # Bump whenever a prompt template changes so cached results from old prompts are not reused
+    PROMPT_VERSION = "1"
+    # Prompts whose answers are cached as 'summary_sentiment' results (single, structured
+    # with its correction retry, and batched)
+    SUMMARY_SENTIMENT_PROMPTS = ('summary_sentiment', 'structured', 'correction', 'batch')
+    
     def __init__(self):
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-1.5-flash",
@@ -28,7 +57,34 @@ class NewsService:
             temperature=0.1
         )
         self.ddgs = DDGS()
+        # Token bucket shared with every other NewsService in this host's workers
+        self.rate_limiter = RateLimiter("gemini")
+        # Shared per-dependency breakers; open circuits send callers straight to fallbacks
+        self.gemini_circuit = get_circuit_breaker("gemini")
+        self.search_circuit = get_circuit_breaker("duckduckgo")
+        self.summary_cache = SummaryCache() if Config.SUMMARY_CACHE_ENABLED else None
+        self.search_cache = SearchResultCache() if Config.SEARCH_CACHE_ENABLED else None
+        # Slow DuckDuckGo searches get a second identical request when hedging is enabled
+        self.search_hedger = Hedger("duckduckgo")
+        self.sentiment_lexicon = LexiconSentimentAnalyzer()
+        self.extractive_summarizer = ExtractiveSummarizer()
+        self.deduplicator = ArticleDeduplicator() if Config.DEDUP_ENABLED else None
+        self.token_budget = TokenBudgetManager()
+        # Search results buffered per session and topic for "load more" pages
+        self.candidate_buffer = CandidateBuffer()
+        # Identical concurrent searches and summaries share one in-flight computation
+        self._search_flights = SingleFlight("search_news")
+        self._summary_flights = SingleFlight("summary")
+        # Bounded worker pools for concurrent topic searches and article summaries.
+        # Kept separate so topic workers never wait on tasks queued behind themselves.
+        self._topic_executor = ThreadPoolExecutor(
+            max_workers=max(1, Config.SEARCH_MAX_WORKERS), thread_name_prefix="news-topic"
+        )
+        self._summary_executor = ThreadPoolExecutor(
+            max_workers=max(1, Config.SUMMARY_MAX_WORKERS), thread_name_prefix="news-summary"
+        )
         self._init_prompt_templates()
+        self._init_prompt_registry()
         logger.info("NewsService initialized successfully")
     
     def _init_prompt_templates(self):
@@ -65,6 +121,90 @@ class NewsService:
                 भावना: [सकारात्मक/नकारात्मक/तटस्थ]"""
             )
         }
+        
+        # English summary-only template; other languages summarize with their summary+sentiment template
+        self.summary_prompt_templates = {
+            'en': ChatPromptTemplate.from_template(
+                """Create a 2-sentence summary of this news article:
+                    
+                    Title: {title}
+                    Article: {article_text}
+                    
+                    Summary:"""
+            )
+        }
+        
+        # Structured templates leave the output format to the JSON schema (Config.STRUCTURED_OUTPUT_ENABLED)
+        self.structured_prompt_templates = build_structured_templates()
+        self.correction_prompt_templates = build_correction_templates()
+        
+        # Batch templates summarize several articles in one call and answer with a JSON array
+        self.batch_prompt_templates = {
+            'en': ChatPromptTemplate.from_template(
+                """For each numbered news article below, create a 2-sentence summary and analyze sentiment (positive/negative/neutral).
+                
+                {articles}
+                
+                Respond with only a JSON array containing one object per article:
+                [{{"id": 1, "summary": "...", "sentiment": "positive|negative|neutral"}}]"""
+            ),
+            'hi': ChatPromptTemplate.from_template(
+                """नीचे दिए गए प्रत्येक क्रमांकित समाचार लेख का हिंदी में 2-वाक्य सारांश बनाएं और भावना (positive/negative/neutral) का विश्लेषण करें।
+                
+                {articles}
+                
+                केवल एक JSON array में उत्तर दें, प्रत्येक लेख के लिए एक object:
+                [{{"id": 1, "summary": "...", "sentiment": "positive|negative|neutral"}}]"""
+            ),
+            'mr': ChatPromptTemplate.from_template(
+                """खालील प्रत्येक क्रमांकित बातमी लेखाचा मराठीत 2-वाक्य सारांश तयार करा आणि भावना (positive/negative/neutral) चे विश्लेषण करा.
+                
+                {articles}
+                
+                फक्त एका JSON array मध्ये उत्तर द्या, प्रत्येक लेखासाठी एक object:
+                [{{"id": 1, "summary": "...", "sentiment": "positive|negative|neutral"}}]"""
+            )
+        }
+    
+    def _init_prompt_registry(self):
+        """Register every prompt by task and language and compose their chains once"""
+        self.prompts = PromptRegistry(self.PROMPT_VERSION)
+        self.prompts.register('summary', self.summary_prompt_templates)
+        self.prompts.register('summary_sentiment', self.prompt_templates)
+        self.prompts.register('sentiment', self.prompt_templates)
+        self.prompts.register('batch', self.batch_prompt_templates)
+        self.prompts.register('structured', self.structured_prompt_templates)
+        self.prompts.register('correction', self.correction_prompt_templates)
+        self._structured_llm = None
+        self.prompts.build([
+            (('summary', 'summary_sentiment', 'sentiment', 'batch'), self.llm),
+            (('structured', 'correction'), self.structured_llm),
+        ])
+    
+    @property
+    def structured_llm(self):
+        """The model constrained to answer with JSON matching SUMMARY_SENTIMENT_SCHEMA"""
+        # Bound once per model so the chains composed with it can be reused
+        if self._structured_llm is None or self._structured_llm[0] is not self.llm:
+            bound = self.llm.bind(response_mime_type="application/json", response_schema=SUMMARY_SENTIMENT_SCHEMA)
+            self._structured_llm = (self.llm, bound)
+        return self._structured_llm[1]
+    
+    def warm_up(self) -> None:
+        """Send one short request through the English chain in the background to open the model connection"""
+        def run():
+            try:
+                inputs = self.token_budget.prepare_inputs("Warm-up", "The service started and is ready for requests.", 'en')
+                self._invoke_rate_limited(self.prompts.chain('sentiment', 'en', self.llm), inputs)
+                logger.info("Prompt chains warmed up")
+            except Exception as e:
+                logger.warning(f"Chain warm-up failed: {e}")
+        
+        threading.Thread(target=run, name="chain-warmup", daemon=True).start()
+    
+    def get_prompt_stats(self) -> Dict[str, Any]:
+        """Get prompt versions and chain composition counters"""
+        return self.prompts.get_stats()
     
     def get_sentiment_prompt_template(self, language: str = 'en') -> ChatPromptTemplate:
         """Get the appropriate prompt template for the specified language with fallback"""
@@ -91,31 +231,103 @@ class NewsService:
                     Exception(f"Language not supported"), target_language
                 )
             
+            # Confident lexicon answers skip the AI round trip and its quota cost
+            local = self.sentiment_lexicon.score(text, target_language) if Config.SENTIMENT_LEXICON_ENABLED else None
+            if local and LexiconSentimentAnalyzer.is_confident(local):
+                self.sentiment_lexicon.record_decision(local, target_language, escalated=False)
+                return local['sentiment']
+            
+            if self.gemini_circuit.is_open():
+                return FallbackManager.get_sentiment_fallback()
+            
+            inputs = self.token_budget.prepare_inputs("Sentiment Analysis", text, target_language)
+            if Config.STRUCTURED_OUTPUT_ENABLED:
+                sentiment = self._invoke_structured(inputs, target_language)['sentiment']
+                logger.info(f"Analyzed sentiment: {sentiment} (language: {target_language})")
+                if local:
+                    self.sentiment_lexicon.record_decision(local, target_language, escalated=True, ai_sentiment=sentiment)
+                return sentiment
+            
             # Use the sentiment analysis prompt template
             prompt_template = self.get_sentiment_prompt_template(target_language)
             
-            # Rate limiting: Add delay between requests
-            import time
-            time.sleep(Config.RATE_LIMIT_DELAY)
-            
-            chain = prompt_template | self.llm
-            result = chain.invoke({
-                "title": "Sentiment Analysis",
-                "article_text": text[:800]  # Limit text to reduce token usage
-            })
+            chain = self.prompts.compose(prompt_template, self.llm)
+            result = self._invoke_rate_limited(chain, inputs)
             
             if hasattr(result, 'content') and result.content:
                 # Parse sentiment from response
                 sentiment = self._parse_sentiment_from_response(result.content)
                 logger.info(f"Analyzed sentiment: {sentiment} (language: {target_language})")
+                if local:
+                    self.sentiment_lexicon.record_decision(local, target_language, escalated=True, ai_sentiment=sentiment)
                 return sentiment
             else:
                 raise SentimentAnalysisError("No content in sentiment analysis response")
                 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             # Let the decorator handle the fallback
             raise SentimentAnalysisError(f"Sentiment analysis failed: {e}")
     
+    def analyze_sentiments(self, texts: List[str], language: str = 'en') -> List[str]:
+        """Analyze the sentiment of many texts, escalating only low-confidence ones to the AI
+        
+        Args:
+            texts: Texts to analyze
+            language: Language of the texts (en, hi, mr)
+        
+        Returns:
+            One sentiment label per text, in order
+        """
+        target_language = LanguageService.get_fallback_language(language)
+        if not Config.SENTIMENT_LEXICON_ENABLED:
+            return [self.analyze_sentiment(text, target_language) for text in texts]
+        
+        sentiments = []
+        for text, local in zip(texts, self.sentiment_lexicon.score_batch(texts, target_language)):
+            if len(text.strip()) >= 20 and LexiconSentimentAnalyzer.is_confident(local):
+                self.sentiment_lexicon.record_decision(local, target_language, escalated=False)
+                sentiments.append(local['sentiment'])
+            else:
+                # Low-confidence texts take the full path, which records the escalation
+                sentiments.append(self.analyze_sentiment(text, target_language))
+        return sentiments
+    
+    def get_sentiment_stats(self) -> Dict[str, Any]:
+        """Get lexicon/AI sentiment decision counters"""
+        return dict(self.sentiment_lexicon.get_stats(), enabled=Config.SENTIMENT_LEXICON_ENABLED)
+    
+    def get_token_budget_stats(self) -> Dict[str, Any]:
+        """Get estimated prompt tokens spent per language"""
+        return self.token_budget.get_stats()
+    
+    def _invoke_rate_limited(self, chain, inputs: Dict[str, Any]):
+        """Invoke an LLM chain once a shared rate limit token is available
+        
+        Throttling errors shrink the shared request rate; successes let it recover.
+        Calls are rejected with CircuitOpenError while the Gemini circuit is open, and
+        with DeadlineExceededError once the request's deadline has passed.
+        """
+        check_deadline("AI request")
+        self.gemini_circuit.check()
+        if not self.rate_limiter.acquire(remaining_budget(Config.RATE_LIMIT_MAX_WAIT)):
+            self.gemini_circuit.cancel()
+            raise AIServiceError("Timed out waiting for an AI request slot")
+        
+        record_attempt('gemini')
+        try:
+            result = chain.invoke(inputs)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.rate_limiter.record_throttle()
+            self.gemini_circuit.record_failure(e)
+            raise
+        
+        self.rate_limiter.record_success()
+        self.gemini_circuit.record_success()
+        return result
+    
     def _parse_sentiment_from_response(self, response_text: str) -> str:
         """Parse sentiment from AI response text"""
         response_lower = response_text.lower()
@@ -143,24 +355,99 @@ class NewsService:
             # Default fallback
             return 'neutral'
     
+    def _summary_cache_key(self, kind: str, article_text: str, title: str, language: str) -> str:
+        """Build the cache key for an AI result on this article content
+        
+        The full title and text are hashed, so articles differing anywhere never share a result.
+        """
+        return SummaryCache.make_key(kind, self._result_version(kind, language), language, title, article_text)
+    
+    def _result_version(self, kind: str, language: str) -> str:
+        """Version of every prompt that can produce a cached result of this kind
+        
+        'summary_sentiment' results come from the plain, structured or batch prompt, so
+        changing any of them, or switching structured output, starts a fresh set of results.
+        """
+        if kind != 'summary_sentiment':
+            return self.prompts.version(kind, language)
+        versions = [self.prompts.version(task, language) for task in self.SUMMARY_SENTIMENT_PROMPTS]
+        return ":".join(versions + [f"structured={Config.STRUCTURED_OUTPUT_ENABLED}"])
+    
+    def _get_cached_result(self, kind: str, article_text: str, title: str, language: str) -> Optional[Any]:
+        """Look up a cached AI result, or None when caching is disabled or on a miss"""
+        if self.summary_cache is None:
+            return None
+        return self.summary_cache.get(self._summary_cache_key(kind, article_text, title, language))
+    
+    def _cache_result(self, kind: str, article_text: str, title: str, language: str, value: Any) -> None:
+        """Store an AI result produced for this article content"""
+        if self.summary_cache is not None:
+            self.summary_cache.set(self._summary_cache_key(kind, article_text, title, language), value)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get summary cache hit/miss counters"""
+        if self.summary_cache is None:
+            return {'enabled': False}
+        return dict(self.summary_cache.get_stats(), enabled=True)
+    
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """Get search result cache hit/miss counters"""
+        if self.search_cache is None:
+            return {'enabled': False}
+        return dict(self.search_cache.get_stats(), enabled=True)
+    
+    def get_search_hedge_stats(self) -> Dict[str, Any]:
+        """Get hedged DuckDuckGo search counters"""
+        return self.search_hedger.get_stats()
+    
+    @staticmethod
+    def _ai_summary_enabled() -> bool:
+        """Check whether summaries may call the AI (USE_AI_SUMMARY on and SUMMARY_MODE not local)"""
+        return Config.USE_AI_SUMMARY and Config.SUMMARY_MODE != 'local'
+    
+    def _fallback_summary(self, article_text: str, language: str = 'en') -> str:
+        """Summarize without AI: extractive in local/auto mode, the lead sentences in llm mode"""
+        if Config.SUMMARY_MODE == 'llm':
+            return FallbackManager.create_fallback_summary(article_text)
+        return self.extractive_summarizer.summarize(article_text, language)
+    
+    def _fallback_sentiment(self, article_text: str, language: str = 'en') -> str:
+        """Sentiment without AI: a confident lexicon label, otherwise the neutral default"""
+        if Config.SENTIMENT_LEXICON_ENABLED and article_text:
+            local = self.sentiment_lexicon.score(article_text, language)
+            if LexiconSentimentAnalyzer.is_confident(local):
+                return local['sentiment']
+        return FallbackManager.get_sentiment_fallback()
+    
+    def _fallback_result(self, article_text: str, language: str) -> dict:
+        """Build a summary/sentiment result without calling the AI"""
+        return {
+            'summary': self._fallback_summary(article_text, language),
+            'sentiment': self._fallback_sentiment(article_text, language),
+            'language': language
+        }
+    
     def generate_summary_with_sentiment(self, article_text: str, title: str, language: str = 'en') -> dict:
         """Generate summary and sentiment analysis in a single API call with comprehensive error handling"""
         try:
-            # Skip AI analysis for very short articles or if disabled
-            if len(article_text) < Config.AI_SUMMARY_MIN_LENGTH or not Config.USE_AI_SUMMARY:
-                return {
-                    'summary': FallbackManager.create_fallback_summary(article_text),
-                    'sentiment': FallbackManager.get_sentiment_fallback(),
-                    'language': LanguageService.get_fallback_language(language)
-                }
+            # Skip AI analysis for very short articles, if disabled, or while Gemini is failing
+            if (len(article_text) < Config.AI_SUMMARY_MIN_LENGTH or not self._ai_summary_enabled()
+                    or self.gemini_circuit.is_open()):
+                return self._fallback_result(article_text, LanguageService.get_fallback_language(language))
+            
+            # Cache hits skip the AI call and the rate limiter entirely
+            cached = self._get_cached_result('summary_sentiment', article_text, title, LanguageService.get_fallback_language(language))
+            if cached:
+                return dict(cached, ai_summary=True)
             
             # Use comprehensive error handling for language operations
-            return handle_language_operation(
+            key = self._summary_cache_key('summary_sentiment', article_text, title, LanguageService.get_fallback_language(language))
+            return self._summary_flights.do(key, lambda: handle_language_operation(
                 "generate_summary_with_sentiment",
                 language,
                 self._generate_summary_with_sentiment_for_language,
                 article_text, title
-            )
+            ))
                 
         except Exception as e:
             # Final fallback with comprehensive error logging
@@ -172,45 +459,69 @@ class NewsService:
             else:
                 ErrorHandler.log_language_error("generate_summary_with_sentiment", target_language, e)
             
-            return {
-                'summary': FallbackManager.create_fallback_summary(article_text),
-                'sentiment': FallbackManager.get_sentiment_fallback(),
-                'language': target_language
-            }
+            return self._fallback_result(article_text, target_language)
     
     @with_retry()
     def _generate_summary_with_sentiment_for_language(self, article_text: str, title: str, language: str) -> dict:
         """Internal method to generate summary and sentiment for a specific language with retry logic"""
         try:
-            # Rate limiting: Add delay between requests
-            import time
-            time.sleep(Config.RATE_LIMIT_DELAY)
-            
-            prompt_template = self.get_sentiment_prompt_template(language)
-            
-            chain = prompt_template | self.llm
-            result = chain.invoke({
-                "title": title[:200],  # Limit title length
-                "article_text": article_text[:800]  # Limit text to reduce memory usage
-            })
-            
-            if hasattr(result, 'content') and result.content:
+            inputs = self.token_budget.prepare_inputs(title, article_text, language)
+            if Config.STRUCTURED_OUTPUT_ENABLED:
+                data = self._invoke_structured(inputs, language)
+                summary, sentiment = data['summary'], data['sentiment']
+            else:
+                prompt_template = self.get_sentiment_prompt_template(language)
+                
+                chain = self.prompts.compose(prompt_template, self.llm)
+                result = self._invoke_rate_limited(chain, inputs)
+                if not (hasattr(result, 'content') and result.content):
+                    raise AIServiceError("No content in AI response")
                 # Parse both summary and sentiment from response
                 summary, sentiment = self._parse_summary_and_sentiment(result.content)
-                logger.info(f"Generated summary and sentiment for article in {language}: {title[:50]}...")
-                return {
-                    'summary': summary or FallbackManager.create_fallback_summary(article_text),
-                    'sentiment': sentiment or FallbackManager.get_sentiment_fallback(),
-                    'language': language
-                }
-            else:
-                raise AIServiceError("No content in AI response")
+            
+            logger.info(f"Generated summary and sentiment for article in {language}: {title[:50]}...")
+            response = {
+                'summary': summary or self._fallback_summary(article_text, language),
+                'sentiment': sentiment or FallbackManager.get_sentiment_fallback(),
+                'language': language,
+                'ai_summary': bool(summary)
+            }
+            # Only cache responses the model actually answered, not local fallbacks
+            if summary:
+                self._cache_result('summary_sentiment', article_text, title, language, response)
+            return response
                 
+        except (StructuredOutputError, CircuitOpenError):
+            raise
         except Exception as e:
             # Enhanced error logging
             ErrorHandler.log_ai_service_error("_generate_summary_with_sentiment_for_language", e)
             raise AIServiceError(f"Failed to generate summary and sentiment: {e}")
     
+    def _invoke_structured(self, inputs: Dict[str, str], language: str) -> Dict[str, str]:
+        """Invoke the JSON schema summary+sentiment chain
+        
+        A malformed answer gets one retry that shows the model its rejected output and
+        the validation error.
+        
+        Returns:
+            Dictionary with 'summary', 'sentiment' and 'language'
+        
+        Raises:
+            StructuredOutputError: If the retry is malformed too
+        """
+        language = LanguageService.get_fallback_language(language)
+        chain = self.prompts.chain('structured', language, self.structured_llm)
+        content = getattr(self._invoke_rate_limited(chain, inputs), 'content', None) or ''
+        try:
+            return parse_structured_response(content, language)
+        except StructuredOutputError as e:
+            logger.warning(f"Malformed structured output in {language} ({e}), retrying once")
+            chain = self.prompts.chain('correction', language, self.structured_llm)
+            retry_inputs = dict(inputs, previous=content[:1000], error=str(e))
+            content = getattr(self._invoke_rate_limited(chain, retry_inputs), 'content', None) or ''
+            return parse_structured_response(content, language)
+    
     def _parse_summary_and_sentiment(self, response_text: str) -> tuple:
         """Parse both summary and sentiment from AI response"""
         summary = None
@@ -255,9 +566,183 @@ class NewsService:
         
         return summary, sentiment
 
-    def search_news(self, topic: str, max_results: int = 5, language: str = 'en') -> List[Dict[str, Any]]:
-        """Search for news articles on a given topic using DuckDuckGo with language support"""
+    def summarize_articles_batch(self, articles: List[Dict[str, Any]], language: str = 'en') -> List[Optional[Dict[str, str]]]:
+        """Generate summaries and sentiments for several articles in a single AI call
+        
+        Args:
+            articles: Articles with 'title' and 'body' keys
+            language: Language for the summaries (en, hi, mr)
+        
+        Returns:
+            One dict with summary, sentiment and language per article, in input order;
+            None for any article whose result was missing or could not be parsed
+        """
+        if not articles:
+            return []
+        
+        target_language = LanguageService.get_fallback_language(language)
+        budgeted = [self.token_budget.prepare_inputs(article.get('title', ''), article.get('body', ''), target_language)
+                    for article in articles]
+        numbered = "\n\n".join(
+            f"Article {i}:\nTitle: {inputs['title']}\nText: {inputs['article_text']}"
+            for i, inputs in enumerate(budgeted, start=1)
+        )
+        
+        try:
+            chain = self.prompts.chain('batch', target_language, self.llm)
+            result = self._invoke_rate_limited(chain, {"articles": numbered})
+            
+            if not (hasattr(result, 'content') and result.content):
+                raise AIServiceError("No content in batch AI response")
+            
+            parsed = self._parse_batch_response(result.content, len(articles), target_language)
+            for article, item in zip(articles, parsed):
+                if item:
+                    self._cache_result('summary_sentiment', article.get('body', ''), article.get('title', ''), target_language, item)
+            logger.info(f"Batch summarized {sum(1 for item in parsed if item)}/{len(articles)} articles in {target_language}")
+            return parsed
+            
+        except Exception as e:
+            ErrorHandler.log_ai_service_error("summarize_articles_batch", e)
+            return [None] * len(articles)
+    
+    def _parse_batch_response(self, response_text: str, count: int, language: str) -> List[Optional[Dict[str, str]]]:
+        """Parse a batched JSON response into per-article results, leaving invalid items as None"""
+        results: List[Optional[Dict[str, str]]] = [None] * count
+        
+        # Models sometimes wrap JSON in markdown code fences or add surrounding prose
+        match = re.search(r'\[.*\]', response_text, re.DOTALL)
+        if not match:
+            logger.warning("Batch AI response contained no JSON array")
+            return results
+        
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Batch AI response was not valid JSON: {e}")
+            return results
+        
+        for position, item in enumerate(items if isinstance(items, list) else []):
+            if not isinstance(item, dict):
+                continue
+            
+            # Prefer the explicit id, otherwise trust the array order
+            index = item.get('id', position + 1)
+            if not isinstance(index, int) or not 1 <= index <= count or results[index - 1]:
+                continue
+            
+            summary = item.get('summary')
+            sentiment = item.get('sentiment')
+            if not isinstance(summary, str) or not summary.strip() or not isinstance(sentiment, str):
+                continue
+            
+            results[index - 1] = {
+                'summary': summary.strip(),
+                'sentiment': self._parse_sentiment_from_response(sentiment),
+                'language': language
+            }
+        
+        return results
+    
+    def search_news(self, topic: str, max_results: int = 5, language: str = 'en',
+                    session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search for news articles on a given topic using DuckDuckGo with language support
+        
+        Each article gets its summary and sentiment from a single AI call, generated within
+        Config.TOPIC_TIME_BUDGET seconds; articles whose summary is not ready by then are
+        returned with a fallback summary and neutral sentiment. Copies of articles already
+        summarized reuse that summary, and articles the session has already seen are dropped.
+        Concurrent identical searches without a session share one search.
+        """
+        if session_id:
+            # Results depend on what the session has already seen
+            return self._search_news(topic, max_results, language, session_id)
+        key = (" ".join(str(topic).lower().split()), max_results, LanguageService.get_fallback_language(language))
+        return self._search_flights.do(
+            key, lambda: self._search_news(topic, max_results, language),
+            timeout=remaining_budget(Config.TOPIC_TIME_BUDGET + self.TOPIC_GRACE_PERIOD)
+        )
+    
+    def search_page(self, topic: str, max_results: int = 5, language: str = 'en', session_id: Optional[str] = None,
+                    cursor: Optional[str] = None, exclude_urls: Iterable[str] = ()) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get the next page of articles for a topic from the session's buffered candidates
+        
+        Without a valid cursor the window the session's first search opened is used, or
+        one is opened from a search for Config.PAGINATION_WINDOW results, which the topic's
+        first search has cached.
+        Articles in exclude_urls, articles the session has seen and duplicates are skipped,
+        and only the articles of the page are summarized. DuckDuckGo is searched again, for
+        a larger window, only once the buffered candidates run out.
+        
+        Args:
+            topic: Topic to page through
+            max_results: Articles per page
+            language: Language for the summaries
+            session_id: Session paging through the topic
+            cursor: Cursor returned with the previous page, if any
+            exclude_urls: URLs already shown to the session, e.g. its saved articles
+        
+        Returns:
+            Tuple of (articles of the page, cursor of the next page or None when there are no more)
+        """
+        deadline = time.monotonic() + remaining_budget(Config.TOPIC_TIME_BUDGET)
+        target_language = LanguageService.get_fallback_language(language)
+        normalized_topic = " ".join(str(topic).lower().split())
+        
+        window, offset = self.candidate_buffer.resume(cursor, session_id, normalized_topic, target_language)
+        if window is None:
+            candidates = self._find_candidates(topic, Config.PAGINATION_WINDOW, target_language)
+            window = self.candidate_buffer.open(session_id, normalized_topic, target_language,
+                                                candidates, Config.PAGINATION_WINDOW)
+            offset = 0
+        
+        shown = set(exclude_urls)
+        page, novel = [], []
+        while len(page) < max_results:
+            batch, offset = window.take(offset, max_results - len(page))
+            if not batch:
+                if not self._grow_window(window, topic):
+                    break
+                continue
+            articles, to_summarize = self._deduplicate(
+                [article for article in batch if article['url'] not in shown], target_language, session_id
+            )
+            page.extend(articles)
+            novel.extend(to_summarize)
+            shown.update(article['url'] for article in articles)
+            self.mark_articles_seen(session_id, articles)
+        
+        self._summarize_articles(novel, target_language, deadline)
+        self._remember_articles(novel, target_language)
+        logger.info(f"Served {len(page)} more articles for topic: {topic} (language: {target_language})")
+        return page, CandidateBuffer.encode_cursor(window, offset) if window.has_more(offset) else None
+    
+    def _grow_window(self, window: CandidateWindow, topic: str) -> bool:
+        """Search for a larger window once the buffered candidates are used up
+        
+        Returns:
+            True if the larger search found candidates not buffered yet
+        """
+        count = min(window.fetched + Config.PAGINATION_WINDOW, Config.PAGINATION_MAX_CANDIDATES)
+        if window.exhausted or count <= window.fetched:
+            window.exhausted = True
+            return False
+        
+        added = window.extend(self._find_candidates(topic, count, window.language))
+        window.fetched = count
+        window.exhausted = added == 0
+        self.candidate_buffer.record_refill()
+        return added > 0
+    
+    def get_pagination_stats(self) -> Dict[str, Any]:
+        """Get "load more" candidate buffer counters"""
+        return self.candidate_buffer.get_stats()
+    
+    def _search_news(self, topic: str, max_results: int = 5, language: str = 'en',
+                     session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run one news search with summaries (see search_news)"""
         try:
+            deadline = time.monotonic() + remaining_budget(Config.TOPIC_TIME_BUDGET)
             logger.info(f"Searching for news on topic: {topic} (language: {language})")
             
             # Validate and get fallback language if needed
@@ -265,35 +750,15 @@ class NewsService:
             if target_language != language:
                 logger.info(f"Language {language} not supported for search, using {target_language}")
             
-            # Search for news using DuckDuckGo
-            search_query = f"{topic} news"
-            results = list(self.ddgs.news(keywords=search_query, max_results=max_results, safesearch='moderate'))
-            
-            news_articles = []
-            for result in results:
-                article = {
-                    'title': str(result.get('title', 'No title'))[:500],
-                    'url': str(result.get('url', ''))[:1000],
-                    'body': str(result.get('body', ''))[:2000],
-                    'date': str(result.get('date', '')),
-                    'source': str(result.get('source', ''))[:200],
-                    'topic': topic,
-                    'language': target_language
-                }
-                
-                # Generate AI-powered summary using Gemini with language support
-                try:
-                    if article['body'] and len(article['body']) > 50:
-                        summary = self.generate_summary(article['body'], article['title'], target_language)
-                        article['summary'] = str(summary)[:2000] if summary else article['body'][:200]
-                    else:
-                        article['summary'] = article['body'] if article['body'] else 'No summary available'
-                except Exception as e:
-                    logger.error(f"Error generating summary for article: {e}")
-                    article['summary'] = article['body'][:200] + "..." if len(article['body']) > 200 else article['body']
-                
-                news_articles.append(article)
-                logger.debug(f"Added article: {article['title']}")
+            # Sessions skip articles they have seen, so fetch extra results to make up for them
+            fetch_count = max_results * 2 if session_id and self.deduplicator is not None else max_results
+            news_articles, novel = self._deduplicate(
+                self._find_articles(topic, fetch_count, target_language, session_id), target_language, session_id,
+                max_results
+            )
+            self._summarize_articles(novel, target_language, deadline)
+            self._remember_articles(novel, target_language)
+            self.mark_articles_seen(session_id, news_articles)
             
             logger.info(f"Found {len(news_articles)} articles for topic: {topic} (language: {target_language})")
             return news_articles
@@ -301,7 +766,224 @@ class NewsService:
         except Exception as e:
             logger.error(f"Error searching news for topic {topic}: {e}")
             return []
+    
+    def _deduplicate(self, articles: List[Dict[str, Any]], language: str, session_id: Optional[str] = None,
+                     limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Drop duplicate search results and reuse summaries of articles seen before
+        
+        Returns:
+            Tuple of (articles to return, the subset that still needs summarizing)
+        """
+        if self.deduplicator is None:
+            return articles[:limit], articles[:limit]
+        try:
+            return self.deduplicator.partition(articles, language, session_id, limit)
+        except Exception as e:
+            logger.error(f"Error deduplicating articles, summarizing all of them: {e}")
+            return articles[:limit], articles[:limit]
+    
+    def _remember_articles(self, articles: List[Dict[str, Any]], language: str) -> None:
+        """Record articles the AI summarized so later copies can reuse their summaries
+        
+        Local fallback summaries (deadline, open circuit, AI errors) are not recorded, so
+        copies seen after the AI recovers get a real summary.
+        """
+        if self.deduplicator is not None:
+            self.deduplicator.remember(articles, language)
+    
+    def mark_articles_seen(self, session_id: Optional[str], articles: List[Dict[str, Any]]) -> None:
+        """Record articles shown to a session so later searches for it skip them
+        
+        Args:
+            session_id: Session the articles were shown to
+            articles: Articles with 'url', 'title' and 'body'
+        """
+        if self.deduplicator is not None and session_id:
+            self.deduplicator.mark_seen(session_id, articles)
+    
+    def get_single_flight_stats(self) -> Dict[str, Any]:
+        """Get request coalescing counters for searches and summaries"""
+        return {'search_news': self._search_flights.get_stats(), 'summary': self._summary_flights.get_stats()}
+    
+    def get_dedup_stats(self) -> Dict[str, Any]:
+        """Get duplicate article counters"""
+        if self.deduplicator is None:
+            return {'enabled': False}
+        return dict(self.deduplicator.get_stats(), enabled=True)
+    
+    def _find_articles(self, topic: str, max_results: int, language: str,
+                       session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search DuckDuckGo for a topic and build unsummarized article dictionaries
+        
+        At least Config.PAGINATION_WINDOW results are searched for and cached, so the
+        "load more" pages that follow a first search are served without searching again.
+        With a session the results are also buffered as its "load more" window.
+        """
+        count = max(max_results, Config.PAGINATION_WINDOW)
+        candidates = self._find_candidates(topic, count, language)
+        if session_id:
+            self.candidate_buffer.open(session_id, " ".join(str(topic).lower().split()), language,
+                                       [dict(candidate) for candidate in candidates], count)
+        return candidates[:max_results]
+    
+    def _find_candidates(self, topic: str, count: int, language: str) -> List[Dict[str, Any]]:
+        """Search DuckDuckGo for count results on a topic as unsummarized article dictionaries"""
+        search_query = f"{topic} news"
+        results = self._fetch_search_results(search_query, count)
+        
+        news_articles = []
+        for result in results:
+            article = {
+                'title': str(result.get('title', 'No title'))[:500],
+                'url': str(result.get('url', ''))[:1000],
+                'body': str(result.get('body', ''))[:2000],
+                'date': str(result.get('date', '')),
+                'source': str(result.get('source', ''))[:200],
+                'topic': topic,
+                'language': language
+            }
+            news_articles.append(article)
+            logger.debug(f"Added article: {article['title']}")
+        return news_articles
+    
+    def _fetch_search_results(self, search_query: str, max_results: int) -> List[Dict[str, Any]]:
+        """Run a DuckDuckGo news search, served from the search cache when possible
+        
+        DuckDuckGo results do not depend on the summary language, so every language shares
+        one cached search.
+        
+        While the DuckDuckGo circuit is open, cached (even stale) results are still served
+        and uncached searches fail fast. A hedged search counts as one call to the circuit.
+        """
+        def fetch():
+            return self.search_circuit.call(lambda: self.search_hedger.call(
+                lambda: list(self.ddgs.news(keywords=search_query, max_results=max_results, safesearch='moderate'))
+            ))
+        
+        if self.search_cache is None:
+            return fetch()
+        
+        key = SearchResultCache.make_key(search_query, max_results)
+        return self.search_cache.get_or_fetch(key, fetch)
+    
+    def _summarize_article(self, article: Dict[str, Any], language: str) -> Dict[str, str]:
+        """Generate the summary and sentiment for a single search result in one AI call
+        
+        Returns:
+            Dictionary with 'summary', 'sentiment' and 'summary_language', falling back to the body text
+        """
+        body = article['body']
+        try:
+            if body and len(body) > 50:
+                result = self.generate_summary_with_sentiment(body, article['title'], language)
+                summary = result.get('summary')
+                return {
+                    'summary': str(summary)[:2000] if summary else body[:200],
+                    'sentiment': result.get('sentiment') or FallbackManager.get_sentiment_fallback(),
+                    'summary_language': result.get('language') or language,
+                    'ai_summary': bool(summary and result.get('ai_summary'))
+                }
+            summary = body if body else 'No summary available'
+        except Exception as e:
+            logger.error(f"Error generating summary for article: {e}")
+            summary = body[:200] + "..." if len(body) > 200 else body
+        return {
+            'summary': summary,
+            'sentiment': FallbackManager.get_sentiment_fallback(),
+            'summary_language': language,
+            'ai_summary': False
+        }
+    
+    def _summarize_articles(self, articles: List[Dict[str, Any]], language: str, deadline: Optional[float] = None) -> None:
+        """Fill in article summaries and sentiments, in parallel when concurrent search is enabled
+        
+        Args:
+            articles: Articles to summarize (updated in place)
+            language: Language for the summaries
+            deadline: time.monotonic() value after which pending summaries are abandoned
+        """
+        if Config.BATCH_SUMMARY_ENABLED and self._ai_summary_enabled():
+            articles = self._apply_batch_summaries(articles, language, deadline)
+        
+        if not Config.CONCURRENT_SEARCH_ENABLED or len(articles) <= 1:
+            for article in articles:
+                article.update(self._summarize_article(article, language))
+            return
+        
+        futures = {
+            submit_with_deadline(self._summary_executor, self._summarize_article, article, language): article
+            for article in articles
+        }
+        timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+        done, pending = wait(futures, timeout=timeout)
+        
+        for future, article in futures.items():
+            if future in done:
+                article.update(future.result())
+            else:
+                # Workers return their result rather than mutating the article, so a
+                # late finisher cannot overwrite the fallback assigned here
+                future.cancel()
+                article.update({
+                    'summary': self._fallback_summary(article['body'], language),
+                    'sentiment': self._fallback_sentiment(article['body'], language),
+                    'summary_language': language,
+                    'ai_summary': False
+                })
+        
+        if pending:
+            logger.warning(f"Summary time budget exceeded, {len(pending)} of {len(articles)} articles use fallback summaries")
 
+    def _apply_batch_summaries(self, articles: List[Dict[str, Any]], language: str, deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Summarize eligible articles in batched AI calls
+        
+        Returns:
+            The articles that still need a summary from the per-article path
+        """
+        summarized = set()
+        eligible = []
+        for article in articles:
+            if len(article['body']) < Config.AI_SUMMARY_MIN_LENGTH:
+                continue
+            cached = self._get_cached_result('summary_sentiment', article['body'], article['title'], language)
+            if cached:
+                article['summary'] = cached['summary'][:2000]
+                article['sentiment'] = cached['sentiment']
+                article['summary_language'] = language
+                article['ai_summary'] = True
+                summarized.add(id(article))
+            else:
+                eligible.append(article)
+        
+        if len(eligible) < 2:
+            return [article for article in articles if id(article) not in summarized]
+        
+        size = max(1, Config.BATCH_SUMMARY_SIZE)
+        chunks = [eligible[i:i + size] for i in range(0, len(eligible), size)]
+        futures = {
+            submit_with_deadline(self._summary_executor, self.summarize_articles_batch, chunk, language): chunk
+            for chunk in chunks
+        }
+        timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+        done, _ = wait(futures, timeout=timeout)
+        
+        for future, chunk in futures.items():
+            if future not in done:
+                future.cancel()
+                continue
+            for article, result in zip(chunk, future.result()):
+                if result:
+                    article['summary'] = result['summary'][:2000]
+                    article['sentiment'] = result['sentiment']
+                    article['summary_language'] = result['language']
+                    article['ai_summary'] = True
+                    summarized.add(id(article))
+        
+        remaining = [article for article in articles if id(article) not in summarized]
+        if remaining:
+            logger.info(f"{len(remaining)} of {len(articles)} articles fall back to per-article summaries")
+        return remaining
+    
     def generate_summary(self, article_text: str, title: str, language: str = 'en', include_sentiment: bool = False) -> str:
         """Generate a concise summary of the article using Gemini with comprehensive error handling
         
@@ -319,17 +1001,24 @@ class NewsService:
             return self.generate_summary_with_sentiment(article_text, title, language)
         
         try:
-            # Skip AI summary for very short articles or if disabled
-            if len(article_text) < Config.AI_SUMMARY_MIN_LENGTH or not Config.USE_AI_SUMMARY:
-                return FallbackManager.create_fallback_summary(article_text)
+            # Skip AI summary for very short articles, if disabled, or while Gemini is failing
+            if (len(article_text) < Config.AI_SUMMARY_MIN_LENGTH or not self._ai_summary_enabled()
+                    or self.gemini_circuit.is_open()):
+                return self._fallback_summary(article_text, LanguageService.get_fallback_language(language))
+            
+            # Cache hits skip the AI call and the rate limiter entirely
+            cached = self._get_cached_summary(article_text, title, LanguageService.get_fallback_language(language))
+            if cached:
+                return cached
             
             # Use comprehensive error handling for language operations
-            return handle_language_operation(
+            key = self._summary_cache_key('summary', article_text, title, LanguageService.get_fallback_language(language))
+            return self._summary_flights.do(key, lambda: handle_language_operation(
                 "generate_summary",
                 language,
                 self._generate_summary_for_language,
                 article_text, title
-            )
+            ))
             
         except Exception as e:
             # Final fallback with comprehensive error logging
@@ -341,16 +1030,20 @@ class NewsService:
             else:
                 ErrorHandler.log_language_error("generate_summary", target_language, e)
             
-            return FallbackManager.create_fallback_summary(article_text)
+            return self._fallback_summary(article_text, target_language)
+    
+    def _get_cached_summary(self, article_text: str, title: str, language: str) -> Optional[str]:
+        """Look up a cached summary, reusing a combined summary+sentiment result when present"""
+        summary = self._get_cached_result('summary', article_text, title, language)
+        if summary:
+            return summary
+        combined = self._get_cached_result('summary_sentiment', article_text, title, language)
+        return combined['summary'] if combined else None
     
     @with_retry()
     def _generate_summary_for_language(self, article_text: str, title: str, language: str) -> str:
         """Internal method to generate summary for a specific language with retry logic"""
         try:
-            # Rate limiting: Add delay between requests
-            import time
-            time.sleep(Config.RATE_LIMIT_DELAY)
-            
             # Use language-specific template if available, otherwise use simple English template
             if language != 'en':
                 # For non-English, use the sentiment template but only return summary
@@ -358,28 +1051,19 @@ class NewsService:
                 return result['summary']
             else:
                 # Use original simple template for English-only summary
-                prompt_template = ChatPromptTemplate.from_template(
-                    """Create a 2-sentence summary of this news article:
-                    
-                    Title: {title}
-                    Article: {article_text}
-                    
-                    Summary:"""
-                )
-                
-                chain = prompt_template | self.llm
-                result = chain.invoke({
-                    "title": title[:200],  # Limit title length
-                    "article_text": article_text[:800]  # Limit text to reduce memory usage
-                })
+                chain = self.prompts.chain('summary', language, self.llm)
+                result = self._invoke_rate_limited(chain, self.token_budget.prepare_inputs(title, article_text, language))
                 
                 if hasattr(result, 'content') and result.content:
                     summary = result.content.strip()
                     logger.info(f"Generated AI summary for article in {language}: {title[:50]}...")
+                    self._cache_result('summary', article_text, title, language, summary)
                     return summary
                 else:
                     raise AIServiceError("No content in AI summary response")
                     
+        except CircuitOpenError:
+            raise
         except Exception as e:
             # Enhanced error logging
             ErrorHandler.log_ai_service_error("_generate_summary_for_language", e)
@@ -391,7 +1075,12 @@ class NewsService:
         return FallbackManager.create_fallback_summary(article_text)
 
     def search_multiple_topics(self, topics: List[str], max_results_per_topic: int = 5, language: str = 'en') -> Dict[str, List[Dict[str, Any]]]:
-        """Search for news on multiple topics with language support"""
+        """Search for news on multiple topics with language support
+        
+        Topics are searched concurrently on a bounded worker pool when
+        Config.CONCURRENT_SEARCH_ENABLED is set. A topic that fails or does not finish
+        within its time budget yields an empty list; the other topics are still returned.
+        """
         all_results = {}
         
         # Validate and get fallback language if needed
@@ -399,14 +1088,125 @@ class NewsService:
         if target_language != language:
             logger.info(f"Language {language} not supported for multi-topic search, using {target_language}")
         
-        for topic in topics:
-            logger.info(f"Searching news for topic: {topic} (language: {target_language})")
-            try:
-                articles = self.search_news(topic, max_results_per_topic, target_language)
-                all_results[topic] = articles
-                logger.info(f"Found {len(articles)} articles for {topic}")
-            except Exception as e:
-                logger.error(f"Error searching for topic {topic}: {e}")
+        if not Config.CONCURRENT_SEARCH_ENABLED or len(topics) <= 1:
+            for topic in topics:
+                all_results[topic] = self._search_topic(topic, max_results_per_topic, target_language)
+            return all_results
+        
+        futures = {
+            submit_with_deadline(self._topic_executor, self._search_topic, topic, max_results_per_topic, target_language): topic
+            for topic in topics
+        }
+        
+        # Topics beyond the pool size queue behind earlier ones, so allow one budget per wave.
+        # The grace period lets search_news return the partial results it collected in time.
+        waves = -(-len(topics) // max(1, Config.SEARCH_MAX_WORKERS))
+        timeout = remaining_budget(Config.TOPIC_TIME_BUDGET * waves + self.TOPIC_GRACE_PERIOD)
+        done, _ = wait(futures, timeout=timeout)
+        
+        for future, topic in futures.items():
+            if future in done:
+                all_results[topic] = future.result()
+            else:
+                future.cancel()
+                logger.warning(f"Search for topic {topic} exceeded its time budget, returning no articles")
                 all_results[topic] = []
         
-        return all_results
+        # Preserve the caller's topic order
+        return {topic: all_results[topic] for topic in topics}
+    
+    def stream_multiple_topics(self, topics: List[str], max_results_per_topic: int = 5,
+                               language: str = 'en') -> Iterator[Dict[str, Any]]:
+        """Search several topics, yielding each article as soon as its summary is ready
+        
+        Searches run on the topic pool and every found article is summarized on the
+        summary pool straight away, so the first article is available after one search
+        and one summary. Articles still pending when the overall budget runs out are
+        yielded with a fallback summary; topics whose search did not finish yield none.
+        
+        Yields:
+            {'type': 'article', 'topic', 'article'} for each article, and
+            {'type': 'topic_complete', 'topic', 'count'} once all of a topic's articles were yielded
+        """
+        target_language = LanguageService.get_fallback_language(language)
+        if target_language != language:
+            logger.info(f"Language {language} not supported for streamed search, using {target_language}")
+        
+        waves = -(-len(topics) // max(1, Config.SEARCH_MAX_WORKERS))
+        deadline = time.monotonic() + remaining_budget(Config.TOPIC_TIME_BUDGET * waves + self.TOPIC_GRACE_PERIOD)
+        
+        searches = {
+            submit_with_deadline(self._topic_executor, self._find_articles, topic, max_results_per_topic, target_language): topic
+            for topic in topics
+        }
+        summaries = {}
+        remaining = {}  # topic -> [articles still to yield, articles found]
+        pending = set(searches)
+        
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future in searches:
+                    topic = searches[future]
+                    try:
+                        articles = future.result()
+                    except Exception as e:
+                        logger.error(f"Error searching for topic {topic}: {e}")
+                        articles = []
+                    articles, novel = self._deduplicate(articles, target_language)
+                    if not articles:
+                        yield {'type': 'topic_complete', 'topic': topic, 'count': 0}
+                        continue
+                    remaining[topic] = [len(articles), len(articles)]
+                    for article in novel:
+                        summary_future = submit_with_deadline(
+                            self._summary_executor, self._summarize_article, article, target_language
+                        )
+                        summaries[summary_future] = (topic, article)
+                        pending.add(summary_future)
+                    # Copies of articles summarized before are ready straight away
+                    novel_ids = {id(article) for article in novel}
+                    for article in articles:
+                        if id(article) not in novel_ids:
+                            yield from self._stream_article(topic, article, remaining)
+                else:
+                    topic, article = summaries[future]
+                    article.update(future.result())
+                    self._remember_articles([article], target_language)
+                    yield from self._stream_article(topic, article, remaining)
+        
+        # Out of time: hand back whatever was found with fallback summaries
+        for future in pending:
+            future.cancel()
+            if future in searches:
+                logger.warning(f"Search for topic {searches[future]} exceeded its time budget, returning no articles")
+                yield {'type': 'topic_complete', 'topic': searches[future], 'count': 0}
+            else:
+                topic, article = summaries[future]
+                article.update({
+                    'summary': self._fallback_summary(article['body'], target_language),
+                    'sentiment': self._fallback_sentiment(article['body'], target_language),
+                    'summary_language': target_language
+                })
+                yield from self._stream_article(topic, article, remaining)
+    
+    @staticmethod
+    def _stream_article(topic: str, article: Dict[str, Any], remaining: Dict[str, List[int]]) -> Iterator[Dict[str, Any]]:
+        """Yield an article event, followed by its topic's completion event if it was the last one"""
+        yield {'type': 'article', 'topic': topic, 'article': article}
+        remaining[topic][0] -= 1
+        if remaining[topic][0] == 0:
+            yield {'type': 'topic_complete', 'topic': topic, 'count': remaining[topic][1]}
+    
+    def _search_topic(self, topic: str, max_results: int, language: str) -> List[Dict[str, Any]]:
+        """Search a single topic for search_multiple_topics, never raising"""
+        logger.info(f"Searching news for topic: {topic} (language: {language})")
+        try:
+            articles = self.search_news(topic, max_results, language)
+            logger.info(f"Found {len(articles)} articles for {topic}")
+            return articles
+        except Exception as e:
+            logger.error(f"Error searching for topic {topic}: {e}")
+            return []
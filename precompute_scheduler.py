@@ -0,0 +1,238 @@
+"""
+Precompute Scheduler Module for NewsFlash Application
+
+This module provides background warming of popular topics including:
+- Topic popularity from the topics sessions collected and the articles they were shown
+- Periodic searches for the most popular topics in every supported language
+- Search results and summaries written into the search and summary caches
+- A lock file so only one process per deployment runs the scheduler
+- A command line entry point for running the refresh from a separate worker
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from config import Config
+from deadline import deadline_scope
+from search_cache import refresh_scope
+
+try:
+    import fcntl
+except ImportError:  # Windows: no lock, every process started with PRECOMPUTE_ENABLED refreshes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_topic(topic: Any) -> str:
+    """Normalize a topic the way the search cache normalizes queries"""
+    return " ".join(str(topic).lower().split())
+
+
+class PrecomputeScheduler:
+    """Keeps search results and summaries for the most popular topics warm."""
+
+    def __init__(self, news_service, app, interval: Optional[float] = None, top_n: Optional[int] = None,
+                 languages: Optional[List[str]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            news_service: NewsService whose caches are warmed
+            app: Flask application, for database access from the background thread
+            interval: Seconds between refreshes (defaults to Config.PRECOMPUTE_INTERVAL)
+            top_n: Number of topics refreshed (defaults to Config.PRECOMPUTE_TOP_TOPICS)
+            languages: Languages refreshed (defaults to every supported language)
+        """
+        self.news_service = news_service
+        self.app = app
+        self.interval = interval if interval is not None else Config.PRECOMPUTE_INTERVAL
+        self.top_n = top_n if top_n is not None else Config.PRECOMPUTE_TOP_TOPICS
+        self.languages = languages or list(Config.SUPPORTED_LANGUAGES)
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock_file = None
+        self._lock = threading.Lock()
+        self._stats = {'runs': 0, 'searches': 0, 'articles': 0, 'errors': 0,
+                       'last_run': None, 'last_duration': None, 'topics': []}
+
+    def popular_topics(self) -> List[str]:
+        """
+        Rank recent topics by the number of sessions that asked for them.
+
+        Topics collected by a session and topics of articles shown to it count once per
+        session. Config.PRECOMPUTE_SEED_TOPICS fill the list while there is little history.
+
+        Returns:
+            Up to top_n normalized topics, most popular first
+        """
+        from models import ConversationSession, NewsArticle
+
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=Config.PRECOMPUTE_LOOKBACK_HOURS)
+        asked = set()  # (session_id, topic)
+        with self.app.app_context():
+            sessions = ConversationSession.query.filter(ConversationSession.updated_at >= cutoff).all()
+            for conv_session in sessions:
+                try:
+                    topics = conv_session.get_topics()
+                except ValueError:
+                    continue
+                asked.update((conv_session.session_id, normalize_topic(topic)) for topic in topics)
+
+            shown = NewsArticle.query.with_entities(NewsArticle.session_id, NewsArticle.topic) \
+                .filter(NewsArticle.created_at >= cutoff).distinct().all()
+            asked.update((session_id, normalize_topic(topic)) for session_id, topic in shown)
+
+        counts = Counter(topic for _, topic in asked if topic)
+        ranked = [topic for topic, _ in counts.most_common(self.top_n)]
+        for topic in Config.PRECOMPUTE_SEED_TOPICS:
+            if len(ranked) >= self.top_n:
+                break
+            if normalize_topic(topic) not in ranked:
+                ranked.append(normalize_topic(topic))
+        return ranked
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Refresh the popular topics in every language, one search at a time.
+
+        A topic's first search bypasses its fresh search cache entry, so every run replaces it
+        before it expires; the topic's other languages reuse the new results for their summaries.
+
+        Returns:
+            The scheduler's counters after the refresh
+        """
+        started = time.monotonic()
+        try:
+            topics = self.popular_topics()
+        except Exception as e:
+            logger.error(f"Could not rank topics for precomputing, using seed topics: {e}")
+            topics = [normalize_topic(topic) for topic in Config.PRECOMPUTE_SEED_TOPICS[:self.top_n]]
+
+        searches = articles = errors = 0
+        for topic, language in ((topic, language) for topic in topics for language in self.languages):
+            if self._stop.is_set():
+                break
+            try:
+                refresh = refresh_scope() if language == self.languages[0] else nullcontext()
+                with deadline_scope(Config.REQUEST_DEADLINE), refresh:
+                    found = self.news_service.search_news(topic, Config.NEWS_RESULTS_PER_TOPIC, language)
+                searches += 1
+                articles += len(found)
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Precomputing '{topic}' in {language} failed: {e}")
+
+        duration = time.monotonic() - started
+        with self._lock:
+            self._stats['runs'] += 1
+            self._stats['searches'] += searches
+            self._stats['articles'] += articles
+            self._stats['errors'] += errors
+            self._stats['last_run'] = datetime.now(timezone.utc).isoformat()
+            self._stats['last_duration'] = round(duration, 2)
+            self._stats['topics'] = topics
+        logger.info(f"Precomputed {searches} searches for {len(topics)} topics in {duration:.1f}s")
+        return self.get_stats()
+
+    def start(self) -> bool:
+        """
+        Start refreshing in a daemon thread, once now and then every interval.
+
+        Only the process holding Config.PRECOMPUTE_LOCK_PATH refreshes, so several web
+        workers sharing an instance directory run a single scheduler between them.
+
+        Returns:
+            Whether this process runs the scheduler
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if not self._acquire_lock():
+            logger.info("Precompute scheduler not started: another process holds the precompute lock")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="precompute", daemon=True)
+        self._thread.start()
+        logger.info(f"Precompute scheduler started: top {self.top_n} topics every {self.interval}s")
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread after the search in progress.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._release_lock()
+
+    def _acquire_lock(self) -> bool:
+        """Take the deployment-wide scheduler lock without waiting; held until stop or exit"""
+        if fcntl is None or self._lock_file is not None:
+            return True
+        directory = os.path.dirname(Config.PRECOMPUTE_LOCK_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(Config.PRECOMPUTE_LOCK_PATH, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def _release_lock(self) -> None:
+        """Let another process take over refreshing"""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _run(self) -> None:
+        """Refresh until stopped"""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Precompute run failed: {e}")
+            self._stop.wait(self.interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get precompute counters.
+
+        Returns:
+            Dictionary of runs, searches, articles and errors, the last run's time, duration
+            and topics, and whether the background thread is running
+        """
+        with self._lock:
+            return dict(self._stats, enabled=Config.PRECOMPUTE_ENABLED,
+                        running=self._thread is not None and self._thread.is_alive())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Keep search results and summaries for popular topics warm")
+    parser.add_argument('--once', action='store_true', help="Refresh once and exit")
+    args = parser.parse_args()
+
+    from app import app
+    from news_service import NewsService
+
+    scheduler = PrecomputeScheduler(NewsService(), app)
+    if args.once:
+        print(scheduler.run_once())
+    else:
+        scheduler.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            scheduler.stop()
@@ -0,0 +1,174 @@
+"""
+Prompt Registry Module for NewsFlash Application
+
+This module provides prompts and chains built once instead of per request including:
+- Registration of each prompt template by task and language
+- Version ids derived from the template text, used in AI result cache keys
+- Memoized prompt | model composition, so requests reuse prebuilt chains
+- Composing every registered chain ahead of the first request
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Iterable, Tuple
+from cachetools import LRUCache
+from langchain_core.prompts import ChatPromptTemplate
+
+logger = logging.getLogger(__name__)
+
+
+def template_version(template: ChatPromptTemplate, revision: str = "1") -> str:
+    """
+    Derive a version id from a template's text.
+
+    Args:
+        template: Prompt template
+        revision: Manual revision, bumped to invalidate results without a wording change
+
+    Returns:
+        Short id that changes whenever the template text or revision changes
+    """
+    parts = [revision]
+    for message in getattr(template, 'messages', []):
+        prompt = getattr(message, 'prompt', None)
+        parts.append(getattr(prompt, 'template', None) or str(message))
+    return f"{revision}-{hashlib.sha1(chr(0).join(parts).encode('utf-8')).hexdigest()[:10]}"
+
+
+class PromptRegistry:
+    """Holds prompt templates per task and language and the chains composed from them."""
+
+    # Composed chains kept; a few models (plain, JSON schema, async gate) times tasks and languages
+    MAX_CHAINS = 64
+
+    def __init__(self, revision: str = "1"):
+        """
+        Initialize an empty registry.
+
+        Args:
+            revision: Manual revision included in every version id
+        """
+        self.revision = revision
+        # (task, language) -> {'template', 'version'}
+        self._entries = {}
+        # (id(template), id(model)) -> (template, model, chain); the objects are kept so ids stay unique
+        self._chains = LRUCache(maxsize=self.MAX_CHAINS)
+        self._lock = threading.Lock()
+        self._stats = {'composed': 0, 'reused': 0}
+
+    def register(self, task: str, templates: Dict[str, ChatPromptTemplate]) -> None:
+        """
+        Register a task's template for each language.
+
+        Args:
+            task: Task name, e.g. 'summary_sentiment'
+            templates: Dictionary mapping language code to template
+        """
+        for language, template in templates.items():
+            self._entries[(task, language)] = {
+                'template': template,
+                'version': template_version(template, self.revision),
+            }
+
+    def _entry(self, task: str, language: str) -> Dict[str, Any]:
+        """Find a task's entry, falling back to English"""
+        entry = self._entries.get((task, language)) or self._entries.get((task, 'en'))
+        if entry is None:
+            raise KeyError(f"No prompt registered for task '{task}'")
+        return entry
+
+    def template(self, task: str, language: str = 'en') -> ChatPromptTemplate:
+        """
+        Get the template for a task and language.
+
+        Args:
+            task: Task name
+            language: Language code; unregistered languages use English
+
+        Returns:
+            The registered template
+        """
+        return self._entry(task, language)['template']
+
+    def version(self, task: str, language: str = 'en') -> str:
+        """
+        Get the version id of a task's template for cache keys.
+
+        Args:
+            task: Task name
+            language: Language code
+
+        Returns:
+            Version id of the template
+        """
+        return self._entry(task, language)['version']
+
+    def compose(self, template: Any, model: Any) -> Any:
+        """
+        Get the chain template | model, composing it only the first time.
+
+        Args:
+            template: Prompt template (or any runnable)
+            model: Chat model (or any runnable)
+
+        Returns:
+            The composed chain
+        """
+        key = (id(template), id(model))
+        with self._lock:
+            cached = self._chains.get(key)
+            if cached and cached[0] is template and cached[1] is model:
+                self._stats['reused'] += 1
+                return cached[2]
+
+        chain = template | model
+        with self._lock:
+            self._chains[key] = (template, model, chain)
+            self._stats['composed'] += 1
+        return chain
+
+    def chain(self, task: str, language: str, model: Any) -> Any:
+        """
+        Get the prebuilt chain for a task and language.
+
+        Args:
+            task: Task name
+            language: Language code
+            model: Chat model the chain ends in
+
+        Returns:
+            The composed chain
+        """
+        return self.compose(self.template(task, language), model)
+
+    def build(self, models: Iterable[Tuple[Iterable[str], Any]]) -> int:
+        """
+        Compose the chains for every language of the given tasks ahead of the first request.
+
+        Args:
+            models: Pairs of (task names, model those tasks run on)
+
+        Returns:
+            Number of chains built
+        """
+        count = 0
+        for tasks, model in models:
+            tasks = set(tasks)
+            for (task, _), entry in list(self._entries.items()):
+                if task in tasks:
+                    self.compose(entry['template'], model)
+                    count += 1
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry counters.
+
+        Returns:
+            Dictionary with registered prompts and their versions, and chains composed or reused
+        """
+        with self._lock:
+            stats = dict(self._stats, chains=len(self._chains))
+        stats['prompts'] = {f"{task}:{language}": entry['version'] for (task, language), entry in self._entries.items()}
+        return stats
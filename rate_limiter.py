@@ -0,0 +1,206 @@
+"""
+Shared Rate Limiting Module for NewsFlash Application
+
+This module provides a token bucket rate limiter for outbound AI requests including:
+- Token bucket state shared across threads and processes via SQLite
+- Burst capacity so idle periods never stall a request
+- Adaptive rate that backs off on 429/quota errors and recovers on success
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket rate limiter whose state is shared through a SQLite file."""
+
+    # Multiplicative decrease applied to the rate when a throttling error is seen
+    BACKOFF_FACTOR = 0.5
+    # Additive increase applied to the rate scale after each successful request
+    RECOVERY_STEP = 0.05
+    # Lowest fraction of the configured rate the limiter will back off to
+    MIN_SCALE = 0.1
+
+    def __init__(self, name: str, db_path: Optional[str] = None):
+        """
+        Initialize a named rate limiter.
+
+        Args:
+            name: Bucket name; limiters with the same name and database share a bucket
+            db_path: SQLite file holding bucket state (defaults to Config.RATE_LIMIT_DB_PATH)
+        """
+        self.name = name
+        self.db_path = db_path or Config.RATE_LIMIT_DB_PATH
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._memory_state = None
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the bucket table, falling back to in-process state if SQLite is unavailable."""
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS rate_buckets ("
+                    "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, scale REAL NOT NULL)"
+                )
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Rate limiter '{self.name}' using in-process state, shared store unavailable: {e}")
+            self.db_path = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection so transactions are controlled explicitly."""
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def interval(self) -> float:
+        """Configured average seconds per request (0 disables limiting)."""
+        return Config.RATE_LIMIT_DELAY
+
+    @property
+    def burst(self) -> float:
+        """Maximum number of tokens the bucket can hold."""
+        return max(1, Config.RATE_LIMIT_BURST)
+
+    def _update(self, mutate: Callable) -> Any:
+        """
+        Atomically load, refill and mutate the bucket state.
+
+        Args:
+            mutate: Callable taking (tokens, scale) and returning (tokens, scale, result)
+
+        Returns:
+            The result produced by mutate
+        """
+        with self._lock:
+            now = time.time()
+            if self.db_path is None:
+                tokens, updated_at, scale = self._memory_state or (self.burst, now, 1.0)
+                tokens, scale, result = mutate(self._refill(tokens, updated_at, scale, now), scale)
+                self._memory_state = (tokens, now, scale)
+                return result
+
+            conn = self._connect()
+            try:
+                # BEGIN IMMEDIATE takes the write lock so other processes serialize on the bucket
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT tokens, updated_at, scale FROM rate_buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                tokens, updated_at, scale = row if row else (self.burst, now, 1.0)
+                tokens, scale, result = mutate(self._refill(tokens, updated_at, scale, now), scale)
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_buckets (name, tokens, updated_at, scale) VALUES (?, ?, ?, ?)",
+                    (self.name, tokens, now, scale)
+                )
+                conn.execute("COMMIT")
+                return result
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    def _refill(self, tokens: float, updated_at: float, scale: float, now: float) -> float:
+        """Add the tokens earned since the last update at the current (scaled) rate."""
+        if self.interval <= 0:
+            return self.burst
+        elapsed = max(0.0, now - updated_at)
+        return min(self.burst, tokens + elapsed * scale / self.interval)
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until the next token is due
+        """
+        def take(tokens, scale):
+            if tokens >= 1:
+                return tokens - 1, scale, 0.0
+            return tokens, scale, (1 - tokens) * self.interval / scale
+
+        return self._update(take)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to Config.RATE_LIMIT_MAX_WAIT)
+
+        Returns:
+            True if a token was acquired, False if the timeout elapsed first
+        """
+        if self.interval <= 0:
+            return True
+
+        timeout = Config.RATE_LIMIT_MAX_WAIT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                wait_time = self.try_acquire()
+            except Exception as e:
+                logger.error(f"Rate limiter '{self.name}' error, allowing request: {e}")
+                return True
+
+            if wait_time <= 0:
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Rate limiter '{self.name}' wait exceeded {timeout}s")
+                return False
+
+            logger.debug(f"Rate limiter '{self.name}' waiting {wait_time:.2f}s for a token")
+            # Event.wait instead of time.sleep so tests patching time.sleep cannot busy-loop here
+            self._wakeup.wait(min(wait_time, remaining))
+
+    def record_throttle(self) -> None:
+        """Reduce the request rate after a 429/quota error and drain the bucket."""
+        def backoff(tokens, scale):
+            new_scale = max(self.MIN_SCALE, scale * self.BACKOFF_FACTOR)
+            return 0.0, new_scale, new_scale
+
+        try:
+            scale = self._update(backoff)
+            logger.warning(f"Rate limiter '{self.name}' backing off to {scale:.0%} of configured rate")
+        except Exception as e:
+            logger.error(f"Rate limiter '{self.name}' failed to record throttle: {e}")
+
+    def record_success(self) -> None:
+        """Gradually restore the request rate after a successful call."""
+        def recover(tokens, scale):
+            return tokens, min(1.0, scale + self.RECOVERY_STEP), None
+
+        try:
+            self._update(recover)
+        except Exception as e:
+            logger.error(f"Rate limiter '{self.name}' failed to record success: {e}")
+
+    def get_scale(self) -> float:
+        """Get the current fraction of the configured rate in use."""
+        return self._update(lambda tokens, scale: (tokens, scale, scale))
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an exception indicates provider throttling (429/quota)."""
+    error_str = str(error).lower()
+    return "429" in error_str or "quota" in error_str or "rate limit" in error_str or "resource exhausted" in error_str
@@ -0,0 +1,185 @@
+"""
+Retry Budget Module for NewsFlash Application
+
+This module provides one retry allowance per top-level operation including:
+- A budget opened by the outermost retrying call and shared by every nested layer
+- Separate allowances per dependency (Gemini, gTTS, ...)
+- Attempt counting at the dependency call sites
+- Per-operation metrics of attempts made, retries spent and budgets exhausted
+"""
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_current_budget = contextvars.ContextVar("newsflash_retry_budget", default=None)
+
+
+class RetryBudget:
+    """Retries one top-level operation may make, per dependency."""
+
+    def __init__(self, operation: str, retries: Optional[int] = None):
+        """
+        Initialize a budget.
+
+        Args:
+            operation: Name of the top-level operation, used in metrics
+            retries: Retries allowed per dependency (defaults to Config.RETRY_BUDGET)
+        """
+        self.operation = operation
+        self.retries = Config.RETRY_BUDGET if retries is None else retries
+        self._spent = {}  # dependency -> retries spent
+        self._attempts = {}  # dependency -> calls made
+        self._exhausted = False
+        self._lock = threading.Lock()
+
+    def record_attempt(self, dependency: str) -> None:
+        """Count one call to a dependency"""
+        with self._lock:
+            self._attempts[dependency] = self._attempts.get(dependency, 0) + 1
+
+    def try_spend(self, dependency: str) -> bool:
+        """
+        Take one retry from a dependency's allowance.
+
+        Args:
+            dependency: Dependency about to be retried
+
+        Returns:
+            True if the retry may go ahead, False once the allowance is used up
+        """
+        with self._lock:
+            spent = self._spent.get(dependency, 0)
+            if spent >= self.retries:
+                self._exhausted = True
+                return False
+            self._spent[dependency] = spent + 1
+            return True
+
+    def exhausted(self) -> bool:
+        """Whether any dependency has used up its retries"""
+        with self._lock:
+            return self._exhausted or any(spent >= self.retries for spent in self._spent.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get what the operation spent.
+
+        Returns:
+            Dictionary with attempts and retries in total and per dependency, and whether the budget ran out
+        """
+        with self._lock:
+            return {
+                'attempts': sum(self._attempts.values()),
+                'retries': sum(self._spent.values()),
+                'exhausted': self._exhausted or any(spent >= self.retries for spent in self._spent.values()),
+                'by_dependency': {
+                    dependency: {'attempts': self._attempts.get(dependency, 0), 'retries': self._spent.get(dependency, 0)}
+                    for dependency in set(self._attempts) | set(self._spent)
+                },
+            }
+
+
+class RetryMetrics:
+    """Attempt and retry counters per top-level operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # operation -> {'operations', 'attempts', 'retries', 'exhausted', 'max_attempts'}
+        self._stats = {}
+
+    def record(self, budget: RetryBudget) -> None:
+        """
+        Add a finished operation's budget to the counters.
+
+        Args:
+            budget: Budget of the operation that just finished
+        """
+        summary = budget.summary()
+        with self._lock:
+            stats = self._stats.setdefault(budget.operation, {
+                'operations': 0, 'attempts': 0, 'retries': 0, 'exhausted': 0, 'max_attempts': 0
+            })
+            stats['operations'] += 1
+            stats['attempts'] += summary['attempts']
+            stats['retries'] += summary['retries']
+            stats['exhausted'] += summary['exhausted']
+            stats['max_attempts'] = max(stats['max_attempts'], summary['attempts'])
+        logger.debug(f"{budget.operation}: {summary['attempts']} attempts, {summary['retries']} retries"
+                     f"{' (budget exhausted)' if summary['exhausted'] else ''}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the counters.
+
+        Returns:
+            Dictionary with the per-dependency budget and, per operation, how many ran, their total,
+            average and largest number of attempts, retries spent and budgets exhausted
+        """
+        with self._lock:
+            operations = {operation: dict(stats) for operation, stats in self._stats.items()}
+        for stats in operations.values():
+            stats['avg_attempts'] = round(stats['attempts'] / stats['operations'], 2) if stats['operations'] else 0.0
+        return {'budget': Config.RETRY_BUDGET, 'operations': operations}
+
+    def reset(self) -> None:
+        """Clear all counters"""
+        with self._lock:
+            self._stats.clear()
+
+
+retry_metrics = RetryMetrics()
+
+
+def current_retry_budget() -> Optional[RetryBudget]:
+    """
+    Get the budget of the operation being run.
+
+    Returns:
+        The current RetryBudget, or None outside any retrying operation
+    """
+    return _current_budget.get()
+
+
+@contextmanager
+def retry_budget_scope(operation: str) -> Iterator[RetryBudget]:
+    """
+    Open a retry budget for a top-level operation, or join the one already open.
+
+    The outermost scope records the operation's metrics when it ends.
+
+    Args:
+        operation: Name of the operation
+
+    Yields:
+        The budget shared by every retry layer of the operation
+    """
+    budget = _current_budget.get()
+    if budget is not None:
+        yield budget
+        return
+
+    budget = RetryBudget(operation)
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+        retry_metrics.record(budget)
+
+
+def record_attempt(dependency: str) -> None:
+    """
+    Count a call to a dependency against the current operation.
+
+    Args:
+        dependency: Name of the dependency being called
+    """
+    budget = _current_budget.get()
+    if budget is not None:
+        budget.record_attempt(dependency)
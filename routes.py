@@ -1,12 +1,20 @@
 import logging
-from flask import render_template, request, jsonify, session, send_from_directory
+from flask import render_template, request, jsonify, session, send_from_directory, Response, stream_with_context
 from app import app, db
 from models import ConversationSession, NewsArticle
 from conversation_graph import NewsConversationGraph
 from news_service import NewsService
+from async_news_service import AsyncNewsService
 from article_extractor import ArticleExtractor
 from tts_service import TTSService
 from session_manager import SessionManager
+from config import Config
+from error_handler import get_circuit_breaker_status
+from deadline import deadline_scope
+from retry_budget import retry_metrics
+from enrichment_pipeline import ArticleEnrichmentPipeline, SEARCH_FIELDS, TOPIC_FIELDS
+from precompute_scheduler import PrecomputeScheduler
+import json
 import uuid
 import os
 from datetime import datetime, timezone
@@ -15,9 +23,30 @@ logger = logging.getLogger(__name__)
 
 # Initialize services
 conversation_graph = NewsConversationGraph()
-news_service = NewsService()
+news_service = AsyncNewsService() if Config.ASYNC_NEWS_SERVICE_ENABLED else NewsService()
+if Config.PROMPT_WARMUP_ENABLED:
+    news_service.warm_up()
 article_extractor = ArticleExtractor()
 tts_service = TTSService()
+# Started by app.py once the database tables exist, when Config.PRECOMPUTE_ENABLED is set
+precompute_scheduler = PrecomputeScheduler(news_service, app)
+
+def _enrichment_pipeline() -> ArticleEnrichmentPipeline:
+    """Build the enrichment pipeline around the current news service"""
+    return ArticleEnrichmentPipeline(news_service)
+
+def _build_news_article(article, topic, session_id, language):
+    """Create a NewsArticle row from an enriched article dictionary"""
+    news_article = NewsArticle()
+    news_article.title = str(article['title'])[:500] if article.get('title') else 'No title'
+    news_article.url = str(article['url'])[:1000] if article.get('url') else ''
+    news_article.summary = str(article.get('summary', ''))[:2000] if article.get('summary') else ''
+    news_article.sentiment = str(article.get('sentiment', 'neutral'))[:20]
+    news_article.language = language
+    news_article.summary_language = str(article.get('summary_language') or language)[:5]
+    news_article.topic = str(topic)[:200]
+    news_article.session_id = session_id
+    return news_article
 
 @app.route('/')
 def index():
@@ -136,51 +165,11 @@ def search():
         
         logger.info(f"Searching news for query: '{query}' in language: {validated_language}, max_results: {max_results}")
         
-        # Search for news with language and sentiment support
+        # Search and enrich in a single pass: summary+sentiment, then language tagging
         try:
-            articles = news_service.search_news(query, max_results, validated_language)
-            
-            # Enhance articles with sentiment analysis if not already present
-            enhanced_articles = []
-            for article in articles:
-                try:
-                    # Generate summary with sentiment if not already done
-                    if not article.get('sentiment'):
-                        summary_data = news_service.generate_summary_with_sentiment(
-                            article.get('body', ''), 
-                            article.get('title', ''), 
-                            validated_language
-                        )
-                        article['summary'] = summary_data.get('summary', article.get('summary', ''))
-                        article['sentiment'] = summary_data.get('sentiment', 'neutral')
-                    
-                    # Ensure all required fields are present
-                    enhanced_article = {
-                        'title': article.get('title', 'No title'),
-                        'url': article.get('url', ''),
-                        'summary': article.get('summary', ''),
-                        'sentiment': article.get('sentiment', 'neutral'),
-                        'language': validated_language,
-                        'date': article.get('date', ''),
-                        'source': article.get('source', ''),
-                        'topic': query
-                    }
-                    enhanced_articles.append(enhanced_article)
-                    
-                except Exception as e:
-                    logger.warning(f"Error enhancing article with sentiment: {e}")
-                    # Add article with default sentiment if enhancement fails
-                    enhanced_article = {
-                        'title': article.get('title', 'No title'),
-                        'url': article.get('url', ''),
-                        'summary': article.get('summary', article.get('body', '')[:200]),
-                        'sentiment': 'neutral',
-                        'language': validated_language,
-                        'date': article.get('date', ''),
-                        'source': article.get('source', ''),
-                        'topic': query
-                    }
-                    enhanced_articles.append(enhanced_article)
+            with deadline_scope(Config.REQUEST_DEADLINE):
+                articles = _enrichment_pipeline().search(query, max_results, validated_language, SEARCH_FIELDS)
+            enhanced_articles = [ArticleEnrichmentPipeline.select(article, SEARCH_FIELDS) for article in articles]
             
             logger.info(f"Successfully processed {len(enhanced_articles)} articles with sentiment data")
             
@@ -232,27 +221,21 @@ def search_news():
         logger.info(f"Searching news for topics: {topics} in language: {validated_language}")
         
         # Search for news with language support
-        news_results = news_service.search_multiple_topics(topics, language=validated_language)
+        with deadline_scope(Config.REQUEST_DEADLINE):
+            news_results = _enrichment_pipeline().search_topics(topics, validated_language, TOPIC_FIELDS)
         
         # Save articles to database
         saved_count = 0
         for topic, articles in news_results.items():
             for article in articles:
                 try:
-                    news_article = NewsArticle()
-                    news_article.title = str(article['title'])[:500] if article.get('title') else 'No title'
-                    news_article.url = str(article['url'])[:1000] if article.get('url') else ''
-                    news_article.summary = str(article.get('summary', ''))[:2000] if article.get('summary') else ''
-                    news_article.sentiment = str(article.get('sentiment', 'neutral'))[:20]
-                    news_article.language = validated_language
-                    news_article.summary_language = validated_language
-                    news_article.topic = str(topic)[:200]
-                    news_article.session_id = session_id
-                    db.session.add(news_article)
+                    db.session.add(_build_news_article(article, topic, session_id, validated_language))
                     saved_count += 1
                 except Exception as e:
                     logger.warning(f"Failed to save article: {e}")
                     continue
+            # Load more for this session skips what it has already been shown
+            news_service.mark_articles_seen(session_id, articles)
         
         try:
             db.session.commit()
@@ -271,25 +254,102 @@ def search_news():
         logger.error(f"Error in search_news route: {e}")
         return jsonify({'error': 'An error occurred while searching for news'}), 500
 
+@app.route('/search_news/stream', methods=['POST'])
+def search_news_stream():
+    """Stream news articles for the session topics as newline-delimited JSON
+    
+    Emits a 'start' event, then an 'article' event as soon as each article is
+    enriched and a 'topic_complete' event per topic, followed by a final
+    'complete' event (or 'error' if the search fails part-way).
+    """
+    try:
+        session_id = session.get('session_id')
+        if not session_id:
+            return jsonify({'error': 'No session found'}), 400
+        
+        conv_session = ConversationSession.query.filter_by(session_id=session_id).first()
+        if not conv_session:
+            return jsonify({'error': 'Conversation session not found'}), 400
+        
+        topics = conv_session.get_topics()
+        if not topics:
+            return jsonify({'error': 'No topics to search'}), 400
+        
+        data = request.get_json(silent=True) or {}
+        language = data.get('language') or SessionManager.get_language_preference()
+        
+        from language_service import LanguageService
+        validated_language = LanguageService.get_fallback_language(language)
+        pipeline = _enrichment_pipeline()
+        
+        logger.info(f"Streaming news for topics: {topics} in language: {validated_language}")
+        
+        def generate():
+            yield _ndjson({'type': 'start', 'topics': topics, 'language': validated_language})
+            saved_count = 0
+            try:
+                with deadline_scope(Config.REQUEST_DEADLINE):
+                    for event in pipeline.stream_topics(topics, validated_language, TOPIC_FIELDS):
+                        if event['type'] == 'article':
+                            try:
+                                db.session.add(_build_news_article(event['article'], event['topic'], session_id, validated_language))
+                                saved_count += 1
+                            except Exception as e:
+                                logger.warning(f"Failed to save streamed article: {e}")
+                            news_service.mark_articles_seen(session_id, [event['article']])
+                        yield _ndjson(event)
+            except Exception as e:
+                logger.error(f"Error streaming news: {e}")
+                db.session.rollback()
+                yield _ndjson({'type': 'error', 'error': 'An error occurred while searching for news'})
+                return
+            
+            try:
+                db.session.commit()
+                logger.info(f"Saved {saved_count} streamed articles to database")
+            except Exception as e:
+                logger.error(f"Failed to commit streamed articles to database: {e}")
+                db.session.rollback()
+            
+            yield _ndjson({'type': 'complete', 'language': validated_language, 'total_results': saved_count})
+        
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        
+    except Exception as e:
+        logger.error(f"Error in search_news_stream route: {e}")
+        return jsonify({'error': 'An error occurred while searching for news'}), 500
+
+def _ndjson(event):
+    """Serialize a streaming event as one line of JSON"""
+    return json.dumps(event, ensure_ascii=False) + '\n'
+
 @app.route('/load_more/<topic>')
 def load_more(topic):
-    """Load more articles for a specific topic"""
+    """Load the next page of articles for a specific topic
+    
+    Pages come from the search results buffered for the session and topic. The optional
+    'cursor' query parameter is the 'next_cursor' returned with the previous page.
+    """
     try:
-        # Search for more articles
-        more_articles = news_service.search_news(topic, max_results=5)
+        # Page through the session's buffered results in its language, leaving out articles already shown
+        language = SessionManager.get_language_preference()
+        session_id = session.get('session_id')
+        shown_urls = set()
+        if session_id:
+            shown_urls = {url for (url,) in NewsArticle.query.with_entities(NewsArticle.url)
+                          .filter_by(session_id=session_id, topic=str(topic)[:200]).all()}
+        with deadline_scope(Config.REQUEST_DEADLINE):
+            more_articles, next_cursor = _enrichment_pipeline().search_page(
+                topic, Config.LOAD_MORE_COUNT, language, TOPIC_FIELDS, session_id=session_id,
+                cursor=request.args.get('cursor'), exclude_urls=shown_urls
+            )
         
         # Save to database
-        session_id = session.get('session_id')
         if session_id:
             for article in more_articles:
                 try:
-                    news_article = NewsArticle()
-                    news_article.title = str(article['title'])[:500] if article.get('title') else 'No title'
-                    news_article.url = str(article['url'])[:1000] if article.get('url') else ''
-                    news_article.summary = str(article.get('summary', ''))[:2000] if article.get('summary') else ''
-                    news_article.topic = str(topic)[:200]
-                    news_article.session_id = session_id
-                    db.session.add(news_article)
+                    db.session.add(_build_news_article(article, topic, session_id, language))
                 except Exception as e:
                     logger.warning(f"Failed to save article in load_more: {e}")
                     continue
@@ -301,7 +361,9 @@ def load_more(topic):
         
         return jsonify({
             'success': True,
-            'articles': more_articles
+            'articles': more_articles,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
         })
         
     except Exception as e:
@@ -322,7 +384,8 @@ def get_full_article():
         logger.info(f"Extracting full article from: {url}")
         
         # Extract full article
-        article_data = article_extractor.get_readable_article(url, title)
+        with deadline_scope(Config.REQUEST_DEADLINE):
+            article_data = article_extractor.get_readable_article(url, title)
         
         # Log extraction results for debugging
         logger.info(f"Article extraction completed - Content length: {len(article_data['content'])}, Formatted: {article_data['formatted']}")
@@ -359,7 +422,8 @@ def text_to_speech():
         logger.info(f"Generating TTS for text of length: {len(text)} in language: {validated_language}")
         
         # Generate TTS with language support
-        audio_url = tts_service.text_to_speech(text, validated_language)
+        with deadline_scope(Config.REQUEST_DEADLINE):
+            audio_url = tts_service.text_to_speech(text, validated_language)
         
         if audio_url:
             return jsonify({
@@ -465,6 +529,51 @@ def get_session_info():
         logger.error(f"Error getting session info: {e}")
         return jsonify({'error': 'An error occurred while getting session information'}), 500
 
+@app.route('/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """Get cache hit/miss, lexicon sentiment, duplicate article and retry counters"""
+    try:
+        return jsonify({
+            'success': True,
+            'summary_cache': news_service.get_cache_stats(),
+            'search_cache': news_service.get_search_cache_stats(),
+            'search_hedging': news_service.get_search_hedge_stats(),
+            'sentiment_lexicon': news_service.get_sentiment_stats(),
+            'dedup': news_service.get_dedup_stats(),
+            'token_budget': news_service.get_token_budget_stats(),
+            'prompts': news_service.get_prompt_stats(),
+            'single_flight': dict(
+                news_service.get_single_flight_stats(),
+                extraction=article_extractor.extraction_flights.get_stats(),
+                tts=tts_service.synthesis_flights.get_stats()
+            ),
+            'pagination': news_service.get_pagination_stats(),
+            'article_fetch': article_extractor.fetcher.get_stats(),
+            'article_cache': article_extractor.get_cache_stats(),
+            'extraction_pool': article_extractor.extraction_pool.get_stats(),
+            'extraction_race': article_extractor.get_race_stats(),
+            'retries': retry_metrics.get_stats(),
+            'precompute': precompute_scheduler.get_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting cache stats: {e}")
+        return jsonify({'error': 'An error occurred while getting cache statistics'}), 500
+
+@app.route('/circuit-breakers', methods=['GET'])
+def get_circuit_breakers():
+    """Get the state of the Gemini, DuckDuckGo, gTTS and article host circuit breakers"""
+    try:
+        return jsonify({
+            'success': True,
+            'enabled': Config.CIRCUIT_BREAKER_ENABLED,
+            'circuits': get_circuit_breaker_status()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting circuit breaker status: {e}")
+        return jsonify({'error': 'An error occurred while getting circuit breaker status'}), 500
+
 @app.route('/reset_conversation', methods=['POST'])
 def reset_conversation():
     """Reset the conversation session"""
@@ -0,0 +1,151 @@
+"""
+Search Result Cache Module for NewsFlash Application
+
+This module provides caching for news search results including:
+- Query normalization so equivalent queries share an entry
+- Fresh entries served directly
+- Stale entries served immediately while a background refresh runs (stale-while-revalidate)
+- A single in-flight refresh per key
+- Forced refreshes that bypass cached entries for background warming
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+from cachetools import TTLCache
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_force_refresh = contextvars.ContextVar('search_force_refresh', default=False)
+
+
+@contextmanager
+def refresh_scope():
+    """Re-run every search inside the block, replacing cached results even when they are fresh."""
+    token = _force_refresh.set(True)
+    try:
+        yield
+    finally:
+        _force_refresh.reset(token)
+
+
+class SearchResultCache:
+    """In-process TTL cache with stale-while-revalidate for search results."""
+
+    def __init__(self, fresh_ttl: Optional[float] = None, stale_ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            fresh_ttl: Seconds an entry is served without refreshing (defaults to Config.SEARCH_CACHE_FRESH_TTL)
+            stale_ttl: Seconds an entry may be served at all (defaults to Config.SEARCH_CACHE_STALE_TTL)
+            max_entries: Maximum cached queries (defaults to Config.SEARCH_CACHE_MAX_ENTRIES)
+        """
+        self.fresh_ttl = fresh_ttl if fresh_ttl is not None else Config.SEARCH_CACHE_FRESH_TTL
+        self.stale_ttl = max(self.fresh_ttl, stale_ttl if stale_ttl is not None else Config.SEARCH_CACHE_STALE_TTL)
+        self._entries = TTLCache(maxsize=max_entries or Config.SEARCH_CACHE_MAX_ENTRIES, ttl=self.stale_ttl)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+        self._stats = {'fresh_hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'refresh_errors': 0,
+                       'forced_refreshes': 0}
+
+    @staticmethod
+    def make_key(query: str, max_results: int) -> Tuple[str, int]:
+        """
+        Build a cache key from a normalized query.
+
+        The summary language is not part of the key: the search itself does not depend on it.
+
+        Args:
+            query: Search query text
+            max_results: Number of results requested
+
+        Returns:
+            Tuple key of (normalized query, max_results)
+        """
+        normalized = " ".join(str(query).lower().split())
+        return normalized, int(max_results)
+
+    def get_or_fetch(self, key: Tuple[str, int], fetch: Callable[[], Any]) -> Any:
+        """
+        Return cached results for key, fetching or refreshing them as needed.
+
+        Args:
+            key: Key from make_key
+            fetch: Callable performing the real search
+
+        Returns:
+            Search results (fresh, stale or newly fetched)
+        """
+        if _force_refresh.get():
+            results = fetch()
+            self._store(key, results)
+            with self._lock:
+                self._stats['forced_refreshes'] += 1
+            return results
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                results, fetched_at = entry
+                if now - fetched_at < self.fresh_ttl:
+                    self._stats['fresh_hits'] += 1
+                    return results
+
+                self._stats['stale_hits'] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._refresh_executor.submit(self._refresh, key, fetch)
+                return results
+
+            self._stats['misses'] += 1
+
+        results = fetch()
+        self._store(key, results)
+        return results
+
+    def _refresh(self, key: Tuple[str, int], fetch: Callable[[], Any]) -> None:
+        """Re-run a search in the background, keeping the stale entry if it fails."""
+        try:
+            self._store(key, fetch())
+            with self._lock:
+                self._stats['refreshes'] += 1
+            logger.debug(f"Refreshed cached search results for: {key[0]}")
+        except Exception as e:
+            with self._lock:
+                self._stats['refresh_errors'] += 1
+            logger.warning(f"Background search refresh failed for {key[0]}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: Tuple[str, int], results: Any) -> None:
+        """Cache non-empty results; empty lists are often transient upstream failures."""
+        if results:
+            with self._lock:
+                self._entries[key] = (results, time.monotonic())
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            Dictionary of counters and the number of cached queries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
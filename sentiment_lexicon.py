@@ -0,0 +1,244 @@
+"""
+Sentiment Lexicon Module for NewsFlash Application
+
+This module provides a local, lexicon-based sentiment classifier including:
+- Positive and negative word lists for English, Hindi and Marathi
+- Negation handling with language-specific scope (English negates forwards,
+  Hindi and Marathi mostly negate the preceding word)
+- Batch scoring of many texts in a single pass over their tokens
+- A confidence value so uncertain texts can be escalated to the LLM
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Dict, List, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+# Separate logger for escalation decisions so they can be routed to their own file for threshold tuning
+decision_logger = logging.getLogger("sentiment_decisions")
+
+# Words scored +1 (positive) or -1 (negative)
+POSITIVE_WORDS = {
+    'en': {
+        'good', 'great', 'excellent', 'positive', 'success', 'successful', 'win', 'wins', 'won', 'winning',
+        'victory', 'gain', 'gains', 'growth', 'grow', 'grows', 'rise', 'rises', 'rising', 'surge', 'surges',
+        'boost', 'boosts', 'improve', 'improves', 'improved', 'improvement', 'record', 'breakthrough',
+        'benefit', 'benefits', 'celebrate', 'celebrates', 'celebrated', 'achieve', 'achieves', 'achieved',
+        'achievement', 'progress', 'prosperity', 'profit', 'profits', 'strong', 'stronger', 'recovery',
+        'recover', 'recovers', 'hope', 'hopeful', 'optimistic', 'optimism', 'innovation', 'innovative',
+        'award', 'awarded', 'praise', 'praised', 'welcome', 'welcomed', 'safe', 'peace', 'peaceful',
+        'support', 'supports', 'happy', 'best', 'better', 'upbeat', 'thrive', 'thrives', 'thriving', 'rescue',
+        'rescued', 'approve', 'approved', 'launch', 'launched', 'wonderful', 'awesome', 'promising',
+    },
+    'hi': {
+        'अच्छा', 'अच्छी', 'अच्छे', 'बेहतर', 'बेहतरीन', 'सफल', 'सफलता', 'जीत', 'जीता', 'जीती', 'जीते',
+        'विजय', 'लाभ', 'फायदा', 'फ़ायदा', 'वृद्धि', 'बढ़त', 'उछाल', 'सुधार', 'प्रगति', 'विकास', 'उपलब्धि',
+        'रिकॉर्ड', 'खुशी', 'खुश', 'उत्साह', 'सकारात्मक', 'समृद्धि', 'मुनाफा', 'मुनाफ़ा', 'मजबूत', 'मज़बूत',
+        'आशा', 'उम्मीद', 'शांति', 'सुरक्षित', 'सम्मान', 'पुरस्कार', 'प्रशंसा', 'स्वागत', 'समर्थन', 'राहत',
+        'नवाचार', 'शानदार', 'उत्कृष्ट', 'मंजूरी', 'मंज़ूरी',
+    },
+    'mr': {
+        'चांगला', 'चांगली', 'चांगले', 'उत्तम', 'सर्वोत्तम', 'यश', 'यशस्वी', 'विजय', 'जिंकला', 'जिंकली',
+        'जिंकले', 'लाभ', 'फायदा', 'वाढ', 'सुधारणा', 'प्रगती', 'विकास', 'कामगिरी', 'विक्रम', 'आनंद',
+        'आनंदी', 'उत्साह', 'सकारात्मक', 'समृद्धी', 'नफा', 'मजबूत', 'आशा', 'अपेक्षा', 'शांतता', 'सुरक्षित',
+        'सन्मान', 'पुरस्कार', 'कौतुक', 'स्वागत', 'पाठिंबा', 'दिलासा', 'नावीन्य', 'शानदार', 'मंजुरी',
+    },
+}
+
+NEGATIVE_WORDS = {
+    'en': {
+        'bad', 'worse', 'worst', 'negative', 'fail', 'fails', 'failed', 'failure', 'loss', 'losses', 'lose',
+        'loses', 'lost', 'decline', 'declines', 'declined', 'fall', 'falls', 'fell', 'drop', 'drops',
+        'dropped', 'crash', 'crashes', 'crisis', 'slump', 'recession', 'inflation', 'war', 'attack',
+        'attacks', 'killed', 'kill', 'kills', 'death', 'deaths', 'dead', 'die', 'dies', 'died', 'injured',
+        'disaster', 'flood', 'floods', 'earthquake', 'fire', 'violence', 'violent', 'fear', 'fears',
+        'concern', 'concerns', 'worry', 'worries', 'warning', 'threat', 'threats', 'risk', 'risks',
+        'scandal', 'fraud', 'corruption', 'arrest', 'arrested', 'protest', 'protests', 'conflict',
+        'weak', 'weaker', 'poor', 'terrible', 'awful', 'sad', 'angry', 'criticism', 'criticized',
+        'layoffs', 'ban', 'banned', 'collapse', 'collapsed', 'shortage', 'debt', 'damage', 'damaged',
+    },
+    'hi': {
+        'बुरा', 'बुरी', 'बुरे', 'खराब', 'ख़राब', 'असफल', 'विफल', 'विफलता', 'नुकसान', 'हानि', 'घाटा', 'हार',
+        'हारा', 'हारी', 'गिरावट', 'गिरा', 'गिरी', 'संकट', 'मंदी', 'महंगाई', 'युद्ध', 'हमला', 'हमले', 'हत्या',
+        'मौत', 'मृत्यु', 'घायल', 'आपदा', 'बाढ़', 'भूकंप', 'आग', 'हिंसा', 'डर', 'चिंता', 'खतरा', 'ख़तरा',
+        'जोखिम', 'घोटाला', 'धोखाधड़ी', 'भ्रष्टाचार', 'गिरफ्तार', 'गिरफ़्तार', 'विरोध', 'संघर्ष', 'कमजोर',
+        'कमज़ोर', 'दुखद', 'दुख', 'नाराज', 'नाराज़', 'आलोचना', 'प्रतिबंध', 'कर्ज', 'क़र्ज़', 'नकारात्मक',
+    },
+    'mr': {
+        'वाईट', 'खराब', 'अपयश', 'अयशस्वी', 'नुकसान', 'तोटा', 'हानी', 'पराभव', 'हरला', 'हरली', 'घसरण',
+        'घसरला', 'संकट', 'मंदी', 'महागाई', 'युद्ध', 'हल्ला', 'हत्या', 'मृत्यू', 'जखमी', 'आपत्ती', 'पूर',
+        'भूकंप', 'आग', 'हिंसा', 'भीती', 'चिंता', 'धोका', 'घोटाळा', 'फसवणूक', 'भ्रष्टाचार', 'अटक', 'विरोध',
+        'संघर्ष', 'कमकुवत', 'दुःखद', 'दुःख', 'नाराज', 'टीका', 'बंदी', 'कर्ज', 'नकारात्मक',
+    },
+}
+
+NEGATION_WORDS = {
+    'en': {'not', 'no', 'never', 'nor', 'without', 'hardly', 'barely', 'neither', 'nobody', 'nothing'},
+    'hi': {'नहीं', 'न', 'ना', 'मत', 'बिना', 'बगैर'},
+    'mr': {'नाही', 'न', 'ना', 'नको', 'नये', 'विना', 'नव्हता', 'नव्हती', 'नव्हते', 'नसून'},
+}
+
+# (tokens before, tokens after) a negation word whose polarity it flips
+NEGATION_SCOPE = {
+    'en': (0, 3),
+    'hi': (2, 1),
+    'mr': (2, 0),
+}
+
+# Word characters plus Devanagari letters and vowel signs, excluding the danda punctuation
+TOKEN_PATTERN = re.compile(r"[\w\u0900-\u0963\u0966-\u097F]+")
+CONTRACTION_PATTERN = re.compile(r"n't\b")
+
+
+class LexiconSentimentAnalyzer:
+    """Scores sentiment locally from word lists, reporting how confident the label is."""
+
+    def __init__(self):
+        # One lookup table per language mapping a token to its polarity
+        self._weights = {
+            language: {**{word: 1 for word in POSITIVE_WORDS[language]},
+                       **{word: -1 for word in NEGATIVE_WORDS[language]}}
+            for language in POSITIVE_WORDS
+        }
+        self._lock = threading.Lock()
+        self._stats = {'local': 0, 'escalated': 0, 'agreed': 0, 'disagreed': 0}
+
+    @staticmethod
+    def _tokenize(text: str, language: str) -> List[str]:
+        """Split text into lowercase tokens, expanding English n't contractions"""
+        text = text.lower()
+        if language == 'en':
+            text = CONTRACTION_PATTERN.sub(" not", text)
+        return TOKEN_PATTERN.findall(text)
+
+    def _polarities(self, tokens: List[str], language: str) -> List[int]:
+        """Get the signed polarity of every sentiment-bearing token after negation"""
+        weights = self._weights.get(language, self._weights['en'])
+        negations = NEGATION_WORDS.get(language, NEGATION_WORDS['en'])
+        before, after = NEGATION_SCOPE.get(language, NEGATION_SCOPE['en'])
+
+        negated = set()
+        for index, token in enumerate(tokens):
+            if token in negations:
+                negated.update(range(index + 1, index + after + 1))
+                negated.update(range(max(0, index - before), index))
+
+        return [
+            -weights[token] if index in negated else weights[token]
+            for index, token in enumerate(tokens) if token in weights
+        ]
+
+    @staticmethod
+    def _classify(positive: int, negative: int) -> Dict[str, object]:
+        """Turn positive/negative hit counts into a label and confidence"""
+        hits = positive + negative
+        if hits == 0:
+            return {'sentiment': Config.SENTIMENT_DEFAULT, 'confidence': 0.0, 'score': 0.0, 'hits': 0}
+
+        score = (positive - negative) / hits
+        # Agreement between hits, discounted when there is little evidence
+        confidence = abs(score) * hits / (hits + 2)
+        if score > 0:
+            sentiment = 'positive'
+        elif score < 0:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+        return {'sentiment': sentiment, 'confidence': round(confidence, 4), 'score': round(score, 4), 'hits': hits}
+
+    def score(self, text: str, language: str = 'en') -> Dict[str, object]:
+        """
+        Score the sentiment of one text.
+
+        Args:
+            text: Text to analyze
+            language: Language code (en, hi, mr)
+
+        Returns:
+            Dictionary with 'sentiment', 'confidence' (0-1), 'score' (-1 to 1) and 'hits'
+        """
+        return self.score_batch([text], language)[0]
+
+    def score_batch(self, texts: List[str], language: str = 'en') -> List[Dict[str, object]]:
+        """
+        Score many texts in one pass.
+
+        Polarities of every text are gathered into flat positive/negative tallies
+        indexed by text, so the per-text work is a dictionary lookup per token.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code shared by the texts
+
+        Returns:
+            One score dictionary per text, in order
+        """
+        positive = [0] * len(texts)
+        negative = [0] * len(texts)
+        for index, text in enumerate(texts):
+            for polarity in self._polarities(self._tokenize(text or '', language), language):
+                if polarity > 0:
+                    positive[index] += 1
+                else:
+                    negative[index] += 1
+        return [self._classify(pos, neg) for pos, neg in zip(positive, negative)]
+
+    @staticmethod
+    def is_confident(result: Dict[str, object], threshold: float = None) -> bool:
+        """
+        Check whether a score is confident enough to skip the LLM.
+
+        Args:
+            result: Result from score or score_batch
+            threshold: Minimum confidence (defaults to Config.SENTIMENT_LEXICON_THRESHOLD)
+
+        Returns:
+            True if the local label can be used as is
+        """
+        threshold = Config.SENTIMENT_LEXICON_THRESHOLD if threshold is None else threshold
+        return result['hits'] > 0 and result['sentiment'] != 'neutral' and result['confidence'] >= threshold
+
+    def record_decision(self, result: Dict[str, object], language: str, escalated: bool,
+                        ai_sentiment: Optional[str] = None) -> None:
+        """
+        Log whether a text was answered locally or escalated to the LLM.
+
+        Escalated texts that had lexicon hits also record whether the LLM agreed,
+        which shows how far the threshold can be lowered.
+
+        Args:
+            result: Lexicon result for the text
+            language: Language code of the text
+            escalated: Whether the LLM was asked
+            ai_sentiment: The LLM's label when escalated
+        """
+        with self._lock:
+            self._stats['escalated' if escalated else 'local'] += 1
+            if escalated and ai_sentiment and result['hits']:
+                self._stats['agreed' if ai_sentiment == result['sentiment'] else 'disagreed'] += 1
+
+        decision_logger.info(json.dumps({
+            'language': language,
+            'lexicon_sentiment': result['sentiment'],
+            'confidence': result['confidence'],
+            'hits': result['hits'],
+            'threshold': Config.SENTIMENT_LEXICON_THRESHOLD,
+            'escalated': escalated,
+            'ai_sentiment': ai_sentiment,
+        }, ensure_ascii=False))
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get decision counters.
+
+        Returns:
+            Dictionary of local/escalated counts, LLM agreement and the local share
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats['local'] + stats['escalated']
+        stats['local_rate'] = round(stats['local'] / total, 4) if total else 0.0
+        return stats
@@ -0,0 +1,117 @@
+"""
+Single Flight Module for NewsFlash Application
+
+This module provides request coalescing for identical concurrent operations including:
+- One in-flight computation per key, shared by every concurrent caller
+- Per-call wait timeouts, after which a waiting caller computes on its own
+- Copies of the shared result for waiting callers, so none can mutate another's
+- Leader/coalesced/timeout counters per operation group
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight computation and the outcome its waiters share."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.leader = threading.get_ident()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one computation."""
+
+    def __init__(self, name: str, timeout: Optional[float] = None):
+        """
+        Initialize a coalescing group.
+
+        Args:
+            name: Operation name used in logs and stats
+            timeout: Default seconds a caller waits for an in-flight call (defaults to Config.SINGLE_FLIGHT_TIMEOUT)
+        """
+        self.name = name
+        self.timeout = timeout if timeout is not None else Config.SINGLE_FLIGHT_TIMEOUT
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {'leaders': 0, 'coalesced': 0, 'timeouts': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn, or wait for an identical call already in flight and share its outcome.
+
+        Args:
+            key: Identifies identical operations
+            fn: Computation to run when no call with this key is in flight
+            timeout: Seconds to wait for an in-flight call before running fn anyway
+
+        Returns:
+            The result of fn; waiting callers each get their own deep copy of it
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every caller that shared the call
+        """
+        if not Config.SINGLE_FLIGHT_ENABLED:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats['leaders'] += 1
+                leading, reentrant = True, False
+            else:
+                # A leader calling itself again would wait on its own result
+                leading, reentrant = False, call.leader == threading.get_ident()
+
+        if leading:
+            return self._lead(key, call, fn)
+        if reentrant:
+            return fn()
+
+        wait = self.timeout if timeout is None else timeout
+        if not call.done.wait(wait):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            logger.warning(f"{self.name}: in-flight call did not finish within {wait}s, running it again")
+            return fn()
+
+        with self._lock:
+            self._stats['coalesced'] += 1
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result)
+
+    def _lead(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> Any:
+        """Run the computation and publish its outcome to waiting callers"""
+        try:
+            result = fn()
+            # Waiters copy a snapshot, so the leader may change its own result freely
+            call.result = copy.deepcopy(result)
+            return result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dictionary of leader, coalesced and timed-out calls and calls currently in flight
+        """
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
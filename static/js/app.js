@@ -256,7 +256,7 @@ class NewsAssistant {
         console.log('Starting news search for topics:', this.currentTopics);
         
         try {
-            const response = await fetch('/search_news', {
+            const response = await fetch('/search_news/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -266,18 +266,13 @@ class NewsAssistant {
                 })
             });
             
-            const data = await response.json();
-            console.log('Search response:', data);
-            
-            if (data.error) {
-                throw new Error(data.error);
+            if (!response.ok || !response.body) {
+                // Streaming unavailable, fall back to the buffered endpoint
+                await this.searchNewsBuffered();
+                return;
             }
             
-            if (data.success) {
-                console.log('Displaying results:', data.results);
-                this.displayNewsResults(data.results);
-                this.updateNewsStatus(`Found news for ${Object.keys(data.results).length} topics`);
-            }
+            await this.readNewsStream(response);
             
         } catch (error) {
             console.error('Error searching news:', error);
@@ -288,7 +283,100 @@ class NewsAssistant {
         }
     }
     
-    displayNewsResults(results) {
+    async readNewsStream(response) {
+        // Parse newline-delimited JSON events and render each article as it arrives
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        
+        this.topicSections = {};
+        this.prepareNewsResults();
+        
+        while (true) {
+            const { done, value } = await reader.read();
+            if (value) {
+                buffer += decoder.decode(value, { stream: true });
+            }
+            
+            const lines = buffer.split('\n');
+            buffer = done ? '' : lines.pop();
+            
+            for (const line of lines) {
+                if (line.trim()) {
+                    this.handleNewsEvent(JSON.parse(line));
+                }
+            }
+            
+            if (done) {
+                break;
+            }
+        }
+    }
+    
+    handleNewsEvent(event) {
+        switch (event.type) {
+            case 'start':
+                // Reserve sections in topic order so cards land in a stable layout
+                event.topics.forEach(topic => this.getTopicSection(topic));
+                break;
+            case 'article': {
+                const section = this.getTopicSection(event.topic);
+                section.container.insertBefore(this.createArticleElement(event.article), section.loadMoreBtn);
+                this.hideLoadingSpinner();
+                break;
+            }
+            case 'topic_complete':
+                if (event.count === 0) {
+                    const section = this.getTopicSection(event.topic);
+                    section.container.insertBefore(this.createNoArticlesMessage(), section.loadMoreBtn);
+                }
+                break;
+            case 'complete':
+                this.updateNewsStatus(`Found news for ${Object.keys(this.topicSections).length} topics`);
+                break;
+            case 'error':
+                throw new Error(event.error);
+        }
+    }
+    
+    getTopicSection(topic) {
+        if (!this.topicSections[topic]) {
+            const section = this.createTopicSection(topic, null);
+            document.getElementById('news-results').appendChild(section);
+            this.topicSections[topic] = {
+                container: section.querySelector('.p-3'),
+                loadMoreBtn: section.querySelector('.load-more-btn')
+            };
+        }
+        return this.topicSections[topic];
+    }
+    
+    async searchNewsBuffered() {
+        const response = await fetch('/search_news', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                language: this.currentLanguage
+            })
+        });
+        
+        const data = await response.json();
+        console.log('Search response:', data);
+        
+        if (data.error) {
+            throw new Error(data.error);
+        }
+        
+        if (data.success) {
+            console.log('Displaying results:', data.results);
+            this.displayNewsResults(data.results);
+            this.updateNewsStatus(`Found news for ${Object.keys(data.results).length} topics`);
+        }
+    }
+    
+    prepareNewsResults() {
         const welcomeMessage = document.getElementById('welcome-message');
         const newsResults = document.getElementById('news-results');
         
@@ -296,6 +384,11 @@ class NewsAssistant {
         welcomeMessage.style.display = 'none';
         newsResults.style.display = 'block';
         newsResults.innerHTML = '';
+    }
+    
+    displayNewsResults(results) {
+        const newsResults = document.getElementById('news-results');
+        this.prepareNewsResults();
         
         // Display news for each topic
         Object.keys(results).forEach(topic => {
@@ -323,12 +416,10 @@ class NewsAssistant {
                 const articleElement = this.createArticleElement(article);
                 articlesContainer.appendChild(articleElement);
             });
-        } else {
+        } else if (articles) {
+            // A null articles list means they are still streaming in
             console.log(`No articles found for topic: ${topic}`);
-            const noArticlesDiv = document.createElement('div');
-            noArticlesDiv.className = 'alert alert-info';
-            noArticlesDiv.innerHTML = '<i class="fas fa-info-circle me-2"></i>No articles found for this topic.';
-            articlesContainer.appendChild(noArticlesDiv);
+            articlesContainer.appendChild(this.createNoArticlesMessage());
         }
         
         // Add load more button
@@ -345,6 +436,13 @@ class NewsAssistant {
         return section;
     }
     
+    createNoArticlesMessage() {
+        const noArticlesDiv = document.createElement('div');
+        noArticlesDiv.className = 'alert alert-info';
+        noArticlesDiv.innerHTML = '<i class="fas fa-info-circle me-2"></i>No articles found for this topic.';
+        return noArticlesDiv;
+    }
+    
     createSentimentIndicator(sentiment) {
         const sentimentData = this.getSentimentData(sentiment);
         
@@ -435,7 +533,9 @@ class NewsAssistant {
         button.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Loading...';
         
         try {
-            const response = await fetch(`/load_more/${encodeURIComponent(topic)}`);
+            // The cursor from the previous page picks up where it left off
+            const cursor = button.dataset.cursor ? `?cursor=${encodeURIComponent(button.dataset.cursor)}` : '';
+            const response = await fetch(`/load_more/${encodeURIComponent(topic)}${cursor}`);
             const data = await response.json();
             
             if (data.success && data.articles.length > 0) {
@@ -445,8 +545,14 @@ class NewsAssistant {
                     container.insertBefore(articleElement, button);
                 });
                 
-                button.innerHTML = '<i class="fas fa-plus me-1"></i>Load more on this topic';
-                button.disabled = false;
+                button.dataset.cursor = data.next_cursor || '';
+                if (data.has_more === false) {
+                    button.innerHTML = '<i class="fas fa-check me-1"></i>No more articles';
+                    button.disabled = true;
+                } else {
+                    button.innerHTML = '<i class="fas fa-plus me-1"></i>Load more on this topic';
+                    button.disabled = false;
+                }
             } else {
                 button.innerHTML = '<i class="fas fa-check me-1"></i>No more articles';
                 button.disabled = true;
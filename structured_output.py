@@ -0,0 +1,117 @@
+"""
+Structured Output Module for NewsFlash Application
+
+This module provides JSON schema output for the summary and sentiment chains including:
+- The response schema Gemini is constrained to (summary, sentiment, language)
+- Compact language-specific prompts without free-text format instructions
+- A correction prompt for the single retry after malformed output
+- A validating parser that replaces line-by-line scanning of the response
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict
+from langchain_core.prompts import ChatPromptTemplate
+from config import Config
+from error_handler import StructuredOutputError
+
+logger = logging.getLogger(__name__)
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+
+SUMMARY_SENTIMENT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'summary': {'type': 'string', 'description': 'Two-sentence summary of the article in the requested language'},
+        'sentiment': {'type': 'string', 'enum': list(SENTIMENTS)},
+        'language': {'type': 'string', 'enum': list(Config.SUPPORTED_LANGUAGES)},
+    },
+    'required': ['summary', 'sentiment', 'language'],
+}
+
+# The schema carries the output format, so the prompts only describe the task
+STRUCTURED_PROMPTS = {
+    'en': """Summarize this news article in 2 sentences in English and classify its sentiment. Language code: en.
+
+Title: {title}
+Article: {article_text}""",
+    'hi': """इस समाचार लेख का हिंदी में 2-वाक्य सारांश बनाएं और इसकी भावना का वर्गीकरण करें। भाषा कोड: hi.
+
+शीर्षक: {title}
+लेख: {article_text}""",
+    'mr': """या बातमी लेखाचा मराठीत 2-वाक्य सारांश तयार करा आणि त्याच्या भावनेचे वर्गीकरण करा. भाषा कोड: mr.
+
+शीर्षक: {title}
+लेख: {article_text}""",
+}
+
+CORRECTION_PROMPT = ("Your previous answer was rejected: {error}. Answer again with only a JSON object "
+                     "containing summary, sentiment (positive, negative or neutral) and language.")
+
+JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def build_structured_templates() -> Dict[str, ChatPromptTemplate]:
+    """
+    Build the structured summary+sentiment prompt for each supported language.
+
+    Returns:
+        Dictionary mapping language code to its prompt template
+    """
+    return {language: ChatPromptTemplate.from_template(prompt) for language, prompt in STRUCTURED_PROMPTS.items()}
+
+
+def build_correction_templates() -> Dict[str, ChatPromptTemplate]:
+    """
+    Build the retry prompts, which replay the original request and the rejected answer.
+
+    Returns:
+        Dictionary mapping language code to its correction template with an extra
+        'previous' (rejected answer) and 'error' variable
+    """
+    return {
+        language: ChatPromptTemplate.from_messages([
+            ('human', prompt),
+            ('ai', '{previous}'),
+            ('human', CORRECTION_PROMPT),
+        ])
+        for language, prompt in STRUCTURED_PROMPTS.items()
+    }
+
+
+def parse_structured_response(response_text: str, language: str) -> Dict[str, str]:
+    """
+    Validate a JSON summary+sentiment response against the schema.
+
+    Args:
+        response_text: Model output, expected to be a JSON object
+        language: Language the summary was requested in
+
+    Returns:
+        Dictionary with 'summary', 'sentiment' and 'language'
+
+    Raises:
+        StructuredOutputError: If the output is not valid JSON or does not match the schema
+    """
+    # Constrained output is bare JSON; tolerate code fences from models that ignore the mime type
+    match = JSON_OBJECT.search(response_text or '')
+    if not match:
+        raise StructuredOutputError("response is not a JSON object")
+    try:
+        data: Any = json.loads(match.group(0))
+    except json.JSONDecodeError as e:
+        raise StructuredOutputError(f"response is not valid JSON ({e.msg})")
+    if not isinstance(data, dict):
+        raise StructuredOutputError("response is not a JSON object")
+
+    summary = data.get('summary')
+    if not isinstance(summary, str) or not summary.strip():
+        raise StructuredOutputError("'summary' must be a non-empty string")
+    sentiment = data.get('sentiment')
+    if not isinstance(sentiment, str) or sentiment.strip().lower() not in SENTIMENTS:
+        raise StructuredOutputError(f"'sentiment' must be one of {', '.join(SENTIMENTS)}")
+    if data.get('language') != language:
+        raise StructuredOutputError(f"'language' must be '{language}'")
+
+    return {'summary': summary.strip(), 'sentiment': sentiment.strip().lower(), 'language': language}
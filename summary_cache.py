@@ -0,0 +1,214 @@
+"""
+Summary Cache Module for NewsFlash Application
+
+This module provides content-addressed caching for AI-generated results including:
+- Keys derived from a hash of article content, language and prompt version
+- An in-process LRU/TTL layer (cachetools) in front of a persistent SQLite store
+- TTL expiry and size-based eviction for the persistent store
+- Hit/miss counters for monitoring
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """Two-tier cache for summary and sentiment results keyed by content hash."""
+
+    # Run persistent eviction once every this many writes
+    EVICTION_INTERVAL = 50
+
+    def __init__(self, db_path: Optional[str] = None, ttl: Optional[float] = None,
+                 memory_size: Optional[int] = None, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the persistent tier (defaults to Config.SUMMARY_CACHE_DB_PATH)
+            ttl: Seconds an entry stays valid (defaults to Config.SUMMARY_CACHE_TTL)
+            memory_size: Entries kept in the in-process LRU (defaults to Config.SUMMARY_CACHE_MEMORY_SIZE)
+            max_entries: Entries kept in the persistent store (defaults to Config.SUMMARY_CACHE_MAX_ENTRIES)
+        """
+        self.db_path = db_path or Config.SUMMARY_CACHE_DB_PATH
+        self.ttl = ttl or Config.SUMMARY_CACHE_TTL
+        self.max_entries = max_entries or Config.SUMMARY_CACHE_MAX_ENTRIES
+        self._memory = TTLCache(maxsize=memory_size or Config.SUMMARY_CACHE_MEMORY_SIZE, ttl=self.ttl)
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the cache table, disabling the persistent tier if SQLite is unavailable."""
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS summary_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed ON summary_cache (accessed_at)")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Summary cache persistent store unavailable, using memory only: {e}")
+            self.db_path = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection to the persistent store."""
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a content-addressed cache key.
+
+        Args:
+            *parts: Values identifying the cached result (content, language, prompt version, ...)
+
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\x00')  # Separator so ("ab", "c") and ("a", "bc") differ
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The cached value or None on a miss
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._stats['memory_hits'] += 1
+                return value
+
+        value = self._get_persistent(key)
+
+        with self._lock:
+            if value is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._memory[key] = value
+            return value
+
+    def _get_persistent(self, key: str) -> Optional[Any]:
+        """Read an unexpired value from the persistent store."""
+        if not self.db_path:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT value FROM summary_cache WHERE key = ? AND created_at > ?", (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE summary_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                return json.loads(row[0])
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Summary cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Key from make_key
+            value: JSON-serializable value
+        """
+        with self._lock:
+            self._memory[key] = value
+            self._stats['writes'] += 1
+            self._writes_since_eviction += 1
+            evict = self._writes_since_eviction >= self.EVICTION_INTERVAL
+            if evict:
+                self._writes_since_eviction = 0
+
+        if not self.db_path:
+            return
+        try:
+            conn = self._connect()
+            try:
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO summary_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), now, now)
+                )
+                if evict:
+                    self._evict(conn, now)
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Summary cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones above max_entries."""
+        removed = conn.execute("DELETE FROM summary_cache WHERE created_at <= ?", (now - self.ttl,)).rowcount
+        removed += conn.execute(
+            "DELETE FROM summary_cache WHERE key IN ("
+            "SELECT key FROM summary_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        if removed:
+            with self._lock:
+                self._stats['evictions'] += removed
+            logger.info(f"Summary cache evicted {removed} entries")
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if not self.db_path:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM summary_cache")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Summary cache clear failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            Dictionary of counters, hit rate and in-process entry count
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['disk_hits']) / lookups, 4) if lookups else 0.0
+        stats['persistent'] = self.db_path is not None
+        return stats
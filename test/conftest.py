@@ -0,0 +1,36 @@
+"""
+Shared pytest configuration for the NewsFlash test suite.
+
+Persistent caches and the rate limiter's buckets are redirected to temporary
+files so tests never read state written by earlier tests or earlier runs and
+cannot throttle each other, and circuit breakers are closed again so failures
+simulated by one test do not trip the next.
+"""
+
+import os
+import tempfile
+import pytest
+
+# Services created at import time (e.g. in routes.py) pick these up before Config is loaded
+_cache_dir = tempfile.mkdtemp(prefix="newsflash-test-")
+os.environ.setdefault("SUMMARY_CACHE_DB_PATH", os.path.join(_cache_dir, "summary_cache.db"))
+os.environ.setdefault("ARTICLE_CACHE_DB_PATH", os.path.join(_cache_dir, "article_cache.db"))
+os.environ.setdefault("RATE_LIMIT_DB_PATH", os.path.join(_cache_dir, "rate_limiter.db"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Give every test its own persistent summary and article caches and rate-limiter buckets."""
+    from config import Config
+    monkeypatch.setattr(Config, "SUMMARY_CACHE_DB_PATH", str(tmp_path / "summary_cache.db"))
+    monkeypatch.setattr(Config, "ARTICLE_CACHE_DB_PATH", str(tmp_path / "article_cache.db"))
+    monkeypatch.setattr(Config, "RATE_LIMIT_DB_PATH", str(tmp_path / "rate_limiter.db"))
+    monkeypatch.setattr(Config, "PRECOMPUTE_LOCK_PATH", str(tmp_path / "precompute.lock"))
+
+
+@pytest.fixture(autouse=True)
+def closed_circuits():
+    """Start every test with all circuit breakers closed."""
+    from error_handler import reset_circuit_breakers
+    reset_circuit_breakers()
+    yield
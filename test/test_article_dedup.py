@@ -0,0 +1,201 @@
+"""
+Tests for near-duplicate article suppression.
+
+This module tests:
+- Canonical URL normalization
+- SimHash similarity of reworded copies
+- Reusing summaries of earlier copies instead of calling the AI
+- Fallback summaries never reused, so copies are summarized once the AI recovers
+- Per-session seen sets for load more
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from article_dedup import ArticleDeduplicator, canonicalize_url, hamming_distance, simhash
+from news_service import NewsService
+
+
+WIRE_STORY = ("The central bank raised interest rates by a quarter point on Tuesday, citing persistent "
+              "inflation and a strong labour market, and signalled that further increases were possible.")
+REWORDED = WIRE_STORY.replace("on Tuesday", "on Tuesday morning")
+OTHER_STORY = ("A spacecraft launched from Florida reached orbit on its way to the moon, carrying "
+               "instruments to study water ice near the lunar south pole.")
+
+
+def article(url, body, title="Rates rise"):
+    """Build an unsummarized search result."""
+    return {'title': title, 'url': url, 'body': body, 'topic': 'economy', 'language': 'en'}
+
+
+class TestCanonicalUrl:
+    """Test URL normalization."""
+
+    def test_strips_tracking_params_and_fragment(self):
+        """Test that campaign parameters and fragments are dropped."""
+        url = "http://www.example.com/news/story/?utm_source=x&id=7&fbclid=abc#comments"
+
+        assert canonicalize_url(url) == "https://example.com/news/story?id=7"
+
+    def test_amp_variants_match_canonical(self):
+        """Test AMP hosts, paths and suffixes."""
+        canonical = canonicalize_url("https://example.com/news/story")
+
+        assert canonicalize_url("https://amp.example.com/news/story") == canonical
+        assert canonicalize_url("https://example.com/amp/news/story") == canonical
+        assert canonicalize_url("https://m.example.com/news/story/amp/") == canonical
+        assert canonicalize_url("https://example.com/news/story.amp?amp=1") == canonical
+
+
+class TestSimHash:
+    """Test fingerprint similarity."""
+
+    def test_reworded_copy_is_near(self):
+        """Test that small edits change few bits."""
+        assert hamming_distance(simhash(WIRE_STORY), simhash(REWORDED)) <= 7
+
+    def test_different_story_is_far(self):
+        """Test that unrelated stories differ in many bits."""
+        assert hamming_distance(simhash(WIRE_STORY), simhash(OTHER_STORY)) > 12
+
+    def test_empty_text(self):
+        """Test that text without words has no fingerprint."""
+        assert simhash("") == 0
+
+
+class TestArticleDeduplicator:
+    """Test class for ArticleDeduplicator."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.dedup = ArticleDeduplicator(max_distance=7, max_entries=100, ttl=60)
+
+    def test_batch_duplicates_are_dropped(self):
+        """Test that the same story from several outlets is kept once."""
+        articles = [article("https://a.com/1", WIRE_STORY), article("https://b.com/2", REWORDED),
+                    article("https://a.com/1?utm_medium=rss", OTHER_STORY), article("https://c.com/3", OTHER_STORY)]
+
+        kept, novel = self.dedup.partition(articles, 'en')
+
+        assert kept == novel == [articles[0], articles[3]]
+        assert self.dedup.get_stats()['batch_duplicates'] == 2
+
+    def test_global_duplicate_reuses_summary(self):
+        """Test that a later copy links to the first copy's summary."""
+        first = article("https://a.com/1", WIRE_STORY)
+        first.update(summary="Rates up.", sentiment="negative", summary_language="en", ai_summary=True)
+        self.dedup.remember([first], 'en')
+
+        later = article("https://b.com/2", REWORDED)
+        kept, novel = self.dedup.partition([later], 'en')
+
+        assert kept == [later] and novel == []
+        assert later['summary'] == "Rates up."
+        assert later['sentiment'] == "negative"
+        assert later['duplicate_of'] == "https://a.com/1"
+
+    def test_fallback_summary_is_not_remembered(self):
+        """Test that a summary made without the AI is not reused for later copies."""
+        first = article("https://a.com/1", WIRE_STORY)
+        first.update(summary="The central bank raised interest rates.", sentiment="neutral",
+                     summary_language="en", ai_summary=False)
+        self.dedup.remember([first], 'en')
+
+        _, novel = self.dedup.partition([article("https://b.com/2", REWORDED)], 'en')
+
+        assert len(novel) == 1
+
+    def test_summary_reuse_is_per_language(self):
+        """Test that a summary in one language is not reused for another."""
+        first = article("https://a.com/1", WIRE_STORY)
+        first.update(summary="Rates up.", sentiment="negative", summary_language="en", ai_summary=True)
+        self.dedup.remember([first], 'en')
+
+        kept, novel = self.dedup.partition([article("https://a.com/1", WIRE_STORY)], 'hi')
+
+        assert len(novel) == 1
+
+    def test_session_seen_articles_are_dropped(self):
+        """Test that a session does not get articles it was already shown."""
+        self.dedup.mark_seen('session-1', [article("https://a.com/1", WIRE_STORY)])
+        articles = [article("https://b.com/2", REWORDED), article("https://c.com/3", OTHER_STORY)]
+
+        kept, _ = self.dedup.partition(articles, 'en', session_id='session-1')
+        other_session, _ = self.dedup.partition(articles, 'en', session_id='session-2')
+
+        assert kept == [articles[1]]
+        assert other_session == articles
+
+    def test_limit_stops_after_enough_articles(self):
+        """Test that partition keeps at most limit articles."""
+        articles = [article(f"https://a.com/{i}", f"Story number {i} about topic {i * 7}", f"Title {i}") for i in range(4)]
+
+        kept, novel = self.dedup.partition(articles, 'en', limit=2)
+
+        assert kept == novel == articles[:2]
+
+
+class TestNewsServiceDedup:
+    """Test deduplication in NewsService.search_news."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.search_cache = None
+        self.results = [
+            {'title': 'Rates rise', 'url': 'https://a.com/1', 'body': WIRE_STORY},
+            {'title': 'Rates rise', 'url': 'https://b.com/2?utm_source=x', 'body': REWORDED},
+            {'title': 'Moon mission', 'url': 'https://c.com/3', 'body': OTHER_STORY},
+        ]
+        self.summary = {'summary': 'Summary.', 'sentiment': 'neutral', 'language': 'en', 'ai_summary': True}
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    def test_duplicates_skip_the_ai(self):
+        """Test that wire copies are summarized once and later searches reuse summaries."""
+        with patch.object(self.news_service.ddgs, 'news', return_value=self.results):
+            with patch.object(self.news_service, 'generate_summary_with_sentiment', return_value=self.summary) as mock_ai:
+                first = self.news_service.search_news("economy", 3, 'en')
+                second = self.news_service.search_news("rates", 3, 'en')
+
+        assert [a['url'] for a in first] == ['https://a.com/1', 'https://c.com/3']
+        assert mock_ai.call_count == 2
+        assert all(a['summary'] == 'Summary.' for a in second)
+        assert second[0]['duplicate_of'] == 'https://a.com/1'
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    @patch('news_service.Config.STRUCTURED_OUTPUT_ENABLED', False)
+    def test_outage_fallbacks_are_summarized_after_recovery(self):
+        """Test that articles summarized locally during an AI outage get AI summaries once it recovers."""
+        answer = Mock(content="Summary: Rates rose again.\nSentiment: negative")
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=self.results):
+            with patch.object(self.news_service.gemini_circuit, 'is_open', return_value=True):
+                during = self.news_service.search_news("economy", 3, 'en')
+            with patch.object(self.news_service, '_invoke_rate_limited', return_value=answer) as mock_ai:
+                after = self.news_service.search_news("economy", 3, 'en')
+
+        assert not any(a['ai_summary'] for a in during)
+        # Only the wire story is long enough for the AI
+        assert mock_ai.call_count == 1
+        assert after[0]['summary'] == "Rates rose again." and after[0]['ai_summary']
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    def test_session_search_skips_seen_articles(self):
+        """Test that a session's repeat search leaves out what it has already seen."""
+        with patch.object(self.news_service.ddgs, 'news', return_value=self.results):
+            with patch.object(self.news_service, 'generate_summary_with_sentiment', return_value=self.summary):
+                self.news_service.mark_articles_seen('session-1', self.results[:1])
+                articles = self.news_service.search_news("economy", 3, 'en', session_id='session-1')
+
+        assert [a['url'] for a in articles] == ['https://c.com/3']
+
+    @patch('news_service.Config.DEDUP_ENABLED', False)
+    def test_disabled(self):
+        """Test that deduplication can be switched off."""
+        news_service = NewsService()
+
+        assert news_service.get_dedup_stats() == {'enabled': False}
+        assert news_service._deduplicate(self.results, 'en') == (self.results, self.results)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
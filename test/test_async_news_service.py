@@ -0,0 +1,219 @@
+"""
+Tests for the asyncio-native AsyncNewsService.
+
+This module tests:
+- Summary and sentiment through ainvoke and abatch
+- Semaphore-bounded AI concurrency on a single event loop
+- Time budget fallbacks and per-article retries
+- Driving the service from synchronous code via the background loop
+- with_retry on coroutine functions
+"""
+
+import asyncio
+import concurrent.futures
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from async_news_service import AsyncNewsService
+from error_handler import with_retry, AIServiceError
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+def make_articles(count, topic='tech'):
+    """Build unsummarized articles as returned by NewsService._find_articles."""
+    return [{'title': f'Article {i}', 'url': f'http://example.com/{i}', 'body': f"{LONG_BODY} {i}",
+             'topic': topic, 'language': 'en'} for i in range(count)]
+
+
+class TestAsyncNewsService:
+    """Test class for AsyncNewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = AsyncNewsService()
+        self.service.summary_cache = None
+        # Fixture articles share one body; deduplication has its own tests
+        self.service.deduplicator = None
+        self.service.rate_limiter = Mock()
+        self.service.rate_limiter.try_acquire.return_value = 0
+        self.service.llm = Mock()
+        self.service.llm.ainvoke = AsyncMock(return_value=Mock(content="Summary: Async summary.\nSentiment: positive"))
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_with_sentiment_uses_ainvoke(self):
+        """Test that a single summary is one awaited model call."""
+        result = asyncio.run(self.service.agenerate_summary_with_sentiment(LONG_BODY, "Title", 'en'))
+
+        assert result == {'summary': 'Async summary.', 'sentiment': 'positive', 'language': 'en', 'ai_summary': True}
+        self.service.llm.ainvoke.assert_awaited_once()
+        self.service.rate_limiter.record_success.assert_called_once()
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    def test_summarize_articles_batches_calls(self):
+        """Test that abatch summarizes every uncached article."""
+        articles = make_articles(3)
+
+        asyncio.run(self.service.asummarize_articles(articles, 'hi'))
+
+        assert self.service.llm.ainvoke.await_count == 3
+        assert all(a['summary'] == 'Async summary.' and a['sentiment'] == 'positive' for a in articles)
+        assert all(a['summary_language'] == 'hi' for a in articles)
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    @patch('async_news_service.Config.ASYNC_LLM_CONCURRENCY', 2)
+    def test_semaphore_bounds_requests_in_flight(self):
+        """Test that no more than ASYNC_LLM_CONCURRENCY calls run at once."""
+        in_flight = []
+        peak = []
+
+        async def slow_call(prompt):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.02)
+            in_flight.pop()
+            return Mock(content="Summary: S.\nSentiment: neutral")
+
+        self.service.llm.ainvoke = AsyncMock(side_effect=slow_call)
+        asyncio.run(self.service.asummarize_articles(make_articles(8), 'en'))
+
+        assert max(peak) == 2
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    @patch('async_news_service.Config.ASYNC_LLM_CONCURRENCY', 30)
+    def test_many_requests_in_flight_on_one_loop(self):
+        """Test that dozens of slow AI calls overlap without a thread each."""
+        async def slow_call(prompt):
+            await asyncio.sleep(0.3)
+            return Mock(content="Summary: S.\nSentiment: neutral")
+
+        self.service.llm.ainvoke = AsyncMock(side_effect=slow_call)
+        start = time.monotonic()
+        asyncio.run(self.service.asummarize_articles(make_articles(30), 'en'))
+
+        assert time.monotonic() - start < 1.5
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    @patch('error_handler.asyncio.sleep', new_callable=AsyncMock)
+    def test_failed_batch_items_retry_individually(self, mock_sleep):
+        """Test that unparseable batch answers go through the single-article path."""
+        responses = [Mock(content="no structure"), Mock(content="Summary: Retried.\nSentiment: negative")]
+        self.service.llm.ainvoke = AsyncMock(side_effect=responses)
+        articles = make_articles(1)
+
+        asyncio.run(self.service.asummarize_articles(articles, 'en'))
+
+        assert articles[0]['summary'] == 'Retried.'
+        assert articles[0]['sentiment'] == 'negative'
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    @patch('async_news_service.Config.TOPIC_TIME_BUDGET', 0.1)
+    def test_search_budget_falls_back(self):
+        """Test that summaries missing the time budget use the article body."""
+        async def stuck_call(prompt):
+            await asyncio.sleep(5)
+
+        self.service.llm.ainvoke = AsyncMock(side_effect=stuck_call)
+        with patch.object(self.service, '_find_articles', return_value=make_articles(2)):
+            articles = asyncio.run(self.service.asearch_news("tech", 2, 'en'))
+
+        assert len(articles) == 2
+        assert all(a['sentiment'] == 'neutral' for a in articles)
+        assert articles[0]['summary'].startswith(LONG_BODY[:50])
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    def test_rate_limit_errors_throttle(self):
+        """Test that 429 responses shrink the shared request rate."""
+        self.service.llm.ainvoke = AsyncMock(side_effect=Exception("429 Resource exhausted"))
+
+        with patch('error_handler.asyncio.sleep', new_callable=AsyncMock):
+            result = asyncio.run(self.service.agenerate_summary_with_sentiment(LONG_BODY, "Title", 'en'))
+
+        assert result['sentiment'] == 'neutral'
+        assert self.service.rate_limiter.record_throttle.called
+
+    @patch('async_news_service.Config.USE_AI_SUMMARY', True)
+    def test_sync_entry_points_use_background_loop(self):
+        """Test that Flask-style synchronous callers can drive the service."""
+        with patch.object(self.service, '_find_articles', side_effect=lambda t, n, l, s=None: make_articles(1, t)):
+            results = self.service.search_multiple_topics(['sports', 'tech'], language='mr')
+
+        assert list(results) == ['sports', 'tech']
+        assert results['sports'][0]['summary'] == 'Async summary.'
+        assert results['tech'][0]['summary_language'] == 'mr'
+
+    def test_sync_entry_point_stops_at_request_deadline(self):
+        """Test that a synchronous caller waits only for the request's budget and cancels the work."""
+        from deadline import deadline_scope
+        cancelled = []
+
+        async def hang(*args):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with patch.object(self.service, 'asearch_news', side_effect=hang):
+            start = time.monotonic()
+            with deadline_scope(0.2), pytest.raises(concurrent.futures.TimeoutError):
+                self.service.search_news("tech", 5, 'en', 'session-1')
+
+        assert time.monotonic() - start < 2
+        for _ in range(100):
+            if cancelled:
+                break
+            time.sleep(0.01)
+        assert cancelled
+
+    def test_analyze_sentiment_short_text(self):
+        """Test that very short text is neutral without a model call."""
+        assert asyncio.run(self.service.aanalyze_sentiment("Too short", 'en')) == 'neutral'
+        self.service.llm.ainvoke.assert_not_awaited()
+
+
+class TestAsyncRetry:
+    """Test with_retry on coroutine functions."""
+
+    @patch('error_handler.asyncio.sleep', new_callable=AsyncMock)
+    def test_async_function_is_retried(self, mock_sleep):
+        """Test that transient errors are retried with asyncio.sleep."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=1)
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise Exception("connection reset")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        first, second = [c.args[0] for c in mock_sleep.await_args_list]
+        # Decorrelated jitter: each delay lies between the base delay and three times the previous one
+        assert 1 <= first <= 3
+        assert 1 <= second <= 3 * first
+
+    def test_async_function_non_retryable(self):
+        """Test that non-retryable errors propagate immediately."""
+        @with_retry(max_attempts=3)
+        async def unauthorized():
+            raise Exception("401 invalid api key")
+
+        with pytest.raises(Exception, match="401"):
+            asyncio.run(unauthorized())
+
+    @patch('error_handler.asyncio.sleep', new_callable=AsyncMock)
+    def test_async_function_exhausts_attempts(self, mock_sleep):
+        """Test that exhausting retries raises AIServiceError."""
+        @with_retry(max_attempts=2, base_delay=1)
+        async def always_failing():
+            raise Exception("timeout")
+
+        with pytest.raises(AIServiceError):
+            asyncio.run(always_failing())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,118 @@
+"""
+Tests for batched multi-article summarization in NewsService.
+
+This module tests:
+- Single AI call for several articles
+- JSON response parsing and validation
+- Per-article fallback for unparseable items
+- Integration with search_news
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from news_service import NewsService
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+class TestBatchSummary:
+    """Test class for batch summarization."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        # Fixture articles share one body; deduplication has its own tests
+        self.news_service.deduplicator = None
+        self.articles = [{'title': f'Article {i}', 'body': LONG_BODY} for i in range(1, 4)]
+
+    def _mock_response(self, content):
+        """Patch the rate-limited invoke to return the given content."""
+        return patch.object(self.news_service, '_invoke_rate_limited', return_value=Mock(content=content))
+
+    def test_batch_uses_single_call(self):
+        """Test that all articles are summarized in one AI call."""
+        content = '''```json
+        [{"id": 1, "summary": "First.", "sentiment": "positive"},
+         {"id": 2, "summary": "Second.", "sentiment": "negative"},
+         {"id": 3, "summary": "Third.", "sentiment": "neutral"}]
+        ```'''
+        with self._mock_response(content) as mock_invoke:
+            results = self.news_service.summarize_articles_batch(self.articles, 'en')
+
+        mock_invoke.assert_called_once()
+        prompt_articles = mock_invoke.call_args[0][1]['articles']
+        assert 'Article 1' in prompt_articles and 'Article 3' in prompt_articles
+        assert [r['summary'] for r in results] == ['First.', 'Second.', 'Third.']
+        assert [r['sentiment'] for r in results] == ['positive', 'negative', 'neutral']
+        assert all(r['language'] == 'en' for r in results)
+
+    def test_invalid_items_are_none(self):
+        """Test that missing or malformed items are reported as None."""
+        content = '''[{"id": 2, "summary": "Second.", "sentiment": "सकारात्मक"},
+                      {"id": 3, "summary": "", "sentiment": "neutral"}]'''
+        with self._mock_response(content):
+            results = self.news_service.summarize_articles_batch(self.articles, 'hi')
+
+        assert results[0] is None
+        assert results[1] == {'summary': 'Second.', 'sentiment': 'positive', 'language': 'hi'}
+        assert results[2] is None
+
+    def test_unparseable_response_returns_all_none(self):
+        """Test that a non-JSON response yields no results."""
+        with self._mock_response("Summary: not json at all"):
+            results = self.news_service.summarize_articles_batch(self.articles, 'en')
+        assert results == [None, None, None]
+
+    def test_ai_error_returns_all_none(self):
+        """Test that AI failures never raise from the batch path."""
+        with patch.object(self.news_service, '_invoke_rate_limited', side_effect=Exception("API Error")):
+            results = self.news_service.summarize_articles_batch(self.articles, 'en')
+        assert results == [None, None, None]
+
+    def test_language_specific_batch_templates(self):
+        """Test that each supported language has its own batch template."""
+        templates = self.news_service.batch_prompt_templates
+        assert set(templates) == {'en', 'hi', 'mr'}
+        assert templates['en'] != templates['hi'] != templates['mr']
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', True)
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_search_news_falls_back_per_article(self):
+        """Test that search_news batches articles and falls back for unparsed ones."""
+        results = [{'title': f'Article {i}', 'url': f'http://example.com/{i}', 'body': LONG_BODY}
+                   for i in range(1, 4)]
+        batch_results = [
+            {'summary': 'Batch one.', 'sentiment': 'positive', 'language': 'en'},
+            None,
+            {'summary': 'Batch three.', 'sentiment': 'negative', 'language': 'en'},
+        ]
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results):
+            with patch.object(self.news_service, 'summarize_articles_batch', return_value=batch_results) as mock_batch:
+                with patch.object(self.news_service, 'generate_summary_with_sentiment',
+                                  return_value={'summary': 'Single summary.', 'sentiment': 'neutral', 'language': 'en'}) as mock_single:
+                    articles = self.news_service.search_news("technology", max_results=3, language='en')
+
+        mock_batch.assert_called_once()
+        mock_single.assert_called_once_with(LONG_BODY, 'Article 2', 'en')
+        assert [a['summary'] for a in articles] == ['Batch one.', 'Single summary.', 'Batch three.']
+        assert [a['sentiment'] for a in articles] == ['positive', 'neutral', 'negative']
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    def test_batch_disabled_uses_per_article_path(self):
+        """Test that search_news skips batching when disabled."""
+        results = [{'title': 'A', 'body': LONG_BODY}, {'title': 'B', 'body': LONG_BODY}]
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results):
+            with patch.object(self.news_service, 'summarize_articles_batch') as mock_batch:
+                with patch.object(self.news_service, 'generate_summary_with_sentiment',
+                                  return_value={'summary': 'Single.', 'sentiment': 'neutral', 'language': 'en'}):
+                    self.news_service.search_news("technology", max_results=2, language='en')
+
+        mock_batch.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
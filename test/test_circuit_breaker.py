@@ -0,0 +1,250 @@
+"""
+Tests for per-dependency circuit breakers.
+
+This module tests:
+- Closed, open and half-open transitions driven by the failure rate
+- Rejected calls while open and probe calls after the cool-down
+- Fallbacks used by the services while a circuit is open
+- The circuit breaker status endpoint
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from error_handler import (
+    CircuitBreaker, CircuitOpenError, get_circuit_breaker, get_circuit_breaker_status, with_retry
+)
+from news_service import NewsService
+from tts_service import TTSService
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+def trip(breaker, count=None):
+    """Record enough failures to open a breaker."""
+    for _ in range(count or breaker.min_calls):
+        breaker.record_failure(ValueError("service unavailable"))
+
+
+class TestCircuitBreaker:
+    """Test class for CircuitBreaker."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=4, window=60,
+                                      open_seconds=0.1, half_open_calls=1)
+
+    def test_opens_at_failure_rate(self):
+        """Test that the circuit opens only once enough calls fail."""
+        self.breaker.record_success()
+        self.breaker.record_success()
+        self.breaker.record_failure(ValueError("boom"))
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+        self.breaker.record_failure(ValueError("boom"))
+
+        assert self.breaker.state == CircuitBreaker.OPEN
+        assert not self.breaker.allow_request()
+        assert self.breaker.get_status()['rejected'] == 1
+        assert self.breaker.get_status()['last_error'] == "boom"
+
+    def test_too_few_calls_do_not_open(self):
+        """Test that a handful of failures below min_calls keeps the circuit closed."""
+        trip(self.breaker, 3)
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_old_outcomes_leave_the_window(self):
+        """Test that failures older than the window are forgotten."""
+        self.breaker.window = 0.05
+        trip(self.breaker, 3)
+        time.sleep(0.1)
+        self.breaker.record_failure(ValueError("boom"))
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+        assert self.breaker.get_status()['calls'] == 1
+
+    def test_probe_success_closes(self):
+        """Test that one probe is allowed after the cool-down and its success closes the circuit."""
+        trip(self.breaker)
+        time.sleep(0.15)
+
+        assert self.breaker.state == CircuitBreaker.HALF_OPEN
+        assert self.breaker.allow_request()
+        assert not self.breaker.allow_request()
+
+        self.breaker.record_success()
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+        assert self.breaker.allow_request()
+
+    def test_probe_failure_reopens(self):
+        """Test that a failed probe opens the circuit for another cool-down."""
+        trip(self.breaker)
+        time.sleep(0.15)
+        assert self.breaker.allow_request()
+
+        self.breaker.record_failure(ValueError("still down"))
+
+        assert self.breaker.state == CircuitBreaker.OPEN
+        assert self.breaker.get_status()['opened'] == 2
+
+    def test_cancel_returns_probe_slot(self):
+        """Test that a probe that was never sent frees its slot."""
+        trip(self.breaker)
+        time.sleep(0.15)
+        assert self.breaker.allow_request()
+
+        self.breaker.cancel()
+
+        assert self.breaker.allow_request()
+
+    def test_call_records_outcome(self):
+        """Test that call() counts failures and raises CircuitOpenError once open."""
+        failing = Mock(side_effect=ValueError("boom"))
+        for _ in range(4):
+            with pytest.raises(ValueError):
+                self.breaker.call(failing)
+
+        with pytest.raises(CircuitOpenError):
+            self.breaker.call(failing)
+        assert failing.call_count == 4
+
+    @patch('error_handler.Config.CIRCUIT_BREAKER_ENABLED', False)
+    def test_disabled(self):
+        """Test that a disabled breaker never rejects calls."""
+        trip(self.breaker)
+
+        assert self.breaker.allow_request()
+        assert not self.breaker.is_open()
+
+    def test_open_circuit_is_not_retried(self):
+        """Test that with_retry gives up immediately on CircuitOpenError."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        def call():
+            calls.append(1)
+            raise CircuitOpenError("open")
+
+        with pytest.raises(CircuitOpenError):
+            call()
+        assert len(calls) == 1
+
+    def test_registry_shares_breakers(self):
+        """Test that breakers are shared by name and reported together."""
+        assert get_circuit_breaker("gemini") is get_circuit_breaker("gemini")
+        trip(get_circuit_breaker("gemini"))
+
+        assert get_circuit_breaker_status()['gemini']['state'] == CircuitBreaker.OPEN
+
+
+class TestServiceFallbacks:
+    """Test the fallbacks services use while a circuit is open."""
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_open_gemini_circuit_skips_ai(self):
+        """Test that summaries and sentiment fall back without calling Gemini."""
+        news_service = NewsService()
+        news_service.summary_cache = None
+        trip(news_service.gemini_circuit)
+
+        with patch.object(news_service, '_generate_summary_with_sentiment_for_language') as mock_generate:
+            result = news_service.generate_summary_with_sentiment(LONG_BODY, "AI", 'en')
+            summary = news_service.generate_summary(LONG_BODY, "AI", 'en')
+
+        mock_generate.assert_not_called()
+        assert result['summary'] and result['sentiment'] in ('positive', 'negative', 'neutral')
+        assert summary
+        with patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', False):
+            assert news_service.analyze_sentiment("The market rallied strongly on good news today.", 'en') == 'neutral'
+
+    def test_gemini_failures_open_circuit(self):
+        """Test that failed model calls are recorded and later calls are rejected unsent."""
+        news_service = NewsService()
+        chain = Mock()
+        chain.invoke.side_effect = ValueError("503 service unavailable")
+
+        for _ in range(news_service.gemini_circuit.min_calls):
+            with pytest.raises(ValueError):
+                news_service._invoke_rate_limited(chain, {})
+
+        with pytest.raises(CircuitOpenError):
+            news_service._invoke_rate_limited(chain, {})
+        assert chain.invoke.call_count == news_service.gemini_circuit.min_calls
+
+    def test_open_search_circuit_serves_cache(self):
+        """Test that cached search results are served and uncached searches fail fast."""
+        news_service = NewsService()
+        news_service.ddgs = Mock()
+        news_service.ddgs.news.return_value = [{'title': 'A'}]
+        assert news_service._fetch_search_results("cricket news", 5) == [{'title': 'A'}]
+
+        trip(news_service.search_circuit)
+
+        assert news_service._fetch_search_results("cricket news", 5) == [{'title': 'A'}]
+        with pytest.raises(CircuitOpenError):
+            news_service._fetch_search_results("tennis news", 5)
+        assert news_service.ddgs.news.call_count == 1
+
+    def test_open_gtts_circuit_reuses_audio(self, tmp_path, monkeypatch):
+        """Test that audio generated earlier is returned while gTTS is down."""
+        monkeypatch.chdir(tmp_path)
+        tts_service = TTSService()
+
+        def fake_save(path):
+            with open(path, 'wb') as f:
+                f.write(b'mp3')
+
+        with patch('tts_service.gTTS') as mock_gtts:
+            mock_gtts.return_value.save.side_effect = fake_save
+            first = tts_service.text_to_speech("Hello world, the news today.", 'en')
+            trip(tts_service.tts_circuit)
+            again = tts_service.text_to_speech("Hello world, the news today.", 'en')
+            other = tts_service.text_to_speech("Something never read aloud before.", 'en')
+
+        assert first and again == first
+        assert other is None
+        assert mock_gtts.call_count == 1
+        assert os.path.exists(os.path.join("static", "audio", os.path.basename(first)))
+
+    def test_article_hosts_have_separate_circuits(self):
+        """Test that a failing host stops being fetched without affecting other hosts."""
+        extractor = ArticleExtractor()
+
+        with patch.object(extractor, '_extract_full_article', return_value=None) as mock_extract:
+            for _ in range(get_circuit_breaker("article_fetch:down.example").min_calls + 2):
+                assert extractor.extract_full_article("https://down.example/story") is None
+            calls = mock_extract.call_count
+            mock_extract.return_value = "Text"
+            assert extractor.extract_full_article("https://up.example/story") == "Text"
+
+        assert calls == get_circuit_breaker("article_fetch:down.example").min_calls
+        assert get_circuit_breaker("article_fetch:down.example").is_open()
+        assert not get_circuit_breaker("article_fetch:up.example").is_open()
+
+
+class TestCircuitBreakerRoute:
+    """Test the circuit breaker status endpoint."""
+
+    def test_status_endpoint(self):
+        """Test that /circuit-breakers reports each breaker's state."""
+        from app import app
+        import routes  # noqa: F401 - registers the endpoints
+
+        trip(get_circuit_breaker("duckduckgo"))
+        with app.test_client() as client:
+            response = client.get('/circuit-breakers')
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['success'] is True
+        assert data['circuits']['duckduckgo']['state'] == 'open'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,146 @@
+"""
+Tests for concurrent multi-topic search in NewsService.
+
+This module tests:
+- Parallel fan-out of topic searches on a bounded worker pool
+- Parallel per-article summarization
+- Per-topic time budgets with partial results
+- Isolation of failing topics
+"""
+
+import time
+import threading
+import pytest
+from unittest.mock import patch
+from news_service import NewsService
+
+
+LONG_BODY = ("Test article body content for testing purposes with artificial intelligence and machine "
+             "learning developments. This article contains detailed information about recent breakthroughs.")
+
+
+class TestConcurrentSearch:
+    """Test class for concurrent search execution."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        # Fixture articles share one body; deduplication has its own tests
+        self.news_service.deduplicator = None
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', True)
+    def test_topics_are_searched_in_parallel(self):
+        """Test that total latency tracks the slowest topic, not the sum."""
+        def slow_search(topic, max_results, language):
+            time.sleep(0.3)
+            return [{'title': topic, 'language': language}]
+
+        with patch.object(self.news_service, 'search_news', side_effect=slow_search):
+            start = time.monotonic()
+            results = self.news_service.search_multiple_topics(['a', 'b', 'c', 'd'], language='en')
+            elapsed = time.monotonic() - start
+
+        assert list(results.keys()) == ['a', 'b', 'c', 'd']
+        assert all(len(articles) == 1 for articles in results.values())
+        assert elapsed < 0.9
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', True)
+    def test_failing_topic_does_not_affect_others(self):
+        """Test that one failing topic yields an empty list while others succeed."""
+        def flaky_search(topic, max_results, language):
+            if topic == 'bad':
+                raise Exception("DDGS failure")
+            return [{'title': topic}]
+
+        with patch.object(self.news_service, 'search_news', side_effect=flaky_search):
+            results = self.news_service.search_multiple_topics(['good', 'bad'], language='en')
+
+        assert results['bad'] == []
+        assert results['good'] == [{'title': 'good'}]
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', True)
+    @patch('news_service.Config.TOPIC_TIME_BUDGET', 0.2)
+    @patch('news_service.NewsService.TOPIC_GRACE_PERIOD', 0.1)
+    def test_slow_topic_returns_partial_results(self):
+        """Test that a topic exceeding its budget is dropped without blocking the rest."""
+        release = threading.Event()
+
+        def stuck_search(topic, max_results, language):
+            if topic == 'slow':
+                release.wait(5)
+            return [{'title': topic}]
+
+        with patch.object(self.news_service, 'search_news', side_effect=stuck_search):
+            start = time.monotonic()
+            results = self.news_service.search_multiple_topics(['fast', 'slow'], language='en')
+            elapsed = time.monotonic() - start
+            release.set()
+
+        assert results['fast'] == [{'title': 'fast'}]
+        assert results['slow'] == []
+        assert elapsed < 2
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', True)
+    def test_articles_summarized_in_parallel(self):
+        """Test that per-article summaries run concurrently within a topic."""
+        results = [
+            {'title': f'Article {i}', 'url': f'http://example.com/{i}', 'body': LONG_BODY,
+             'date': '2024-01-01', 'source': 'Test'}
+            for i in range(4)
+        ]
+
+        def slow_summary(body, title, language):
+            time.sleep(0.3)
+            return {'summary': f"Summary of {title}", 'sentiment': 'neutral', 'language': language}
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results):
+            with patch.object(self.news_service, 'generate_summary_with_sentiment', side_effect=slow_summary):
+                start = time.monotonic()
+                articles = self.news_service.search_news("technology", max_results=4, language='en')
+                elapsed = time.monotonic() - start
+
+        assert [a['summary'] for a in articles] == [f"Summary of Article {i}" for i in range(4)]
+        assert elapsed < 0.9
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', True)
+    @patch('news_service.Config.TOPIC_TIME_BUDGET', 0.2)
+    def test_slow_summary_uses_fallback(self):
+        """Test that summaries not ready within the budget fall back to the article body."""
+        release = threading.Event()
+        results = [
+            {'title': 'Fast', 'url': 'http://example.com/1', 'body': LONG_BODY},
+            {'title': 'Slow', 'url': 'http://example.com/2', 'body': LONG_BODY},
+        ]
+
+        def summary(body, title, language):
+            if title == 'Slow':
+                release.wait(5)
+            return {'summary': f"AI summary of {title}", 'sentiment': 'positive', 'language': language}
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results):
+            with patch.object(self.news_service, 'generate_summary_with_sentiment', side_effect=summary):
+                articles = self.news_service.search_news("technology", max_results=2, language='en')
+                release.set()
+
+        assert articles[0]['summary'] == "AI summary of Fast"
+        assert articles[1]['summary'] != "AI summary of Slow"
+        assert articles[1]['summary'].startswith(LONG_BODY[:50])
+        assert articles[1]['sentiment'] == 'neutral'
+
+    @patch('news_service.Config.CONCURRENT_SEARCH_ENABLED', False)
+    def test_sequential_mode_when_disabled(self):
+        """Test that disabling concurrency searches topics on the calling thread."""
+        threads = []
+
+        def record_thread(topic, max_results, language):
+            threads.append(threading.current_thread())
+            return []
+
+        with patch.object(self.news_service, 'search_news', side_effect=record_thread):
+            self.news_service.search_multiple_topics(['a', 'b'], language='en')
+
+        assert threads == [threading.current_thread()] * 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
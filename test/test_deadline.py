@@ -0,0 +1,229 @@
+"""
+Tests for request deadlines and deadline-aware retries.
+
+This module tests:
+- Deadline scopes, nesting and propagation into worker threads
+- Decorrelated jitter and Retry-After hints in with_retry
+- Retries cut short by the request deadline
+- Error classification by exception type and HTTP status
+- Services giving up once the deadline has passed
+"""
+
+import time
+import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from deadline import current_deadline, deadline_scope, remaining_budget, submit_with_deadline
+from error_handler import (
+    AIServiceError, DeadlineExceededError, _is_retryable_error, _retry_after, check_deadline, with_retry
+)
+from news_service import NewsService
+
+
+class HTTPStatusError(Exception):
+    """Client error carrying an HTTP status, like google-api-core errors."""
+
+    def __init__(self, code, message="request failed"):
+        super().__init__(message)
+        self.code = code
+
+
+def http_error(status, headers=None):
+    """Build a requests.HTTPError with a response."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+class TestDeadlineScope:
+    """Test class for deadline scopes."""
+
+    def test_no_deadline_outside_scope(self):
+        """Test that budgets are unchanged outside a request."""
+        assert current_deadline() is None
+        assert remaining_budget(10) == 10
+        check_deadline("anything")
+
+    def test_scope_caps_budgets(self):
+        """Test that budgets are limited to the time the request has left."""
+        with deadline_scope(2) as deadline:
+            assert current_deadline() is deadline
+            assert remaining_budget(30) <= 2
+            assert remaining_budget(0.5) == 0.5
+            assert remaining_budget(None) <= 2
+        assert current_deadline() is None
+
+    def test_nested_scope_cannot_extend(self):
+        """Test that an inner scope keeps the sooner outer deadline."""
+        with deadline_scope(1) as outer:
+            with deadline_scope(100) as inner:
+                assert inner is outer
+            with deadline_scope(0.5) as tighter:
+                assert tighter is not outer
+                assert tighter.remaining() <= 0.5
+
+    def test_expired_deadline_raises(self):
+        """Test that check_deadline raises once the deadline has passed."""
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                check_deadline("AI request")
+
+    def test_deadline_reaches_worker_threads(self):
+        """Test that submitted work sees the caller's deadline."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with deadline_scope(5) as deadline:
+                seen = submit_with_deadline(pool, current_deadline).result()
+            outside = pool.submit(current_deadline).result()
+
+        assert seen is deadline
+        assert outside is None
+
+
+class TestRetryBackoff:
+    """Test backoff timing in with_retry."""
+
+    @patch('error_handler.time.sleep')
+    @patch('retry_budget.Config.RETRY_BUDGET', 3)
+    def test_decorrelated_jitter(self, mock_sleep):
+        """Test that each delay lies between the base delay and three times the previous one."""
+        @with_retry(max_attempts=4, base_delay=1)
+        def failing():
+            raise ConnectionError("reset")
+
+        with pytest.raises(AIServiceError):
+            failing()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert 1 <= delays[0] <= 3
+        for previous, delay in zip(delays, delays[1:]):
+            assert 1 <= delay <= min(10, previous * 3)
+
+    @patch('error_handler.time.sleep')
+    def test_retry_after_header_is_honored(self, mock_sleep):
+        """Test that a Retry-After header replaces the computed delay."""
+        calls = []
+
+        @with_retry(max_attempts=2, base_delay=0.1)
+        def throttled():
+            calls.append(1)
+            if len(calls) == 1:
+                raise http_error(429, {'Retry-After': '4'})
+            return "ok"
+
+        assert throttled() == "ok"
+        assert 4 <= mock_sleep.call_args[0][0] <= 4.1
+
+    @patch('error_handler.time.sleep')
+    def test_long_retry_after_is_not_waited_for(self, mock_sleep):
+        """Test that a hint longer than the maximum delay ends the retries."""
+        @with_retry(max_attempts=3, base_delay=0.1)
+        def throttled():
+            raise http_error(429, {'Retry-After': '120'})
+
+        with pytest.raises(AIServiceError):
+            throttled()
+        mock_sleep.assert_not_called()
+
+    def test_retry_hint_sources(self):
+        """Test Retry-After from attributes, wrapped errors and google RetryInfo details."""
+        hinted = Exception("quota")
+        hinted.retry_after = 2.5
+        retry_info = Mock(retry_delay=Mock(seconds=7, nanos=500000000))
+        quota = HTTPStatusError(429)
+        quota.details = [retry_info]
+        try:
+            try:
+                raise quota
+            except HTTPStatusError as e:
+                raise AIServiceError(f"Failed to generate summary: {e}")
+        except AIServiceError as wrapped:
+            assert _retry_after(wrapped) == 7.5
+
+        assert _retry_after(hinted) == 2.5
+        assert _retry_after(Exception("no hint")) is None
+
+    @patch('error_handler.time.sleep')
+    def test_retry_stops_at_deadline(self, mock_sleep):
+        """Test that no retry is made when its delay would outlast the request."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=1)
+        def failing():
+            calls.append(1)
+            raise ConnectionError("reset")
+
+        with deadline_scope(0.5):
+            with pytest.raises(AIServiceError):
+                failing()
+
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+
+
+class TestErrorClassification:
+    """Test retryable error classification by type."""
+
+    def test_status_codes(self):
+        """Test that HTTP statuses decide retryability regardless of message."""
+        assert _is_retryable_error(HTTPStatusError(503, "boom"))
+        assert _is_retryable_error(HTTPStatusError(429, "boom"))
+        assert _is_retryable_error(http_error(502))
+        assert not _is_retryable_error(HTTPStatusError(400, "connection timeout"))
+        assert not _is_retryable_error(http_error(404))
+
+    def test_exception_types(self):
+        """Test transport errors and our own non-retryable errors."""
+        assert _is_retryable_error(requests.Timeout("read timed out"))
+        assert _is_retryable_error(TimeoutError())
+        assert not _is_retryable_error(requests.exceptions.InvalidURL("bad url"))
+        assert not _is_retryable_error(DeadlineExceededError("deadline passed"))
+
+    def test_wrapped_errors_use_their_cause(self):
+        """Test that wrapper exceptions are classified by the error they wrap."""
+        try:
+            try:
+                raise HTTPStatusError(403, "denied")
+            except HTTPStatusError as e:
+                raise AIServiceError(f"Failed to generate summary: {e}")
+        except AIServiceError as wrapped:
+            assert not _is_retryable_error(wrapped)
+
+    def test_untyped_errors_fall_back_to_message(self):
+        """Test that plain exceptions are still classified by their message."""
+        assert _is_retryable_error(Exception("503 Service Unavailable"))
+        assert not _is_retryable_error(Exception("401 Unauthorized"))
+
+
+class TestServiceDeadlines:
+    """Test services under an expired deadline."""
+
+    def test_ai_call_is_not_sent_after_deadline(self):
+        """Test that no model request is made once the request has run out of time."""
+        news_service = NewsService()
+        chain = Mock()
+
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                news_service._invoke_rate_limited(chain, {})
+
+        chain.invoke.assert_not_called()
+
+    def test_extractor_stops_downloading(self):
+        """Test that extraction gives up without touching the host's circuit."""
+        extractor = ArticleExtractor()
+
+        with patch.object(extractor, '_extract_full_article') as mock_extract:
+            with deadline_scope(0.1):
+                assert extractor.extract_full_article("https://example.com/late") is None
+
+        mock_extract.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
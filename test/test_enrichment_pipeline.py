@@ -0,0 +1,186 @@
+"""
+Tests for the single-pass article enrichment pipeline.
+
+This module tests:
+- Stages only running for missing requested fields
+- One summary+sentiment AI call per article through search_news and the routes
+- Per-article fallbacks when the summary stage fails
+- /search, /search_news and /load_more using the pipeline
+"""
+
+import json
+import uuid
+import pytest
+from unittest.mock import Mock, patch
+from enrichment_pipeline import ArticleEnrichmentPipeline, SEARCH_FIELDS, TOPIC_FIELDS
+from news_service import NewsService
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+class TestArticleEnrichmentPipeline:
+    """Test class for ArticleEnrichmentPipeline stages."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = Mock()
+        self.news_service.generate_summary_with_sentiment.return_value = {
+            'summary': 'AI summary.', 'sentiment': 'positive', 'language': 'hi'
+        }
+        self.pipeline = ArticleEnrichmentPipeline(self.news_service)
+
+    def test_summary_stage_skipped_when_sentiment_present(self):
+        """Test that articles enriched by search_news are not summarized again."""
+        articles = [{'title': 'A', 'body': LONG_BODY, 'summary': 'Existing.', 'sentiment': 'negative'}]
+
+        self.pipeline.enrich(articles, 'hi', SEARCH_FIELDS, topic='tech')
+
+        self.news_service.generate_summary_with_sentiment.assert_not_called()
+        assert articles[0]['summary'] == 'Existing.'
+        assert articles[0]['language'] == 'hi'
+        assert articles[0]['topic'] == 'tech'
+
+    def test_each_stage_runs_once_per_article(self):
+        """Test that enriching twice never repeats the AI call."""
+        articles = [{'title': 'A', 'body': LONG_BODY}, {'title': 'B', 'body': LONG_BODY}]
+
+        self.pipeline.enrich(articles, 'hi', TOPIC_FIELDS, topic='tech')
+        self.pipeline.enrich(articles, 'hi', TOPIC_FIELDS, topic='tech')
+
+        assert self.news_service.generate_summary_with_sentiment.call_count == 2
+        assert articles[0]['sentiment'] == 'positive'
+        assert articles[0]['summary_language'] == 'hi'
+
+    def test_unrequested_stages_do_not_run(self):
+        """Test that callers only pay for the fields they ask for."""
+        articles = [{'title': 'A', 'body': LONG_BODY}]
+
+        self.pipeline.enrich(articles, 'en', ('language', 'topic'), topic='tech')
+
+        self.news_service.generate_summary_with_sentiment.assert_not_called()
+        assert articles[0]['language'] == 'en'
+
+    def test_summary_stage_failure_falls_back(self):
+        """Test that a failing summary stage keeps the article with neutral sentiment."""
+        self.news_service.generate_summary_with_sentiment.side_effect = Exception("API Error")
+        articles = [{'title': 'A', 'body': LONG_BODY}]
+
+        self.pipeline.enrich(articles, 'en', SEARCH_FIELDS)
+
+        assert articles[0]['sentiment'] == 'neutral'
+        assert articles[0]['summary'] == LONG_BODY[:200]
+
+    def test_select_projects_requested_fields(self):
+        """Test that select returns exactly the requested fields with defaults."""
+        selected = ArticleEnrichmentPipeline.select({'url': 'http://example.com', 'body': LONG_BODY})
+
+        assert set(selected) == set(SEARCH_FIELDS)
+        assert selected['title'] == 'No title'
+        assert selected['sentiment'] == 'neutral'
+
+
+class TestSinglePassSearch:
+    """Test that search results reach the client with one AI call per article."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        # Fixture articles share one body; deduplication has its own tests
+        self.news_service.deduplicator = None
+        self.results = [{'title': f'Article {i}', 'url': f'http://example.com/{i}', 'body': LONG_BODY}
+                        for i in range(3)]
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    def test_search_news_sets_sentiment(self):
+        """Test that search_news fills summary and sentiment from one combined call."""
+        result = {'summary': 'Combined.', 'sentiment': 'positive', 'language': 'en'}
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=self.results):
+            with patch.object(self.news_service, 'generate_summary_with_sentiment', return_value=result) as mock_combined:
+                with patch.object(self.news_service, 'generate_summary') as mock_summary:
+                    articles = ArticleEnrichmentPipeline(self.news_service).search("technology", 3, 'en')
+
+        assert mock_combined.call_count == 3
+        mock_summary.assert_not_called()
+        assert all(a['sentiment'] == 'positive' and a['summary'] == 'Combined.' for a in articles)
+
+    @patch('news_service.Config.BATCH_SUMMARY_ENABLED', False)
+    def test_search_route_single_call_per_article(self):
+        """Test that /search no longer re-summarizes articles from search_news."""
+        from app import app
+        import routes
+        app.config['TESTING'] = True
+        result = {'summary': 'Combined.', 'sentiment': 'negative', 'language': 'en'}
+
+        with patch.object(routes.news_service.ddgs, 'news', return_value=self.results):
+            with patch.object(routes.news_service, 'deduplicator', None):
+                with patch.object(routes.news_service, 'generate_summary_with_sentiment', return_value=result) as mock_combined:
+                    with app.test_client() as client:
+                        response = client.post('/search', json={'query': 'single pass test', 'max_results': 3})
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert [a['sentiment'] for a in data['articles']] == ['negative'] * 3
+        assert mock_combined.call_count == 3
+
+
+class TestPipelineRoutes:
+    """Test the topic routes asking the pipeline for their fields."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with a conversation session."""
+        from app import app, db
+        from models import ConversationSession
+        app.config['TESTING'] = True
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+
+        with app.test_client() as client:
+            with app.app_context():
+                db.create_all()
+                self.session_id = str(uuid.uuid4())
+                db.session.add(ConversationSession(session_id=self.session_id, topics='["technology"]'))
+                db.session.commit()
+                with client.session_transaction() as sess:
+                    sess['session_id'] = self.session_id
+                    sess['preferred_language'] = 'mr'
+                yield client
+                db.drop_all()
+
+    def test_search_news_enriches_missing_sentiment(self, client):
+        """Test that /search_news fills sentiment for articles that lack it."""
+        articles = {'technology': [{'title': 'A', 'url': 'http://example.com', 'body': LONG_BODY}]}
+        result = {'summary': 'सारांश', 'sentiment': 'positive', 'language': 'mr'}
+
+        with patch('routes.news_service.search_multiple_topics', return_value=articles):
+            with patch('routes.news_service.generate_summary_with_sentiment', return_value=result) as mock_combined:
+                response = client.post('/search_news', json={'language': 'mr'})
+
+        assert response.status_code == 200
+        article = json.loads(response.data)['results']['technology'][0]
+        assert article['sentiment'] == 'positive'
+        assert article['summary_language'] == 'mr'
+        mock_combined.assert_called_once()
+
+    def test_load_more_uses_session_language(self, client):
+        """Test that /load_more pages in the session language through the pipeline."""
+        articles = [{'title': 'A', 'url': 'http://example.com', 'body': LONG_BODY,
+                     'summary': 'S', 'sentiment': 'neutral'}]
+
+        with patch('routes.news_service.search_page', return_value=(articles, 'next')) as mock_page:
+            with patch('routes.news_service.generate_summary_with_sentiment') as mock_combined:
+                response = client.get('/load_more/technology?cursor=abc')
+
+        assert response.status_code == 200
+        mock_page.assert_called_once_with('technology', 5, 'mr', session_id=self.session_id,
+                                          cursor='abc', exclude_urls=set())
+        mock_combined.assert_not_called()
+        data = json.loads(response.data)
+        assert data['articles'][0]['language'] == 'mr'
+        assert data['next_cursor'] == 'next' and data['has_more'] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,181 @@
+"""
+Tests for the persistent extracted-article cache.
+
+This module tests:
+- Cache keys shared by links with click-tracking parameters and fragments, but not by page variants
+- Compressed entries with their ETag/Last-Modified validators
+- Least recently read entries evicted above the size cap
+- Repeat opens served without downloading, and conditional revalidation once stale
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from extraction_cache import ExtractionCache
+
+
+PARAGRAPH = ("Heavy rain closed schools across the district on Tuesday as rivers rose above the danger "
+             "mark, and officials moved families from low-lying villages to relief camps.")
+
+PAGE = f"""<html><head><title>Schools shut by floods</title></head>
+<body><article><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></article></body></html>"""
+
+
+def make_page(html=PAGE, etag='"v1"', last_modified='Tue, 14 Oct 2026 08:00:00 GMT'):
+    """Build a page as PageFetcher.fetch_page returns it."""
+    return {'not_modified': html is None, 'html': html, 'etag': etag, 'last_modified': last_modified}
+
+
+class TestExtractionCache:
+    """Test class for ExtractionCache."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.cache = ExtractionCache(ttl=60)
+
+    def test_links_share_entry_without_tracking(self):
+        """Test that fragments, click-tracking parameters and host case share one entry."""
+        self.cache.set("HTTPS://www.News.Example.com/story?utm_source=x&b=2&a=1&fbclid=abc#top", {'content': 'Text'})
+
+        assert self.cache.get("https://www.news.example.com/story?b=2&a=1")['content'] == 'Text'
+        assert self.cache.get_stats()['entries'] == 1
+
+    def test_page_variants_keep_their_own_entries(self):
+        """Test that mobile, AMP, plain-http and ref/source variants are not served each other's page."""
+        self.cache.set("https://www.example.com/story", {'content': 'Desktop'})
+
+        for variant in ("https://m.example.com/story", "https://amp.example.com/story",
+                        "https://www.example.com/story/amp", "http://www.example.com/story",
+                        "https://www.example.com/story?source=rss", "https://www.example.com/story?ref=home"):
+            assert self.cache.get(variant) is None, variant
+
+    def test_round_trip_with_validators(self):
+        """Test that entries come back with their validators and are stored compressed."""
+        self.cache.set("https://example.com/a?utm_medium=rss", {'content': PARAGRAPH * 20}, etag='"v1"')
+
+        entry = self.cache.get("https://example.com/a")
+
+        assert entry['content'] == PARAGRAPH * 20
+        assert entry['etag'] == '"v1"' and entry['last_modified'] is None
+        assert entry['fresh']
+        stats = self.cache.get_stats()
+        assert stats['hits'] == 1 and stats['entries'] == 1
+        assert stats['bytes'] < len(PARAGRAPH * 20) / 4
+
+    def test_entries_go_stale_and_revalidate(self):
+        """Test that entries past the TTL are stale until revalidated."""
+        cache = ExtractionCache(ttl=0.05)
+        cache.set("https://example.com/a", {'content': 'Text'})
+        time.sleep(0.1)
+
+        assert cache.get("https://example.com/a")['fresh'] is False
+        cache.revalidate("https://example.com/a")
+        assert cache.get("https://example.com/a")['fresh'] is True
+        assert cache.get_stats()['stale'] == 1
+
+    def test_least_recently_read_evicted(self):
+        """Test that the size cap evicts the entries read longest ago."""
+        cache = ExtractionCache()
+        cache.EVICTION_INTERVAL = 1
+        for name in ('a', 'b', 'c'):
+            cache.set(f"https://example.com/{name}", {'content': os.urandom(500).hex()})
+            time.sleep(0.01)
+        # Room for three entries, so the fourth evicts one
+        cache.max_bytes = cache.get_stats()['bytes'] + 100
+        cache.get("https://example.com/a")
+        cache.set("https://example.com/d", {'content': os.urandom(500).hex()})
+
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/d") is not None
+        assert cache.get_stats()['evictions'] >= 1
+
+
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', False)
+class TestCachedExtraction:
+    """Test ArticleExtractor reading through the cache."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.fetcher = Mock()
+        self.fetcher.fetch_page.return_value = make_page()
+        self.extractor = ArticleExtractor(fetcher=self.fetcher)
+
+    def test_repeat_opens_skip_download(self):
+        """Test that a second open of the same article needs no download or parsing."""
+        url = "https://example.com/floods"
+        first = self.extractor.get_readable_article(url)
+
+        with patch.object(self.extractor, '_extract_page') as mock_extract:
+            second = self.extractor.get_readable_article(url + "?utm_source=share")
+
+        assert first == second and first['formatted']
+        assert self.fetcher.fetch_page.call_count == 1
+        mock_extract.assert_not_called()
+
+    def test_metadata_comes_from_the_same_download(self):
+        """Test that metadata is cached by the extraction that downloaded the page."""
+        url = "https://example.com/floods"
+        self.extractor.extract_full_article(url)
+
+        metadata = self.extractor.get_article_metadata(url)
+
+        assert metadata['title'] == "Schools shut by floods"
+        assert self.fetcher.fetch_page.call_count == 1
+
+    def test_failed_extraction_is_not_downloaded_again(self):
+        """Test that metadata of a page the extraction could not download is an error, not a second download."""
+        self.fetcher.fetch_page.return_value = None
+        self.fetcher.fetch.return_value = PAGE
+
+        metadata = self.extractor.get_article_metadata("https://example.com/floods")
+
+        assert metadata['title'] == "Error extracting title"
+        assert self.fetcher.fetch_page.call_count == 1
+        self.fetcher.fetch.assert_not_called()
+
+    def test_stale_entry_revalidated_when_not_modified(self):
+        """Test that a stale entry is requested conditionally and reused on 304."""
+        url = "https://example.com/floods"
+        self.extractor.extraction_cache.ttl = 0
+        text = self.extractor.extract_full_article(url)
+        self.fetcher.fetch_page.return_value = make_page(html=None)
+
+        with patch.object(self.extractor, '_extract_page') as mock_extract:
+            assert self.extractor.extract_full_article(url) == text
+
+        assert self.fetcher.fetch_page.call_args.kwargs == {'etag': '"v1"',
+                                                            'last_modified': 'Tue, 14 Oct 2026 08:00:00 GMT'}
+        mock_extract.assert_not_called()
+        assert self.extractor.get_cache_stats()['revalidated'] == 1
+
+    def test_changed_page_is_extracted_again(self):
+        """Test that a stale entry is replaced when the page changed."""
+        url = "https://example.com/floods"
+        self.extractor.extraction_cache.ttl = 0
+        self.extractor.extract_full_article(url)
+        updated = PAGE.replace("Tuesday", "Wednesday")
+        self.fetcher.fetch_page.return_value = make_page(html=updated, etag='"v2"')
+
+        text = self.extractor.extract_full_article(url)
+
+        assert "Wednesday" in text
+        assert self.extractor.extraction_cache.get(url)['etag'] == '"v2"'
+
+    @patch('article_extractor.Config.ARTICLE_CACHE_ENABLED', False)
+    def test_disabled_cache_downloads_every_time(self):
+        """Test that every open downloads the page when the cache is off."""
+        extractor = ArticleExtractor(fetcher=self.fetcher)
+
+        extractor.extract_full_article("https://example.com/floods")
+        extractor.extract_full_article("https://example.com/floods")
+
+        assert self.fetcher.fetch_page.call_count == 2
+        assert self.fetcher.fetch_page.call_args.kwargs == {'etag': None, 'last_modified': None}
+        assert extractor.get_cache_stats() == {'enabled': False}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
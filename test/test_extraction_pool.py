@@ -0,0 +1,187 @@
+"""
+Tests for the article parsing process pool.
+
+This module tests:
+- Parsing run in worker processes rather than the request thread
+- Per-task timeouts replacing only the stuck worker, not counting worker start-up
+- Workers started ahead of the first task by warm-up
+- Tasks retried in a new worker after a crash, and parsing in-process when the pool is disabled
+- Parse functions importable in workers without loading the web application
+- ArticleExtractor parsing downloaded pages through the pool
+"""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from article_parser import extract_page
+from deadline import deadline_scope
+from extraction_pool import ExtractionPool, WorkerCrashed
+
+
+PARAGRAPH = ("The city council approved a plan on Friday to add two hundred electric buses to its fleet "
+             "over the next three years, replacing the oldest diesel vehicles first.")
+
+PAGE = f"<html><body><article><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></article></body></html>"
+
+
+def crash_in_worker():
+    """Kill the worker process running it, but not the test process."""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return "parsed in-process"
+
+
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', True)
+class TestExtractionPool:
+    """Test class for ExtractionPool."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.pool = ExtractionPool(max_workers=1, timeout=20, max_tasks_per_child=10)
+
+    def teardown_method(self):
+        """Stop the worker processes."""
+        self.pool.shutdown()
+
+    def test_tasks_run_in_worker_process(self):
+        """Test that work runs in another process and its result comes back."""
+        assert self.pool.run(os.getpid) != os.getpid()
+
+        text, _ = self.pool.run(extract_page, "https://example.com/buses", PAGE)
+
+        assert PARAGRAPH in text
+        stats = self.pool.get_stats()
+        assert stats['tasks'] == 2 and stats['inline'] == 0 and stats['running']
+
+    def test_stuck_task_times_out_and_worker_is_replaced(self):
+        """Test that a task past the deadline is given up and its worker replaced."""
+        self.pool.run(os.getpid)
+
+        with deadline_scope(0.5):
+            with pytest.raises(TimeoutError):
+                self.pool.run(time.sleep, 30)
+
+        assert self.pool.run(os.getpid) != os.getpid()
+        stats = self.pool.get_stats()
+        assert stats['timeouts'] == 1 and stats['restarts'] == 1
+
+    def test_start_up_is_not_charged_to_the_task(self):
+        """Test that a task may take its whole timeout after its worker started and imported its modules."""
+        pool = ExtractionPool(max_workers=1, timeout=2, preload=('article_parser',))
+
+        try:
+            started = time.monotonic()
+            assert pool.run(time.sleep, 1.5) is None
+        finally:
+            pool.shutdown()
+
+        assert time.monotonic() - started > 1.5
+        assert pool.get_stats()['timeouts'] == 0
+
+    def test_warm_up_starts_workers(self):
+        """Test that warm-up starts every worker without running a task."""
+        pool = ExtractionPool(max_workers=2, timeout=20)
+
+        try:
+            pool.warm_up()
+            for _ in range(100):
+                stats = pool.get_stats()
+                if stats['running'] and stats['busy'] == 0:
+                    break
+                time.sleep(0.1)
+            assert pool.run(os.getpid) != os.getpid()
+        finally:
+            pool.shutdown()
+
+        assert stats['running'] and stats['tasks'] == 0
+
+    def test_timeout_spares_other_workers(self):
+        """Test that one stuck task does not take down a task running in another worker."""
+        pool = ExtractionPool(max_workers=2, timeout=20)
+        outcome = {}
+        pool.run(os.getpid)
+
+        def slow_task():
+            outcome['result'] = pool.run(time.sleep, 1)
+
+        try:
+            other = threading.Thread(target=slow_task)
+            other.start()
+            with deadline_scope(0.3):
+                with pytest.raises(TimeoutError):
+                    pool.run(time.sleep, 30)
+            other.join()
+        finally:
+            pool.shutdown()
+
+        assert outcome == {'result': None}
+        stats = pool.get_stats()
+        assert stats['restarts'] == 1 and stats['inline'] == 0
+
+    def test_crashed_task_is_retried_in_a_new_worker(self):
+        """Test that a crash is retried once in a new worker, never in-process."""
+        with pytest.raises(WorkerCrashed):
+            self.pool.run(crash_in_worker)
+
+        assert self.pool.run(os.getpid) != os.getpid()
+        stats = self.pool.get_stats()
+        assert stats['retries'] == 1 and stats['restarts'] == 2 and stats['inline'] == 0
+
+    def test_parser_does_not_load_the_app(self):
+        """Test that workers importing the parse functions do not import the web application."""
+        # Spawned workers also re-import the __main__ module, e.g. main.py
+        check = ("import sys, article_parser, main; "
+                 "print(sorted({'app', 'routes', 'news_service', 'article_extractor', 'flask'} & set(sys.modules)))")
+
+        result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, timeout=60,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert result.stdout.strip() == "[]"
+
+    def test_disabled_runs_in_process(self):
+        """Test that nothing is sent to workers when the pool is off."""
+        with patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', False):
+            assert self.pool.run(os.getpid) == os.getpid()
+
+        stats = self.pool.get_stats()
+        assert stats['inline'] == 1 and not stats['running']
+
+
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', True)
+@patch('article_extractor.Config.ARTICLE_CACHE_ENABLED', False)
+class TestPooledExtraction:
+    """Test ArticleExtractor parsing through the pool."""
+
+    def test_extractor_parses_in_pool(self):
+        """Test that the request thread downloads and the pool parses."""
+        fetcher = Mock()
+        fetcher.fetch_page.return_value = {'not_modified': False, 'html': PAGE, 'etag': None, 'last_modified': None}
+        extractor = ArticleExtractor(fetcher=fetcher)
+        extractor.extraction_pool = ExtractionPool(max_workers=1, timeout=20)
+
+        try:
+            text = extractor.extract_full_article("https://example.com/buses")
+        finally:
+            extractor.extraction_pool.shutdown()
+
+        assert PARAGRAPH in text
+        assert extractor.extraction_pool.get_stats()['tasks'] == 1
+
+    def test_parse_timeout_gives_no_article(self):
+        """Test that a page that cannot be parsed in time counts as not extracted."""
+        extractor = ArticleExtractor(fetcher=Mock())
+        extractor.fetcher.fetch_page.return_value = {'not_modified': False, 'html': PAGE,
+                                                     'etag': None, 'last_modified': None}
+
+        with patch.object(extractor.extraction_pool, 'run', side_effect=TimeoutError("Article parsing timed out")):
+            assert extractor._extract_full_article("https://example.com/buses") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,176 @@
+"""
+Tests for racing article extraction strategies.
+
+This module tests:
+- Quality scores from text length, paragraph count and noise
+- Strategy failures scored as empty extractions
+- Races ending at the first confident result, or keeping the best one
+- Races in worker processes bounded by the slowest strategy and the timeout
+- Sequential extraction when too few workers are free to race
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from article_parser import run_strategy, score_extraction
+from deadline import deadline_scope
+from extraction_pool import ExtractionPool
+
+
+SENTENCES = [
+    "The monsoon arrived in Kerala three days ahead of schedule on Thursday, the weather office said.",
+    "Farmers across the southern states had been waiting for the rains to begin sowing rice and pulses.",
+    "Officials expect the rains to cover Maharashtra by the second week of June if conditions hold.",
+    "Reservoir levels in several states had fallen below a quarter of capacity during the summer heat.",
+    "The forecast also warned of heavy rainfall in coastal districts over the coming weekend.",
+    "Fishermen have been advised not to venture into the sea until the warning is lifted next week.",
+]
+
+ARTICLE = "\n\n".join(f"{sentence} {sentence} {sentence}" for sentence in SENTENCES)
+
+PAGE = "<html><body><article>" + "".join(f"<p>{paragraph}</p>" for paragraph in ARTICLE.split("\n\n")) + \
+    "</article></body></html>"
+
+
+def fixed_strategy(text, metadata=None):
+    """Build a strategy returning fixed text."""
+    return Mock(return_value=(text, metadata))
+
+
+class TestScoring:
+    """Test class for extraction scores."""
+
+    def test_short_text_scores_zero(self):
+        """Test that extractions of 100 characters or less are worthless."""
+        assert score_extraction("Too short", "Too short") == 0.0
+        assert score_extraction(None, None) == 0.0
+
+    def test_full_article_scores_high(self):
+        """Test that a long, clean, multi-paragraph text is confident."""
+        assert score_extraction(ARTICLE, ARTICLE) >= 0.8
+
+    def test_noise_lowers_the_score(self):
+        """Test that raw text full of navigation and ads scores lower than clean text."""
+        text = SENTENCES[0] * 3
+        noisy = "\n".join([text, "Home", "Subscribe to our newsletter", "Follow us on Twitter", "Share this"])
+
+        assert score_extraction(noisy, text) < score_extraction(text, text)
+
+    def test_failed_strategy_scores_zero(self):
+        """Test that an exception in a strategy gives an empty, zero scored result."""
+        with patch.dict('article_parser.STRATEGIES', {'newspaper3k': Mock(side_effect=ValueError("bad html"))}):
+            result = run_strategy('newspaper3k', "https://example.com/a", PAGE)
+
+        assert result == {'strategy': 'newspaper3k', 'text': None, 'score': 0.0, 'metadata': None}
+
+
+@patch('article_extractor.Config.EXTRACTION_RACE_ENABLED', True)
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', False)
+class TestRaceInProcess:
+    """Test raced extraction without worker processes."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.extractor = ArticleExtractor(fetcher=Mock())
+
+    def test_confident_result_stops_the_race(self):
+        """Test that a confident first strategy makes the others unnecessary."""
+        trafilatura = fixed_strategy(ARTICLE)
+        strategies = {'newspaper3k': fixed_strategy(ARTICLE, {'title': 'Monsoon arrives'}),
+                      'trafilatura': trafilatura, 'beautifulsoup': fixed_strategy(ARTICLE)}
+
+        with patch.dict('article_parser.STRATEGIES', strategies):
+            text, metadata = self.extractor._extract_page("https://example.com/a", PAGE)
+
+        assert SENTENCES[0] in text
+        assert metadata == {'title': 'Monsoon arrives'}
+        trafilatura.assert_not_called()
+        stats = self.extractor.get_race_stats()
+        assert stats['wins'] == {'newspaper3k': 1} and stats['early'] == 1
+
+    def test_best_result_wins_without_confidence(self):
+        """Test that the best scoring text is used when none is confident."""
+        short = "\n\n".join(SENTENCES[:2])
+        longer = "\n\n".join(SENTENCES[:4])
+        strategies = {'newspaper3k': fixed_strategy(""), 'trafilatura': fixed_strategy(short),
+                      'beautifulsoup': fixed_strategy(longer)}
+
+        with patch.dict('article_parser.STRATEGIES', strategies):
+            text, _ = self.extractor._extract_page("https://example.com/a", PAGE)
+
+        assert SENTENCES[3] in text
+        assert self.extractor.get_race_stats()['wins'] == {'beautifulsoup': 1}
+
+    def test_nothing_extracted(self):
+        """Test that a race where every strategy finds too little extracts nothing."""
+        with patch.dict('article_parser.STRATEGIES', {name: fixed_strategy("Menu") for name in
+                                                          ('newspaper3k', 'trafilatura', 'beautifulsoup')}):
+            assert self.extractor._extract_page("https://example.com/a", PAGE) == (None, None)
+        assert self.extractor.get_race_stats()['no_content'] == 1
+
+    def test_too_few_workers_extracts_sequentially(self):
+        """Test that a race the pool cannot staff falls back to trying strategies in turn."""
+        with patch.object(self.extractor.extraction_pool, 'race', return_value=None):
+            text, _ = self.extractor._extract_page("https://example.com/a", PAGE)
+
+        assert SENTENCES[0] in text
+        stats = self.extractor.get_race_stats()
+        assert stats['skipped'] == 1 and stats['races'] == 0
+
+
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', True)
+class TestRaceInPool:
+    """Test races in worker processes."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.pool = ExtractionPool(max_workers=3, timeout=20)
+
+    def teardown_method(self):
+        """Stop the worker processes."""
+        self.pool.shutdown()
+
+    def test_race_ends_at_first_accepted_result(self):
+        """Test that a fast acceptable result does not wait for a slow task."""
+        self.pool.run(os.getpid)
+        started = time.monotonic()
+
+        results = self.pool.race([(time.sleep, (5,)), (os.getpid, ())], accept=lambda result: result is not None)
+
+        assert time.monotonic() - started < 4
+        assert results[-1] != os.getpid()
+
+    def test_timeout_keeps_finished_results(self):
+        """Test that the results finished in time are returned when the timeout passes."""
+        with deadline_scope(1):
+            results = self.pool.race([(time.sleep, (30,)), (os.getpid, ())], accept=lambda result: False)
+
+        assert len(results) == 1
+        stats = self.pool.get_stats()
+        assert stats['timeouts'] == 1 and stats['restarts'] == 1
+        assert stats['running'] and stats['busy'] == 0
+
+    def test_race_needs_a_free_worker_per_task(self):
+        """Test that losers still running keep their workers, so the next race is not started."""
+        first = self.pool.race([(time.sleep, (2,)), (time.sleep, (2,)), (os.getpid, ())],
+                               accept=lambda result: result is not None)
+
+        assert self.pool.race([(os.getpid, ()), (os.getpid, ())], accept=lambda result: True) is None
+        assert len(first) == 1 and self.pool.get_stats()['busy'] == 2
+
+    @patch('article_extractor.Config.EXTRACTION_RACE_ENABLED', True)
+    def test_extractor_races_in_pool(self):
+        """Test that a raced extraction of a real page picks a confident strategy."""
+        extractor = ArticleExtractor(fetcher=Mock())
+        extractor.extraction_pool = self.pool
+
+        text, _ = extractor._extract_page("https://example.com/monsoon", PAGE)
+
+        assert SENTENCES[-1] in text
+        assert sum(extractor.get_race_stats()['wins'].values()) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,134 @@
+"""
+Tests for the local extractive summarizer and summary modes.
+
+This module tests:
+- Sentence segmentation with abbreviations, quotes and the Devanagari danda
+- TextRank selection of central sentences in original order
+- Length and sentence limits
+- SUMMARY_MODE local/llm/auto in NewsService
+"""
+
+import pytest
+from unittest.mock import patch
+from extractive_summarizer import ExtractiveSummarizer
+from error_handler import FallbackManager
+from news_service import NewsService
+
+
+ENGLISH_ARTICLE = (
+    "The central bank raised interest rates on Tuesday to fight inflation. "
+    "Inflation has stayed above the bank's target for two years. "
+    "The weather in the capital was sunny. "
+    "Higher interest rates are expected to slow borrowing and cool inflation over the next year. "
+    "A local football club played its match. "
+    "The bank said further rate rises remain possible if inflation does not ease."
+)
+
+HINDI_ARTICLE = (
+    "सरकार ने नई शिक्षा नीति की घोषणा की। इस नीति से छात्रों को लाभ होगा। मौसम आज साफ रहा। "
+    "शिक्षा नीति में शिक्षकों के प्रशिक्षण पर ज़ोर है। शिक्षा मंत्री ने नीति को ऐतिहासिक बताया। "
+    "बाज़ार में सब्ज़ियों के दाम स्थिर रहे।"
+)
+
+
+class TestExtractiveSummarizer:
+    """Test class for ExtractiveSummarizer."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.summarizer = ExtractiveSummarizer()
+
+    def test_split_sentences_handles_abbreviations_and_quotes(self):
+        """Test that abbreviations do not end sentences and quotes stay attached."""
+        sentences = ExtractiveSummarizer.split_sentences('Dr. Rao met U.S. officials. "We agreed." Next steps?')
+
+        assert sentences == ['Dr. Rao met U.S. officials.', '"We agreed."', 'Next steps?']
+
+    def test_split_sentences_on_danda(self):
+        """Test Devanagari sentence boundaries with and without following spaces."""
+        sentences = ExtractiveSummarizer.split_sentences("भारत ने मैच जीता। खिलाड़ी खुश हैं।टीम लौटेगी॥ अंत")
+
+        assert sentences == ['भारत ने मैच जीता।', 'खिलाड़ी खुश हैं।', 'टीम लौटेगी॥', 'अंत']
+
+    def test_summary_keeps_central_sentences_in_order(self):
+        """Test that off-topic sentences are dropped and order is preserved."""
+        summary = self.summarizer.summarize(ENGLISH_ARTICLE, 'en', max_sentences=3)
+
+        assert 'weather' not in summary
+        assert 'football' not in summary
+        assert summary.startswith("The central bank raised interest rates")
+        sentences = ExtractiveSummarizer.split_sentences(summary)
+        assert len(sentences) == 3
+        assert [ENGLISH_ARTICLE.index(s) for s in sentences] == sorted(ENGLISH_ARTICLE.index(s) for s in sentences)
+
+    def test_hindi_summary(self):
+        """Test extractive summaries of Hindi text."""
+        summary = self.summarizer.summarize(HINDI_ARTICLE, 'hi', max_sentences=2)
+
+        assert 'मौसम' not in summary
+        assert summary.count('।') == 2
+
+    def test_short_text_returned_unchanged(self):
+        """Test that text within the limits is returned as is."""
+        assert self.summarizer.summarize("One sentence only.", 'en') == "One sentence only."
+        assert self.summarizer.summarize("", 'en') == "No content available for summary."
+
+    def test_max_length_respected(self):
+        """Test that summaries stay within the character limit."""
+        summary = self.summarizer.summarize(ENGLISH_ARTICLE, 'en', max_sentences=5, max_length=150)
+
+        assert len(summary) <= 150
+
+    def test_unsplittable_text_is_truncated(self):
+        """Test text without sentence boundaries falls back to truncation."""
+        summary = self.summarizer.summarize("A" * 500, 'en', max_length=100)
+
+        assert summary == "A" * 100 + "..."
+
+    def test_fallback_summary_respects_danda(self):
+        """Test that the lead-sentence fallback splits Devanagari sentences."""
+        summary = FallbackManager.create_fallback_summary(HINDI_ARTICLE, max_length=100)
+
+        assert summary == "सरकार ने नई शिक्षा नीति की घोषणा की। इस नीति से छात्रों को लाभ होगा।"
+
+
+class TestSummaryModes:
+    """Test SUMMARY_MODE handling in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.summary_cache = None
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    @patch('news_service.Config.SUMMARY_MODE', 'local')
+    def test_local_mode_never_calls_ai(self):
+        """Test that local mode summarizes without the AI."""
+        with patch.object(self.news_service, '_generate_summary_with_sentiment_for_language') as mock_ai:
+            result = self.news_service.generate_summary_with_sentiment(ENGLISH_ARTICLE, "Rates", 'en')
+
+        mock_ai.assert_not_called()
+        assert 'weather' not in result['summary']
+        assert result['language'] == 'en'
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    @patch('news_service.Config.SUMMARY_MODE', 'auto')
+    def test_auto_mode_uses_extractive_fallback(self):
+        """Test that auto mode falls back to extractive summaries when the AI fails."""
+        with patch.object(self.news_service, '_generate_summary_with_sentiment_for_language',
+                          side_effect=Exception("429 quota exceeded")):
+            result = self.news_service.generate_summary_with_sentiment(ENGLISH_ARTICLE, "Rates", 'en')
+
+        assert result['summary'] == self.news_service.extractive_summarizer.summarize(ENGLISH_ARTICLE, 'en')
+
+    @patch('news_service.Config.USE_AI_SUMMARY', False)
+    @patch('news_service.Config.SUMMARY_MODE', 'llm')
+    def test_llm_mode_keeps_lead_sentence_fallback(self):
+        """Test that llm mode keeps the original fallback summary."""
+        result = self.news_service.generate_summary(ENGLISH_ARTICLE, "Rates", 'en')
+
+        assert result == FallbackManager.create_fallback_summary(ENGLISH_ARTICLE)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
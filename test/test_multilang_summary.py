@@ -117,13 +117,14 @@ class TestMultiLanguageSummaryGeneration:
                 }
             ]
             
-            with patch.object(self.news_service, 'generate_summary') as mock_summary:
-                mock_summary.return_value = "Test summary in Hindi"
+            with patch.object(self.news_service, 'generate_summary_with_sentiment') as mock_summary:
+                mock_summary.return_value = {'summary': "Test summary in Hindi", 'sentiment': 'neutral', 'language': 'hi'}
                 
                 results = self.news_service.search_news("technology", max_results=1, language='hi')
                 
                 assert len(results) == 1
                 assert results[0]['language'] == 'hi'
+                assert results[0]['summary'] == "Test summary in Hindi"
                 mock_summary.assert_called_with(
                     long_body,
                     'Test Article',
@@ -0,0 +1,181 @@
+"""
+Tests for the shared article page fetcher.
+
+This module tests:
+- Pooled sessions with compression and per-host connection limits
+- Pages decoded with the charset their HTML declares
+- Conditional requests answered 304 Not Modified
+- One download per extraction, handed to every extraction strategy
+- Metadata read from the same kind of single download
+"""
+
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from deadline import deadline_scope
+from page_fetcher import PageFetcher
+
+
+PARAGRAPH = ("The state government announced a new scheme on Monday to support farmers affected by the "
+             "delayed monsoon, with payments expected to reach bank accounts within two weeks.")
+
+PAGE = f"""<html><head><title>Relief for farmers</title></head><body>
+<nav>Home | World | Sports</nav>
+<article><h1>Relief for farmers</h1><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></article>
+<footer>Subscribe to our newsletter</footer>
+</body></html>"""
+
+
+def make_page(html=PAGE, etag=None, last_modified=None):
+    """Build a page as PageFetcher.fetch_page returns it."""
+    return {'not_modified': html is None, 'html': html, 'etag': etag, 'last_modified': last_modified}
+
+
+def make_response(body, content_type='text/html', encoding='utf-8'):
+    """Build a successful response like requests returns it."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = 'https://example.com/story'
+    response.headers['Content-Type'] = content_type
+    response._content = body.encode(encoding)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class TestPageFetcher:
+    """Test class for PageFetcher."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.fetcher = PageFetcher(timeout=5, max_per_host=2, pool_hosts=8)
+
+    def test_session_is_pooled_and_compressed(self):
+        """Test that downloads share keep-alive pools sized to the per-host limit."""
+        adapter = self.fetcher.session.get_adapter('https://example.com/story')
+
+        assert adapter._pool_maxsize == 2
+        assert adapter._pool_connections == 8
+        assert 'gzip' in self.fetcher.session.headers['Accept-Encoding']
+
+    def test_declared_charset_is_used(self):
+        """Test that a page without a charset header is decoded with the one in its HTML."""
+        body = '<html><head><meta charset="utf-8"></head><body>किसानों को राहत</body></html>'
+
+        with patch.object(self.fetcher.session, 'get', return_value=make_response(body)) as mock_get:
+            html = self.fetcher.fetch('https://example.com/story')
+
+        assert 'किसानों को राहत' in html
+        assert mock_get.call_args.kwargs['timeout'] == 5
+        assert self.fetcher.get_stats()['downloads'] == 1
+
+    def test_failed_download_returns_none(self):
+        """Test that HTTP errors are counted and give no page."""
+        response = make_response('Not found')
+        response.status_code = 404
+
+        with patch.object(self.fetcher.session, 'get', return_value=response):
+            assert self.fetcher.fetch('https://example.com/missing') is None
+        assert self.fetcher.get_stats()['failures'] == 1
+
+    def test_conditional_request(self):
+        """Test that validators are sent and a 304 answer is reported as not modified."""
+        response = make_response('')
+        response.status_code = 304
+        response.headers['ETag'] = '"v1"'
+
+        with patch.object(self.fetcher.session, 'get', return_value=response) as mock_get:
+            page = self.fetcher.fetch_page('https://example.com/story', etag='"v1"')
+
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert page == {'not_modified': True, 'html': None, 'etag': '"v1"', 'last_modified': None}
+        assert self.fetcher.get_stats()['not_modified'] == 1
+
+    def test_downloads_per_host_are_limited(self):
+        """Test that a busy host makes further downloads wait, while other hosts are not held up."""
+        fetcher = PageFetcher(timeout=5, max_per_host=1)
+        started = threading.Event()
+
+        def get(url, timeout, headers):
+            if 'busy' in url:
+                started.set()
+                time.sleep(0.3)
+            return make_response(PAGE)
+
+        with patch.object(fetcher.session, 'get', side_effect=get):
+            first = threading.Thread(target=fetcher.fetch, args=('https://busy.example/1',))
+            first.start()
+            started.wait(1)
+            with deadline_scope(0.1):
+                assert fetcher.fetch('https://busy.example/2') is None
+                assert fetcher.fetch('https://other.example/1') is not None
+            first.join()
+
+        stats = fetcher.get_stats()
+        assert stats['host_waits'] == 1
+        assert stats['downloads'] == 2
+        assert stats['hosts'] == 2
+
+    def test_host_slots_are_bounded(self):
+        """Test that per-host limits are kept only for the most recently used hosts."""
+        for i in range(300):
+            self.fetcher._host_slot(f'https://host{i}.example/story')
+
+        assert self.fetcher.get_stats()['hosts'] == 256
+        assert 'host299.example' in self.fetcher._host_slots
+        assert 'host0.example' not in self.fetcher._host_slots
+
+
+@patch('extraction_pool.Config.EXTRACTION_POOL_ENABLED', False)
+class TestSharedDownload:
+    """Test that ArticleExtractor downloads each page once."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.fetcher = Mock()
+        self.fetcher.fetch_page.return_value = make_page()
+        self.extractor = ArticleExtractor(fetcher=self.fetcher)
+
+    def test_newspaper_parses_downloaded_page(self):
+        """Test that newspaper3k extracts from the fetched HTML without downloading itself."""
+        with patch('newspaper.network.get_html_2XX_only') as mock_download:
+            text = self.extractor._extract_full_article('https://example.com/story')
+
+        assert PARAGRAPH in text
+        mock_download.assert_not_called()
+        assert self.fetcher.fetch_page.call_count == 1
+
+    def test_fallbacks_reuse_the_download(self):
+        """Test that trafilatura and BeautifulSoup get the same HTML when newspaper3k finds too little."""
+        with patch('article_parser.Article') as mock_article, \
+                patch('article_parser.trafilatura.extract', return_value=None) as mock_trafilatura:
+            mock_article.return_value.text = ""
+            text = self.extractor._extract_full_article('https://example.com/story')
+
+        assert PARAGRAPH in text
+        assert 'Home | World' not in text
+        mock_article.return_value.download.assert_called_once_with(input_html=PAGE)
+        assert mock_trafilatura.call_args.args[0] == PAGE
+        assert self.fetcher.fetch_page.call_count == 1
+
+    def test_failed_download_skips_strategies(self):
+        """Test that no strategy runs when the page could not be downloaded."""
+        self.fetcher.fetch_page.return_value = None
+
+        with patch('article_parser.Article') as mock_article:
+            assert self.extractor._extract_full_article('https://example.com/story') is None
+        mock_article.assert_not_called()
+
+    def test_metadata_uses_the_fetcher(self):
+        """Test that metadata is read from a pooled download."""
+        metadata = self.extractor.get_article_metadata('https://example.com/story')
+
+        assert metadata['title'] == "Relief for farmers"
+        assert metadata['text_length'] > 0
+        assert self.fetcher.fetch_page.call_args.args == ('https://example.com/story',)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,140 @@
+"""
+Tests for cursor pagination of "load more" results.
+
+This module tests:
+- Opaque cursors and the buffers they point to
+- Pages served from the buffered candidate window without searching again
+- The window of a session's first search picked up by its first "load more"
+- Summaries generated only for the articles of a page
+- Larger searches once the buffer runs out, and the end of the results
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from candidate_buffer import CandidateBuffer
+from news_service import NewsService
+
+
+def make_results(count):
+    """Build DuckDuckGo news results."""
+    return [{'title': f'Story {i}', 'url': f'https://example.com/{i}', 'body': f'Body of story {i}.'}
+            for i in range(count)]
+
+
+class TestCandidateBuffer:
+    """Test class for CandidateBuffer."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.buffer = CandidateBuffer()
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor leads back to its window and position."""
+        window = self.buffer.open("s1", "cricket", 'en', make_results(3), 3)
+        cursor = CandidateBuffer.encode_cursor(window, 2)
+
+        assert self.buffer.resume(cursor, "s1", "cricket", 'en') == (window, 2)
+
+    def test_latest_window_without_cursor(self):
+        """Test that a page without a cursor starts the session's latest window for the topic."""
+        window = self.buffer.open("s1", "cricket", 'en', make_results(3), 3)
+
+        assert self.buffer.resume(None, "s1", "cricket", 'en') == (window, 0)
+        assert self.buffer.resume(None, "s2", "cricket", 'en') == (None, 0)
+
+    def test_foreign_and_malformed_cursors_are_ignored(self):
+        """Test that cursors of other sessions or topics and garbage open no window."""
+        window = self.buffer.open("s1", "cricket", 'en', make_results(3), 3)
+        cursor = CandidateBuffer.encode_cursor(window, 1)
+
+        assert self.buffer.resume(cursor, "s2", "cricket", 'en') == (None, 0)
+        assert self.buffer.resume(cursor, "s1", "weather", 'en') == (None, 0)
+        assert self.buffer.resume("not a cursor!", "s1", "cricket", 'en') == (None, 0)
+        assert self.buffer.get_stats()['rejected'] == 2
+
+    def test_window_skips_buffered_candidates(self):
+        """Test that a larger search only adds candidates not buffered yet."""
+        window = self.buffer.open("s1", "cricket", 'en', make_results(3), 3)
+
+        assert window.extend(make_results(5)) == 2
+        batch, offset = window.take(2, 10)
+        assert [article['title'] for article in batch] == ['Story 2', 'Story 3', 'Story 4']
+        assert offset == 5
+
+
+@patch('news_service.Config.PAGINATION_WINDOW', 12)
+@patch('news_service.Config.PAGINATION_MAX_CANDIDATES', 24)
+class TestSearchPage:
+    """Test NewsService.search_page."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.deduplicator = None
+        self.news_service.ddgs = Mock()
+        self.news_service.ddgs.news.side_effect = lambda keywords, max_results, safesearch: make_results(
+            min(max_results, 18)
+        )
+        self.summarized = []
+
+        def summarize(articles, language, deadline=None):
+            self.summarized.extend(article['title'] for article in articles)
+            for article in articles:
+                article.update(summary='Summary', sentiment='neutral', summary_language=language)
+
+        self.news_service._summarize_articles = summarize
+
+    def titles(self, articles):
+        """Titles of a page."""
+        return [article['title'] for article in articles]
+
+    def test_pages_come_from_first_search(self):
+        """Test that load more after a first search needs no new DuckDuckGo search."""
+        first = self.news_service.search_news("Cricket", 5, 'en')
+        self.summarized.clear()
+
+        page, cursor = self.news_service.search_page("Cricket", 5, 'en', session_id="s1",
+                                                     exclude_urls={a['url'] for a in first})
+        second, _ = self.news_service.search_page("cricket", 5, 'en', session_id="s1", cursor=cursor)
+
+        assert self.titles(page) == [f'Story {i}' for i in range(5, 10)]
+        assert self.titles(second) == [f'Story {i}' for i in range(10, 15)]
+        assert self.news_service.ddgs.news.call_count == 2
+        assert self.summarized == self.titles(page) + self.titles(second)
+
+    def test_session_search_opens_the_window(self):
+        """Test that a session's first search buffers its window for load more without a cursor."""
+        first = self.news_service.search_news("Cricket", 5, 'en', session_id="s1")
+        self.news_service.search_cache = None
+
+        page, cursor = self.news_service.search_page("cricket", 5, 'en', session_id="s1",
+                                                     exclude_urls={a['url'] for a in first})
+
+        assert self.titles(page) == [f'Story {i}' for i in range(5, 10)]
+        assert self.titles(first) == [f'Story {i}' for i in range(5)]
+        assert self.news_service.ddgs.news.call_count == 1
+        assert cursor is not None
+        assert self.news_service.get_pagination_stats()['resumed'] == 1
+
+    def test_buffer_grows_then_ends(self):
+        """Test that a larger search runs only when the buffer is used up, and paging ends with no cursor."""
+        page, cursor = self.news_service.search_page("cricket", 10, 'en', session_id="s1")
+        assert self.news_service.ddgs.news.call_count == 1
+
+        page, cursor = self.news_service.search_page("cricket", 10, 'en', session_id="s1", cursor=cursor)
+
+        assert self.titles(page) == [f'Story {i}' for i in range(10, 18)]
+        assert [c.kwargs['max_results'] for c in self.news_service.ddgs.news.call_args_list] == [12, 24]
+        assert cursor is None
+        assert self.news_service.get_pagination_stats()['refills'] == 1
+
+    def test_expired_cursor_starts_over_without_repeats(self):
+        """Test that an unknown cursor opens a new window that still skips shown articles."""
+        page, _ = self.news_service.search_page("cricket", 3, 'en', session_id="s1", cursor="gone",
+                                                exclude_urls={'https://example.com/0', 'https://example.com/2'})
+
+        assert self.titles(page) == ['Story 1', 'Story 3', 'Story 4']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -338,22 +338,12 @@ class TestPerformanceOptimization:
                 if response.status_code != 200:
                     return {'success': False, 'error': 'Failed to set language'}
                 
-                # Mock news search for consistent testing
-                with patch('news_service.NewsService.search_news') as mock_search:
-                    mock_search.return_value = [{
-                        'title': f'Concurrent Test Article {request_id}',
-                        'body': 'Test content for concurrent request testing.',
-                        'url': f'https://example.com/concurrent-{request_id}',
-                        'date': '2024-01-01',
-                        'source': 'Test Source'
-                    }]
-                    
-                    # Perform search
-                    response = client.post('/search', json={
-                        'query': f'test-{request_id}',
-                        'language': lang,
-                        'max_results': 1
-                    })
+                # Perform search (news search is mocked once for all threads below)
+                response = client.post('/search', json={
+                    'query': f'test-{request_id}',
+                    'language': lang,
+                    'max_results': 1
+                })
                 
                 end_time = time.time()
                 response_time = end_time - start_time
@@ -383,7 +373,20 @@ class TestPerformanceOptimization:
                     'error': str(e)
                 }
         
-        with test_app.app_context():
+        def mock_search_news(query, max_results, language):
+            """Return one article per request, keyed by the request's query."""
+            request_id = query.split('-', 1)[1]
+            return [{
+                'title': f'Concurrent Test Article {request_id}',
+                'body': 'Test content for concurrent request testing.',
+                'url': f'https://example.com/concurrent-{request_id}',
+                'date': '2024-01-01',
+                'source': 'Test Source'
+            }]
+        
+        # Mock news search for consistent testing. Patching once outside the thread pool
+        # avoids threads restoring each other's mocks and leaking one past the test.
+        with test_app.app_context(), patch('news_service.NewsService.search_news', side_effect=mock_search_news):
             # Create concurrent requests
             with ThreadPoolExecutor(max_workers=num_concurrent_requests) as executor:
                 futures = []
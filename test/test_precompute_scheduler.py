@@ -0,0 +1,216 @@
+"""
+Tests for the popular topic precompute scheduler.
+
+This module tests:
+- Topic popularity counted once per session from sessions and shown articles
+- Seed topics filling the list while there is little history
+- Refreshes searching every popular topic in every language
+- The background thread starting and stopping
+"""
+
+import os
+import tempfile
+import time
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+from app import app, db
+from models import ConversationSession, NewsArticle
+from precompute_scheduler import PrecomputeScheduler, normalize_topic
+
+
+@pytest.fixture
+def test_app():
+    """Create a test Flask application with a temporary database."""
+    db_fd, db_path = tempfile.mkstemp()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+    os.close(db_fd)
+    os.unlink(db_path)
+
+
+def add_session(session_id, topics, updated_at=None):
+    """Store a conversation session with its collected topics."""
+    conv_session = ConversationSession(session_id=session_id, state='{}')
+    conv_session.set_topics(topics)
+    if updated_at is not None:
+        conv_session.updated_at = updated_at
+    db.session.add(conv_session)
+
+
+def add_article(session_id, topic, count=1):
+    """Store articles shown to a session for a topic."""
+    for i in range(count):
+        db.session.add(NewsArticle(title=f"{topic} {i}", url=f"https://example.com/{topic}/{i}",
+                                   topic=topic, session_id=session_id))
+
+
+class TestPopularTopics:
+    """Test class for topic popularity."""
+
+    def test_ranked_by_sessions(self, test_app):
+        """Test that topics are ranked by distinct sessions, not by article rows."""
+        add_session("s1", ["Cricket", "weather"])
+        add_session("s2", ["cricket "])
+        add_session("s3", ["elections"])
+        add_article("s1", "cricket", count=5)
+        add_article("s4", "Stock Market", count=2)
+        add_article("s5", "stock market")
+        add_article("s6", "CRICKET")
+        db.session.commit()
+
+        topics = PrecomputeScheduler(Mock(), test_app, top_n=2).popular_topics()
+
+        assert topics == ["cricket", "stock market"]
+
+    def test_old_sessions_are_ignored(self, test_app):
+        """Test that only sessions within the lookback window count."""
+        add_session("old", ["elections"], updated_at=datetime.now(timezone.utc) - timedelta(days=3))
+        add_session("new", ["weather"])
+        db.session.commit()
+
+        assert PrecomputeScheduler(Mock(), test_app, top_n=5).popular_topics() == ["weather"]
+
+    @patch('precompute_scheduler.Config.PRECOMPUTE_SEED_TOPICS', ["Cricket", "Weather", "Elections"])
+    def test_seed_topics_fill_the_list(self, test_app):
+        """Test that seed topics are added after the popular ones, without duplicates."""
+        add_session("s1", ["weather"])
+        db.session.commit()
+
+        topics = PrecomputeScheduler(Mock(), test_app, top_n=3).popular_topics()
+
+        assert topics == ["weather", "cricket", "elections"]
+
+    def test_normalize_topic(self):
+        """Test that topics are normalized like search cache queries."""
+        assert normalize_topic("  Stock   Market ") == "stock market"
+
+
+class TestPrecomputeRuns:
+    """Test refresh runs and the background thread."""
+
+    def test_run_searches_every_language(self, test_app):
+        """Test that each popular topic is searched once per language."""
+        news_service = Mock()
+        news_service.search_news.side_effect = [[{'title': 'A'}], RuntimeError("search failed"), [], [{'title': 'B'}]]
+        scheduler = PrecomputeScheduler(news_service, test_app, languages=['en', 'hi'])
+
+        with patch.object(scheduler, 'popular_topics', return_value=["cricket", "weather"]):
+            stats = scheduler.run_once()
+
+        searched = [(c.args[0], c.args[2]) for c in news_service.search_news.call_args_list]
+        assert searched == [("cricket", 'en'), ("cricket", 'hi'), ("weather", 'en'), ("weather", 'hi')]
+        assert stats['runs'] == 1 and stats['searches'] == 3 and stats['errors'] == 1
+        assert stats['articles'] == 2
+        assert stats['topics'] == ["cricket", "weather"]
+
+    def test_background_thread_refreshes(self, test_app):
+        """Test that the scheduler refreshes in the background until stopped."""
+        news_service = Mock()
+        news_service.search_news.return_value = []
+        scheduler = PrecomputeScheduler(news_service, test_app, interval=0.05, languages=['en'])
+
+        with patch.object(scheduler, 'popular_topics', return_value=["cricket"]):
+            scheduler.start()
+            time.sleep(0.2)
+            scheduler.stop(timeout=1)
+
+        assert not scheduler.get_stats()['running']
+        assert scheduler.get_stats()['runs'] >= 2
+
+    def test_one_scheduler_holds_the_lock(self, test_app):
+        """Test that a second scheduler does not start while another one holds the lock."""
+        news_service = Mock()
+        news_service.search_news.return_value = []
+        first = PrecomputeScheduler(news_service, test_app, interval=60, languages=['en'])
+        second = PrecomputeScheduler(news_service, test_app, interval=60, languages=['en'])
+
+        with patch.object(PrecomputeScheduler, 'popular_topics', return_value=["cricket"]):
+            assert first.start()
+            try:
+                assert not second.start()
+                assert not second.get_stats()['running']
+            finally:
+                first.stop(timeout=1)
+            assert second.start()
+            second.stop(timeout=1)
+
+    def test_reloader_watcher_does_not_serve(self):
+        """Test that the debug reloader's watcher process starts no background work."""
+        from app import serves_requests
+        with patch.dict(os.environ, {'NEWSFLASH_RELOADER': 'true'}):
+            os.environ.pop('WERKZEUG_RUN_MAIN', None)
+            assert not serves_requests()
+            os.environ['WERKZEUG_RUN_MAIN'] = 'true'
+            assert serves_requests()
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('NEWSFLASH_RELOADER', None)
+            assert serves_requests()
+
+    def test_every_run_refreshes_fresh_results(self, test_app):
+        """Test that each run re-searches even while cached results are still fresh."""
+        from news_service import NewsService
+        news_service = NewsService()
+        news_service.ddgs = Mock()
+        news_service.ddgs.news.return_value = [{'title': 'Match report', 'url': 'https://example.com/m',
+                                                'body': 'India won the final by six wickets. ' * 5}]
+        news_service.generate_summary_with_sentiment = Mock(
+            return_value={'summary': 'India won.', 'sentiment': 'positive', 'language': 'en'}
+        )
+        scheduler = PrecomputeScheduler(news_service, test_app, languages=['en'])
+
+        with patch.object(scheduler, 'popular_topics', return_value=["cricket"]):
+            scheduler.run_once()
+            scheduler.run_once()
+
+        assert news_service.ddgs.news.call_count == 2
+        assert news_service.get_search_cache_stats()['forced_refreshes'] == 2
+
+    def test_languages_share_the_refreshed_search(self, test_app):
+        """Test that a topic is searched once per run however many languages are refreshed."""
+        from news_service import NewsService
+        news_service = NewsService()
+        news_service.ddgs = Mock()
+        news_service.ddgs.news.return_value = [{'title': 'Match report', 'url': 'https://example.com/m',
+                                                'body': 'India won the final by six wickets. ' * 5}]
+        news_service.generate_summary_with_sentiment = Mock(
+            return_value={'summary': 'India won.', 'sentiment': 'positive', 'language': 'en'}
+        )
+        scheduler = PrecomputeScheduler(news_service, test_app, languages=['en', 'hi', 'mr'])
+
+        with patch.object(scheduler, 'popular_topics', return_value=["cricket"]):
+            stats = scheduler.run_once()
+
+        assert stats['searches'] == 3
+        assert news_service.ddgs.news.call_count == 1
+
+    def test_warms_search_cache(self, test_app):
+        """Test that a user search after a refresh is served from the search cache."""
+        from news_service import NewsService
+        news_service = NewsService()
+        news_service.ddgs = Mock()
+        news_service.ddgs.news.return_value = [{'title': 'Match report', 'url': 'https://example.com/m',
+                                                'body': 'India won the final by six wickets. ' * 5}]
+        news_service.generate_summary_with_sentiment = Mock(
+            return_value={'summary': 'India won.', 'sentiment': 'positive', 'language': 'en'}
+        )
+        scheduler = PrecomputeScheduler(news_service, test_app, languages=['en'])
+
+        with patch.object(scheduler, 'popular_topics', return_value=["cricket"]):
+            scheduler.run_once()
+        news_service.search_news("Cricket", 5, 'en')
+
+        assert news_service.ddgs.news.call_count == 1
+        assert news_service.get_search_cache_stats()['fresh_hits'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
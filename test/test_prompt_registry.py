@@ -0,0 +1,144 @@
+"""
+Tests for the prompt and chain registry.
+
+This module tests:
+- Version ids derived from template text
+- Reuse of composed chains instead of per-request composition
+- Prompt versions in AI result cache keys
+- The startup warm-up request
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from langchain_core.prompts import ChatPromptTemplate
+from config import Config
+from news_service import NewsService
+from prompt_registry import PromptRegistry, template_version
+
+
+class TestPromptRegistry:
+    """Test class for PromptRegistry."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.registry = PromptRegistry()
+        self.templates = {
+            'en': ChatPromptTemplate.from_template("Summarize: {article_text}"),
+            'hi': ChatPromptTemplate.from_template("सारांश: {article_text}"),
+        }
+        self.registry.register('summary', self.templates)
+
+    def test_version_follows_template_text(self):
+        """Test that versions change with the wording or the revision only."""
+        same = ChatPromptTemplate.from_template("Summarize: {article_text}")
+        reworded = ChatPromptTemplate.from_template("Summarize briefly: {article_text}")
+
+        assert template_version(same) == self.registry.version('summary', 'en')
+        assert template_version(reworded) != self.registry.version('summary', 'en')
+        assert template_version(same, revision="2") != template_version(same)
+        assert self.registry.version('summary', 'hi') != self.registry.version('summary', 'en')
+
+    def test_unregistered_language_uses_english(self):
+        """Test the English fallback."""
+        assert self.registry.template('summary', 'fr') is self.templates['en']
+
+        with pytest.raises(KeyError):
+            self.registry.template('unknown', 'en')
+
+    def test_chains_are_composed_once(self):
+        """Test that repeated lookups return the same chain object."""
+        model = Mock()
+
+        built = self.registry.build([(('summary',), model)])
+        first = self.registry.chain('summary', 'hi', model)
+        second = self.registry.chain('summary', 'hi', model)
+
+        assert built == 2
+        assert first is second
+        assert self.registry.get_stats()['composed'] == 2
+        assert self.registry.get_stats()['reused'] == 2
+
+    def test_new_model_gets_new_chain(self):
+        """Test that replacing the model composes a new chain."""
+        first = self.registry.chain('summary', 'en', Mock())
+        second = self.registry.chain('summary', 'en', Mock())
+
+        assert first is not second
+
+
+class TestNewsServicePrompts:
+    """Test the registry in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+
+    def test_all_tasks_are_prebuilt(self):
+        """Test that every task and language is registered and composed at startup."""
+        stats = self.news_service.get_prompt_stats()
+
+        for task in ('summary_sentiment', 'sentiment', 'batch', 'structured', 'correction'):
+            for language in ('en', 'hi', 'mr'):
+                assert f"{task}:{language}" in stats['prompts']
+        assert 'summary:en' in stats['prompts']
+        assert stats['chains'] >= 13
+
+    def test_hot_path_reuses_chains(self):
+        """Test that requests do not compose new chains."""
+        composed = self.news_service.get_prompt_stats()['composed']
+
+        for _ in range(3):
+            self.news_service.prompts.compose(self.news_service.get_sentiment_prompt_template('hi'), self.news_service.llm)
+            self.news_service.prompts.chain('summary', 'en', self.news_service.llm)
+            self.news_service.prompts.chain('structured', 'mr', self.news_service.structured_llm)
+
+        assert self.news_service.get_prompt_stats()['composed'] == composed
+
+    def test_cache_key_includes_prompt_version(self):
+        """Test that a changed prompt does not reuse results cached for the old one."""
+        key = self.news_service._summary_cache_key('summary_sentiment', "Body", "Title", 'en')
+
+        self.news_service.prompts.register('summary_sentiment', {
+            'en': ChatPromptTemplate.from_template("New wording: {title} {article_text}")
+        })
+
+        assert self.news_service._summary_cache_key('summary_sentiment', "Body", "Title", 'en') != key
+
+    def test_cache_key_covers_every_summary_prompt(self):
+        """Test that changing the structured or batch prompt, or structured output, invalidates cached results."""
+        key = self.news_service._summary_cache_key('summary_sentiment', "Body", "Title", 'en')
+
+        with patch('news_service.Config.STRUCTURED_OUTPUT_ENABLED', not Config.STRUCTURED_OUTPUT_ENABLED):
+            assert self.news_service._summary_cache_key('summary_sentiment', "Body", "Title", 'en') != key
+
+        for task in ('structured', 'batch'):
+            self.news_service.prompts.register(task, {
+                'en': ChatPromptTemplate.from_template(f"New {task} wording: {{title}} {{article_text}}")
+            })
+            changed = self.news_service._summary_cache_key('summary_sentiment', "Body", "Title", 'en')
+            assert changed != key
+            key = changed
+
+    def test_cache_key_covers_the_whole_article(self):
+        """Test that articles differing only late in the text do not share a cached result."""
+        body = "Opening paragraph of the story. " * 40
+
+        first = self.news_service._summary_cache_key('summary_sentiment', body + "The vote passed.", "Title", 'en')
+        second = self.news_service._summary_cache_key('summary_sentiment', body + "The vote failed.", "Title", 'en')
+
+        assert first != second
+
+    def test_warm_up_sends_one_request(self):
+        """Test that warm-up invokes the English chain once in the background."""
+        with patch.object(self.news_service, '_invoke_rate_limited') as mock_invoke:
+            with patch('news_service.threading.Thread') as mock_thread:
+                self.news_service.warm_up()
+                mock_thread.call_args[1]['target']()
+
+        mock_thread.return_value.start.assert_called_once()
+        mock_invoke.assert_called_once()
+        assert mock_invoke.call_args[0][0] is self.news_service.prompts.chain('sentiment', 'en', self.news_service.llm)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
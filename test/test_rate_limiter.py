@@ -0,0 +1,161 @@
+"""
+Tests for the shared token bucket rate limiter.
+
+This module tests:
+- Burst capacity and token refill
+- Bucket sharing between limiter instances (threads/processes)
+- Adaptive backoff on throttling errors and recovery on success
+- NewsService integration replacing the fixed rate-limit sleep
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from rate_limiter import RateLimiter, is_rate_limit_error
+from news_service import NewsService
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary SQLite file for bucket state."""
+    return str(tmp_path / "rate_limiter.db")
+
+
+class TestRateLimiter:
+    """Test class for RateLimiter behaviour."""
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 10)
+    @patch('rate_limiter.Config.RATE_LIMIT_BURST', 3)
+    def test_burst_allows_immediate_requests(self, db_path):
+        """Test that an idle bucket serves a burst without waiting."""
+        limiter = RateLimiter("test", db_path=db_path)
+
+        assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.try_acquire() > 0
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 10)
+    @patch('rate_limiter.Config.RATE_LIMIT_BURST', 1)
+    def test_acquire_times_out_when_bucket_empty(self, db_path):
+        """Test that acquire gives up after its timeout."""
+        limiter = RateLimiter("test", db_path=db_path)
+        assert limiter.acquire(timeout=0.1) is True
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=0.1) is False
+        assert time.monotonic() - start < 1
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 0.05)
+    @patch('rate_limiter.Config.RATE_LIMIT_BURST', 1)
+    def test_tokens_refill_over_time(self, db_path):
+        """Test that acquire waits for the next token rather than failing."""
+        limiter = RateLimiter("test", db_path=db_path)
+        assert limiter.acquire(timeout=1) is True
+        assert limiter.acquire(timeout=1) is True
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 10)
+    @patch('rate_limiter.Config.RATE_LIMIT_BURST', 2)
+    def test_instances_share_bucket(self, db_path):
+        """Test that limiters with the same name and database share one bucket."""
+        first = RateLimiter("gemini", db_path=db_path)
+        second = RateLimiter("gemini", db_path=db_path)
+        other = RateLimiter("other", db_path=db_path)
+
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() > 0
+        assert other.try_acquire() == 0
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 10)
+    def test_throttle_reduces_rate_and_success_recovers(self, db_path):
+        """Test multiplicative backoff on throttling and additive recovery."""
+        limiter = RateLimiter("test", db_path=db_path)
+        assert limiter.get_scale() == 1.0
+
+        limiter.record_throttle()
+        assert limiter.get_scale() == pytest.approx(0.5)
+        assert limiter.try_acquire() > 0  # Bucket drained after throttling
+
+        limiter.record_success()
+        assert limiter.get_scale() == pytest.approx(0.5 + RateLimiter.RECOVERY_STEP)
+
+        for _ in range(10):
+            limiter.record_throttle()
+        assert limiter.get_scale() == pytest.approx(RateLimiter.MIN_SCALE)
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 0)
+    def test_zero_delay_disables_limiting(self, db_path):
+        """Test that RATE_LIMIT_DELAY of 0 never blocks."""
+        limiter = RateLimiter("test", db_path=db_path)
+        assert all(limiter.acquire(timeout=0) for _ in range(20))
+
+    @patch('rate_limiter.Config.RATE_LIMIT_DELAY', 10)
+    @patch('rate_limiter.Config.RATE_LIMIT_BURST', 1)
+    def test_falls_back_to_in_process_state(self, tmp_path):
+        """Test that an unusable database path degrades to an in-process bucket."""
+        limiter = RateLimiter("test", db_path=str(tmp_path))  # A directory, not a file
+        assert limiter.db_path is None
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() > 0
+
+    def test_is_rate_limit_error(self):
+        """Test detection of provider throttling errors."""
+        assert is_rate_limit_error(Exception("429 Too Many Requests"))
+        assert is_rate_limit_error(Exception("Quota exceeded for model"))
+        assert not is_rate_limit_error(Exception("Connection reset"))
+
+
+class TestNewsServiceRateLimiting:
+    """Test rate limiter integration in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.rate_limiter = Mock()
+        self.news_service.rate_limiter.acquire.return_value = True
+
+    def test_invoke_acquires_token_and_records_success(self):
+        """Test that chain calls take a token and report success."""
+        chain = Mock()
+        chain.invoke.return_value = "result"
+
+        assert self.news_service._invoke_rate_limited(chain, {}) == "result"
+        self.news_service.rate_limiter.acquire.assert_called_once()
+        self.news_service.rate_limiter.record_success.assert_called_once()
+
+    def test_invoke_records_throttle_on_quota_error(self):
+        """Test that 429 errors shrink the shared rate."""
+        chain = Mock()
+        chain.invoke.side_effect = Exception("429 Resource has been exhausted (e.g. check quota).")
+
+        with pytest.raises(Exception):
+            self.news_service._invoke_rate_limited(chain, {})
+        self.news_service.rate_limiter.record_throttle.assert_called_once()
+        self.news_service.rate_limiter.record_success.assert_not_called()
+
+    def test_invoke_fails_when_no_token(self):
+        """Test that an exhausted limiter fails the call instead of hanging."""
+        self.news_service.rate_limiter.acquire.return_value = False
+        chain = Mock()
+
+        with pytest.raises(Exception, match="AI request slot"):
+            self.news_service._invoke_rate_limited(chain, {})
+        chain.invoke.assert_not_called()
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_does_not_sleep(self):
+        """Test that summary generation no longer pays a fixed sleep."""
+        mock_chain = Mock()
+        mock_chain.invoke.return_value = Mock(content="A short summary.")
+
+        with patch('time.sleep') as mock_sleep:
+            with patch.object(self.news_service.prompts, 'chain', return_value=mock_chain):
+                summary = self.news_service._generate_summary_for_language("Body " * 50, "Title", 'en')
+
+        assert summary == "A short summary."
+        mock_sleep.assert_not_called()
+        self.news_service.rate_limiter.acquire.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,203 @@
+"""
+Tests for per-operation retry budgets.
+
+This module tests:
+- One retry allowance shared by nested with_retry layers
+- Separate allowances per dependency
+- Language fallbacks skipped once the budget is exhausted
+- Attempt metrics recorded per top-level operation
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from config import Config
+from error_handler import AIServiceError, LanguageError, handle_language_operation, with_retry
+from news_service import NewsService
+from retry_budget import (
+    RetryBudget, current_retry_budget, record_attempt, retry_budget_scope, retry_metrics
+)
+
+
+class TestRetryBudget:
+    """Test class for RetryBudget and its scopes."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        retry_metrics.reset()
+
+    def test_allowance_per_dependency(self):
+        """Test that each dependency has its own retries."""
+        budget = RetryBudget("search", retries=1)
+
+        assert budget.try_spend("gemini")
+        assert not budget.try_spend("gemini")
+        assert budget.try_spend("gtts")
+        assert budget.exhausted()
+
+    def test_nested_scopes_share_budget(self):
+        """Test that inner scopes join the outermost one."""
+        assert current_retry_budget() is None
+        with retry_budget_scope("outer") as outer:
+            with retry_budget_scope("inner") as inner:
+                assert inner is outer
+            record_attempt("gemini")
+        assert current_retry_budget() is None
+
+        stats = retry_metrics.get_stats()['operations']
+        assert stats == {'outer': {'operations': 1, 'attempts': 1, 'retries': 0, 'exhausted': 0,
+                                   'max_attempts': 1, 'avg_attempts': 1.0}}
+
+    def test_attempts_outside_scope_are_ignored(self):
+        """Test that calls made outside any operation are not counted."""
+        record_attempt("gemini")
+
+        assert retry_metrics.get_stats()['operations'] == {}
+
+
+class TestRetryLayers:
+    """Test with_retry under a shared budget."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        retry_metrics.reset()
+
+    @patch('error_handler.time.sleep')
+    def test_stacked_decorators_do_not_multiply(self, mock_sleep):
+        """Test that nested retry layers make at most one call plus the budget."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        def inner():
+            record_attempt("gemini")
+            calls.append(1)
+            raise ConnectionError("reset")
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        def outer():
+            return inner()
+
+        with pytest.raises(AIServiceError):
+            outer()
+
+        assert len(calls) == 1 + Config.RETRY_BUDGET
+        stats = retry_metrics.get_stats()['operations']['outer']
+        assert stats['attempts'] == 1 + Config.RETRY_BUDGET
+        assert stats['retries'] == Config.RETRY_BUDGET
+        assert stats['exhausted'] == 1
+
+    @patch('error_handler.time.sleep')
+    def test_dependencies_retry_separately(self, mock_sleep):
+        """Test that spending the AI allowance leaves the speech allowance intact."""
+        speech_calls = []
+
+        @with_retry(max_attempts=5, base_delay=0.01)
+        def summarize():
+            raise ConnectionError("reset")
+
+        @with_retry(max_attempts=5, base_delay=0.01, dependency="gtts")
+        def speak():
+            speech_calls.append(1)
+            raise ConnectionError("reset")
+
+        with retry_budget_scope("request"):
+            with pytest.raises(AIServiceError):
+                summarize()
+            with pytest.raises(AIServiceError):
+                speak()
+
+        assert len(speech_calls) == 1 + Config.RETRY_BUDGET
+
+    @patch('error_handler.time.sleep')
+    def test_each_operation_gets_its_own_budget(self, mock_sleep):
+        """Test that separate top-level calls do not share retries."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        def flaky():
+            calls.append(1)
+            if len(calls) % 2:
+                raise ConnectionError("reset")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert flaky() == "ok"
+
+        assert retry_metrics.get_stats()['operations']['flaky']['operations'] == 2
+        assert retry_metrics.get_stats()['operations']['flaky']['retries'] == 2
+
+
+class TestLanguageFallbackBudget:
+    """Test language fallbacks under a shared budget."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        retry_metrics.reset()
+
+    @patch('error_handler.time.sleep')
+    def test_fallback_skipped_when_exhausted(self, mock_sleep):
+        """Test that the default language is not tried after the retries ran out."""
+        languages = []
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        def summarize(language):
+            languages.append(language)
+            raise ConnectionError("reset")
+
+        with pytest.raises(LanguageError):
+            handle_language_operation("summarize", "hi", summarize)
+
+        assert languages == ['hi'] * (1 + Config.RETRY_BUDGET)
+
+    @patch('error_handler.time.sleep')
+    def test_fallback_used_for_non_retryable_errors(self, mock_sleep):
+        """Test that a failure that spent no retries still falls back to English."""
+        def summarize(language):
+            if language != 'en':
+                raise ValueError("400 Bad Request: unsupported language")
+            return "summary"
+
+        assert handle_language_operation("summarize", "hi", with_retry(base_delay=0.01)(summarize)) == "summary"
+
+    @patch('error_handler.time.sleep')
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_makes_bounded_calls(self, mock_sleep):
+        """Test that a failing non-English summary stops after the budget instead of retrying each layer."""
+        news_service = NewsService()
+        news_service.summary_cache = None
+        news_service.rate_limiter = Mock()
+        chain = Mock()
+        chain.invoke.side_effect = ConnectionError("connection reset")
+        article = "The government announced a new policy on renewable energy today. " * 5
+
+        with patch.object(news_service.prompts, 'chain', return_value=chain), \
+                patch.object(news_service.prompts, 'compose', return_value=chain):
+            summary = news_service.generate_summary(article, "Energy policy", 'hi')
+
+        assert summary
+        assert chain.invoke.call_count == 1 + Config.RETRY_BUDGET
+        stats = retry_metrics.get_stats()['operations']['generate_summary']
+        assert stats['attempts'] == 1 + Config.RETRY_BUDGET
+
+
+class TestRetryStatsRoute:
+    """Test retry counters in the cache statistics endpoint."""
+
+    def test_cache_stats_include_retries(self):
+        """Test that /cache-stats reports the retry budget and per-operation counters."""
+        from app import app
+        import routes  # noqa: F401 - registers the endpoints
+
+        retry_metrics.reset()
+        with retry_budget_scope("search_news"):
+            record_attempt("gemini")
+        with app.test_client() as client:
+            response = client.get('/cache-stats')
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['retries']['budget'] == Config.RETRY_BUDGET
+        assert data['retries']['operations']['search_news']['attempts'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,162 @@
+"""
+Tests for the stale-while-revalidate search result cache.
+
+This module tests:
+- Query normalization
+- Fresh, stale and expired entry handling
+- Single background refresh per key
+- NewsService integration around DuckDuckGo searches
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from search_cache import SearchResultCache, refresh_scope
+from news_service import NewsService
+
+
+def wait_for(condition, timeout=2):
+    """Poll until condition() is true or the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSearchResultCache:
+    """Test class for SearchResultCache behaviour."""
+
+    def test_make_key_normalizes_query(self):
+        """Test that case and whitespace differences share a key."""
+        assert SearchResultCache.make_key("  Cricket   News ", 5) == SearchResultCache.make_key("cricket news", 5)
+        assert SearchResultCache.make_key("cricket news", 5) != SearchResultCache.make_key("cricket news", 10)
+
+    def test_fresh_entry_served_without_fetch(self):
+        """Test that fresh results never call the search backend again."""
+        cache = SearchResultCache(fresh_ttl=60, stale_ttl=120)
+        fetch = Mock(return_value=[{'title': 'A'}])
+        key = SearchResultCache.make_key("topic", 5)
+
+        assert cache.get_or_fetch(key, fetch) == [{'title': 'A'}]
+        assert cache.get_or_fetch(key, fetch) == [{'title': 'A'}]
+        fetch.assert_called_once()
+        assert cache.get_stats()['fresh_hits'] == 1
+        assert cache.get_stats()['misses'] == 1
+
+    def test_stale_entry_served_while_refreshing(self):
+        """Test that stale results return immediately and refresh in the background."""
+        cache = SearchResultCache(fresh_ttl=0, stale_ttl=60)
+        key = SearchResultCache.make_key("topic", 5)
+        cache.get_or_fetch(key, Mock(return_value=['old']))
+
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(2)
+            return ['new']
+
+        start = time.monotonic()
+        assert cache.get_or_fetch(key, slow_fetch) == ['old']
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        assert wait_for(lambda: cache.get_stats()['refreshes'] == 1)
+        assert cache.get_or_fetch(key, Mock(return_value=['ignored'])) == ['new']
+
+    def test_single_refresh_per_key(self):
+        """Test that concurrent stale hits trigger only one refresh."""
+        cache = SearchResultCache(fresh_ttl=0, stale_ttl=60)
+        key = SearchResultCache.make_key("topic", 5)
+        cache.get_or_fetch(key, Mock(return_value=['old']))
+
+        release = threading.Event()
+        fetch = Mock(side_effect=lambda: release.wait(2) and ['new'])
+        for _ in range(5):
+            assert cache.get_or_fetch(key, fetch) == ['old']
+        release.set()
+
+        assert wait_for(lambda: cache.get_stats()['refreshes'] == 1)
+        assert fetch.call_count == 1
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        """Test that refresh errors leave the stale results in place."""
+        cache = SearchResultCache(fresh_ttl=0, stale_ttl=60)
+        key = SearchResultCache.make_key("topic", 5)
+        cache.get_or_fetch(key, Mock(return_value=['old']))
+
+        cache.get_or_fetch(key, Mock(side_effect=Exception("Ratelimit")))
+        assert wait_for(lambda: cache.get_stats()['refresh_errors'] == 1)
+        assert cache.get_or_fetch(key, Mock(side_effect=Exception("Ratelimit"))) == ['old']
+
+    def test_refresh_scope_bypasses_fresh_entry(self):
+        """Test that a forced refresh re-runs the search and replaces a still-fresh entry."""
+        cache = SearchResultCache(fresh_ttl=60, stale_ttl=120)
+        key = SearchResultCache.make_key("topic", 5)
+        cache.get_or_fetch(key, Mock(return_value=['old']))
+
+        with refresh_scope():
+            assert cache.get_or_fetch(key, Mock(return_value=['new'])) == ['new']
+
+        fetch = Mock(return_value=['newer'])
+        assert cache.get_or_fetch(key, fetch) == ['new']
+        fetch.assert_not_called()
+        assert cache.get_stats()['forced_refreshes'] == 1
+
+    def test_empty_results_not_cached(self):
+        """Test that empty searches are retried on the next request."""
+        cache = SearchResultCache(fresh_ttl=60, stale_ttl=120)
+        key = SearchResultCache.make_key("topic", 5)
+        fetch = Mock(return_value=[])
+
+        cache.get_or_fetch(key, fetch)
+        cache.get_or_fetch(key, fetch)
+        assert fetch.call_count == 2
+
+
+class TestNewsServiceSearchCache:
+    """Test search cache integration in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+
+    def test_repeated_search_hits_ddgs_once(self):
+        """Test that repeated searches for a topic reuse DuckDuckGo results."""
+        results = [{'title': 'Article', 'url': 'http://example.com', 'body': 'Short body'}]
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results) as mock_news:
+            first = self.news_service.search_news("Cricket", max_results=5, language='en')
+            second = self.news_service.search_news("cricket ", max_results=5, language='en')
+
+        mock_news.assert_called_once()
+        assert [a['title'] for a in first] == [a['title'] for a in second] == ['Article']
+        assert self.news_service.get_search_cache_stats()['fresh_hits'] == 1
+
+    def test_languages_share_one_search(self):
+        """Test that the same topic in several summary languages searches DuckDuckGo once."""
+        results = [{'title': 'Article', 'url': 'http://example.com', 'body': 'Short body'}]
+
+        with patch.object(self.news_service.ddgs, 'news', return_value=results) as mock_news:
+            english = self.news_service.search_news("cricket", max_results=5, language='en')
+            hindi = self.news_service.search_news("cricket", max_results=5, language='hi')
+
+        mock_news.assert_called_once()
+        assert english[0]['language'] == 'en' and hindi[0]['language'] == 'hi'
+
+    @patch('news_service.Config.SEARCH_CACHE_ENABLED', False)
+    def test_cache_can_be_disabled(self):
+        """Test that disabling the cache searches every time."""
+        news_service = NewsService()
+        results = [{'title': 'Article', 'url': 'http://example.com', 'body': 'Short body'}]
+
+        with patch.object(news_service.ddgs, 'news', return_value=results) as mock_news:
+            news_service.search_news("cricket", max_results=5, language='en')
+            news_service.search_news("cricket", max_results=5, language='en')
+
+        assert mock_news.call_count == 2
+        assert news_service.get_search_cache_stats() == {'enabled': False}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
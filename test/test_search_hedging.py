@@ -0,0 +1,151 @@
+"""
+Tests for hedged DuckDuckGo searches.
+
+This module tests:
+- A second request sent when the first is slower than the hedge delay
+- The hedge delay taken from a percentile of recent latencies
+- The cap on hedges as a percentage of requests
+- Hedged searches in NewsService and their counters
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from deadline import deadline_scope
+from error_handler import DeadlineExceededError
+from hedging import Hedger
+from news_service import NewsService
+
+
+def slow_then_fast(first_delay, result="ok"):
+    """Build a request whose first call is slow and later calls are fast."""
+    calls = []
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            calls.append(1)
+            number = len(calls)
+        if number == 1:
+            time.sleep(first_delay)
+            return f"{result}-slow"
+        return f"{result}-fast"
+
+    return request, calls
+
+
+@patch('hedging.Config.SEARCH_HEDGING_ENABLED', True)
+class TestHedger:
+    """Test class for Hedger."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.hedger = Hedger("test", percentile=95, max_extra_percent=100, initial_delay=0.05)
+
+    def test_fast_request_is_not_hedged(self):
+        """Test that a request answering within the delay is sent once."""
+        request = Mock(return_value="ok")
+
+        assert self.hedger.call(request) == "ok"
+
+        assert request.call_count == 1
+        assert self.hedger.get_stats()['hedged'] == 0
+
+    def test_slow_request_is_hedged(self):
+        """Test that the hedge answers for a slow first request."""
+        request, calls = slow_then_fast(0.5)
+
+        started = time.monotonic()
+        assert self.hedger.call(request) == "ok-fast"
+
+        assert time.monotonic() - started < 0.4
+        assert len(calls) == 2
+        stats = self.hedger.get_stats()
+        assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+
+    def test_failed_request_falls_back_to_hedge(self):
+        """Test that a hedge still answers when the first request fails after it was sent."""
+        calls = []
+
+        def request():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                raise ConnectionError("reset")
+            time.sleep(0.2)
+            return "ok"
+
+        assert self.hedger.call(request) == "ok"
+
+    def test_all_requests_failing_raises(self):
+        """Test that the error is raised when no request succeeds."""
+        def request():
+            time.sleep(0.1)
+            raise ConnectionError("reset")
+
+        with pytest.raises(ConnectionError):
+            self.hedger.call(request)
+
+    def test_hedges_capped_by_percentage(self):
+        """Test that no more than the allowed share of requests is hedged."""
+        hedger = Hedger("capped", max_extra_percent=25, initial_delay=0.01)
+        request = Mock(side_effect=lambda: time.sleep(0.03) or "ok")
+
+        for _ in range(8):
+            hedger.call(request)
+
+        stats = hedger.get_stats()
+        assert stats['hedged'] == 2
+        assert stats['over_budget'] == 6
+        assert request.call_count == 10
+
+    def test_delay_follows_latency_percentile(self):
+        """Test that the delay is the initial one until enough latencies are sampled."""
+        assert self.hedger.hedge_delay() == 0.05
+
+        with patch('hedging.Config.SEARCH_HEDGE_MIN_SAMPLES', 10):
+            for latency in range(1, 21):
+                self.hedger._latencies.append(latency / 100)
+            assert self.hedger.hedge_delay() == 0.19
+
+    def test_deadline_stops_waiting(self):
+        """Test that the caller stops waiting at the request deadline."""
+        request = Mock(side_effect=lambda: time.sleep(0.5))
+
+        with deadline_scope(0.1):
+            with pytest.raises(DeadlineExceededError):
+                self.hedger.call(request)
+
+    def test_disabled_calls_directly(self):
+        """Test that requests run on the caller's thread when hedging is off."""
+        caller = threading.get_ident()
+
+        with patch('hedging.Config.SEARCH_HEDGING_ENABLED', False):
+            assert self.hedger.call(lambda: threading.get_ident()) == caller
+        assert self.hedger.get_stats()['requests'] == 0
+
+
+@patch('hedging.Config.SEARCH_HEDGING_ENABLED', True)
+class TestHedgedSearch:
+    """Test hedged searches in NewsService."""
+
+    def test_slow_search_is_hedged(self):
+        """Test that a slow DuckDuckGo search is answered by the hedge and counted once by the circuit."""
+        news_service = NewsService()
+        news_service.search_cache = None
+        news_service.search_hedger = Hedger("duckduckgo", max_extra_percent=100, initial_delay=0.05)
+        request, calls = slow_then_fast(0.5)
+        news_service.ddgs = Mock()
+        news_service.ddgs.news.side_effect = lambda **kwargs: [{'title': request()}]
+
+        results = news_service._fetch_search_results("cricket news", 5)
+
+        assert results == [{'title': 'ok-fast'}]
+        assert news_service.ddgs.news.call_count == 2
+        assert news_service.search_circuit.get_status()['calls'] == 1
+        assert news_service.get_search_hedge_stats()['hedge_wins'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
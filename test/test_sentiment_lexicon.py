@@ -0,0 +1,145 @@
+"""
+Tests for the local lexicon sentiment classifier.
+
+This module tests:
+- Positive and negative scoring for English, Hindi and Marathi
+- Language-specific negation scope
+- Confidence values and batch scoring
+- Escalating only low-confidence texts to the AI
+- Decision logging and counters
+"""
+
+import json
+import logging
+import pytest
+from unittest.mock import Mock, patch
+from news_service import NewsService
+from sentiment_lexicon import LexiconSentimentAnalyzer
+
+
+POSITIVE_EN = "The team celebrated a record victory as profits surge and growth continues to improve."
+NEGATIVE_EN = "The earthquake caused deaths and damage, deepening the crisis."
+
+
+class TestLexiconSentimentAnalyzer:
+    """Test class for LexiconSentimentAnalyzer."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.analyzer = LexiconSentimentAnalyzer()
+
+    def test_english_positive_and_negative(self):
+        """Test that clear English news gets a confident label."""
+        positive = self.analyzer.score(POSITIVE_EN, 'en')
+        negative = self.analyzer.score(NEGATIVE_EN, 'en')
+
+        assert positive['sentiment'] == 'positive'
+        assert negative['sentiment'] == 'negative'
+        assert LexiconSentimentAnalyzer.is_confident(positive, 0.6)
+        assert LexiconSentimentAnalyzer.is_confident(negative, 0.6)
+
+    def test_english_negation_flips_following_words(self):
+        """Test that not and n't flip the words after them."""
+        assert self.analyzer.score("This is not good", 'en')['sentiment'] == 'negative'
+        assert self.analyzer.score("The plan didn't fail", 'en')['sentiment'] == 'positive'
+
+    def test_hindi_devanagari_and_negation(self):
+        """Test Hindi tokens and negation of the preceding word."""
+        assert self.analyzer.score("कंपनी को बड़ी सफलता मिली।", 'hi')['sentiment'] == 'positive'
+        assert self.analyzer.score("योजना सफल नहीं रही।", 'hi')['sentiment'] == 'negative'
+
+    def test_marathi_devanagari_and_negation(self):
+        """Test Marathi tokens and negation of the preceding word."""
+        assert self.analyzer.score("भूकंपात मोठे नुकसान झाले", 'mr')['sentiment'] == 'negative'
+        assert self.analyzer.score("परिस्थिती चांगली नाही", 'mr')['sentiment'] == 'negative'
+
+    def test_danda_is_not_part_of_a_word(self):
+        """Test that the sentence-ending danda does not hide the last word."""
+        assert LexiconSentimentAnalyzer._tokenize("यह जीत है।", 'hi') == ['यह', 'जीत', 'है']
+
+    def test_no_hits_is_neutral_with_zero_confidence(self):
+        """Test that text without lexicon words is not confident."""
+        result = self.analyzer.score("The committee met on Tuesday afternoon.", 'en')
+
+        assert result == {'sentiment': 'neutral', 'confidence': 0.0, 'score': 0.0, 'hits': 0}
+        assert not LexiconSentimentAnalyzer.is_confident(result, 0.0)
+
+    def test_mixed_text_has_low_confidence(self):
+        """Test that conflicting words lower confidence."""
+        result = self.analyzer.score("Profits rise despite fears of a recession", 'en')
+
+        assert result['confidence'] < 0.6
+
+    def test_batch_matches_single_scores(self):
+        """Test that batch scoring gives the same results in order."""
+        texts = [POSITIVE_EN, NEGATIVE_EN, "", "Nothing here"]
+
+        assert self.analyzer.score_batch(texts, 'en') == [self.analyzer.score(t, 'en') for t in texts]
+
+    def test_record_decision_logs_json_and_counts(self, caplog):
+        """Test that decisions are logged for threshold tuning."""
+        result = self.analyzer.score(POSITIVE_EN, 'en')
+
+        with caplog.at_level(logging.INFO, logger="sentiment_decisions"):
+            self.analyzer.record_decision(result, 'en', escalated=False)
+            self.analyzer.record_decision(result, 'en', escalated=True, ai_sentiment='negative')
+
+        logged = [json.loads(r.getMessage()) for r in caplog.records if r.name == "sentiment_decisions"]
+        assert [entry['escalated'] for entry in logged] == [False, True]
+        assert logged[1]['ai_sentiment'] == 'negative'
+        stats = self.analyzer.get_stats()
+        assert (stats['local'], stats['escalated'], stats['disagreed'], stats['local_rate']) == (1, 1, 1, 0.5)
+
+
+class TestLexiconEscalation:
+    """Test NewsService using the lexicon before the AI."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+
+    @patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', True)
+    @patch('news_service.Config.SENTIMENT_LEXICON_THRESHOLD', 0.6)
+    def test_confident_text_skips_ai(self):
+        """Test that a confident lexicon label is returned without an AI call."""
+        with patch.object(self.news_service, 'get_sentiment_prompt_template') as mock_template:
+            assert self.news_service.analyze_sentiment(POSITIVE_EN, 'en') == 'positive'
+
+        mock_template.assert_not_called()
+
+    @patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', True)
+    @patch('news_service.Config.SENTIMENT_LEXICON_THRESHOLD', 0.6)
+    def test_uncertain_text_escalates_to_ai(self):
+        """Test that low-confidence texts are sent to the AI."""
+        with patch.object(self.news_service, 'get_sentiment_prompt_template') as mock_template:
+            mock_template.return_value.__or__ = Mock(return_value=Mock(invoke=Mock(return_value=Mock(content="negative"))))
+            sentiment = self.news_service.analyze_sentiment("Profits rise despite fears of a recession", 'en')
+
+        assert sentiment == 'negative'
+        mock_template.assert_called_once_with('en')
+        assert self.news_service.get_sentiment_stats()['escalated'] == 1
+
+    @patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', False)
+    def test_disabled_lexicon_always_uses_ai(self):
+        """Test that the lexicon can be switched off."""
+        with patch.object(self.news_service, 'get_sentiment_prompt_template') as mock_template:
+            mock_template.return_value.__or__ = Mock(return_value=Mock(invoke=Mock(return_value=Mock(content="positive"))))
+            self.news_service.analyze_sentiment(POSITIVE_EN, 'en')
+
+        mock_template.assert_called_once_with('en')
+
+    @patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', True)
+    @patch('news_service.Config.SENTIMENT_LEXICON_THRESHOLD', 0.6)
+    def test_batch_escalates_only_low_confidence(self):
+        """Test that analyze_sentiments sends only uncertain texts to the AI."""
+        texts = [POSITIVE_EN, "The committee met on Tuesday afternoon.", NEGATIVE_EN]
+
+        with patch.object(self.news_service, 'analyze_sentiment', return_value='neutral') as mock_analyze:
+            sentiments = self.news_service.analyze_sentiments(texts, 'en')
+
+        assert sentiments == ['positive', 'neutral', 'negative']
+        mock_analyze.assert_called_once_with(texts[1], 'en')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
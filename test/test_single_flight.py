@@ -0,0 +1,203 @@
+"""
+Tests for single-flight request coalescing.
+
+This module tests:
+- Concurrent callers sharing one computation and its errors
+- Per-call wait timeouts
+- Coalesced searches, summaries, extractions and TTS synthesis
+"""
+
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from article_extractor import ArticleExtractor
+from news_service import NewsService
+from single_flight import SingleFlight
+from tts_service import TTSService
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+def run_concurrently(count, fn):
+    """Call fn from count threads at once and return their results."""
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(lambda _: fn(), range(count)))
+
+
+def slow(result, calls, delay=0.2):
+    """Build a computation that records its calls and takes a while."""
+    def compute():
+        calls.append(1)
+        time.sleep(delay)
+        return result
+    return compute
+
+
+class TestSingleFlight:
+    """Test class for SingleFlight."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.flights = SingleFlight("test", timeout=5)
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that identical concurrent calls run once and get equal, separate results."""
+        calls = []
+
+        results = run_concurrently(5, lambda: self.flights.do('key', slow([{'title': 'A'}], calls)))
+
+        assert len(calls) == 1
+        assert all(result == [{'title': 'A'}] for result in results)
+        assert len({id(result) for result in results}) == 5
+        assert self.flights.get_stats() == {'leaders': 1, 'coalesced': 4, 'timeouts': 0, 'in_flight': 0}
+
+    def test_leader_changes_do_not_reach_waiters(self):
+        """Test that the leader mutating its result after returning leaves waiters' copies intact."""
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.2)
+            return [{'title': 'A'}]
+
+        def lead():
+            result = self.flights.do('key', compute)
+            result[0]['title'] = 'Changed'
+            return result
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(lead)
+            started.wait(1)
+            waiter = self.flights.do('key', compute)
+
+        assert leader.result() == [{'title': 'Changed'}]
+        assert waiter == [{'title': 'A'}]
+
+    def test_different_keys_do_not_wait(self):
+        """Test that calls with different keys run separately."""
+        calls = []
+        keys = iter(range(3))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                key = next(keys)
+            return self.flights.do(key, slow(key, calls))
+
+        assert sorted(run_concurrently(3, call)) == [0, 1, 2]
+        assert len(calls) == 3
+
+    def test_errors_are_shared(self):
+        """Test that every waiting caller sees the leader's exception."""
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError("upstream down")
+
+        def call():
+            try:
+                return self.flights.do('key', fail)
+            except ValueError as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(call)
+            started.wait()
+            second = pool.submit(call)
+
+        assert first.result() == second.result() == "upstream down"
+
+    def test_timeout_runs_its_own_call(self):
+        """Test that a caller stops waiting after its timeout."""
+        calls = []
+        started = threading.Event()
+
+        def stuck():
+            started.set()
+            time.sleep(0.5)
+            return 'slow'
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(self.flights.do, 'key', stuck)
+            started.wait()
+            result = self.flights.do('key', lambda: calls.append(1) or 'own', timeout=0.05)
+
+        assert result == 'own'
+        assert self.flights.get_stats()['timeouts'] == 1
+
+    def test_reentrant_call_does_not_deadlock(self):
+        """Test that the leader calling the same key again runs directly."""
+        assert self.flights.do('key', lambda: self.flights.do('key', lambda: 'inner')) == 'inner'
+
+    @patch('single_flight.Config.SINGLE_FLIGHT_ENABLED', False)
+    def test_disabled(self):
+        """Test that disabling coalescing runs every call."""
+        calls = []
+
+        run_concurrently(3, lambda: self.flights.do('key', slow('x', calls, delay=0.05)))
+
+        assert len(calls) == 3
+
+
+class TestCoalescedServices:
+    """Test coalescing in the services."""
+
+    def test_identical_searches_share_one_search(self):
+        """Test that concurrent searches for one topic run one search."""
+        news_service = NewsService()
+        calls = []
+
+        with patch.object(news_service, '_search_news', side_effect=lambda *args: slow([{'title': 'A'}], calls)()):
+            results = run_concurrently(4, lambda: news_service.search_news("Cricket", 5, 'en'))
+            news_service.search_news("Cricket", 5, 'en', session_id='session-1')
+
+        assert len(calls) == 2
+        assert results == [[{'title': 'A'}]] * 4
+        assert news_service.get_single_flight_stats()['search_news']['coalesced'] == 3
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_identical_summaries_share_one_ai_call(self):
+        """Test that concurrent summaries of one article make one AI call."""
+        news_service = NewsService()
+        news_service.summary_cache = None
+        calls = []
+        result = {'summary': 'Shared.', 'sentiment': 'positive', 'language': 'en'}
+
+        with patch.object(news_service, '_generate_summary_with_sentiment_for_language',
+                          side_effect=lambda *args, **kwargs: slow(result, calls)()):
+            results = run_concurrently(3, lambda: news_service.generate_summary_with_sentiment(LONG_BODY, "AI", 'en'))
+
+        assert len(calls) == 1
+        assert results == [result] * 3
+
+    def test_identical_extractions_share_one_download(self):
+        """Test that concurrent readers of one URL share one extraction."""
+        extractor = ArticleExtractor()
+        calls = []
+
+        with patch.object(extractor, '_extract_full_article', side_effect=lambda url: slow("Text", calls)()):
+            results = run_concurrently(3, lambda: extractor.extract_full_article("https://example.com/a"))
+
+        assert len(calls) == 1
+        assert results == ["Text"] * 3
+
+    def test_identical_tts_requests_share_one_file(self):
+        """Test that concurrent TTS requests for the same text share one audio file."""
+        tts_service = TTSService()
+        calls = []
+
+        with patch.object(tts_service, '_synthesize', side_effect=lambda *args: slow("/static/audio/a.mp3", calls)()):
+            results = run_concurrently(3, lambda: tts_service.text_to_speech("Hello world, the news today.", 'en'))
+
+        assert len(calls) == 1
+        assert results == ["/static/audio/a.mp3"] * 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
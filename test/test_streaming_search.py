@@ -0,0 +1,180 @@
+"""
+Tests for streaming multi-topic news search.
+
+This module tests:
+- Articles yielded as soon as their summary is ready
+- Per-topic completion events, including topics without results
+- Fallback summaries when the time budget runs out
+- The /search_news/stream NDJSON endpoint
+"""
+
+import json
+import threading
+import time
+import uuid
+import pytest
+from unittest.mock import patch
+from news_service import NewsService
+
+
+LONG_BODY = ("Researchers have developed a new artificial intelligence system that can process natural "
+             "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+def make_articles(topic, count):
+    """Build unsummarized articles as returned by NewsService._find_articles."""
+    return [{'title': f'{topic} {i}', 'url': f'http://example.com/{topic}/{i}', 'body': LONG_BODY,
+             'topic': topic, 'language': 'en'} for i in range(count)]
+
+
+class TestStreamMultipleTopics:
+    """Test class for NewsService.stream_multiple_topics."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        # Fixture articles share one body; deduplication has its own tests
+        self.news_service.deduplicator = None
+
+    def test_first_article_before_slow_summaries(self):
+        """Test that time-to-first-article is one search plus one summary."""
+        release = threading.Event()
+
+        def summarize(article, language):
+            if article['title'] != 'fast 0':
+                release.wait(5)
+            return {'summary': f"Summary of {article['title']}", 'sentiment': 'neutral', 'summary_language': language}
+
+        with patch.object(self.news_service, '_find_articles', side_effect=lambda t, n, l: make_articles(t, 2)):
+            with patch.object(self.news_service, '_summarize_article', side_effect=summarize):
+                start = time.monotonic()
+                stream = self.news_service.stream_multiple_topics(['fast', 'slow'], language='en')
+                first = next(stream)
+                elapsed = time.monotonic() - start
+                release.set()
+                rest = list(stream)
+
+        assert first['type'] == 'article'
+        assert first['article']['summary'] == 'Summary of fast 0'
+        assert elapsed < 1
+        events = [first] + rest
+        assert sum(1 for e in events if e['type'] == 'article') == 4
+        assert {e['topic']: e['count'] for e in events if e['type'] == 'topic_complete'} == {'fast': 2, 'slow': 2}
+
+    def test_topic_complete_follows_its_articles(self):
+        """Test that a topic's completion event comes after all of its articles."""
+        summary = {'summary': 'S', 'sentiment': 'positive', 'summary_language': 'en'}
+
+        with patch.object(self.news_service, '_find_articles', side_effect=lambda t, n, l: make_articles(t, 3)):
+            with patch.object(self.news_service, '_summarize_article', return_value=summary):
+                events = list(self.news_service.stream_multiple_topics(['tech'], language='en'))
+
+        assert [e['type'] for e in events] == ['article', 'article', 'article', 'topic_complete']
+        assert all(e['article']['sentiment'] == 'positive' for e in events[:3])
+
+    def test_empty_and_failed_topics_complete_with_no_articles(self):
+        """Test that topics without results still get a completion event."""
+        def find(topic, max_results, language):
+            if topic == 'broken':
+                raise Exception("Ratelimit")
+            return []
+
+        with patch.object(self.news_service, '_find_articles', side_effect=find):
+            events = list(self.news_service.stream_multiple_topics(['empty', 'broken'], language='en'))
+
+        assert sorted((e['type'], e['topic'], e['count']) for e in events) == [
+            ('topic_complete', 'broken', 0), ('topic_complete', 'empty', 0)
+        ]
+
+    @patch('news_service.Config.TOPIC_TIME_BUDGET', 0.2)
+    @patch('news_service.NewsService.TOPIC_GRACE_PERIOD', 0)
+    def test_budget_exhaustion_uses_fallback_summaries(self):
+        """Test that summaries still pending at the deadline fall back to the article body."""
+        release = threading.Event()
+
+        def summarize(article, language):
+            release.wait(5)
+            return {'summary': 'Too late', 'sentiment': 'positive', 'summary_language': language}
+
+        with patch.object(self.news_service, '_find_articles', side_effect=lambda t, n, l: make_articles(t, 1)):
+            with patch.object(self.news_service, '_summarize_article', side_effect=summarize):
+                events = list(self.news_service.stream_multiple_topics(['tech'], language='en'))
+                release.set()
+
+        assert events[0]['article']['summary'].startswith(LONG_BODY[:50])
+        assert events[0]['article']['sentiment'] == 'neutral'
+        assert events[1] == {'type': 'topic_complete', 'topic': 'tech', 'count': 1}
+
+
+class TestSearchNewsStreamRoute:
+    """Test the /search_news/stream endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with a conversation session."""
+        from app import app, db
+        from models import ConversationSession
+        app.config['TESTING'] = True
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+
+        with app.test_client() as client:
+            with app.app_context():
+                db.create_all()
+                self.session_id = str(uuid.uuid4())
+                db.session.add(ConversationSession(session_id=self.session_id, topics='["technology"]'))
+                db.session.commit()
+                with client.session_transaction() as sess:
+                    sess['session_id'] = self.session_id
+                yield client
+                db.drop_all()
+
+    def test_stream_emits_ndjson_events(self, client):
+        """Test that the endpoint streams start, article, topic and completion events."""
+        from models import NewsArticle
+        article = {'title': 'AI', 'url': 'http://example.com', 'body': LONG_BODY,
+                   'summary': 'सारांश', 'sentiment': 'positive', 'language': 'hi'}
+        events = [
+            {'type': 'article', 'topic': 'technology', 'article': article},
+            {'type': 'topic_complete', 'topic': 'technology', 'count': 1},
+        ]
+
+        with patch('routes.news_service.stream_multiple_topics', return_value=iter(events)) as mock_stream:
+            response = client.post('/search_news/stream', json={'language': 'hi'})
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        mock_stream.assert_called_once_with(['technology'], language='hi')
+        assert [e['type'] for e in lines] == ['start', 'article', 'topic_complete', 'complete']
+        assert lines[1]['article']['summary_language'] == 'hi'
+        assert lines[3]['total_results'] == 1
+
+        saved = NewsArticle.query.filter_by(session_id=self.session_id).first()
+        assert saved.sentiment == 'positive'
+        assert saved.topic == 'technology'
+
+    def test_stream_reports_errors_in_band(self, client):
+        """Test that a failure mid-stream ends with an error event."""
+        def failing_stream(topics, language):
+            raise Exception("boom")
+            yield  # pragma: no cover
+
+        with patch('routes.news_service.stream_multiple_topics', side_effect=failing_stream):
+            response = client.post('/search_news/stream', json={})
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+        assert [e['type'] for e in lines] == ['start', 'error']
+
+    def test_stream_requires_session(self):
+        """Test that the endpoint rejects requests without a session."""
+        from app import app
+        app.config['TESTING'] = True
+
+        with app.test_client() as client:
+            response = client.post('/search_news/stream', json={})
+
+        assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
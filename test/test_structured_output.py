@@ -0,0 +1,176 @@
+"""
+Tests for JSON schema summary and sentiment responses.
+
+This module tests:
+- Validation of structured responses against the schema
+- Compact prompts and correction prompts for every language
+- The single correction retry after malformed output
+- Structured mode in the async service
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+from async_news_service import AsyncNewsService
+from error_handler import StructuredOutputError
+from news_service import NewsService
+from structured_output import (
+    SUMMARY_SENTIMENT_SCHEMA, build_correction_templates, build_structured_templates, parse_structured_response
+)
+
+
+ARTICLE = ("Researchers have developed a new artificial intelligence system that can process natural "
+           "language with unprecedented accuracy. The breakthrough promises to change how we work.")
+
+
+def answer(summary="AI system improves language processing.", sentiment="positive", language="en"):
+    """Build a model response carrying a JSON answer."""
+    return Mock(content=json.dumps({'summary': summary, 'sentiment': sentiment, 'language': language}))
+
+
+class TestParseStructuredResponse:
+    """Test schema validation of model output."""
+
+    def test_valid_response(self):
+        """Test that a valid answer is returned normalized."""
+        text = '{"summary": " Rates rose. ", "sentiment": "Negative", "language": "en"}'
+
+        assert parse_structured_response(text, 'en') == {'summary': 'Rates rose.', 'sentiment': 'negative', 'language': 'en'}
+
+    def test_code_fenced_response(self):
+        """Test that a JSON object inside a code fence is accepted."""
+        text = '```json\n{"summary": "सारांश।", "sentiment": "neutral", "language": "hi"}\n```'
+
+        assert parse_structured_response(text, 'hi')['summary'] == 'सारांश।'
+
+    @pytest.mark.parametrize("text", [
+        "Summary: Rates rose.\nSentiment: negative",
+        '{"summary": "Rates rose.", "sentiment": }',
+        '{"summary": "", "sentiment": "negative", "language": "en"}',
+        '{"summary": "Rates rose.", "sentiment": "mixed", "language": "en"}',
+        '{"summary": "Rates rose.", "sentiment": "negative", "language": "hi"}',
+        '',
+    ])
+    def test_invalid_responses(self, text):
+        """Test that malformed or off-schema answers are rejected."""
+        with pytest.raises(StructuredOutputError):
+            parse_structured_response(text, 'en')
+
+
+class TestStructuredTemplates:
+    """Test the structured prompts."""
+
+    def test_schema_requires_all_fields(self):
+        """Test that the schema constrains the sentiment labels."""
+        assert SUMMARY_SENTIMENT_SCHEMA['required'] == ['summary', 'sentiment', 'language']
+        assert SUMMARY_SENTIMENT_SCHEMA['properties']['sentiment']['enum'] == ['positive', 'negative', 'neutral']
+
+    @pytest.mark.parametrize("language", ['en', 'hi', 'mr'])
+    def test_templates_for_each_language(self, language):
+        """Test that every language has a prompt and a correction prompt."""
+        prompt = build_structured_templates()[language].format_messages(title="T", article_text="Body")
+        correction = build_correction_templates()[language].format_messages(
+            title="T", article_text="Body", previous="not json", error="bad"
+        )
+
+        assert "Body" in prompt[0].content
+        assert f"{language}." in prompt[0].content
+        assert [message.type for message in correction] == ['human', 'ai', 'human']
+        assert correction[1].content == "not json"
+        assert "bad" in correction[2].content
+
+
+@patch('news_service.Config.STRUCTURED_OUTPUT_ENABLED', True)
+@patch('news_service.Config.USE_AI_SUMMARY', True)
+class TestStructuredNewsService:
+    """Test structured mode in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.summary_cache = None
+
+    def test_valid_answer_is_one_call(self):
+        """Test that a valid first answer needs no retry."""
+        with patch.object(self.news_service, '_invoke_rate_limited', return_value=answer()) as mock_invoke:
+            result = self.news_service.generate_summary_with_sentiment(ARTICLE, "AI", 'en')
+
+        assert result == {'summary': 'AI system improves language processing.', 'sentiment': 'positive', 'language': 'en',
+                          'ai_summary': True}
+        assert mock_invoke.call_count == 1
+
+    def test_malformed_answer_is_corrected_once(self):
+        """Test that a malformed answer is retried with the validation error."""
+        responses = [Mock(content="Summary: plain text"), answer(language='hi')]
+        with patch.object(self.news_service, '_invoke_rate_limited', side_effect=responses) as mock_invoke:
+            result = self.news_service.generate_summary_with_sentiment(ARTICLE, "AI", 'hi')
+
+        assert result['sentiment'] == 'positive'
+        assert mock_invoke.call_count == 2
+        retry_inputs = mock_invoke.call_args[0][1]
+        assert retry_inputs['previous'] == "Summary: plain text"
+        assert "JSON object" in retry_inputs['error']
+
+    def test_malformed_twice_falls_back(self):
+        """Test that a second malformed answer gives the local fallback without more calls."""
+        with patch.object(self.news_service, '_invoke_rate_limited', return_value=Mock(content="no json")) as mock_invoke:
+            result = self.news_service.generate_summary_with_sentiment(ARTICLE, "AI", 'en')
+
+        assert mock_invoke.call_count == 2
+        assert result['summary'] == self.news_service._fallback_summary(ARTICLE, 'en')
+        assert result['language'] == 'en'
+
+    @patch('news_service.Config.SENTIMENT_LEXICON_ENABLED', False)
+    def test_sentiment_uses_structured_answer(self):
+        """Test that sentiment analysis reads the sentiment field."""
+        with patch.object(self.news_service, '_invoke_rate_limited', return_value=answer(sentiment='negative')):
+            assert self.news_service.analyze_sentiment(ARTICLE, 'en') == 'negative'
+
+
+@patch('news_service.Config.STRUCTURED_OUTPUT_ENABLED', True)
+@patch('async_news_service.Config.USE_AI_SUMMARY', True)
+class TestStructuredAsyncNewsService:
+    """Test structured mode in AsyncNewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = AsyncNewsService()
+        self.service.summary_cache = None
+        self.service.deduplicator = None
+        self.service.rate_limiter = Mock()
+        self.service.rate_limiter.try_acquire.return_value = 0
+        self.structured_llm = Mock()
+
+    def run_with_answers(self, coroutine_factory, *responses):
+        """Run a coroutine with the structured model returning the given responses."""
+        self.structured_llm.ainvoke = AsyncMock(side_effect=list(responses))
+        with patch.object(AsyncNewsService, 'structured_llm', new_callable=PropertyMock, return_value=self.structured_llm):
+            return asyncio.run(coroutine_factory())
+
+    def test_summary_with_correction(self):
+        """Test the async correction retry."""
+        result = self.run_with_answers(
+            lambda: self.service.agenerate_summary_with_sentiment(ARTICLE, "AI", 'mr'),
+            Mock(content='{"summary": "x"}'), answer(summary="सारांश.", language='mr'),
+        )
+
+        assert result == {'summary': 'सारांश.', 'sentiment': 'positive', 'language': 'mr', 'ai_summary': True}
+        assert self.structured_llm.ainvoke.await_count == 2
+
+    def test_batch_parses_structured_answers(self):
+        """Test that abatch answers are validated and malformed ones retried per article."""
+        articles = [{'title': f'Article {i}', 'url': f'http://example.com/{i}', 'body': f"{ARTICLE} {i}",
+                     'topic': 'tech', 'language': 'en'} for i in range(2)]
+
+        self.run_with_answers(
+            lambda: self.service.asummarize_articles(articles, 'en'),
+            answer(summary="First."), Mock(content="broken"), answer(summary="Second."),
+        )
+
+        assert sorted(article['summary'] for article in articles) == ['First.', 'Second.']
+        assert self.structured_llm.ainvoke.await_count == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
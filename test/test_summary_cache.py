@@ -0,0 +1,160 @@
+"""
+Tests for the content-addressed summary cache.
+
+This module tests:
+- In-process and persistent cache tiers
+- TTL expiry and size-based eviction
+- Hit/miss counters and the /cache-stats endpoint
+- NewsService cache integration skipping AI calls and rate limiting
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+from summary_cache import SummaryCache
+from news_service import NewsService
+
+
+ARTICLE = ("This is a comprehensive test article designed to evaluate caching for summary generation. "
+           "The article contains sufficient content to trigger the AI-powered summary path in NewsService.")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache backed by a temporary SQLite file."""
+    return SummaryCache(db_path=str(tmp_path / "cache.db"), ttl=60, memory_size=10, max_entries=100)
+
+
+class TestSummaryCache:
+    """Test class for SummaryCache behaviour."""
+
+    def test_make_key_is_content_addressed(self):
+        """Test that keys depend on every part and their boundaries."""
+        assert SummaryCache.make_key('a', 'b') == SummaryCache.make_key('a', 'b')
+        assert SummaryCache.make_key('a', 'b') != SummaryCache.make_key('a', 'c')
+        assert SummaryCache.make_key('ab', 'c') != SummaryCache.make_key('a', 'bc')
+
+    def test_memory_hit_and_miss_counters(self, cache):
+        """Test that lookups are counted by tier."""
+        assert cache.get('missing') is None
+        cache.set('key', {'summary': 'S', 'sentiment': 'neutral'})
+        assert cache.get('key') == {'summary': 'S', 'sentiment': 'neutral'}
+
+        stats = cache.get_stats()
+        assert stats['misses'] == 1
+        assert stats['memory_hits'] == 1
+        assert stats['writes'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_persistent_tier_survives_new_instance(self, tmp_path):
+        """Test that a new process-level cache reads entries from SQLite."""
+        db_path = str(tmp_path / "cache.db")
+        SummaryCache(db_path=db_path).set('key', 'हिंदी सारांश')
+
+        fresh = SummaryCache(db_path=db_path)
+        assert fresh.get('key') == 'हिंदी सारांश'
+        assert fresh.get_stats()['disk_hits'] == 1
+        assert fresh.get('key') == 'हिंदी सारांश'
+        assert fresh.get_stats()['memory_hits'] == 1
+
+    def test_expired_entries_are_not_served(self, tmp_path):
+        """Test TTL expiry in the persistent tier."""
+        db_path = str(tmp_path / "cache.db")
+        with patch('summary_cache.time.time', return_value=1000):
+            SummaryCache(db_path=db_path, ttl=60).set('key', 'value')
+
+        with patch('summary_cache.time.time', return_value=1100):
+            assert SummaryCache(db_path=db_path, ttl=60).get('key') is None
+
+    def test_size_based_eviction(self, tmp_path):
+        """Test that the persistent store is trimmed to max_entries."""
+        cache = SummaryCache(db_path=str(tmp_path / "cache.db"), max_entries=5)
+        with patch.object(SummaryCache, 'EVICTION_INTERVAL', 10):
+            for i in range(10):
+                cache.set(f'key{i}', i)
+
+        assert cache.get_stats()['evictions'] == 5
+        fresh = SummaryCache(db_path=cache.db_path)
+        assert fresh.get('key0') is None
+        assert fresh.get('key9') == 9
+
+    def test_memory_only_when_store_unavailable(self, tmp_path):
+        """Test that an unusable database path degrades to memory only."""
+        cache = SummaryCache(db_path=str(tmp_path))  # A directory, not a file
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+        assert cache.get_stats()['persistent'] is False
+
+
+class TestNewsServiceSummaryCache:
+    """Test summary cache integration in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.rate_limiter = Mock()
+        self.news_service.rate_limiter.acquire.return_value = True
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_with_sentiment_cached_after_first_call(self):
+        """Test that identical articles are only sent to the AI once."""
+        mock_chain = Mock()
+        mock_chain.invoke.return_value = Mock(content="Summary: Cached summary.\nSentiment: positive")
+
+        with patch.object(self.news_service, 'get_sentiment_prompt_template') as mock_template:
+            mock_template.return_value.__or__ = Mock(return_value=mock_chain)
+            first = self.news_service.generate_summary_with_sentiment(ARTICLE, "Title", 'hi')
+            second = self.news_service.generate_summary_with_sentiment(ARTICLE, "Title", 'hi')
+
+        assert first == second == {'summary': 'Cached summary.', 'sentiment': 'positive', 'language': 'hi',
+                                   'ai_summary': True}
+        assert mock_chain.invoke.call_count == 1
+        assert self.news_service.rate_limiter.acquire.call_count == 1
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_reuses_combined_result(self):
+        """Test that generate_summary reuses a cached summary+sentiment result."""
+        self.news_service._cache_result('summary_sentiment', ARTICLE, "Title", 'mr',
+                                        {'summary': 'मराठी सारांश', 'sentiment': 'neutral', 'language': 'mr'})
+
+        with patch('news_service.handle_language_operation') as mock_handle:
+            assert self.news_service.generate_summary(ARTICLE, "Title", 'mr') == 'मराठी सारांश'
+        mock_handle.assert_not_called()
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_cache_key_includes_language(self):
+        """Test that a cached English summary is not served for Hindi."""
+        self.news_service._cache_result('summary', ARTICLE, "Title", 'en', 'English summary')
+
+        with patch('news_service.handle_language_operation', return_value='Hindi summary') as mock_handle:
+            assert self.news_service.generate_summary(ARTICLE, "Title", 'hi') == 'Hindi summary'
+        mock_handle.assert_called_once()
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_fallback_results_are_not_cached(self):
+        """Test that unparseable AI responses are not cached."""
+        mock_chain = Mock()
+        mock_chain.invoke.return_value = Mock(content="no structured answer")
+
+        with patch.object(self.news_service, 'get_sentiment_prompt_template') as mock_template:
+            mock_template.return_value.__or__ = Mock(return_value=mock_chain)
+            self.news_service.generate_summary_with_sentiment(ARTICLE, "Title", 'en')
+
+        assert self.news_service._get_cached_result('summary_sentiment', ARTICLE, "Title", 'en') is None
+
+    def test_cache_stats_endpoint(self):
+        """Test that /cache-stats exposes the counters."""
+        from app import app
+        app.config['TESTING'] = True
+
+        with app.test_client() as client:
+            response = client.get('/cache-stats')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert 'hit_rate' in data['summary_cache']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
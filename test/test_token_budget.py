@@ -0,0 +1,135 @@
+"""
+Tests for token budgeting of prompt inputs.
+
+This module tests:
+- Token estimates for Latin and Devanagari text
+- Boilerplate removal with the article extractor's noise rules
+- Truncation on sentence boundaries
+- Budgeted inputs and usage reporting in NewsService
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from article_extractor import ArticleExtractor
+from news_service import NewsService
+from token_budget import TokenBudgetManager, estimate_tokens
+
+
+ENGLISH_ARTICLE = (
+    "The central bank raised interest rates on Tuesday to fight inflation. "
+    "Subscribe to our newsletter for more updates today. "
+    "Inflation has stayed above the bank's target for two years. "
+    "Higher rates are expected to slow borrowing."
+)
+
+HINDI_ARTICLE = (
+    "सरकार ने नई शिक्षा नीति की घोषणा की। इस नीति से छात्रों को लाभ होगा। "
+    "शिक्षा नीति में शिक्षकों के प्रशिक्षण पर ज़ोर है। शिक्षा मंत्री ने नीति को ऐतिहासिक बताया।"
+)
+
+
+class TestEstimateTokens:
+    """Test token estimates."""
+
+    def test_devanagari_costs_more_per_character(self):
+        """Test that Devanagari text is estimated at more tokens per character."""
+        english = "a" * 100
+        hindi = "क" * 100
+
+        assert estimate_tokens(english) == 25
+        assert estimate_tokens(hindi) == 50
+
+    def test_empty_text(self):
+        """Test that empty text costs nothing."""
+        assert estimate_tokens("") == 0
+
+
+class TestTokenBudgetManager:
+    """Test class for TokenBudgetManager."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.budget = TokenBudgetManager(article_budget=40, title_budget=10)
+
+    def test_boilerplate_is_stripped(self):
+        """Test that noise sentences are removed before truncation."""
+        cleaned = TokenBudgetManager.strip_boilerplate(ENGLISH_ARTICLE)
+
+        assert "newsletter" not in cleaned
+        assert cleaned.startswith("The central bank raised interest rates")
+
+    def test_all_noise_text_is_kept(self):
+        """Test that text made only of noise is not emptied."""
+        assert TokenBudgetManager.strip_boilerplate("Read more") == "Read more"
+
+    def test_truncates_on_sentence_boundaries(self):
+        """Test that only whole sentences within the budget are kept."""
+        inputs = self.budget.prepare_inputs("Rates", ENGLISH_ARTICLE, 'en')
+
+        assert inputs['article_text'] == ("The central bank raised interest rates on Tuesday to fight inflation. "
+                                          "Inflation has stayed above the bank's target for two years.")
+        assert estimate_tokens(inputs['article_text']) <= 40
+
+    def test_hindi_budget_keeps_fewer_characters(self):
+        """Test that Hindi text is cut to the same token budget at a danda."""
+        inputs = self.budget.prepare_inputs("शिक्षा", HINDI_ARTICLE, 'hi')
+
+        assert inputs['article_text'] == "सरकार ने नई शिक्षा नीति की घोषणा की। इस नीति से छात्रों को लाभ होगा।"
+        assert estimate_tokens(inputs['article_text']) <= 40
+
+    def test_long_sentence_is_cut_on_words(self):
+        """Test that a single sentence over budget is cut between words."""
+        text = TokenBudgetManager.truncate("word " * 100, 10)
+
+        assert text.split(' ') == ["word"] * 8
+        assert estimate_tokens(text) <= 10
+
+    def test_usage_is_reported_per_language(self):
+        """Test the per-language counters."""
+        self.budget.prepare_inputs("Rates", ENGLISH_ARTICLE, 'en')
+        self.budget.prepare_inputs("शिक्षा", HINDI_ARTICLE, 'hi')
+        self.budget.prepare_inputs("Short", "A short article that fits.", 'hi')
+
+        stats = self.budget.get_stats()
+
+        assert stats['article_budget'] == 40
+        assert stats['languages']['en'] == {'calls': 1, 'tokens': 35, 'truncated': 1, 'noise_removed': 1, 'avg_tokens': 35.0}
+        assert stats['languages']['hi']['calls'] == 2
+        assert stats['languages']['hi']['truncated'] == 1
+
+
+class TestNoiseRules:
+    """Test the shared noise rules."""
+
+    def test_devanagari_lines_are_not_noise(self):
+        """Test that Hindi text counts as letters rather than punctuation."""
+        extractor = ArticleExtractor()
+
+        assert not extractor._is_likely_noise("इस नीति से छात्रों को लाभ होगा और शिक्षकों को प्रशिक्षण मिलेगा।")
+        assert extractor._is_likely_noise("१२३४५६ -- ।। ७८९०१२ -- ।।")
+
+
+class TestNewsServiceBudget:
+    """Test budgeted prompt inputs in NewsService."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.news_service = NewsService()
+        self.news_service.summary_cache = None
+        self.news_service.token_budget = TokenBudgetManager(article_budget=40, title_budget=10)
+
+    @patch('news_service.Config.USE_AI_SUMMARY', True)
+    def test_summary_prompt_uses_budgeted_inputs(self):
+        """Test that the chain gets stripped, sentence-bounded text."""
+        response = Mock(content="Summary: Rates rose.\nSentiment: negative")
+        with patch.object(self.news_service, '_invoke_rate_limited', return_value=response) as mock_invoke:
+            self.news_service.generate_summary_with_sentiment(ENGLISH_ARTICLE, "Rates", 'en')
+
+        inputs = mock_invoke.call_args[0][1]
+        assert "newsletter" not in inputs['article_text']
+        assert inputs['article_text'].endswith("two years.")
+        assert self.news_service.get_token_budget_stats()['languages']['en']['calls'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
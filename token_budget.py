@@ -0,0 +1,184 @@
+"""
+Token Budget Module for NewsFlash Application
+
+This module provides token-aware prompt input preparation including:
+- Token estimates per script, since Devanagari costs more tokens per character than English
+- Boilerplate removal with the same noise rules as ArticleExtractor
+- Truncation on sentence boundaries to a configurable token budget
+- Per-call and per-language reporting of the tokens used
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+from config import Config
+from article_parser import is_likely_noise
+from extractive_summarizer import ExtractiveSummarizer
+
+logger = logging.getLogger(__name__)
+budget_logger = logging.getLogger("prompt_budget")
+
+DEVANAGARI = re.compile(r"[ऀ-ॿ]")
+WHITESPACE = re.compile(r"\s+")
+
+# Rough characters per token; Devanagari is split into far smaller pieces than Latin text
+LATIN_CHARS_PER_TOKEN = 4.0
+DEVANAGARI_CHARS_PER_TOKEN = 2.0
+
+
+def _token_weight(text: str) -> float:
+    """Fractional token estimate, so pieces of a text can be summed before rounding"""
+    devanagari = len(DEVANAGARI.findall(text))
+    return devanagari / DEVANAGARI_CHARS_PER_TOKEN + (len(text) - devanagari) / LATIN_CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many model tokens a text costs.
+
+    Args:
+        text: Text in English, Hindi or Marathi (mixed scripts are fine)
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(_token_weight(text)) if text else 0
+
+
+class TokenBudgetManager:
+    """Fits prompt inputs into token budgets and reports what each call used."""
+
+    def __init__(self, article_budget: Optional[int] = None, title_budget: Optional[int] = None):
+        """
+        Initialize the budget manager.
+
+        Args:
+            article_budget: Tokens of article text per prompt (defaults to Config.PROMPT_ARTICLE_TOKEN_BUDGET)
+            title_budget: Tokens of title per prompt (defaults to Config.PROMPT_TITLE_TOKEN_BUDGET)
+        """
+        self.article_budget = article_budget or Config.PROMPT_ARTICLE_TOKEN_BUDGET
+        self.title_budget = title_budget or Config.PROMPT_TITLE_TOKEN_BUDGET
+        self._lock = threading.Lock()
+        # language -> {'calls', 'tokens', 'truncated', 'noise_removed'}
+        self._stats = {}
+
+    @staticmethod
+    def strip_boilerplate(text: str) -> str:
+        """
+        Remove sentences that ArticleExtractor would treat as noise.
+
+        Args:
+            text: Article text
+
+        Returns:
+            Text without noise sentences, or the original text if every sentence looks like noise
+        """
+        sentences = ExtractiveSummarizer.split_sentences(text)
+        kept = [sentence for sentence in sentences if not is_likely_noise(sentence)]
+        if not kept or len(kept) == len(sentences):
+            return text
+        return ' '.join(kept)
+
+    @staticmethod
+    def truncate(text: str, max_tokens: int) -> str:
+        """
+        Cut text to a token budget, preferring whole sentences.
+
+        Args:
+            text: Text to cut
+            max_tokens: Token budget
+
+        Returns:
+            The leading sentences that fit, or the leading words of the first sentence if none do
+        """
+        text = WHITESPACE.sub(' ', text).strip()
+        if estimate_tokens(text) <= max_tokens:
+            return text
+
+        # Whole sentences first; words of the first sentence only if no sentence fits
+        for pieces in (ExtractiveSummarizer.split_sentences(text), text.split(' ')):
+            kept, used = [], 0.0
+            for piece in pieces:
+                cost = _token_weight(f" {piece}" if kept else piece)
+                if used + cost > max_tokens:
+                    break
+                kept.append(piece)
+                used += cost
+            if kept:
+                return ' '.join(kept)
+        return ""
+
+    def fit(self, text: str, max_tokens: int) -> Tuple[str, bool, bool]:
+        """
+        Strip boilerplate from text and truncate it to a token budget.
+
+        Args:
+            text: Text to fit
+            max_tokens: Token budget
+
+        Returns:
+            Tuple of (fitted text, whether noise was removed, whether it was truncated)
+        """
+        text = (text or '').strip()
+        cleaned = self.strip_boilerplate(text)
+        fitted = self.truncate(cleaned, max_tokens)
+        return fitted, cleaned != text, fitted != WHITESPACE.sub(' ', cleaned).strip()
+
+    def prepare_inputs(self, title: str, article_text: str, language: str) -> Dict[str, str]:
+        """
+        Build the title and article_text prompt inputs within their token budgets.
+
+        Args:
+            title: Article title
+            article_text: Article text
+            language: Language the prompt is for, used for reporting
+
+        Returns:
+            Dictionary with 'title' and 'article_text'
+        """
+        title = self.truncate(title or '', self.title_budget)
+        article_text, noise_removed, truncated = self.fit(article_text, self.article_budget)
+        self.record(language, estimate_tokens(title) + estimate_tokens(article_text), noise_removed, truncated)
+        return {"title": title, "article_text": article_text}
+
+    def record(self, language: str, tokens: int, noise_removed: bool = False, truncated: bool = False) -> None:
+        """
+        Record the tokens one prompt spent on article content.
+
+        Args:
+            language: Language of the prompt
+            tokens: Estimated tokens of title and article text
+            noise_removed: Whether boilerplate was stripped
+            truncated: Whether the text was cut to the budget
+        """
+        with self._lock:
+            stats = self._stats.setdefault(language, {'calls': 0, 'tokens': 0, 'truncated': 0, 'noise_removed': 0})
+            stats['calls'] += 1
+            stats['tokens'] += tokens
+            stats['truncated'] += truncated
+            stats['noise_removed'] += noise_removed
+
+        budget_logger.debug(json.dumps({
+            'language': language,
+            'tokens': tokens,
+            'budget': self.article_budget + self.title_budget,
+            'truncated': truncated,
+            'noise_removed': noise_removed,
+        }))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get token usage per language.
+
+        Returns:
+            Dictionary with the budgets and, per language, calls, total and average tokens,
+            and how often text was truncated or had noise removed
+        """
+        with self._lock:
+            languages = {language: dict(stats) for language, stats in self._stats.items()}
+        for stats in languages.values():
+            stats['avg_tokens'] = round(stats['tokens'] / stats['calls'], 1) if stats['calls'] else 0.0
+        return {'article_budget': self.article_budget, 'title_budget': self.title_budget, 'languages': languages}
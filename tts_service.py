@@ -2,14 +2,19 @@ import logging
 import os
 import tempfile
 from typing import Optional, Dict
+from cachetools import LRUCache
 from gtts import gTTS
 from config import Config
 from language_service import LanguageService
 from error_handler import (
     ErrorHandler, FallbackManager, with_language_fallback, with_retry,
-    handle_language_operation, TTSError, LanguageError
+    handle_language_operation, get_circuit_breaker, check_deadline, TTSError, LanguageError, CircuitOpenError
 )
+import hashlib
 import uuid
+from single_flight import SingleFlight
+from deadline import remaining_budget
+from retry_budget import record_attempt
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,13 @@ class TTSService:
         # Validate and normalize the default language
         self.default_language = LanguageService.get_fallback_language(self.default_language)
         
+        # Identical concurrent requests share one synthesized file
+        self.synthesis_flights = SingleFlight("tts")
+        
+        # While gTTS is failing, requests are answered from audio generated earlier
+        self.tts_circuit = get_circuit_breaker("gtts")
+        self._generated_audio = LRUCache(maxsize=256)
+        
         logger.info(f"TTSService initialized with default language: {self.default_language}")
 
     def text_to_speech(self, text: str, language: str = None) -> Optional[str]:
@@ -55,6 +67,22 @@ class TTSService:
             if len(clean_text) > 5000:  # Limit text length
                 clean_text = clean_text[:5000] + "... Text truncated for audio generation."
             
+            key = (hashlib.sha256(clean_text.encode('utf-8')).hexdigest(), target_language, self.slow)
+            if self.tts_circuit.is_open():
+                return self._get_generated_audio(key)
+            
+            audio_url = self.synthesis_flights.do(key, lambda: self._synthesize(clean_text, target_language))
+            if audio_url:
+                self._generated_audio[key] = audio_url
+            return audio_url or self._get_generated_audio(key)
+            
+        except Exception as e:
+            ErrorHandler.log_tts_error("text_to_speech", language or self.default_language, e)
+            return None
+
+    def _synthesize(self, clean_text: str, target_language: str) -> Optional[str]:
+        """Generate one audio file for cleaned text (see text_to_speech)"""
+        try:
             logger.info(f"Generating TTS for text of length: {len(clean_text)} in language: {target_language}")
             
             # Generate unique filename with language code
@@ -79,9 +107,25 @@ class TTSService:
                 return None
             
         except Exception as e:
-            ErrorHandler.log_tts_error("text_to_speech", language or self.default_language, e)
+            ErrorHandler.log_tts_error("text_to_speech", target_language, e)
             return None
 
+    def _get_generated_audio(self, key: tuple) -> Optional[str]:
+        """
+        Find audio generated earlier for the same text, language and speed.
+        
+        Args:
+            key: Synthesis key built in text_to_speech
+            
+        Returns:
+            URL path to the audio file, or None if none was generated or it has been cleaned up
+        """
+        audio_url = self._generated_audio.get(key)
+        if audio_url and os.path.exists(os.path.join("static", "audio", os.path.basename(audio_url))):
+            logger.info(f"gTTS unavailable, reusing generated audio: {audio_url}")
+            return audio_url
+        return None
+
     def _clean_text_for_tts(self, text: str) -> str:
         """Clean text to make it more suitable for TTS"""
         try:
@@ -151,7 +195,7 @@ class TTSService:
         tts_code = LanguageService.get_tts_code(language)
         return tts_code if tts_code else LanguageService.get_default_language()
     
-    @with_retry(max_attempts=2)  # Fewer retries for TTS to avoid long delays
+    @with_retry(max_attempts=2, dependency="gtts")  # Fewer retries for TTS to avoid long delays
     def _generate_tts_for_language(self, text: str, audio_path: str, language: str) -> bool:
         """
         Generate TTS for a specific language with retry logic.
@@ -168,17 +212,27 @@ class TTSService:
             # Get TTS language code
             tts_lang_code = self._get_tts_language_code(language)
             
-            # Generate TTS
-            tts = gTTS(text=text, lang=tts_lang_code, slow=self.slow)
-            tts.save(audio_path)
-            
-            # Verify file was created successfully
-            if not os.path.exists(audio_path) or os.path.getsize(audio_path) == 0:
-                raise TTSError(f"TTS file not created or empty: {audio_path}")
+            check_deadline("speech synthesis")
+            self.tts_circuit.check()
+            try:
+                # Generate TTS, giving up on the download when the request runs out of time
+                record_attempt('gtts')
+                tts = gTTS(text=text, lang=tts_lang_code, slow=self.slow, timeout=remaining_budget(None))
+                tts.save(audio_path)
+                
+                # Verify file was created successfully
+                if not os.path.exists(audio_path) or os.path.getsize(audio_path) == 0:
+                    raise TTSError(f"TTS file not created or empty: {audio_path}")
+            except Exception as e:
+                self.tts_circuit.record_failure(e)
+                raise
+            self.tts_circuit.record_success()
             
             logger.info(f"Successfully generated TTS for language {language}")
             return True
             
+        except CircuitOpenError:
+            raise
         except Exception as e:
             ErrorHandler.log_tts_error("_generate_tts_for_language", language, e)
             raise TTSError(f"TTS generation failed for language {language}: {e}")